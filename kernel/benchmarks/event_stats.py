@@ -0,0 +1,112 @@
+"""
+`cyntra stats` benchmark over a large synthetic event log.
+
+Writes N synthetic events through the segmented event log (rolled
+segments record their rollups in the manifest), builds the event index
+over the live head once (timed separately), then times the full
+`show_stats` report (all sections). Target: under a second
+for 5M events.
+
+Usage (from `kernel/`):
+    python -m benchmarks.event_stats
+    python -m benchmarks.event_stats --events 500000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import random
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from rich.console import Console
+
+from cyntra.kernel.config import KernelConfig
+from cyntra.observability import stats
+from cyntra.observability.event_log import SegmentedEventLog
+from cyntra.observability.events import EventReader
+
+DEFAULT_EVENTS = 5_000_000
+
+_TYPES = ("cycle_start", "task_complete", "task_failed", "issue.started", "workcell.created")
+_TOOLCHAINS = ("codex", "claude", "crush", "opencode")
+_SIZES = ("XS", "S", "M", "L", "XL")
+
+
+def write_events(logs_dir: Path, num_events: int, days: int = 90, seed: int = 0) -> None:
+    """Write synthetic events spread over `days`, rolled into ~64 MB segments."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    step = timedelta(days=days) / num_events
+    log = SegmentedEventLog(logs_dir, roll_daily=False, flush_interval=3600, compression="none")
+    for n in range(num_events):
+        data: dict = {"toolchain": rng.choice(_TOOLCHAINS)}
+        event_type = rng.choice(_TYPES)
+        if event_type == "task_complete":
+            data["duration_ms"] = rng.randrange(1_000, 600_000)
+            data["size"] = rng.choice(_SIZES)
+        if rng.random() < 0.3:
+            data["tokens_used"] = rng.randrange(100, 50_000)
+        event = {
+            "type": event_type,
+            "timestamp": (start + step * n).isoformat().replace("+00:00", "Z"),
+            "issue_id": str(rng.randrange(10_000)),
+            "data": data,
+        }
+        log.append(json.dumps(event))
+        if n % 100_000 == 0:
+            log.flush()
+    log.close()
+
+
+def time_stats(config: KernelConfig, repeat: int) -> list[float]:
+    """Return wall-clock seconds for `repeat` full `show_stats` reports."""
+    timings: list[float] = []
+    original_console, original_load = stats.console, stats.KernelConfig.load
+    stats.console = Console(file=io.StringIO())
+    stats.KernelConfig.load = classmethod(lambda cls, path: config)  # type: ignore[assignment]
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            stats.show_stats(
+                config.config_path, show_cost=True, show_success_rate=True, show_timing=True
+            )
+            timings.append(time.perf_counter() - start)
+    finally:
+        stats.console, stats.KernelConfig.load = original_console, original_load
+    return timings
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=DEFAULT_EVENTS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config = KernelConfig(repo_root=Path(tmp))
+        config.logs_dir.mkdir(parents=True)
+
+        start = time.perf_counter()
+        write_events(config.logs_dir, args.events, seed=args.seed)
+        generate_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        EventReader(config.logs_dir).index.close()
+        build_s = time.perf_counter() - start
+
+        timings = time_stats(config, args.repeat)
+        best = min(timings) * 1000
+        mean = sum(timings) / len(timings) * 1000
+
+    print(f"{'events':>10} {'generate_s':>11} {'build_s':>9} {'best_ms':>9} {'mean_ms':>9}")
+    print(f"{args.events:>10,} {generate_s:>11.1f} {build_s:>9.1f} {best:>9.1f} {mean:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
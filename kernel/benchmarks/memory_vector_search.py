@@ -0,0 +1,108 @@
+"""
+Embedded memory store vector search: IVF vs exact.
+
+Loads N synthetic memories (clustered embeddings) into an
+`EmbeddedMemoryStore`, then runs the same `search_similar` queries with
+the IVF index and with exact search, reporting recall@k against exact
+results and per-query latency for each nprobe.
+
+Usage (from `kernel/`):
+    python -m benchmarks.memory_vector_search
+    python -m benchmarks.memory_vector_search --memories 200000 --nprobe 4 8 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from cyntra.memory.embedded_store import EmbeddedMemoryStore
+from cyntra.memory.models import ExtractedMemory, MemoryType
+
+DEFAULT_MEMORIES = 50_000
+DEFAULT_DIM = 768
+
+
+def synthetic_embeddings(num: int, dim: int, noise: float, seed: int) -> np.ndarray:
+    """Embeddings drawn around sqrt(num) topic centres, like real memory text."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(1, int(num**0.5)), dim)).astype(np.float32)
+    labels = rng.integers(0, len(centers), size=num)
+    return centers[labels] + rng.normal(scale=noise, size=(num, dim)).astype(np.float32)
+
+
+async def load(store: EmbeddedMemoryStore, embeddings: np.ndarray, batch: int = 5_000) -> None:
+    for start in range(0, len(embeddings), batch):
+        chunk = embeddings[start : start + batch]
+        memories = [
+            ExtractedMemory(text=f"memory {start + i}", memory_type=MemoryType.PATTERN)
+            for i in range(len(chunk))
+        ]
+        await store.create_batch(memories, agent_id="bench", embeddings=chunk)
+
+
+async def run_queries(
+    store: EmbeddedMemoryStore, queries: np.ndarray, k: int, exact: bool
+) -> tuple[list[list], list[float]]:
+    results, timings = [], []
+    for query in queries:
+        start = time.perf_counter()
+        found = await store.search_similar(
+            query, agent_id="bench", limit=k, similarity_threshold=-1.0, exact=exact
+        )
+        timings.append(time.perf_counter() - start)
+        results.append([m.id for m in found])
+    return results, timings
+
+
+async def bench(args: argparse.Namespace) -> None:
+    embeddings = synthetic_embeddings(args.memories, args.dim, args.noise, args.seed)
+    rng = np.random.default_rng(args.seed + 1)
+    queries = embeddings[rng.integers(0, len(embeddings), size=args.queries)]
+    queries = queries + rng.normal(scale=0.5, size=queries.shape).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "memory.db"
+        store = EmbeddedMemoryStore(db_path)
+        start = time.perf_counter()
+        await load(store, embeddings)
+        load_s = time.perf_counter() - start
+
+        truth, exact_times = await run_queries(store, queries, args.k, exact=True)
+        rows = [("exact", 1.0, exact_times)]
+        for nprobe in args.nprobe:
+            store.vectors.nprobe = nprobe
+            await run_queries(store, queries[:1], args.k, exact=False)  # train outside timing
+            found, times = await run_queries(store, queries, args.k, exact=False)
+            hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth, strict=True))
+            rows.append((f"ivf nprobe={nprobe}", hits / sum(len(t) for t in truth), times))
+        store.conn.close()
+
+    print(f"{args.memories:,} memories x {args.dim}d, loaded in {load_s:.1f}s, k={args.k}")
+    print(f"{'search':>16} {'recall':>8} {'p50_ms':>8} {'p95_ms':>8}")
+    for name, recall, times in rows:
+        p50 = statistics.median(times) * 1000
+        p95 = statistics.quantiles(times, n=20)[-1] * 1000
+        print(f"{name:>16} {recall:>8.3f} {p50:>8.2f} {p95:>8.2f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--memories", type=int, default=DEFAULT_MEMORIES)
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--noise", type=float, default=1.0, help="spread around topic centres")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(bench(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Planner training data startup: `encode_dataset` vs the compiled memmap format.
+
+Writes N synthetic planner dataset rows to a temp `dataset.jsonl`, then times:
+- the first `load_compiled_dataset` call (compile + open),
+- a second call (cache hit: hash the file, open the maps),
+- one shuffled epoch of training batches from the compiled maps,
+- loading and encoding the rows into `EncodedExample` lists (the old path),
+reporting peak RSS growth after each step (Linux `ru_maxrss`). Growth during
+compile is mostly written pages of the file-backed maps.
+
+Usage (from `kernel/`):
+    python -m benchmarks.planner_compiled_dataset
+    python -m benchmarks.planner_compiled_dataset --rows 200000 --seq-len 512
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from cyntra.planner.training.compiled import load_compiled_dataset
+from cyntra.planner.training.data import (
+    build_vocab,
+    dataset_action_space,
+    encode_dataset,
+    load_dataset,
+)
+
+DEFAULT_ROWS = 50_000
+SWARMS = ["serial_handoff", "speculate_vote"]
+
+
+def synthetic_row(i: int, rng: random.Random) -> dict:
+    swarm = rng.choice(SWARMS)
+    return {
+        "split": rng.choice(["train"] * 8 + ["val", "test"]),
+        "planner_input": {
+            "schema_version": "cyntra.planner_input.v1",
+            "job_type": "code",
+            "universe_id": "medica",
+            "universe_defaults": {"swarm_id": "speculate_vote"},
+            "issue": {
+                "issue_id": str(i),
+                "dk_priority": rng.choice(["P0", "P1", "P2"]),
+                "dk_risk": rng.choice(["low", "medium", "high"]),
+                "dk_size": rng.choice(["S", "M", "L"]),
+                "tags": [f"tag{rng.randrange(50)}" for _ in range(3)],
+                "keywords": [f"kw{rng.randrange(500)}" for _ in range(5)],
+            },
+            "history": {"last_n_similar_runs": []},
+            "action_space": {
+                "swarm_ids": SWARMS,
+                "max_candidates_bins": [1, 2, 3, "NA"],
+                "max_minutes_bins": [15, 30, 45, 60, 120, "NA"],
+                "max_iterations_bins": ["NA"],
+            },
+            "system_state": None,
+        },
+        "label_action": {
+            "swarm_id": swarm,
+            "budgets": {
+                "max_candidates_bin": 1 if swarm == "serial_handoff" else rng.choice([2, 3]),
+                "max_minutes_bin": rng.choice([15, 30, 60]),
+                "max_iterations_bin": "NA",
+            },
+        },
+    }
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset_path = Path(tmp) / "dataset.jsonl"
+        with open(dataset_path, "w", encoding="utf-8") as f:
+            for i in range(args.rows):
+                f.write(json.dumps(synthetic_row(i, rng)) + "\n")
+
+        steps: list[tuple[str, float, float]] = []
+
+        def _step(name: str, fn: Callable[[], Any]) -> Any:
+            before = _peak_rss_mb()
+            start = time.perf_counter()
+            result = fn()
+            steps.append((name, time.perf_counter() - start, _peak_rss_mb() - before))
+            return result
+
+        data = _step("compile", lambda: load_compiled_dataset(dataset_path, seq_len=args.seq_len))
+        _step("cached open", lambda: load_compiled_dataset(dataset_path, seq_len=args.seq_len))
+
+        def _epoch() -> int:
+            batches = 0
+            for _batch in data.iter_batches(
+                "train", args.batch_size, rng=np.random.default_rng(args.seed)
+            ):
+                batches += 1
+            return batches
+
+        _step("epoch batches", _epoch)
+
+        if not args.skip_legacy:
+
+            def _legacy() -> int:
+                rows = load_dataset(dataset_path)
+                examples = encode_dataset(
+                    rows,
+                    vocab=build_vocab(rows),
+                    head_vocab=dataset_action_space(rows),
+                    seq_len=args.seq_len,
+                )
+                return len(examples)
+
+            _step("encode_dataset", _legacy)
+
+    print(f"{args.rows:,} rows, seq_len={args.seq_len}, {len(data):,} encoded")
+    print(f"{'step':>16} {'seconds':>9} {'peak_rss_+MB':>13}")
+    for name, seconds, rss in steps:
+        print(f"{name:>16} {seconds:>9.2f} {rss:>13.1f}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--seq-len", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-legacy", action="store_true", help="skip the in-memory encode_dataset path"
+    )
+    bench(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Planner dataset example building: serial vs sharded worker processes.
+
+Generates N synthetic, time-ordered run summaries and builds dataset
+examples with `build_dataset_examples` at each worker count, checking the
+`dataset_hash` matches the serial build and reporting wall time and speedup.
+
+Usage (from `kernel/`):
+    python -m benchmarks.planner_dataset_build
+    python -m benchmarks.planner_dataset_build --runs 100000 --workers 1 8 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from cyntra.planner.dataset import build_dataset_examples, dataset_hash
+
+DEFAULT_RUNS = 20_000
+MINUTE_MS = 60 * 1000
+
+
+def synthetic_summaries(num: int, num_tags: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    tags = [f"tag:{i}" for i in range(num_tags)]
+    summaries = []
+    started_ms = 1_700_000_000_000
+    for i in range(num):
+        started_ms += rng.randrange(0, 10 * MINUTE_MS)
+        job_type = rng.choice(["code", "code", "code", "fab-world"])
+        summary = {
+            "run_id": f"wc-{i:07d}",
+            "issue_id": str(rng.randrange(500)),
+            "started_ms": started_ms,
+            "job_type": job_type,
+            "tags": rng.sample(tags, rng.randrange(1, 4)),
+            "action_executed": {
+                "swarm_id": rng.choice(["serial_handoff", "speculate_vote"]),
+                "max_candidates": rng.choice([1, 2, 3]),
+                "max_minutes": rng.choice([15, 30, 60]),
+            },
+            "outcome": {"status": rng.choice(["success", "failed"]), "fail_codes": []},
+        }
+        if job_type == "fab-world":
+            summary["world_id"] = f"world-{rng.randrange(5)}"
+            summary["objective_id"] = f"objective-{rng.randrange(3)}"
+        summaries.append(summary)
+    return summaries
+
+
+def bench(args: argparse.Namespace) -> None:
+    summaries = synthetic_summaries(args.runs, args.tags, args.seed)
+    worker_counts = args.workers or sorted({1, 2, 4, os.cpu_count() or 1})
+
+    rows = []
+    baseline_s: float | None = None
+    baseline_hash: str | None = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in worker_counts:
+            start = time.perf_counter()
+            examples = build_dataset_examples(
+                repo_root=Path(tmp),
+                run_summaries=summaries,
+                issues={},
+                universe_id="",
+                include_world=True,
+                n_similar=args.n,
+                workers=workers,
+            )
+            seconds = time.perf_counter() - start
+            h = dataset_hash(examples)
+            if baseline_s is None:
+                baseline_s, baseline_hash = seconds, h
+            rows.append((workers, seconds, baseline_s / seconds, h == baseline_hash))
+
+    print(f"{args.runs:,} runs, {args.tags} tags, n_similar={args.n}")
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>8} {'same_hash':>10}")
+    for workers, seconds, speedup, same in rows:
+        print(f"{workers:>8} {seconds:>9.2f} {speedup:>8.2f} {same!s:>10}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--tags", type=int, default=20, help="distinct tags in the corpus")
+    parser.add_argument("--n", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--workers", type=int, nargs="*", help="worker counts to time (first is the baseline)"
+    )
+    bench(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Similar-run retrieval: `SimilarRunsIndex` vs the linear `select_similar_runs` scan.
+
+Generates N synthetic run summaries in time order, then:
+- times building the index incrementally (what dataset construction does),
+- runs the same queries against the full history with the linear scan and
+  with the index, checking the results are identical and reporting
+  per-query latency.
+
+Usage (from `kernel/`):
+    python -m benchmarks.planner_similar_runs
+    python -m benchmarks.planner_similar_runs --runs 100000 --queries 500 --tags 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from cyntra.planner.similar_runs import SimilarRunsIndex, SimilarRunsQuery, select_similar_runs
+
+DEFAULT_RUNS = 100_000
+MINUTE_MS = 60 * 1000
+
+
+def synthetic_runs(num: int, num_tags: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    tags = [f"tag:{i}" for i in range(num_tags)]
+    runs = []
+    started_ms = 1_700_000_000_000
+    for i in range(num):
+        started_ms += rng.randrange(0, 10 * MINUTE_MS)
+        job_type = rng.choice(["code", "code", "code", "fab-world"])
+        run = {
+            "run_id": f"wc-{i:07d}",
+            "started_ms": started_ms,
+            "job_type": job_type,
+            "tags": rng.sample(tags, rng.randrange(1, 4)),
+            "outcome": {"status": rng.choice(["success", "failed"]), "fail_codes": []},
+        }
+        if job_type == "fab-world":
+            run["world_id"] = f"world-{rng.randrange(5)}"
+            run["objective_id"] = f"objective-{rng.randrange(3)}"
+        runs.append(run)
+    return runs
+
+
+def bench(args: argparse.Namespace) -> None:
+    runs = synthetic_runs(args.runs, args.tags, args.seed)
+    rng = random.Random(args.seed + 1)
+    end_ms = runs[-1]["started_ms"] + 1
+    queries = [
+        SimilarRunsQuery(
+            job_type=rng.choice(["code", "fab-world"]),
+            started_ms=rng.randrange(runs[0]["started_ms"], end_ms),
+            tags=[f"tag:{rng.randrange(args.tags)}" for _ in range(rng.randrange(1, 4))],
+            world_id=f"world-{rng.randrange(5)}" if rng.random() < 0.5 else None,
+        )
+        for _ in range(args.queries)
+    ]
+
+    start = time.perf_counter()
+    index = SimilarRunsIndex()
+    for run in runs:
+        index.add(run)
+    build_s = time.perf_counter() - start
+
+    rows = []
+    results: dict[str, list[list[dict]]] = {}
+    for name, candidates in (("linear", runs), ("index", index)):
+        timings, found = [], []
+        for query in queries:
+            start = time.perf_counter()
+            found.append(select_similar_runs(query, candidates, n=args.n))
+            timings.append(time.perf_counter() - start)
+        results[name] = found
+        rows.append((name, timings))
+
+    identical = all(
+        [id(r) for r in a] == [id(r) for r in b]
+        for a, b in zip(results["linear"], results["index"], strict=True)
+    )
+
+    print(f"{args.runs:,} runs, {args.tags} tags, index built in {build_s:.2f}s, n={args.n}")
+    print(f"{'select':>8} {'p50_ms':>8} {'p95_ms':>8}")
+    for name, timings in rows:
+        p50 = statistics.median(timings) * 1000
+        p95 = statistics.quantiles(timings, n=20)[-1] * 1000
+        print(f"{name:>8} {p50:>8.3f} {p95:>8.3f}")
+    print(f"identical results: {identical}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--tags", type=int, default=20, help="distinct tags in the corpus")
+    parser.add_argument("--n", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    bench(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Scheduler throughput benchmark.
+
+Times one full `Scheduler.schedule()` call on synthetic Beads graphs.
+
+Usage (from `kernel/`):
+    python -m benchmarks.scheduler_schedule
+    python -m benchmarks.scheduler_schedule --sizes 1000 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import UTC, datetime
+
+from cyntra.kernel.config import KernelConfig
+from cyntra.kernel.scheduler import Scheduler
+from cyntra.state.models import BeadsGraph, Dep, Issue
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+_STATUSES = ("open", "open", "open", "ready", "done", "done", "running", "blocked")
+_SIZES = ("XS", "S", "M", "L", "XL")
+_RISKS = ("low", "medium", "high", "critical")
+_PRIORITIES = ("P0", "P1", "P2", "P3")
+
+
+def build_graph(num_issues: int, avg_deps: float = 1.5, seed: int = 0) -> BeadsGraph:
+    """
+    Build a random DAG of `num_issues` issues.
+
+    Edges only point from lower to higher index, so the graph is acyclic and
+    shaped like a real backlog: a wide frontier with a few long chains.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+
+    issues = [
+        Issue(
+            id=str(n),
+            title=f"Synthetic issue {n}",
+            status=rng.choice(_STATUSES),
+            created=now,
+            updated=now,
+            dk_priority=rng.choice(_PRIORITIES),
+            dk_risk=rng.choice(_RISKS),
+            dk_size=rng.choice(_SIZES),
+            dk_estimated_tokens=rng.randrange(10_000, 120_000),
+        )
+        for n in range(num_issues)
+    ]
+
+    deps: list[Dep] = []
+    num_deps = int(num_issues * avg_deps)
+    for _ in range(num_deps):
+        to_idx = rng.randrange(1, num_issues)
+        # Bias blockers towards recent issues to produce chains, not a star.
+        from_idx = max(0, to_idx - 1 - int(rng.expovariate(1 / 50)))
+        deps.append(Dep(from_id=str(from_idx), to_id=str(to_idx), dep_type="blocks", created=now))
+
+    return BeadsGraph(issues=issues, deps=deps)
+
+
+def time_schedule(graph: BeadsGraph, config: KernelConfig, repeat: int) -> list[float]:
+    """Return wall-clock seconds for `repeat` fresh schedule() calls."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        # Fresh graph object per run so index construction is included.
+        fresh = BeadsGraph(issues=list(graph.issues), deps=list(graph.deps))
+        scheduler = Scheduler(config)
+        start = time.perf_counter()
+        scheduler.schedule(fresh)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--avg-deps", type=float, default=1.5)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = KernelConfig(max_concurrent_workcells=8, max_concurrent_tokens=1_000_000)
+
+    print(f"{'issues':>10} {'deps':>10} {'best_ms':>10} {'mean_ms':>10}")
+    for size in args.sizes:
+        graph = build_graph(size, avg_deps=args.avg_deps, seed=args.seed)
+        timings = time_schedule(graph, config, args.repeat)
+        best = min(timings) * 1000
+        mean = sum(timings) / len(timings) * 1000
+        print(f"{size:>10,} {len(graph.deps):>10,} {best:>10.1f} {mean:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
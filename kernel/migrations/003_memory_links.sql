@@ -0,0 +1,210 @@
+-- Cyntra Agent Memory: normalised link table
+--
+-- Moves links from the inbound_links / outbound_links JSONB arrays on
+-- agent_memories to a memory_links edge table. Every new link used to
+-- rewrite both memory rows, and healing dead links scanned every row; with
+-- the edge table a link is one index insert and degree/neighbour queries
+-- are index lookups.
+--
+-- Run after 001 and 002:
+-- psql -U cyntra_admin -h localhost -d cyntra_db -f migrations/003_memory_links.sql
+--
+-- The JSONB columns are left in place (no longer written) so readers that
+-- still select them keep working during the rollout; 004 drops them once
+-- every reader queries memory_links.
+--
+-- The migration is idempotent: the backfill only runs while memory_links
+-- is empty and the JSONB columns still exist.
+
+BEGIN;
+
+-- =====================================================================
+-- MEMORY LINKS TABLE (directed, typed edges between memories)
+-- =====================================================================
+
+CREATE TABLE IF NOT EXISTS memory_links (
+    source_id UUID NOT NULL REFERENCES agent_memories(id) ON DELETE CASCADE,
+    target_id UUID NOT NULL REFERENCES agent_memories(id) ON DELETE CASCADE,
+    link_type VARCHAR(50) NOT NULL,
+    confidence NUMERIC(3,2),
+    reasoning TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (source_id, link_type, target_id)
+);
+
+COMMENT ON TABLE memory_links IS 'Directed typed links between memories (one row per link)';
+
+-- Outbound lookups use the primary key (source_id, link_type, target_id);
+-- inbound lookups and hub degree counts use the target index
+CREATE INDEX IF NOT EXISTS idx_memory_links_target ON memory_links(target_id, created_at);
+
+COMMENT ON INDEX idx_memory_links_target IS 'B-tree index for inbound link lookups and degree counts';
+
+-- =====================================================================
+-- BACKFILL FROM JSONB ARRAYS
+-- =====================================================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'agent_memories' AND column_name = 'outbound_links'
+    ) AND NOT EXISTS (SELECT 1 FROM memory_links) THEN
+        -- Either side of a link may be the only surviving copy, so read both
+        INSERT INTO memory_links (source_id, target_id, link_type, confidence, reasoning, created_at)
+        SELECT DISTINCT ON (l.source_id, l.link_type, l.target_id)
+               l.source_id, l.target_id, l.link_type, l.confidence, l.reasoning, l.created_at
+        FROM (
+            SELECT m.id AS source_id,
+                   (elem->>'uuid')::uuid AS target_id,
+                   elem->>'type' AS link_type,
+                   (elem->>'confidence')::numeric AS confidence,
+                   elem->>'reasoning' AS reasoning,
+                   COALESCE((elem->>'created_at')::timestamptz, m.created_at) AS created_at
+            FROM agent_memories m, jsonb_array_elements(m.outbound_links) AS elem
+            WHERE elem->>'uuid' ~* '^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$'
+            UNION ALL
+            SELECT (elem->>'uuid')::uuid,
+                   m.id,
+                   elem->>'type',
+                   (elem->>'confidence')::numeric,
+                   elem->>'reasoning',
+                   COALESCE((elem->>'created_at')::timestamptz, m.created_at)
+            FROM agent_memories m, jsonb_array_elements(m.inbound_links) AS elem
+            WHERE elem->>'uuid' ~* '^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$'
+        ) l
+        JOIN agent_memories s ON s.id = l.source_id
+        JOIN agent_memories t ON t.id = l.target_id
+        WHERE l.link_type IS NOT NULL
+        ORDER BY l.source_id, l.link_type, l.target_id, l.created_at
+        ON CONFLICT DO NOTHING;
+    END IF;
+END;
+$$;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'agent_memories' AND column_name = 'outbound_links'
+    ) THEN
+        COMMENT ON COLUMN agent_memories.inbound_links IS 'Deprecated: superseded by memory_links, dropped by 004';
+        COMMENT ON COLUMN agent_memories.outbound_links IS 'Deprecated: superseded by memory_links, dropped by 004';
+    END IF;
+END;
+$$;
+
+-- =====================================================================
+-- SCORING: hub score from the edge table
+-- =====================================================================
+
+CREATE OR REPLACE FUNCTION calculate_memory_importance(
+    p_memory_id UUID,
+    p_current_runs INTEGER
+) RETURNS NUMERIC(4,3) AS $$
+DECLARE
+    mem RECORD;
+    runs_since_creation INTEGER;
+    runs_since_access INTEGER;
+    effective_access_count NUMERIC;
+    access_rate NUMERIC;
+    value_score NUMERIC;
+    hub_score NUMERIC;
+    mention_score NUMERIC;
+    newness_boost NUMERIC;
+    raw_score NUMERIC;
+    recency_boost NUMERIC;
+    temporal_multiplier NUMERIC;
+    expiration_multiplier NUMERIC;
+    final_score NUMERIC;
+    inbound_count INTEGER;
+BEGIN
+    -- Fetch memory
+    SELECT * INTO mem FROM agent_memories WHERE id = p_memory_id;
+    IF NOT FOUND THEN
+        RETURN 0.0;
+    END IF;
+
+    -- Hard zero if expired more than 5 days ago
+    IF mem.expires_at IS NOT NULL AND
+       EXTRACT(EPOCH FROM (NOW() - mem.expires_at)) / 86400 > 5 THEN
+        RETURN 0.0;
+    END IF;
+
+    -- Calculate run deltas
+    runs_since_creation := GREATEST(0, p_current_runs - COALESCE(mem.runs_at_creation, 0));
+    runs_since_access := GREATEST(0, p_current_runs - COALESCE(mem.runs_at_last_access, mem.runs_at_creation, 0));
+
+    -- VALUE SCORE: access rate with momentum decay
+    effective_access_count := mem.access_count * POWER(0.95, runs_since_access);
+    access_rate := effective_access_count / GREATEST(7, runs_since_creation);
+    value_score := LN(1 + access_rate / 0.02) * 0.8;
+
+    -- HUB SCORE: diminishing returns after 10 links
+    SELECT COUNT(*) INTO inbound_count FROM memory_links WHERE target_id = p_memory_id;
+    IF inbound_count = 0 THEN
+        hub_score := 0.0;
+    ELSIF inbound_count <= 10 THEN
+        hub_score := inbound_count * 0.04;
+    ELSE
+        hub_score := 0.4 + (inbound_count - 10) * 0.02 / (1 + (inbound_count - 10) * 0.05);
+    END IF;
+
+    -- MENTION SCORE: explicit LLM references
+    IF mem.mention_count = 0 THEN
+        mention_score := 0.0;
+    ELSIF mem.mention_count <= 5 THEN
+        mention_score := mem.mention_count * 0.08;
+    ELSE
+        mention_score := 0.4 + LN(1 + (mem.mention_count - 5)) * 0.1;
+    END IF;
+
+    -- NEWNESS BOOST: grace period for new memories (decays over 15 runs)
+    newness_boost := GREATEST(0.0, 2.0 - (runs_since_creation * 0.133));
+
+    -- RAW SCORE
+    raw_score := value_score + hub_score + mention_score + newness_boost;
+
+    -- RECENCY BOOST: gentle transition to cold storage
+    recency_boost := 1.0 / (1.0 + runs_since_access * 0.015);
+
+    -- TEMPORAL MULTIPLIER: happens_at proximity boost (calendar-based)
+    IF mem.happens_at IS NOT NULL THEN
+        IF mem.happens_at < NOW() THEN
+            -- Event has passed: 45-day gradual decay (0.8 -> 0.4)
+            IF EXTRACT(EPOCH FROM (NOW() - mem.happens_at)) / 86400 <= 45 THEN
+                temporal_multiplier := 0.4 * (1.0 - (EXTRACT(EPOCH FROM (NOW() - mem.happens_at)) / 86400) / 45.0) + 0.4;
+            ELSE
+                temporal_multiplier := 0.4;
+            END IF;
+        ELSE
+            -- Event upcoming: boost based on proximity
+            IF EXTRACT(EPOCH FROM (mem.happens_at - NOW())) / 86400 <= 1 THEN
+                temporal_multiplier := 2.0;
+            ELSIF EXTRACT(EPOCH FROM (mem.happens_at - NOW())) / 86400 <= 7 THEN
+                temporal_multiplier := 1.5;
+            ELSIF EXTRACT(EPOCH FROM (mem.happens_at - NOW())) / 86400 <= 14 THEN
+                temporal_multiplier := 1.2;
+            ELSE
+                temporal_multiplier := 1.0;
+            END IF;
+        END IF;
+    ELSE
+        temporal_multiplier := 1.0;
+    END IF;
+
+    -- EXPIRATION TRAILOFF: 5-day crash-out after expires_at
+    IF mem.expires_at IS NOT NULL AND mem.expires_at < NOW() THEN
+        expiration_multiplier := GREATEST(0.0, 1.0 - (EXTRACT(EPOCH FROM (NOW() - mem.expires_at)) / 86400) / 5.0);
+    ELSE
+        expiration_multiplier := 1.0;
+    END IF;
+
+    -- SIGMOID TRANSFORM
+    final_score := 1.0 / (1.0 + EXP(-(raw_score * recency_boost * temporal_multiplier * expiration_multiplier - 2.0)));
+
+    RETURN ROUND(final_score::NUMERIC, 3);
+END;
+$$ LANGUAGE plpgsql;
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- Cyntra Agent Memory: drop the legacy JSONB link columns
+--
+-- 003 moved links to the memory_links edge table but kept the
+-- inbound_links / outbound_links columns on agent_memories for readers
+-- that still selected them. Every store query now aggregates links from
+-- memory_links, so the columns can go.
+--
+-- Run after 003, once all deployed readers query memory_links:
+-- psql -U cyntra_admin -h localhost -d cyntra_db -f migrations/004_drop_memory_link_columns.sql
+--
+-- The migration is idempotent.
+
+BEGIN;
+
+ALTER TABLE agent_memories DROP COLUMN IF EXISTS inbound_links;
+ALTER TABLE agent_memories DROP COLUMN IF EXISTS outbound_links;
+
+COMMIT;
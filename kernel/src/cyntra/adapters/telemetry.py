@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import json
 import threading
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
@@ -271,3 +271,30 @@ def read_telemetry_events(
         logger.error("Failed to read telemetry file", path=str(telemetry_path), error=str(e))
 
     return events
+
+
+def iter_telemetry_events(telemetry_path: Path) -> Iterator[dict[str, Any]]:
+    """
+    Stream telemetry events from a JSONL file one line at a time.
+
+    Unlike `read_telemetry_events`, the file is never held in memory as a
+    whole, so callers can process arbitrarily large logs in bounded chunks.
+
+    Args:
+        telemetry_path: Path to telemetry.jsonl file
+
+    Yields:
+        Parsed telemetry events (malformed lines are logged and skipped)
+    """
+    if not telemetry_path.exists():
+        return
+
+    try:
+        with open(telemetry_path, encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                try:
+                    yield json.loads(line.strip())
+                except json.JSONDecodeError as e:
+                    logger.warning("Failed to parse telemetry event", line_num=i, error=str(e))
+    except OSError as e:
+        logger.error("Failed to read telemetry file", path=str(telemetry_path), error=str(e))
@@ -14,6 +14,7 @@ from typing import Any
 import structlog
 
 from cyntra.kernel.config import KernelConfig
+from cyntra.state.mutation_log import MUTATION_LOG_FILE
 
 logger = structlog.get_logger()
 
@@ -91,6 +92,8 @@ def write_bench_beads(
     issues_path = beads_dir / "issues.jsonl"
     deps_path = beads_dir / "deps.jsonl"
     deps_path.write_text("")
+    # A fresh graph: logged writes against a previous one must not replay.
+    (beads_dir / MUTATION_LOG_FILE).unlink(missing_ok=True)
 
     now = _utc_now()
     issues: list[dict[str, Any]] = []
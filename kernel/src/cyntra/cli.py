@@ -104,6 +104,7 @@ def workcells(ctx: click.Context, as_json: bool, show_all: bool) -> None:
 @click.option("--run", "run_id", type=str, help="Specific run")
 @click.option("--issue", type=str, help="Specific issue")
 @click.option("--limit", type=int, default=50, help="Last N events")
+@click.option("--since", type=click.DateTime(), help="Only events at or after this time (UTC)")
 @click.option("--json", "as_json", is_flag=True, help="JSON output")
 @click.pass_context
 def history(
@@ -111,6 +112,7 @@ def history(
     run_id: str | None,
     issue: str | None,
     limit: int,
+    since: datetime | None,
     as_json: bool,
 ) -> None:
     """Show run history."""
@@ -122,6 +124,7 @@ def history(
         issue_id=issue,
         limit=limit,
         json_output=as_json,
+        since=since,
     )
 
 
@@ -129,8 +132,15 @@ def history(
 @click.option("--cost", is_flag=True, help="Token/cost breakdown")
 @click.option("--success-rate", is_flag=True, help="Per-toolchain success rates")
 @click.option("--time", "timing", is_flag=True, help="Timing analysis")
+@click.option("--since", type=click.DateTime(), help="Only events at or after this time (UTC)")
 @click.pass_context
-def stats(ctx: click.Context, cost: bool, success_rate: bool, timing: bool) -> None:
+def stats(
+    ctx: click.Context,
+    cost: bool,
+    success_rate: bool,
+    timing: bool,
+    since: datetime | None,
+) -> None:
     """Show statistics."""
     from cyntra.observability.stats import show_stats
 
@@ -139,6 +149,7 @@ def stats(ctx: click.Context, cost: bool, success_rate: bool, timing: bool) -> N
         show_cost=cost,
         show_success_rate=success_rate,
         show_timing=timing,
+        since=since,
     )
 
 
@@ -1671,6 +1682,13 @@ def planner_stats(ctx: click.Context, include_world: bool, as_json: bool) -> Non
     "--n-similar", type=int, default=8, show_default=True, help="Similar runs per example"
 )
 @click.option("--include-world/--no-include-world", default=True, help="Include fab-world runs")
+@click.option(
+    "--workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Worker processes for example building (1 = serial)",
+)
 @click.pass_context
 def planner_build_dataset(
     ctx: click.Context,
@@ -1678,6 +1696,7 @@ def planner_build_dataset(
     universe_id: str | None,
     n_similar: int,
     include_world: bool,
+    workers: int,
 ) -> None:
     """Build a deterministic planner dataset from `.cyntra/*` and `.beads/*` artifacts."""
     from cyntra.planner.dataset import build_and_write_dataset
@@ -1690,6 +1709,7 @@ def planner_build_dataset(
         include_world=include_world,
         n_similar=n_similar,
         universe_id=universe_id,
+        workers=workers,
     )
     console.print(f"[green]✓[/green] Wrote planner dataset to {out_dir}")
     console.print_json(data=meta)
@@ -2112,6 +2132,8 @@ def planner_eval(
             bundle_dir = (repo_root / bundle_dir).resolve()
         planner = OnnxPlanner(bundle_dir)
 
+    model_inputs: list[dict] = []
+    model_golds: list[tuple] = []
     for row in rows:
         label = row.get("label_action")
         if not isinstance(label, dict):
@@ -2128,12 +2150,16 @@ def planner_eval(
         if planner is not None:
             pi = row.get("planner_input")
             if isinstance(pi, dict):
-                pred = planner.predict_action(pi)
-                pred_tuple = action_tuple(pred)
-                if pred_tuple is not None:
-                    model_pairs.append((pred_tuple, gold))
+                model_inputs.append(pi)
+                model_golds.append(gold)
         gold_pairs.append((gold, gold))
 
+    if planner is not None:
+        for pred, gold in zip(planner.predict_actions(model_inputs), model_golds, strict=True):
+            pred_tuple = action_tuple(pred)
+            if pred_tuple is not None:
+                model_pairs.append((pred_tuple, gold))
+
     report: dict[str, Any] = {
         "schema_version": "cyntra.planner_eval_report.v1",
         "dataset": str(dataset_path),
@@ -2286,8 +2312,8 @@ def planner_ablate(
             resolved = (repo_root / resolved).resolve()
         planner = OnnxPlanner(resolved)
 
-        pairs = []
-        confidences: list[float] = []
+        inputs: list[dict] = []
+        golds: list[tuple] = []
         for row in rows:
             label = row.get("label_action")
             if not isinstance(label, dict):
@@ -2298,7 +2324,12 @@ def planner_ablate(
             pi = row.get("planner_input")
             if not isinstance(pi, dict):
                 continue
-            pred = planner.predict_action(pi)
+            inputs.append(pi)
+            golds.append(gold_tuple)
+
+        pairs = []
+        confidences: list[float] = []
+        for pred, gold_tuple in zip(planner.predict_actions(inputs), golds, strict=True):
             pred_tuple = action_tuple(pred)
             if pred_tuple is None:
                 continue
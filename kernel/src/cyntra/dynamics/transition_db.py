@@ -9,60 +9,80 @@ import sqlite3
 from pathlib import Path
 from typing import Any
 
+from cyntra.state.sqlite_pool import SQLitePool, open_pool
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS states (
+    state_id TEXT PRIMARY KEY,
+    domain TEXT NOT NULL,
+    job_type TEXT NOT NULL,
+    data_json TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS transitions (
+    transition_id TEXT PRIMARY KEY,
+    rollout_id TEXT,
+    workcell_id TEXT,
+    issue_id TEXT,
+    job_type TEXT,
+    toolchain TEXT,
+    transition_kind TEXT,
+    from_state TEXT NOT NULL,
+    to_state TEXT NOT NULL,
+    timestamp TEXT,
+    action_tool TEXT,
+    action_command_class TEXT,
+    action_domain TEXT,
+    context_json TEXT,
+    observations_json TEXT,
+    FOREIGN KEY(from_state) REFERENCES states(state_id),
+    FOREIGN KEY(to_state) REFERENCES states(state_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_transitions_from_state ON transitions(from_state);
+CREATE INDEX IF NOT EXISTS idx_transitions_to_state ON transitions(to_state);
+"""
+
 
 class TransitionDB:
+    """
+    Transition store over a process-wide `SQLitePool`.
+
+    Every write holds the pool's writer lock and commits before returning,
+    since other handles on the same file share that connection. Read
+    queries borrow read-only connections, so readers on executor threads
+    don't contend with each other or with ingest.
+    """
+
     def __init__(self, db_path: Path) -> None:
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
-        self._init_schema()
+        self.pool: SQLitePool = open_pool(self.db_path, schema=_SCHEMA)
 
     def close(self) -> None:
-        self.conn.close()
-
-    def _init_schema(self) -> None:
-        cursor = self.conn.cursor()
-        cursor.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS states (
-                state_id TEXT PRIMARY KEY,
-                domain TEXT NOT NULL,
-                job_type TEXT NOT NULL,
-                data_json TEXT NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS transitions (
-                transition_id TEXT PRIMARY KEY,
-                rollout_id TEXT,
-                workcell_id TEXT,
-                issue_id TEXT,
-                job_type TEXT,
-                toolchain TEXT,
-                transition_kind TEXT,
-                from_state TEXT NOT NULL,
-                to_state TEXT NOT NULL,
-                timestamp TEXT,
-                action_tool TEXT,
-                action_command_class TEXT,
-                action_domain TEXT,
-                context_json TEXT,
-                observations_json TEXT,
-                FOREIGN KEY(from_state) REFERENCES states(state_id),
-                FOREIGN KEY(to_state) REFERENCES states(state_id)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_transitions_from_state ON transitions(from_state);
-            CREATE INDEX IF NOT EXISTS idx_transitions_to_state ON transitions(to_state);
-            """
-        )
-        self.conn.commit()
+        self.pool.close()
 
     def insert_state(self, state: dict[str, Any]) -> None:
+        with self.pool.write() as conn, conn:
+            self._insert_state(conn, state)
+
+    def insert_transition(self, transition: dict[str, Any]) -> None:
+        with self.pool.write() as conn, conn:
+            self._insert_transition(conn, transition)
+
+    def insert_transitions(self, transitions: list[dict[str, Any]]) -> int:
+        count = 0
+        with self.pool.write() as conn, conn:
+            for transition in transitions:
+                self._insert_transition(conn, transition)
+                count += 1
+        return count
+
+    @staticmethod
+    def _insert_state(conn: sqlite3.Connection, state: dict[str, Any]) -> None:
         state_id = state.get("state_id")
         if not state_id:
             return
-        self.conn.execute(
+        conn.execute(
             """
             INSERT OR IGNORE INTO states (state_id, domain, job_type, data_json)
             VALUES (?, ?, ?, ?)
@@ -75,17 +95,18 @@ class TransitionDB:
             ),
         )
 
-    def insert_transition(self, transition: dict[str, Any]) -> None:
+    @classmethod
+    def _insert_transition(cls, conn: sqlite3.Connection, transition: dict[str, Any]) -> None:
         from_state = transition.get("from_state") or {}
         to_state = transition.get("to_state") or {}
 
-        self.insert_state(from_state)
-        self.insert_state(to_state)
+        cls._insert_state(conn, from_state)
+        cls._insert_state(conn, to_state)
 
         action_label = transition.get("action_label") or {}
         context = transition.get("context") or {}
 
-        self.conn.execute(
+        conn.execute(
             """
             INSERT OR REPLACE INTO transitions (
                 transition_id,
@@ -129,16 +150,9 @@ class TransitionDB:
             ),
         )
 
-    def insert_transitions(self, transitions: list[dict[str, Any]]) -> int:
-        count = 0
-        with self.conn:
-            for transition in transitions:
-                self.insert_transition(transition)
-                count += 1
-        return count
-
     def load_states(self) -> dict[str, dict[str, Any]]:
-        rows = self.conn.execute("SELECT state_id, data_json FROM states").fetchall()
+        with self.pool.read() as conn:
+            rows = conn.execute("SELECT state_id, data_json FROM states").fetchall()
         result: dict[str, dict[str, Any]] = {}
         for row in rows:
             state_id = row["state_id"]
@@ -149,13 +163,13 @@ class TransitionDB:
         return result
 
     def list_transition_timestamps(self) -> list[str]:
-        rows = self.conn.execute(
-            "SELECT timestamp FROM transitions WHERE timestamp IS NOT NULL"
-        ).fetchall()
+        with self.pool.read() as conn:
+            rows = conn.execute(
+                "SELECT timestamp FROM transitions WHERE timestamp IS NOT NULL"
+            ).fetchall()
         return [row["timestamp"] for row in rows if row["timestamp"]]
 
     def transition_counts(self, limit: int | None = None) -> list[dict[str, Any]]:
-        cursor = self.conn.cursor()
         query = """
             SELECT from_state, to_state, COUNT(*) as count
             FROM transitions
@@ -164,9 +178,8 @@ class TransitionDB:
         """
         if limit:
             query += " LIMIT ?"
-            rows = cursor.execute(query, (limit,)).fetchall()
-        else:
-            rows = cursor.execute(query).fetchall()
+        with self.pool.read() as conn:
+            rows = conn.execute(query, (limit,) if limit else ()).fetchall()
         return [dict(row) for row in rows]
 
     def transition_probabilities(self, limit: int | None = None) -> list[dict[str, Any]]:
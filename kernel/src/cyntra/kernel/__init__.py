@@ -3,6 +3,7 @@ Kernel - Core orchestration components.
 
 Modules:
     scheduler   - Computes ready set, critical path, lane packing
+    incremental - Scheduler state carried across cycles, updated from deltas
     dispatcher  - Spawns workcells, routes to toolchains, monitors
     verifier    - Runs quality gates, compares candidates, vote selection
     runner      - Main kernel loop
@@ -12,7 +13,8 @@ Modules:
 """
 
 from cyntra.kernel.dispatcher import Dispatcher
+from cyntra.kernel.incremental import IncrementalScheduler
 from cyntra.kernel.scheduler import Scheduler
 from cyntra.kernel.verifier import Verifier
 
-__all__ = ["Scheduler", "Dispatcher", "Verifier"]
+__all__ = ["Scheduler", "IncrementalScheduler", "Dispatcher", "Verifier"]
@@ -132,6 +132,20 @@ class PlannerConfig:
     mode: str = "off"
     bundle_dir: Path | None = None
     confidence_threshold: float = 0.2
+    # ONNX Runtime session threads (None = runtime default)
+    intra_op_threads: int | None = None
+    inter_op_threads: int | None = None
+
+
+@dataclass
+class EventLogConfig:
+    """Event log buffering, rolling and retention."""
+
+    flush_interval_seconds: float = 1.0
+    max_segment_mb: float = 64.0
+    roll_daily: bool = True
+    compression: str = "auto"  # auto (zstd if installed, else gzip), zstd, gzip, none
+    retention_days: float | None = None  # keep rolled segments forever
 
 
 @dataclass
@@ -184,6 +198,7 @@ class KernelConfig:
     control: ControlConfig = field(default_factory=ControlConfig)
     post_execution_hooks: PostExecutionHooksConfig = field(default_factory=PostExecutionHooksConfig)
     planner: PlannerConfig = field(default_factory=PlannerConfig)
+    event_log: EventLogConfig = field(default_factory=EventLogConfig)
 
     # Runtime overrides
     force_speculate: bool = False
@@ -220,6 +235,7 @@ class KernelConfig:
         speculation_data = data.get("speculation") or {}
         control_data = data.get("control") or {}
         planner_data = data.get("planner") or {}
+        event_log_data = data.get("event_log") or {}
 
         # Back-compat: allow flat keys at top-level (tests + older configs).
         max_concurrent_workcells = scheduling_data.get(
@@ -398,7 +414,25 @@ class KernelConfig:
         )
         planner_kwargs = _filter_keys(
             dict(planner_data) if isinstance(planner_data, dict) else {},
-            {"mode", "bundle_dir", "confidence_threshold", "enabled"},
+            {
+                "mode",
+                "bundle_dir",
+                "confidence_threshold",
+                "enabled",
+                "intra_op_threads",
+                "inter_op_threads",
+            },
+        )
+
+        event_log_kwargs = _filter_keys(
+            dict(event_log_data) if isinstance(event_log_data, dict) else {},
+            {
+                "flush_interval_seconds",
+                "max_segment_mb",
+                "roll_daily",
+                "compression",
+                "retention_days",
+            },
         )
 
         # Back-compat: allow boolean `planner.enabled`.
@@ -429,6 +463,7 @@ class KernelConfig:
             routing=RoutingConfig(rules=routing_rules, fallbacks=fallbacks),
             control=ControlConfig(**control_kwargs) if control_kwargs else ControlConfig(),
             planner=PlannerConfig(**planner_kwargs) if planner_kwargs else PlannerConfig(),
+            event_log=EventLogConfig(**event_log_kwargs) if event_log_kwargs else EventLogConfig(),
         )
 
         if config_path:
@@ -564,4 +599,11 @@ class KernelConfig:
                 else None,
                 "confidence_threshold": self.planner.confidence_threshold,
             },
+            "event_log": {
+                "flush_interval_seconds": self.event_log.flush_interval_seconds,
+                "max_segment_mb": self.event_log.max_segment_mb,
+                "roll_daily": self.event_log.roll_daily,
+                "compression": self.event_log.compression,
+                "retention_days": self.event_log.retention_days,
+            },
         }
@@ -0,0 +1,86 @@
+"""
+Dispatch pool bookkeeping - slot accounting and queue-wait metrics.
+
+The runner keeps a bounded pool of `max_concurrent_workcells` slots and
+refills a slot as soon as a workcell finishes. `SlotMetrics` tracks how
+busy those slots were, the estimated tokens held by running lanes, and how
+long ready issues waited for a slot.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class SlotMetrics:
+    """
+    Tracks slot occupancy and ready→dispatch wait times for one dispatch loop.
+
+    Utilisation is busy slot-seconds divided by capacity × wall-clock seconds.
+    """
+
+    def __init__(self, capacity: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.capacity = max(1, capacity)
+        self._clock = clock
+        self._started = clock()
+        self._last_change = self._started
+        self._busy_slot_seconds = 0.0
+        self._ready_since: dict[str, float] = {}
+        self._waits: list[float] = []
+        self.busy = 0
+        self.busy_tokens = 0
+        self.peak_busy = 0
+        self.dispatched = 0
+
+    @property
+    def free(self) -> int:
+        """Number of currently unoccupied slots."""
+        return max(0, self.capacity - self.busy)
+
+    def _advance(self) -> float:
+        now = self._clock()
+        self._busy_slot_seconds += self.busy * (now - self._last_change)
+        self._last_change = now
+        return now
+
+    def mark_ready(self, issue_id: str) -> None:
+        """Record the first time an issue was seen ready but not yet dispatched."""
+        self._ready_since.setdefault(issue_id, self._clock())
+
+    def acquire(self, issue_id: str, slots: int = 1, tokens: int = 0) -> float:
+        """Occupy `slots` and `tokens` for an issue; returns its queue wait in seconds."""
+        now = self._advance()
+        wait = now - self._ready_since.pop(issue_id, now)
+        self._waits.append(wait)
+        self.busy += slots
+        self.busy_tokens += tokens
+        self.peak_busy = max(self.peak_busy, self.busy)
+        self.dispatched += 1
+        return wait
+
+    def release(self, slots: int = 1, tokens: int = 0) -> None:
+        """Free `slots` and `tokens` after a dispatch finishes."""
+        self._advance()
+        self.busy = max(0, self.busy - slots)
+        self.busy_tokens = max(0, self.busy_tokens - tokens)
+
+    def summary(self) -> dict[str, Any]:
+        """Metrics for the loop so far, suitable for an event payload."""
+        now = self._advance()
+        wall = now - self._started
+        waits = sorted(self._waits)
+        utilisation = self._busy_slot_seconds / (self.capacity * wall) if wall > 0 else 0.0
+
+        return {
+            "capacity": self.capacity,
+            "dispatched": self.dispatched,
+            "peak_busy_slots": self.peak_busy,
+            "wall_seconds": round(wall, 3),
+            "busy_slot_seconds": round(self._busy_slot_seconds, 3),
+            "slot_utilisation": round(min(1.0, utilisation), 4),
+            "queue_wait_ms_avg": int(sum(waits) / len(waits) * 1000) if waits else 0,
+            "queue_wait_ms_p50": int(waits[len(waits) // 2] * 1000) if waits else 0,
+            "queue_wait_ms_max": int(waits[-1] * 1000) if waits else 0,
+        }
@@ -65,6 +65,19 @@ class DynamicsRouter:
         self._cache: dict[str, dict[str, float]] = {}
         self._domain_cache: dict[str, dict[str, float]] = {}
         self._last_refresh: float = 0
+        self._db: TransitionDB | None = None
+
+    def _transition_db(self) -> TransitionDB:
+        """Shared handle on the transition DB, opened once and reused across queries."""
+        if self._db is None:
+            self._db = TransitionDB(self.db_path)
+        return self._db
+
+    def close(self) -> None:
+        """Release the transition DB handle."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
     def get_toolchain_probabilities(
         self,
@@ -126,44 +139,39 @@ class DynamicsRouter:
     ) -> dict[str, float]:
         """Query transition DB for success rates by toolchain from specific state."""
         try:
-            db = TransitionDB(self.db_path)
-
             # Get transitions from this state or similar states in same domain
-            cursor = db.conn.cursor()
-
-            # Try exact state match first
-            rows = cursor.execute(
-                """
-                SELECT
-                    t.toolchain,
-                    s_to.data_json as to_state_data,
-                    COUNT(*) as count
-                FROM transitions t
-                JOIN states s_to ON t.to_state = s_to.state_id
-                WHERE t.from_state = ?
-                GROUP BY t.toolchain, s_to.data_json
-            """,
-                (state_id,),
-            ).fetchall()
-
-            # If no exact matches, try domain-level
-            if not rows:
-                rows = cursor.execute(
+            with self._transition_db().pool.read() as conn:
+                # Try exact state match first
+                rows = conn.execute(
                     """
                     SELECT
                         t.toolchain,
                         s_to.data_json as to_state_data,
                         COUNT(*) as count
                     FROM transitions t
-                    JOIN states s_from ON t.from_state = s_from.state_id
                     JOIN states s_to ON t.to_state = s_to.state_id
-                    WHERE s_from.domain = ?
+                    WHERE t.from_state = ?
                     GROUP BY t.toolchain, s_to.data_json
                 """,
-                    (domain,),
+                    (state_id,),
                 ).fetchall()
 
-            db.close()
+                # If no exact matches, try domain-level
+                if not rows:
+                    rows = conn.execute(
+                        """
+                        SELECT
+                            t.toolchain,
+                            s_to.data_json as to_state_data,
+                            COUNT(*) as count
+                        FROM transitions t
+                        JOIN states s_from ON t.from_state = s_from.state_id
+                        JOIN states s_to ON t.to_state = s_to.state_id
+                        WHERE s_from.domain = ?
+                        GROUP BY t.toolchain, s_to.data_json
+                    """,
+                        (domain,),
+                    ).fetchall()
 
             # Aggregate success by toolchain
             toolchain_outcomes: dict[str, dict[str, int]] = {}
@@ -213,28 +221,24 @@ class DynamicsRouter:
             return self._domain_cache[domain]
 
         try:
-            db = TransitionDB(self.db_path)
-
-            cursor = db.conn.cursor()
-            rows = cursor.execute(
-                """
-                SELECT
-                    t.toolchain,
-                    COUNT(*) as total,
-                    SUM(CASE
-                        WHEN json_extract(s_to.data_json, '$.features.phase') IN ('verified', 'merge', 'done', 'success')
-                        THEN 1 ELSE 0
-                    END) as successes
-                FROM transitions t
-                JOIN states s_from ON t.from_state = s_from.state_id
-                JOIN states s_to ON t.to_state = s_to.state_id
-                WHERE s_from.domain = ?
-                GROUP BY t.toolchain
-            """,
-                (domain,),
-            ).fetchall()
-
-            db.close()
+            with self._transition_db().pool.read() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT
+                        t.toolchain,
+                        COUNT(*) as total,
+                        SUM(CASE
+                            WHEN json_extract(s_to.data_json, '$.features.phase') IN ('verified', 'merge', 'done', 'success')
+                            THEN 1 ELSE 0
+                        END) as successes
+                    FROM transitions t
+                    JOIN states s_from ON t.from_state = s_from.state_id
+                    JOIN states s_to ON t.to_state = s_to.state_id
+                    WHERE s_from.domain = ?
+                    GROUP BY t.toolchain
+                """,
+                    (domain,),
+                ).fetchall()
 
             probabilities: dict[str, float] = {}
             for row in rows:
@@ -316,13 +320,6 @@ class DynamicsRouter:
             return {"toolchains": {}, "total_transitions": 0, "domains": []}
 
         try:
-            db = TransitionDB(self.db_path)
-            cursor = db.conn.cursor()
-
-            # Get domain list
-            domains_rows = cursor.execute("SELECT DISTINCT domain FROM states").fetchall()
-            domains = [r["domain"] for r in domains_rows]
-
             # Get toolchain stats
             query = """
                 SELECT
@@ -344,7 +341,10 @@ class DynamicsRouter:
 
             query += " GROUP BY t.toolchain"
 
-            rows = cursor.execute(query, params).fetchall()
+            with self._transition_db().pool.read() as conn:
+                domains_rows = conn.execute("SELECT DISTINCT domain FROM states").fetchall()
+                rows = conn.execute(query, params).fetchall()
+            domains = [r["domain"] for r in domains_rows]
 
             toolchains: dict[str, dict[str, Any]] = {}
             total_transitions = 0
@@ -361,8 +361,6 @@ class DynamicsRouter:
                     }
                     total_transitions += total
 
-            db.close()
-
             return {
                 "toolchains": toolchains,
                 "total_transitions": total_transitions,
@@ -0,0 +1,424 @@
+"""
+Incremental scheduling - keeps scheduler state alive between kernel cycles.
+
+`Scheduler.schedule()` recomputes the ready set and critical path from scratch
+every cycle. `IncrementalScheduler` instead keeps:
+
+- the "blocks" adjacency and per-issue count of unfinished blockers
+- the ready set
+- longest-path distances (effort-weighted) and topological levels
+- longest chains starting at each issue, which give CPM slack
+
+and updates them from the issue/dep changes since the previous cycle.
+
+Cost model:
+- a status flip touches the issue and its direct dependents only
+  (distances do not depend on status)
+- a size change or dep edit re-evaluates the downstream cone of the
+  affected issues (and the upstream cone for chain tails), in local
+  topological order
+- lane packing still runs over the (small) ready set each cycle
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter, deque
+from typing import TYPE_CHECKING
+
+from cyntra.kernel.scheduler import ESCALATION_TAGS, SIZE_TO_HOURS, Scheduler, ScheduleResult
+from cyntra.state.models import GraphDelta
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from cyntra.state.models import BeadsGraph, Dep, Issue
+
+
+# Fields that feed readiness or distances; anything else is picked up by
+# swapping in the latest Issue object without touching derived state.
+_Snapshot = tuple[str, tuple[str, ...], int, int, str]
+
+
+def _snapshot(issue: Issue) -> _Snapshot:
+    return (
+        issue.status,
+        tuple(issue.tags or ()),
+        issue.dk_attempts,
+        issue.dk_max_attempts,
+        issue.dk_size,
+    )
+
+
+def _weight(issue: Issue) -> int:
+    return SIZE_TO_HOURS.get(issue.dk_size, 4)
+
+
+def _is_eligible(issue: Issue) -> bool:
+    """Readiness checks that depend only on the issue itself."""
+    if issue.status not in ("open", "ready"):
+        return False
+    if any(t in ESCALATION_TAGS for t in (issue.tags or [])):
+        return False
+    return issue.dk_attempts < issue.dk_max_attempts
+
+
+class IncrementalScheduleState:
+    """
+    Derived scheduling state for a Beads graph, maintained under deltas.
+
+    Only "blocks" deps participate. Edges may reference issues that are not
+    (yet) present; they are kept and take effect once both ends exist, which
+    matches how `BeadsGraph` accessors skip unknown issues.
+    """
+
+    def __init__(self) -> None:
+        self.issues: dict[str, Issue] = {}
+        self._seq: dict[str, int] = {}
+        self._next_seq = 0
+        self._snapshots: dict[str, _Snapshot] = {}
+
+        # Multiset adjacency of "blocks" edges (A blocks B means A→B)
+        self._out: dict[str, list[str]] = {}
+        self._in: dict[str, list[str]] = {}
+        self._edges: Counter[tuple[str, str]] = Counter()
+        self._edge_deps: dict[tuple[str, str], Dep] = {}
+
+        # Readiness
+        self._open_blockers: dict[str, int] = {}
+        self._ready: set[str] = set()
+
+        # Longest path (earliest finish, in hours) and topological level
+        self.dist: dict[str, int] = {}
+        self.level: dict[str, int] = {}
+        self.parent: dict[str, str | None] = {}
+        self._cyclic: set[str] = set()
+        self._heap: list[tuple[int, int, str]] = []
+
+        # Longest chain starting at each issue (for CPM slack)
+        self.tail: dict[str, int] = {}
+        self._tail_cyclic: set[str] = set()
+
+    # ===== Change application =====
+
+    def sync(self, graph: BeadsGraph) -> GraphDelta:
+        """
+        Bring state in line with a freshly loaded graph.
+
+        Diffing is a linear scan of cheap comparisons; derived state is only
+        recomputed for what actually changed. Returns the applied delta.
+        """
+        seen: dict[str, Issue] = {}
+        for issue in graph.issues:
+            seen.setdefault(issue.id, issue)
+
+        delta = GraphDelta(
+            removed_issue_ids=[iid for iid in self.issues if iid not in seen],
+        )
+        for iid, issue in seen.items():
+            if self._snapshots.get(iid) != _snapshot(issue) or iid not in self.issues:
+                delta.upserted_issues.append(issue)
+            else:
+                # Unchanged for scheduling purposes; keep the newest object.
+                self.issues[iid] = issue
+
+        edges: Counter[tuple[str, str]] = Counter(
+            (d.from_id, d.to_id) for d in graph.deps if d.dep_type == "blocks"
+        )
+        if edges != self._edges:
+            by_key = {(d.from_id, d.to_id): d for d in graph.deps if d.dep_type == "blocks"}
+            delta.added_deps = [
+                by_key[key] for key, n in (edges - self._edges).items() for _ in range(n)
+            ]
+            delta.removed_deps = [
+                self._edge_deps[key] for key, n in (self._edges - edges).items() for _ in range(n)
+            ]
+
+        self.apply(delta)
+        return delta
+
+    def apply(self, delta: GraphDelta) -> None:
+        """Apply issue and dep changes, then refresh affected distances."""
+        # Seeds for the forward (dist) and backward (tail) recomputations
+        dirty: set[str] = set()
+        dirty_tail: set[str] = set()
+
+        for iid in delta.removed_issue_ids:
+            self._remove_issue(iid, dirty, dirty_tail)
+        for issue in delta.upserted_issues:
+            self._upsert_issue(issue, dirty, dirty_tail)
+        for dep in delta.removed_deps:
+            if dep.dep_type == "blocks":
+                self._remove_edge(dep.from_id, dep.to_id, dirty, dirty_tail)
+        for dep in delta.added_deps:
+            if dep.dep_type == "blocks":
+                self._edge_deps[(dep.from_id, dep.to_id)] = dep
+                self._add_edge(dep.from_id, dep.to_id, dirty, dirty_tail)
+
+        if dirty:
+            self._recompute_cone(dirty)
+        if dirty_tail:
+            self._recompute_cone(dirty_tail, forward=False)
+
+    def _upsert_issue(self, issue: Issue, dirty: set[str], dirty_tail: set[str]) -> None:
+        iid = issue.id
+        previous = self.issues.get(iid)
+        self.issues[iid] = issue
+        self._snapshots[iid] = _snapshot(issue)
+
+        if previous is None:
+            if iid not in self._seq:
+                self._seq[iid] = self._next_seq
+                self._next_seq += 1
+            self._open_blockers[iid] = sum(
+                1 for src in self._in.get(iid, ()) if self._blocks_open(src)
+            )
+            if issue.status != "done":
+                self._bump_dependents(iid, +1)
+            dirty.add(iid)
+            dirty_tail.add(iid)
+        else:
+            was_done = previous.status == "done"
+            is_done = issue.status == "done"
+            if was_done != is_done:
+                self._bump_dependents(iid, +1 if was_done else -1)
+            if _weight(previous) != _weight(issue):
+                dirty.add(iid)
+                dirty_tail.add(iid)
+
+        self._refresh_ready(iid)
+
+    def _remove_issue(self, iid: str, dirty: set[str], dirty_tail: set[str]) -> None:
+        issue = self.issues.pop(iid, None)
+        if issue is None:
+            return
+        if issue.status != "done":
+            self._bump_dependents(iid, -1)
+        self._snapshots.pop(iid, None)
+        self._open_blockers.pop(iid, None)
+        self.dist.pop(iid, None)
+        self.level.pop(iid, None)
+        self.parent.pop(iid, None)
+        self.tail.pop(iid, None)
+        self._ready.discard(iid)
+        self._cyclic.discard(iid)
+        self._tail_cyclic.discard(iid)
+        dirty.update(self._succs(iid))
+        dirty_tail.update(self._preds(iid))
+
+    def _add_edge(self, from_id: str, to_id: str, dirty: set[str], dirty_tail: set[str]) -> None:
+        self._edges[(from_id, to_id)] += 1
+        self._out.setdefault(from_id, []).append(to_id)
+        self._in.setdefault(to_id, []).append(from_id)
+        if to_id in self.issues:
+            if self._blocks_open(from_id):
+                self._open_blockers[to_id] += 1
+                self._refresh_ready(to_id)
+            dirty.add(to_id)
+        if from_id in self.issues:
+            dirty_tail.add(from_id)
+
+    def _remove_edge(self, from_id: str, to_id: str, dirty: set[str], dirty_tail: set[str]) -> None:
+        if self._edges[(from_id, to_id)] <= 0:
+            return
+        self._edges[(from_id, to_id)] -= 1
+        if not self._edges[(from_id, to_id)]:
+            del self._edges[(from_id, to_id)]
+            self._edge_deps.pop((from_id, to_id), None)
+        self._out[from_id].remove(to_id)
+        self._in[to_id].remove(from_id)
+        if to_id in self.issues:
+            if self._blocks_open(from_id):
+                self._open_blockers[to_id] -= 1
+                self._refresh_ready(to_id)
+            dirty.add(to_id)
+        if from_id in self.issues:
+            dirty_tail.add(from_id)
+
+    def _blocks_open(self, blocker_id: str) -> bool:
+        blocker = self.issues.get(blocker_id)
+        return blocker is not None and blocker.status != "done"
+
+    def _bump_dependents(self, iid: str, step: int) -> None:
+        for target in self._out.get(iid, ()):
+            if target in self.issues:
+                self._open_blockers[target] += step
+                self._refresh_ready(target)
+
+    def _refresh_ready(self, iid: str) -> None:
+        if self._open_blockers[iid] == 0 and _is_eligible(self.issues[iid]):
+            self._ready.add(iid)
+        else:
+            self._ready.discard(iid)
+
+    # ===== Longest-path maintenance =====
+
+    def _preds(self, iid: str) -> Iterable[str]:
+        return (src for src in self._in.get(iid, ()) if src in self.issues)
+
+    def _succs(self, iid: str) -> Iterable[str]:
+        return (dst for dst in self._out.get(iid, ()) if dst in self.issues)
+
+    def _recompute_cone(self, seeds: set[str], *, forward: bool = True) -> None:
+        """
+        Recompute distances for every issue downstream of `seeds`.
+
+        `forward=True` maintains dist/level/parent (longest chain ending at an
+        issue); `forward=False` walks edges in reverse and maintains `tail`
+        (longest chain starting at an issue).
+        """
+        upstream, downstream = (self._preds, self._succs) if forward else (self._succs, self._preds)
+        cyclic = self._cyclic if forward else self._tail_cyclic
+        evaluate = self._evaluate if forward else self._evaluate_tail
+
+        cone: set[str] = set()
+        stack = [s for s in seeds if s in self.issues]
+        while stack:
+            node = stack.pop()
+            if node in cone:
+                continue
+            cone.add(node)
+            stack.extend(downstream(node))
+
+        # Local Kahn over the cone; predecessors outside it are already final.
+        # Issues behind a cycle outside the cone can never resolve, so they
+        # are held back just as a full rebuild would hold them back.
+        indeg: dict[str, int] = {}
+        for node in cone:
+            preds = list(upstream(node))
+            indeg[node] = sum(1 for p in preds if p in cone)
+            if any(p in cyclic and p not in cone for p in preds):
+                indeg[node] += 1
+        queue = deque(sorted((n for n, d in indeg.items() if d == 0), key=self._seq.__getitem__))
+        resolved: set[str] = set()
+        while queue:
+            node = queue.popleft()
+            cyclic.discard(node)
+            evaluate(node)
+            resolved.add(node)
+            for target in downstream(node):
+                if target in indeg:
+                    indeg[target] -= 1
+                    if indeg[target] == 0:
+                        queue.append(target)
+
+        # Whatever Kahn could not reach sits on or behind a cycle. Those issues
+        # only count acyclic predecessors, matching a full rebuild.
+        leftover = cone - resolved
+        cyclic.update(leftover)
+        for node in sorted(leftover, key=self._seq.__getitem__):
+            evaluate(node)
+
+    def _evaluate(self, iid: str) -> None:
+        best: str | None = None
+        best_key = (-1, 0)
+        level = 0
+        for pred in self._preds(iid):
+            if pred in self._cyclic:
+                continue
+            key = (self.dist[pred], -self._seq[pred])
+            if key > best_key:
+                best, best_key = pred, key
+            level = max(level, self.level[pred] + 1)
+
+        dist = _weight(self.issues[iid]) + (best_key[0] if best is not None else 0)
+        self.parent[iid] = best
+        self.level[iid] = level
+        if self.dist.get(iid) != dist:
+            self.dist[iid] = dist
+            heapq.heappush(self._heap, (-dist, self._seq[iid], iid))
+            if len(self._heap) > 4 * len(self.issues) + 64:
+                self._heap = [(-d, self._seq[i], i) for i, d in self.dist.items()]
+                heapq.heapify(self._heap)
+
+    def _evaluate_tail(self, iid: str) -> None:
+        longest = max(
+            (self.tail[s] for s in self._succs(iid) if s not in self._tail_cyclic),
+            default=0,
+        )
+        self.tail[iid] = _weight(self.issues[iid]) + longest
+
+    # ===== Queries =====
+
+    def ready_issues(self, exclude: set[str] | None = None) -> list[Issue]:
+        """Ready issues in first-seen order, minus any in `exclude`."""
+        exclude = exclude or set()
+        ids = sorted((i for i in self._ready if i not in exclude), key=self._seq.__getitem__)
+        return [self.issues[i] for i in ids]
+
+    def critical_path(self) -> list[Issue]:
+        """Longest effort-weighted chain ending at the furthest-finishing issue."""
+        heap = self._heap
+        while heap:
+            neg_dist, _, iid = heap[0]
+            if self.dist.get(iid) == -neg_dist and iid in self.issues:
+                break
+            heapq.heappop(heap)
+        if not heap:
+            return []
+
+        path: list[Issue] = []
+        current: str | None = heap[0][2]
+        while current is not None:
+            path.append(self.issues[current])
+            current = self.parent.get(current)
+        return list(reversed(path))
+
+    def slack(self, issue_ids: Iterable[str]) -> dict[str, int]:
+        """
+        CPM slack for the given issues, relative to the current critical path.
+
+        slack = duration - (longest chain through the issue). Issues on or
+        next to dependency cycles are omitted.
+        """
+        path = self.critical_path()
+        if not path:
+            return {}
+        duration = self.dist[path[-1].id]
+        return {
+            iid: duration - self.dist[iid] - self.tail[iid] + _weight(self.issues[iid])
+            for iid in issue_ids
+            if iid in self.issues and iid not in self._cyclic and iid not in self._tail_cyclic
+        }
+
+    def topological_order(self) -> list[Issue]:
+        """Issues ordered by topological level (issues on cycles last)."""
+        ids = sorted(
+            self.issues,
+            key=lambda i: (i in self._cyclic, self.level.get(i, 0), self._seq[i]),
+        )
+        return [self.issues[i] for i in ids]
+
+
+class IncrementalScheduler(Scheduler):
+    """
+    Scheduler that carries ready-set and critical-path state across cycles.
+
+    `schedule(graph)` diffs the graph against the previous cycle; callers
+    with a change feed can call `apply(delta)` and then `schedule_current()`
+    to skip the diff entirely.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        self.state = IncrementalScheduleState()
+
+    def schedule(self, graph: BeadsGraph) -> ScheduleResult:
+        """Sync state with `graph` and run lane packing."""
+        self.state.sync(graph)
+        return self.schedule_current()
+
+    def apply(self, delta: GraphDelta) -> None:
+        """Apply changes from a change feed."""
+        self.state.apply(delta)
+
+    def schedule_current(self) -> ScheduleResult:
+        """Schedule from the current incremental state."""
+        ready_set = self.state.ready_issues(exclude=self.running_tasks)
+        critical_path = self.state.critical_path()
+        slack = self.state.slack(i.id for i in ready_set)
+        return self._build_result(ready_set, critical_path, slack)
+
+    def reset(self) -> None:
+        """Drop all cached state; the next cycle does a full rebuild."""
+        self.state = IncrementalScheduleState()
@@ -16,7 +16,7 @@ from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from cyntra.adapters.telemetry import read_telemetry_events
+from cyntra.adapters.telemetry import iter_telemetry_events
 from cyntra.memory import MemoryHooks
 
 if TYPE_CHECKING:
@@ -28,6 +28,9 @@ logger = structlog.get_logger()
 # Default memory database path
 DEFAULT_MEMORY_DB_PATH = Path(".cyntra/memory/cyntra-mem.db")
 
+# Observations written per transaction while ingesting telemetry
+TELEMETRY_CHUNK_SIZE = 500
+
 
 class KernelMemoryBridge:
     """
@@ -193,69 +196,72 @@ class KernelMemoryBridge:
         return result
 
     def _ingest_telemetry(self, telemetry_path: Path) -> None:
-        """Parse telemetry.jsonl and create tool_use observations."""
-        events = read_telemetry_events(telemetry_path)
-
-        for event in events:
-            event_type = event.get("type")
-
-            try:
-                if event_type == "file_write":
-                    self.hooks.tool_use(
-                        tool_name="Write",
-                        tool_args={"path": event.get("path")},
-                        result="File written",
-                        file_refs=[event.get("path")] if event.get("path") else None,
-                    )
-
-                elif event_type == "file_read":
-                    # Skip reads - too noisy, low value
-                    pass
+        """Stream telemetry.jsonl into tool_use observations, bulk-written in chunks."""
+        with self.hooks.batched(flush_every=TELEMETRY_CHUNK_SIZE):
+            for event in iter_telemetry_events(telemetry_path):
+                self._ingest_event(event)
+
+    def _ingest_event(self, event: dict[str, Any]) -> None:
+        """Record one telemetry event as an observation (if it is worth keeping)."""
+        event_type = event.get("type")
+
+        try:
+            if event_type == "file_write":
+                self.hooks.tool_use(
+                    tool_name="Write",
+                    tool_args={"path": event.get("path")},
+                    result="File written",
+                    file_refs=[event.get("path")] if event.get("path") else None,
+                )
 
-                elif event_type == "bash_command":
-                    self.hooks.tool_use(
-                        tool_name="Bash",
-                        tool_args={"command": event.get("command", "")[:200]},
-                        result=(event.get("output", "")[:500] if "output" in event else ""),
-                    )
+            elif event_type == "file_read":
+                # Skip reads - too noisy, low value
+                pass
 
-                elif event_type == "tool_call":
-                    tool = event.get("tool", "unknown")
-                    args = event.get("args", {})
-
-                    # Extract file refs from common args
-                    file_refs = []
-                    if "path" in args:
-                        file_refs.append(args["path"])
-                    elif "file_path" in args:
-                        file_refs.append(args["file_path"])
-
-                    self.hooks.tool_use(
-                        tool_name=tool,
-                        tool_args=args,
-                        result="",  # Result comes in tool_result event
-                        file_refs=file_refs if file_refs else None,
-                    )
+            elif event_type == "bash_command":
+                self.hooks.tool_use(
+                    tool_name="Bash",
+                    tool_args={"command": event.get("command", "")[:200]},
+                    result=(event.get("output", "")[:500] if "output" in event else ""),
+                )
 
-                elif event_type == "tool_result":
-                    # Tool results are paired with tool_call, skip separate handling
-                    pass
+            elif event_type == "tool_call":
+                tool = event.get("tool", "unknown")
+                args = event.get("args", {})
+
+                # Extract file refs from common args
+                file_refs = []
+                if "path" in args:
+                    file_refs.append(args["path"])
+                elif "file_path" in args:
+                    file_refs.append(args["file_path"])
+
+                self.hooks.tool_use(
+                    tool_name=tool,
+                    tool_args=args,
+                    result="",  # Result comes in tool_result event
+                    file_refs=file_refs if file_refs else None,
+                )
 
-                elif event_type == "error":
-                    # Record errors as discoveries
-                    error_msg = event.get("error", "Unknown error")
-                    self.hooks.add_discovery(
-                        discovery=f"Error encountered: {error_msg[:200]}",
-                        context=event.get("context"),
-                    )
+            elif event_type == "tool_result":
+                # Tool results are paired with tool_call, skip separate handling
+                pass
 
-            except Exception as e:
-                logger.warning(
-                    "Failed to process telemetry event",
-                    event_type=event_type,
-                    error=str(e),
+            elif event_type == "error":
+                # Record errors as discoveries
+                error_msg = event.get("error", "Unknown error")
+                self.hooks.add_discovery(
+                    discovery=f"Error encountered: {error_msg[:200]}",
+                    context=event.get("context"),
                 )
 
+        except Exception as e:
+            logger.warning(
+                "Failed to process telemetry event",
+                event_type=event_type,
+                error=str(e),
+            )
+
     def _infer_domain(self, manifest: dict[str, Any]) -> str:
         """Infer domain from manifest job_type."""
         job_type = manifest.get("job_type", "code")
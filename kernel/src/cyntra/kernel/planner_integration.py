@@ -98,7 +98,11 @@ class KernelPlannerIntegration:
             return None
 
         try:
-            self._planner = OnnxPlanner(bundle_dir)
+            self._planner = OnnxPlanner(
+                bundle_dir,
+                intra_op_threads=getattr(self.config.planner, "intra_op_threads", None),
+                inter_op_threads=getattr(self.config.planner, "inter_op_threads", None),
+            )
             return self._planner
         except Exception as exc:
             self._planner_error = f"bundle_load_failed:{exc}"
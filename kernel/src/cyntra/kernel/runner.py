@@ -27,24 +27,26 @@ from cyntra.control.exploration_controller import ExplorationController
 from cyntra.dynamics.state_t1 import build_state_t1
 from cyntra.dynamics.transition_db import TransitionDB
 from cyntra.kernel.config import KernelConfig
+from cyntra.kernel.dispatch_pool import SlotMetrics
 from cyntra.kernel.dispatcher import Dispatcher, DispatchResult
+from cyntra.kernel.incremental import IncrementalScheduler
 from cyntra.kernel.memory_integration import KernelMemoryBridge
 from cyntra.kernel.planner_integration import KernelPlannerIntegration
-from cyntra.kernel.scheduler import Scheduler, ScheduleResult
+from cyntra.kernel.scheduler import DEFAULT_ESTIMATED_TOKENS, ESCALATION_TAGS, ScheduleResult
 from cyntra.kernel.verifier import Verifier
+from cyntra.observability.events import EventEmitter
 from cyntra.sleeptime import SleeptimeConfig, SleeptimeOrchestrator
 from cyntra.state.manager import StateManager
+from cyntra.state.watch import BeadsWatcher
 from cyntra.workcell.manager import WorkcellManager
 
 if TYPE_CHECKING:
     from cyntra.planner.action_space import ActionSpace
-    from cyntra.state.models import BeadsGraph, Issue
+    from cyntra.state.models import BeadsGraph, GraphDelta, Issue
 
 logger = structlog.get_logger()
 console = Console()
 
-ESCALATION_TAGS = {"escalation", "needs-human", "@human-escalated", "human-escalated"}
-
 
 def _utc_now() -> datetime:
     """Get current UTC time as timezone-aware datetime."""
@@ -114,13 +116,27 @@ class KernelRunner:
         self._running_tasks: set[str] = set()
 
         # Initialize components
-        self.state_manager = StateManager(self.config)
+        self.state_manager = StateManager(self.config, cached=True)
         self.controller = ExplorationController(self.config)
-        self.scheduler = Scheduler(self.config, self._running_tasks, controller=self.controller)
+        self.scheduler = IncrementalScheduler(
+            self.config, self._running_tasks, controller=self.controller
+        )
         self.dispatcher = Dispatcher(self.config, controller=self.controller)
         self.verifier = Verifier(self.config)
         self.planner_integration = KernelPlannerIntegration(self.config)
         self.workcell_manager = WorkcellManager(self.config, self.config.repo_root)
+        event_log = self.config.event_log
+        self.events = EventEmitter(
+            self.config.logs_dir,
+            flush_interval=event_log.flush_interval_seconds,
+            max_segment_bytes=int(event_log.max_segment_mb * (1 << 20)),
+            roll_daily=event_log.roll_daily,
+            compression=event_log.compression,
+            retention_days=event_log.retention_days,
+        )
+        self.beads_watcher = BeadsWatcher(self.config.beads_path)
+        self._cached_graph: BeadsGraph | None = None
+        self._pending_delta: GraphDelta | None = None
 
         # Memory integration (claude-mem pattern)
         self.memory_bridge = KernelMemoryBridge(
@@ -178,6 +194,8 @@ class KernelRunner:
                 logger.info("Starting kernel cycle", cycle=self._cycle_count)
 
                 had_work = await self._run_cycle()
+                self.state_manager.flush()
+                self.events.flush()
 
                 if self.single_cycle:
                     console.print("\n[green]✓[/green] Single cycle complete")
@@ -188,12 +206,25 @@ class KernelRunner:
                     break
 
                 if self.config.watch_mode:
+                    # Idle: fold our logged issue writes into issues.jsonl.
+                    self.state_manager.compact()
                     console.print("[dim]Waiting for Beads changes...[/dim]")
-                    await asyncio.sleep(5)
+                    change = await self.beads_watcher.wait()
+                    if change is not None:
+                        self._pending_delta = change.delta
+                        logger.info(
+                            "Beads changed",
+                            incremental=not change.requires_reload,
+                            watcher=self.beads_watcher.mode,
+                        )
 
         except KeyboardInterrupt:
             console.print("\n[yellow]Interrupted[/yellow]")
             self._running = False
+        finally:
+            self.state_manager.compact()
+            self.events.close()
+            self.beads_watcher.close()
 
         self._display_summary()
 
@@ -203,25 +234,10 @@ class KernelRunner:
 
         Returns True if work was dispatched.
         """
-        # Load current state
-        graph = self.state_manager.load_beads_graph()
-
-        if not graph.issues:
-            console.print("[yellow]No issues found in Beads[/yellow]")
+        loaded = self._load_and_schedule(announce=True)
+        if loaded is None:
             return False
-
-        # Filter to target issue if specified
-        if self.target_issue:
-            graph = graph.filter_to_issue(self.target_issue)
-            if not graph.issues:
-                console.print(f"[yellow]Issue #{self.target_issue} not found[/yellow]")
-                return False
-
-        # Update scheduler with current running tasks
-        self.scheduler.update_running_tasks(self._running_tasks)
-
-        # Schedule
-        schedule = self.scheduler.schedule(graph)
+        graph, schedule = loaded
 
         if not schedule.scheduled_lanes:
             if self.target_issue and self.single_cycle:
@@ -257,6 +273,61 @@ class KernelRunner:
 
         return True
 
+    def _load_and_schedule(
+        self,
+        *,
+        announce: bool = False,
+        in_flight: set[str] | None = None,
+        reserved_tokens: int = 0,
+    ) -> tuple[BeadsGraph, ScheduleResult] | None:
+        """
+        Load Beads state and run the scheduler.
+
+        Returns None when there is nothing to schedule from (no issues, or the
+        target issue is missing).
+
+        In watch mode, issues journaled or records appended to the Beads files
+        since the last load are applied to the cached graph instead of
+        re-reading everything.
+        """
+        delta, self._pending_delta = self._pending_delta, None
+        incremental = (
+            delta is not None
+            and self._cached_graph is not None
+            and not self.target_issue
+            and not self.state_manager.bd_available
+        )
+        if incremental:
+            graph = self._cached_graph
+            graph.apply(delta)
+        else:
+            self.beads_watcher.mark_synced()
+            graph = self.state_manager.load_beads_graph()
+            self._cached_graph = graph if self.config.watch_mode else None
+
+        if not graph.issues:
+            if announce:
+                console.print("[yellow]No issues found in Beads[/yellow]")
+            return None
+
+        # Filter to target issue if specified
+        if self.target_issue:
+            graph = graph.filter_to_issue(self.target_issue)
+            if not graph.issues:
+                if announce:
+                    console.print(f"[yellow]Issue #{self.target_issue} not found[/yellow]")
+                return None
+
+        # Update scheduler with current running tasks and the tokens they hold
+        self.scheduler.update_running_tasks(
+            self._running_tasks | (in_flight or set()), reserved_tokens
+        )
+
+        if incremental:
+            self.scheduler.apply(delta)
+            return graph, self.scheduler.schedule_current()
+        return graph, self.scheduler.schedule(graph)
+
     def _explain_not_ready(self, issue: Issue, graph: BeadsGraph) -> str:
         reasons: list[str] = []
         if issue.status not in ("open", "ready"):
@@ -271,9 +342,19 @@ class KernelRunner:
         return "; ".join(reasons) if reasons else "unspecified"
 
     async def _dispatch_parallel(self, schedule: ScheduleResult) -> None:
-        """Dispatch all scheduled work in parallel."""
-        spec_ids = {i.id for i in schedule.speculate_issues}
+        """
+        Dispatch scheduled work through a bounded pool of workcell slots.
+
+        The pool holds `max_concurrent_workcells` slots. Whenever a dispatch
+        finishes, its slots are released and the scheduler is re-run against
+        fresh Beads state, so dependents unblocked by the finished issue (and
+        anything else that became ready) start immediately instead of waiting
+        for the slowest workcell of the batch. In single-cycle mode only the
+        initial schedule is dispatched.
 
+        Slot utilisation and queue wait are emitted as a `dispatch.metrics`
+        event when the pool drains.
+        """
         from cyntra.planner.artifacts import collect_history_candidates
 
         history_candidates = collect_history_candidates(
@@ -281,25 +362,117 @@ class KernelRunner:
             include_world=False,
         )
 
-        # Separate speculate vs single dispatch
-        speculate_issues = [i for i in schedule.scheduled_lanes if i.id in spec_ids]
-        single_issues = [i for i in schedule.scheduled_lanes if i.id not in spec_ids]
+        metrics = SlotMetrics(self.config.max_concurrent_workcells)
+        active: dict[asyncio.Task[None], tuple[str, int, int]] = {}
+        pending: ScheduleResult | None = schedule
+        announced = False
 
-        # Create tasks for all dispatches
-        tasks = []
+        while True:
+            if pending is not None:
+                in_flight = {issue_id for issue_id, _, _ in active.values()}
+                started = self._fill_slots(
+                    pending, metrics, active, in_flight, history_candidates=history_candidates
+                )
+                if started and not announced:
+                    console.print(
+                        f"\n[cyan]Dispatching {started} task(s) "
+                        f"across {metrics.capacity} slot(s)...[/cyan]"
+                    )
+                    announced = True
+
+            if not active:
+                break
+
+            done, _ = await asyncio.wait(active, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                issue_id, slots, tokens = active.pop(task)
+                metrics.release(slots, tokens)
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(
+                        "Dispatch task failed",
+                        issue_id=issue_id,
+                        error=str(task.exception()),
+                    )
 
-        for issue in single_issues:
-            tasks.append(self._dispatch_single_async(issue, history_candidates=history_candidates))
+            # Persist this round's status changes in one batched write.
+            self.state_manager.flush()
 
-        for issue in speculate_issues:
-            tasks.append(
-                self._dispatch_speculate_async(issue, history_candidates=history_candidates)
+            pending = None
+            if not self.single_cycle and self._running:
+                in_flight = {issue_id for issue_id, _, _ in active.values()}
+                loaded = self._load_and_schedule(
+                    in_flight=in_flight, reserved_tokens=metrics.busy_tokens
+                )
+                pending = loaded[1] if loaded else None
+
+        summary = metrics.summary()
+        self.events.dispatch_metrics(summary)
+        self.events.flush()
+        logger.info("Dispatch pool drained", **summary)
+
+    def _fill_slots(
+        self,
+        schedule: ScheduleResult,
+        metrics: SlotMetrics,
+        active: dict[asyncio.Task[None], tuple[str, int, int]],
+        in_flight: set[str],
+        *,
+        history_candidates: list[dict[str, Any]],
+    ) -> int:
+        """
+        Start scheduled lanes into free slots, in priority order. Returns count started.
+
+        A lane holds its estimated tokens per slot until it finishes; lanes
+        that would exceed `max_concurrent_tokens` stay queued.
+        """
+        spec_ids = {i.id for i in schedule.speculate_issues}
+        for issue in schedule.ready_issues:
+            if issue.id not in in_flight:
+                metrics.mark_ready(issue.id)
+
+        started = 0
+        for issue in schedule.scheduled_lanes:
+            if metrics.free <= 0:
+                break
+            if issue.id in in_flight or issue.id in self._running_tasks:
+                continue
+
+            speculate = issue.id in spec_ids
+            est_tokens = issue.dk_estimated_tokens or DEFAULT_ESTIMATED_TOKENS
+            free_tokens = self.config.max_concurrent_tokens - metrics.busy_tokens
+            # Extra speculate attempts only while the budget lasts, as in pack_lanes.
+            slots = min(
+                self._lane_slots(issue, speculate),
+                metrics.capacity,
+                max(1, free_tokens // est_tokens),
             )
+            if slots > metrics.free or est_tokens > free_tokens:
+                # Leave the lane queued; a smaller one may still fit.
+                continue
 
-        # Run all in parallel
-        if tasks:
-            console.print(f"\n[cyan]Dispatching {len(tasks)} task(s) in parallel...[/cyan]")
-            await asyncio.gather(*tasks)
+            coro = (
+                self._dispatch_speculate_async(issue, history_candidates=history_candidates)
+                if speculate
+                else self._dispatch_single_async(issue, history_candidates=history_candidates)
+            )
+            wait_s = metrics.acquire(issue.id, slots, est_tokens * slots)
+            active[asyncio.create_task(coro)] = (issue.id, slots, est_tokens * slots)
+            in_flight.add(issue.id)
+            started += 1
+            logger.debug("Slot acquired", issue_id=issue.id, slots=slots, queue_wait_s=wait_s)
+
+        return started
+
+    def _lane_slots(self, issue: Issue, speculate: bool) -> int:
+        """Number of workcell slots a lane occupies."""
+        if not speculate:
+            return 1
+        from cyntra.kernel.routing import speculate_parallelism
+
+        return max(
+            1,
+            self.controller.speculate_parallelism(issue, speculate_parallelism(self.config, issue)),
+        )
 
     async def _dispatch_single_async(
         self,
@@ -1227,7 +1400,6 @@ class KernelRunner:
 
         try:
             self.transition_db.insert_transition(transition)
-            self.transition_db.conn.commit()
             logger.debug(
                 "Recorded transition",
                 transition_id=transition_id,
@@ -31,6 +31,30 @@ def _utc_now() -> datetime:
 # Size to hours mapping for critical path calculation
 SIZE_TO_HOURS = {"XS": 1, "S": 2, "M": 4, "L": 8, "XL": 16}
 
+# Token estimate for issues without dk_estimated_tokens
+DEFAULT_ESTIMATED_TOKENS = 50000
+
+# Tags marking issues that are reserved for humans and never auto-scheduled
+ESCALATION_TAGS = frozenset({"escalation", "needs-human", "@human-escalated", "human-escalated"})
+
+
+@dataclass
+class CriticalPathAnalysis:
+    """CPM schedule over the blocks graph, in estimated hours."""
+
+    path: list[Issue] = field(default_factory=list)
+    earliest_start: dict[str, int] = field(default_factory=dict)
+    latest_start: dict[str, int] = field(default_factory=dict)
+    duration: int = 0
+
+    @property
+    def slack(self) -> dict[str, int]:
+        """Per-issue total float (latest start minus earliest start)."""
+        return {
+            issue_id: self.latest_start[issue_id] - start
+            for issue_id, start in self.earliest_start.items()
+        }
+
 
 @dataclass
 class ScheduleResult:
@@ -42,11 +66,12 @@ class ScheduleResult:
     speculate_issues: list[Issue]
     skipped_issues: list[Issue] = field(default_factory=list)
     reasons: dict[str, str] = field(default_factory=dict)
+    slack: dict[str, int] = field(default_factory=dict)
 
     @property
     def total_estimated_tokens(self) -> int:
         """Total estimated tokens for scheduled work."""
-        return sum(i.dk_estimated_tokens or 50000 for i in self.scheduled_lanes)
+        return sum(i.dk_estimated_tokens or DEFAULT_ESTIMATED_TOKENS for i in self.scheduled_lanes)
 
     def summary(self) -> str:
         """Human-readable summary."""
@@ -78,6 +103,8 @@ class Scheduler:
     ) -> None:
         self.config = config
         self.running_tasks = running_tasks or set()
+        # Tokens held by lanes that are already running
+        self.reserved_tokens = 0
         self.controller = controller or ExplorationController(config)
 
     def schedule(self, graph: BeadsGraph) -> ScheduleResult:
@@ -87,10 +114,26 @@ class Scheduler:
         Returns ready issues, critical path, and scheduled lanes.
         """
         ready_set = self.compute_ready_set(graph)
-        critical_path = self.compute_critical_path(graph)
+        analysis = self.analyze_critical_path(graph)
+        slack = analysis.slack
+        return self._build_result(
+            ready_set,
+            analysis.path,
+            {i.id: slack[i.id] for i in ready_set if i.id in slack},
+        )
+
+    def _build_result(
+        self,
+        ready_set: list[Issue],
+        critical_path: list[Issue],
+        slack: dict[str, int] | None = None,
+    ) -> ScheduleResult:
+        """Apply starvation boosts, pack lanes and pick speculate candidates."""
         ready_set = self.prevent_starvation(ready_set)
-        scheduled, skipped, reasons = self.pack_lanes(ready_set, critical_path)
-        speculate = [i for i in scheduled if self.should_speculate(i, critical_path)]
+        scheduled, skipped, reasons = self.pack_lanes(
+            ready_set, critical_path, slack, reserved_tokens=self.reserved_tokens
+        )
+        speculate = [i for i in scheduled if self.should_speculate(i, critical_path, slack)]
 
         return ScheduleResult(
             ready_issues=ready_set,
@@ -99,6 +142,7 @@ class Scheduler:
             speculate_issues=speculate,
             skipped_issues=skipped,
             reasons=reasons,
+            slack=dict(slack or {}),
         )
 
     def compute_ready_set(self, graph: BeadsGraph) -> list[Issue]:
@@ -119,10 +163,7 @@ class Scheduler:
                 continue
 
             # Escalations are for humans only; never auto-schedule them.
-            if any(
-                t in {"escalation", "needs-human", "@human-escalated", "human-escalated"}
-                for t in (issue.tags or [])
-            ):
+            if any(t in ESCALATION_TAGS for t in (issue.tags or [])):
                 continue
 
             # Check if already running
@@ -145,27 +186,31 @@ class Scheduler:
         Compute the critical path through the dependency graph.
 
         Critical path = longest chain weighted by estimated effort.
-        Uses topological sort + dynamic programming.
+        See `analyze_critical_path` for the full CPM schedule.
+        """
+        return self.analyze_critical_path(graph).path
+
+    def analyze_critical_path(self, graph: BeadsGraph) -> CriticalPathAnalysis:
+        """
+        Run the critical path method over "blocks" deps.
+
+        Builds adjacency in one pass over deps, topologically sorts with
+        Kahn's algorithm, then does a forward pass (earliest start/finish)
+        and a backward pass (latest start). Linear in issues + deps.
+        Issues on dependency cycles get no slack entry.
         """
         if not graph.issues:
-            return []
+            return CriticalPathAnalysis()
 
         # Build adjacency list (A blocks B means edge A→B)
-        adj: dict[str, list[str]] = defaultdict(list)
-        in_degree: dict[str, int] = defaultdict(int)
         issue_map = {i.id: i for i in graph.issues}
+        adj: dict[str, list[str]] = defaultdict(list)
+        in_degree: dict[str, int] = dict.fromkeys(issue_map, 0)
 
-        for issue in graph.issues:
-            # Find all issues that this issue blocks
-            for dep in graph.deps:
-                if dep.from_id == issue.id and dep.dep_type == "blocks":
-                    adj[issue.id].append(dep.to_id)
-                    in_degree[dep.to_id] += 1
-
-        # Initialize in_degree for all issues
-        for issue in graph.issues:
-            if issue.id not in in_degree:
-                in_degree[issue.id] = 0
+        for dep in graph.deps:
+            if dep.dep_type == "blocks" and dep.from_id in issue_map:
+                adj[dep.from_id].append(dep.to_id)
+                in_degree[dep.to_id] = in_degree.get(dep.to_id, 0) + 1
 
         # Topological sort using Kahn's algorithm
         queue = deque([i for i in graph.issues if in_degree[i.id] == 0])
@@ -182,23 +227,24 @@ class Scheduler:
                         queue.append(neighbor)
 
         if not topo_order:
-            return []
+            return CriticalPathAnalysis()
 
-        # DP: longest path ending at each node
-        dist = {i.id: SIZE_TO_HOURS.get(i.dk_size, 4) for i in graph.issues}
-        parent: dict[str, str | None] = {i.id: None for i in graph.issues}
+        # Forward pass: longest path ending at each node (earliest finish)
+        weight = {i.id: SIZE_TO_HOURS.get(i.dk_size, 4) for i in graph.issues}
+        dist = dict(weight)
+        parent: dict[str, str | None] = dict.fromkeys(weight)
 
         for node in topo_order:
             for neighbor_id in adj[node.id]:
-                neighbor = issue_map.get(neighbor_id)
-                if neighbor:
-                    new_dist = dist[node.id] + SIZE_TO_HOURS.get(neighbor.dk_size, 4)
+                if neighbor_id in issue_map:
+                    new_dist = dist[node.id] + weight[neighbor_id]
                     if new_dist > dist[neighbor_id]:
                         dist[neighbor_id] = new_dist
                         parent[neighbor_id] = node.id
 
         # Backtrack from max
         end_id: str = max(dist, key=lambda x: dist[x])
+        duration = dist[end_id]
         path: list[Issue] = []
 
         current: str | None = end_id
@@ -208,45 +254,67 @@ class Scheduler:
                 path.append(issue)
             current = parent.get(current)
 
-        return list(reversed(path))
+        # Backward pass: latest start without delaying the whole schedule
+        earliest_start: dict[str, int] = {}
+        latest_start: dict[str, int] = {}
+        for node in reversed(topo_order):
+            latest_finish = min(
+                (latest_start[s] for s in adj[node.id] if s in latest_start),
+                default=duration,
+            )
+            latest_start[node.id] = latest_finish - weight[node.id]
+            earliest_start[node.id] = dist[node.id] - weight[node.id]
+
+        return CriticalPathAnalysis(
+            path=list(reversed(path)),
+            earliest_start=earliest_start,
+            latest_start=latest_start,
+            duration=duration,
+        )
 
     def pack_lanes(
         self,
         ready_set: list[Issue],
         critical_path: list[Issue],
+        slack: dict[str, int] | None = None,
+        *,
+        reserved_tokens: int = 0,
     ) -> tuple[list[Issue], list[Issue], dict[str, str]]:
         """
         Pack ready issues into parallel lanes respecting:
         - max_concurrent_workcells
-        - max_concurrent_tokens
+        - max_concurrent_tokens, less `reserved_tokens` held by running lanes
         - Critical path priority
+        - Slack (least float first, among equal priority)
 
         Returns (scheduled, skipped, reasons)
         """
+        slack = slack or {}
         lanes: list[Issue] = []
         skipped: list[Issue] = []
         reasons: dict[str, str] = {}
 
         remaining_slots = self.config.max_concurrent_workcells
-        remaining_tokens = self.config.max_concurrent_tokens
+        remaining_tokens = self.config.max_concurrent_tokens - reserved_tokens
 
         # Priority 1: Critical path items that are ready
         cp_ids = {i.id for i in critical_path}
         cp_ready = [i for i in ready_set if i.id in cp_ids]
 
-        # Priority 2: High priority items (sorted by priority, then risk)
+        # Priority 2: High priority items (sorted by priority, then slack, then risk)
         other_ready = sorted(
             [i for i in ready_set if i.id not in cp_ids],
             key=lambda x: (
                 self.controller.decide(x).priority_rank,
                 x.dk_priority or "P2",
+                slack.get(x.id, 0),
                 -{"low": 0, "medium": 1, "high": 2, "critical": 3}.get(x.dk_risk, 1),
             ),
         )
 
         # Pack into lanes (critical path first, then others)
         for issue in cp_ready + other_ready:
-            est_tokens = issue.dk_estimated_tokens or 50000
+            est_tokens = issue.dk_estimated_tokens or DEFAULT_ESTIMATED_TOKENS
 
             # Check slot availability
             if remaining_slots <= 0:
@@ -266,7 +334,7 @@ class Scheduler:
             remaining_tokens -= est_tokens
 
             # If speculate mode, reserve additional slots for parallel attempts
-            if self.should_speculate(issue, critical_path):
+            if self.should_speculate(issue, critical_path, slack):
                 from cyntra.kernel.routing import speculate_parallelism
 
                 desired_parallelism = self.controller.speculate_parallelism(
@@ -284,13 +352,19 @@ class Scheduler:
 
         return lanes, skipped, reasons
 
-    def should_speculate(self, issue: Issue, critical_path: list[Issue]) -> bool:
+    def should_speculate(
+        self,
+        issue: Issue,
+        critical_path: list[Issue],
+        slack: dict[str, int] | None = None,
+    ) -> bool:
         """
         Determine if an issue should use speculate+vote mode.
 
         Triggered when:
         1. Issue has dk_speculate: true
-        2. Issue is on critical path AND has dk_risk >= 'high'
+        2. Issue is critical (on the critical path, or zero slack) AND has
+           dk_risk >= 'high'
         3. Config has force_speculate enabled
         """
         if not self.config.speculation.enabled:
@@ -313,10 +387,8 @@ class Scheduler:
         # Auto-trigger for high-risk critical path items
         if self.config.speculation.auto_trigger_on_critical_path:
             cp_ids = {i.id for i in critical_path}
-            if (
-                issue.id in cp_ids
-                and issue.dk_risk in self.config.speculation.auto_trigger_risk_levels
-            ):
+            is_critical = issue.id in cp_ids or (slack or {}).get(issue.id) == 0
+            if is_critical and issue.dk_risk in self.config.speculation.auto_trigger_risk_levels:
                 return True
 
         return False
@@ -361,6 +433,7 @@ class Scheduler:
             key=lambda x: (x.dk_priority or "P2", not getattr(x, "dk_starved", False)),
         )
 
-    def update_running_tasks(self, task_ids: set[str]) -> None:
-        """Update the set of currently running task IDs."""
+    def update_running_tasks(self, task_ids: set[str], reserved_tokens: int = 0) -> None:
+        """Update the set of currently running task IDs and the tokens they hold."""
         self.running_tasks = task_ids
+        self.reserved_tokens = reserved_tokens
@@ -0,0 +1,202 @@
+"""
+Incremental similarity clustering for memory consolidation.
+
+`NeighborGraph` keeps a thresholded k-nearest-neighbour graph over
+normalised embeddings. New vectors are scored in blocks against the
+matrix (blocked top-k), so inserting m vectors into an n-vector graph
+costs O(m * n) dot products rather than re-scoring all n^2 pairs.
+
+Only rows whose neighbourhood changed since they were last examined are
+"pending"; `leader_clusters` seeds clusters from those rows alone, so
+repeated consolidation passes cost grows with new memories, not with
+the total number of memories.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+
+import numpy as np
+
+from .vector_ops import normalize_rows
+
+DEFAULT_MAX_NEIGHBORS = 32
+DEFAULT_BLOCK_SIZE = 1024
+
+
+class NeighborGraph:
+    """
+    Growable kNN graph keeping edges with similarity >= threshold.
+
+    Rows are addressed by caller-supplied keys (memory IDs). Removed rows
+    are tombstoned; build a new graph to compact.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        max_neighbors: int = DEFAULT_MAX_NEIGHBORS,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        """
+        Initialize an empty graph.
+
+        Args:
+            threshold: Minimum cosine similarity for an edge
+            max_neighbors: Edges kept per row (most similar first)
+            block_size: Rows scored per matrix multiply
+        """
+        self.threshold = threshold
+        self.max_neighbors = max_neighbors
+        self.block_size = block_size
+
+        self.keys: list[Hashable] = []
+        self._rows: dict[Hashable, int] = {}
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._neighbors: list[dict[int, float]] = []
+        self.pending: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    # ===== Mutation =====
+
+    def add(self, keys: Sequence[Hashable], embeddings: Sequence[Sequence[float]]) -> set[int]:
+        """
+        Insert vectors and link them to their nearest neighbours.
+
+        Keys already present are ignored.
+
+        Returns:
+            Rows whose neighbourhood changed (new rows and rows gaining an edge)
+        """
+        fresh: dict[Hashable, Sequence[float]] = {}
+        for key, embedding in zip(keys, embeddings, strict=True):
+            if key not in self._rows:
+                fresh.setdefault(key, embedding)
+        if not fresh:
+            return set()
+
+        vectors = normalize_rows(list(fresh.values()))
+        start = len(self.keys)
+        self._grow(start + len(vectors), vectors.shape[1])
+        self._matrix[start : start + len(vectors)] = vectors
+        self._alive[start : start + len(vectors)] = True
+        for offset, key in enumerate(fresh):
+            self.keys.append(key)
+            self._rows[key] = start + offset
+            self._neighbors.append({})
+
+        end = len(self.keys)
+        matrix = self._matrix[:end]
+        changed = set(range(start, end))
+        for block_start in range(start, end, self.block_size):
+            block_end = min(block_start + self.block_size, end)
+            scores = matrix[block_start:block_end] @ matrix.T
+            scores[:, ~self._alive[:end]] = -np.inf
+            for offset, row_scores in enumerate(scores):
+                i = block_start + offset
+                row_scores[i] = -np.inf
+                for j, sim in self._top_neighbors(row_scores):
+                    self._link(i, j, sim)
+                    if self._link(j, i, sim):
+                        changed.add(j)
+
+        self.pending |= changed
+        return changed
+
+    def remove(self, keys: Sequence[Hashable]) -> None:
+        """Tombstone rows (e.g. memories archived by consolidation)."""
+        for key in keys:
+            row = self._rows.pop(key, None)
+            if row is None:
+                continue
+            self._alive[row] = False
+            self.pending.discard(row)
+            for j in self._neighbors[row]:
+                self._neighbors[j].pop(row, None)
+            self._neighbors[row] = {}
+
+    def _grow(self, rows: int, dim: int) -> None:
+        if self._matrix.shape[1] not in (0, dim):
+            raise ValueError(
+                f"Embedding dim {dim} does not match graph dim {self._matrix.shape[1]}"
+            )
+        if rows <= len(self._matrix):
+            return
+        capacity = max(rows, 2 * len(self._matrix), 64)
+        rows_used = len(self.keys)
+        matrix = np.zeros((capacity, dim), dtype=np.float32)
+        alive = np.zeros(capacity, dtype=bool)
+        if rows_used:
+            matrix[:rows_used] = self._matrix[:rows_used]
+            alive[:rows_used] = self._alive[:rows_used]
+        self._matrix, self._alive = matrix, alive
+
+    def _top_neighbors(self, scores: np.ndarray) -> list[tuple[int, float]]:
+        candidates = np.flatnonzero(scores >= self.threshold)
+        if len(candidates) > self.max_neighbors:
+            keep = np.argpartition(-scores[candidates], self.max_neighbors - 1)
+            candidates = candidates[keep[: self.max_neighbors]]
+        return [(int(j), min(float(scores[j]), 1.0)) for j in candidates]
+
+    def _link(self, i: int, j: int, sim: float) -> bool:
+        """Add edge i -> j if it ranks among i's best; returns whether it was added."""
+        neighbors = self._neighbors[i]
+        if j in neighbors:
+            return False
+        if len(neighbors) >= self.max_neighbors:
+            worst = min(neighbors, key=neighbors.__getitem__)
+            if neighbors[worst] >= sim:
+                return False
+            del neighbors[worst]
+        neighbors[j] = sim
+        return True
+
+    # ===== Clustering =====
+
+    def leader_clusters(
+        self,
+        min_size: int,
+        max_size: int,
+        limit: int | None = None,
+    ) -> list[list[tuple[Hashable, float]]]:
+        """
+        Greedy leader clustering seeded from pending rows.
+
+        Each pending row (in insertion order) that is not yet in a cluster
+        leads one: its unclustered neighbours, in insertion order like the
+        original greedy pass, up to `max_size` members in total. Leaders that cannot gather
+        `min_size` members stop being pending; leaders of returned clusters
+        stay pending until removed, so unconsolidated clusters resurface.
+
+        Returns:
+            Clusters as [(key, similarity to leader), ...], leader first
+        """
+        clusters: list[list[tuple[Hashable, float]]] = []
+        used: set[int] = set()
+
+        for leader in sorted(self.pending):
+            if limit is not None and len(clusters) >= limit:
+                break
+            if leader in used:
+                continue
+
+            neighbors = self._neighbors[leader]
+            members = [
+                (j, neighbors[j]) for j in sorted(neighbors) if j not in used and self._alive[j]
+            ][: max_size - 1]
+
+            if len(members) + 1 < min_size:
+                self.pending.discard(leader)
+                continue
+
+            clusters.append([(self.keys[leader], 1.0)] + [(self.keys[j], s) for j, s in members])
+            used.add(leader)
+            used.update(j for j, _ in members)
+
+        return clusters
@@ -158,21 +158,7 @@ class CollectiveMemoryService:
         Returns:
             List of collective pattern memories
         """
-        # Search for collective scope patterns
-        # This requires a custom query since search_by_type is agent-scoped
-        async with self.store.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT * FROM agent_memories
-                WHERE scope = 'collective'
-                  AND memory_type = 'pattern'
-                  AND is_archived = FALSE
-                ORDER BY importance_score DESC
-                LIMIT $1
-                """,
-                limit,
-            )
-            return [self.store._row_to_memory(row) for row in rows]
+        return await self.store.search_collective(MemoryType.PATTERN, limit=limit)
 
     async def get_collective_by_type(
         self,
@@ -189,20 +175,7 @@ class CollectiveMemoryService:
         Returns:
             List of collective memories
         """
-        async with self.store.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT * FROM agent_memories
-                WHERE scope = 'collective'
-                  AND memory_type = $1
-                  AND is_archived = FALSE
-                ORDER BY importance_score DESC
-                LIMIT $2
-                """,
-                memory_type.value,
-                limit,
-            )
-            return [self.store._row_to_memory(row) for row in rows]
+        return await self.store.search_collective(memory_type, limit=limit)
 
     async def find_similar_across_agents(
         self,
@@ -223,35 +196,16 @@ class CollectiveMemoryService:
         Returns:
             List of similar memories from other agents
         """
-        if not memory.embedding:
+        if memory.embedding is None:
             return []
 
-        async with self.store.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT m.*,
-                       1 - (m.embedding <=> $1::vector) as similarity_score
-                FROM agent_memories m
-                WHERE m.agent_id != $2
-                  AND m.memory_type = $3
-                  AND m.is_archived = FALSE
-                  AND 1 - (m.embedding <=> $1::vector) >= $4
-                ORDER BY m.embedding <=> $1::vector
-                LIMIT $5
-                """,
-                memory.embedding,
-                memory.agent_id,
-                memory.memory_type.value,
-                similarity_threshold,
-                limit,
-            )
-
-            memories = []
-            for row in rows:
-                mem = self.store._row_to_memory(row)
-                mem.similarity_score = row["similarity_score"]
-                memories.append(mem)
-            return memories
+        return await self.store.search_similar_other_agents(
+            memory.embedding,
+            agent_id=memory.agent_id,
+            memory_type=memory.memory_type,
+            similarity_threshold=similarity_threshold,
+            limit=limit,
+        )
 
     async def identify_promotion_candidates(
         self,
@@ -272,34 +226,21 @@ class CollectiveMemoryService:
         criteria = self.criteria
 
         # Find high-quality individual memories
-        async with self.store.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT * FROM agent_memories
-                WHERE scope = 'individual'
-                  AND memory_type IN ('pattern', 'dynamic', 'playbook')
-                  AND importance_score >= $1
-                  AND access_count >= $2
-                  AND confidence >= $3
-                  AND is_archived = FALSE
-                ORDER BY importance_score DESC, access_count DESC
-                LIMIT $4
-                """,
-                criteria.min_importance,
-                criteria.min_access_count,
-                criteria.pattern_min_confidence,
-                limit * 2,  # Fetch extra to filter
-            )
-
-            candidates = []
-            for row in rows:
-                memory = self.store._row_to_memory(row)
-
-                # Check if similar patterns exist in other agents
-                similar = await self.find_similar_across_agents(memory)
-                if len(similar) >= criteria.pattern_min_agents - 1:
-                    candidates.append(memory)
-                    if len(candidates) >= limit:
-                        break
-
-            return candidates
+        memories = await self.store.get_promotion_candidates(
+            [MemoryType.PATTERN, MemoryType.DYNAMIC, MemoryType.PLAYBOOK],
+            min_importance=criteria.min_importance,
+            min_access_count=criteria.min_access_count,
+            min_confidence=criteria.pattern_min_confidence,
+            limit=limit * 2,  # Fetch extra to filter
+        )
+
+        candidates = []
+        for memory in memories:
+            # Check if similar patterns exist in other agents
+            similar = await self.find_similar_across_agents(memory)
+            if len(similar) >= criteria.pattern_min_agents - 1:
+                candidates.append(memory)
+                if len(candidates) >= limit:
+                    break
+
+        return candidates
@@ -8,9 +8,11 @@ to reduce token usage and improve retrieval quality.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID, uuid4
 
+from .clustering import DEFAULT_MAX_NEIGHBORS, NeighborGraph
 from .models import AgentMemory, ConsolidationCluster, ExtractedMemory, MemoryType
 
 logger = logging.getLogger(__name__)
@@ -28,12 +30,38 @@ class ConsolidationConfig:
     # Selection criteria
     min_importance: float = 0.2
     max_age_runs: int = 100  # Don't consolidate very old memories
+    max_candidates: int = 100  # Memories fetched per pass (most recent on rebuild)
+
+    # Incremental clustering
+    incremental: bool = True  # Only insert memories created since the last pass
+    max_neighbors: int = DEFAULT_MAX_NEIGHBORS  # Similarity graph edges per memory
+    rebuild_interval: int = 50  # Passes between full rebuilds (resyncs external archival)
 
     # LLM settings (for consolidation text generation)
     model: str = "claude-sonnet-4-20250514"
     max_tokens: int = 1024
     temperature: float = 0.3
 
+    def __post_init__(self):
+        # Members are drawn from the leader's graph edges, so a larger
+        # cluster could never be gathered.
+        if self.max_cluster_size > self.max_neighbors + 1:
+            raise ValueError(
+                f"max_cluster_size ({self.max_cluster_size}) needs max_neighbors >= "
+                f"{self.max_cluster_size - 1}, got {self.max_neighbors}"
+            )
+
+
+@dataclass
+class _ClusterState:
+    """Per-agent similarity graph carried between consolidation passes."""
+
+    graph: NeighborGraph
+    texts: dict[UUID, str] = field(default_factory=dict)
+    # (created_at, id) of the newest memory seen; ids break created_at ties.
+    watermark: tuple[datetime, UUID] | None = None
+    passes: int = 0
+
 
 class ConsolidationHandler:
     """
@@ -66,6 +94,7 @@ class ConsolidationHandler:
         self.vector_ops = vector_ops
         self.llm_client = llm_client
         self.config = config or ConsolidationConfig()
+        self._cluster_state: dict[str, _ClusterState] = {}
 
     async def find_clusters(
         self,
@@ -75,6 +104,10 @@ class ConsolidationHandler:
         """
         Find clusters of similar memories.
 
+        The agent's similarity graph persists across calls: each pass inserts
+        only memories created since the previous one and re-clusters only the
+        neighbourhoods they touched.
+
         Args:
             agent_id: Agent to analyze
             limit: Maximum clusters to find
@@ -83,56 +116,60 @@ class ConsolidationHandler:
             List of ConsolidationCluster objects
         """
         config = self.config
+        state = self._cluster_state.get(agent_id)
 
-        # Get candidate memories
-        memories = await self._get_consolidation_candidates(agent_id)
-        if len(memories) < config.min_cluster_size:
-            return []
-
-        # Build similarity graph
-        clusters = []
-        used_ids = set()
-
-        for i, mem_i in enumerate(memories):
-            if mem_i.id in used_ids:
-                continue
-
-            cluster_ids = [mem_i.id]
-            cluster_texts = [mem_i.text]
-            similarities = [1.0]
-
-            for j, mem_j in enumerate(memories):
-                if i == j or mem_j.id in used_ids:
-                    continue
-
-                if mem_i.embedding and mem_j.embedding:
-                    sim = self.vector_ops.cosine_similarity(mem_i.embedding, mem_j.embedding)
-                    if sim >= config.similarity_threshold:
-                        cluster_ids.append(mem_j.id)
-                        cluster_texts.append(mem_j.text)
-                        similarities.append(sim)
+        # Fetch only memories created since the last pass; rebuild from the
+        # most recent candidates on the first pass and every rebuild_interval.
+        if state is None or not config.incremental or state.passes >= config.rebuild_interval:
+            state = _ClusterState(
+                NeighborGraph(config.similarity_threshold, max_neighbors=config.max_neighbors)
+            )
+            self._cluster_state[agent_id] = state
+            memories = await self._get_consolidation_candidates(
+                agent_id, limit=config.max_candidates
+            )
+        else:
+            memories = await self._get_consolidation_candidates(
+                agent_id, limit=config.max_candidates, after=state.watermark
+            )
+        state.passes += 1
 
-                        if len(cluster_ids) >= config.max_cluster_size:
-                            break
+        if memories:
+            newest = max((m.created_at, m.id) for m in memories)
+            if state.watermark is None or newest > state.watermark:
+                state.watermark = newest
+        memories = [m for m in memories if m.embedding is not None]
+        if memories:
+            state.texts.update((m.id, m.text) for m in memories)
+            state.graph.add([m.id for m in memories], [m.embedding for m in memories])
 
-            # Create cluster if large enough
-            if len(cluster_ids) >= config.min_cluster_size:
-                cluster = ConsolidationCluster(
+        clusters = []
+        for members in state.graph.leader_clusters(
+            config.min_cluster_size, config.max_cluster_size, limit=limit
+        ):
+            similarities = [sim for _, sim in members]
+            clusters.append(
+                ConsolidationCluster(
                     cluster_id=str(uuid4()),
-                    memory_ids=cluster_ids,
-                    memory_texts=cluster_texts,
+                    memory_ids=[memory_id for memory_id, _ in members],
+                    memory_texts=[state.texts[memory_id] for memory_id, _ in members],
                     similarity_scores=similarities,
                     avg_similarity=sum(similarities) / len(similarities),
                     consolidation_confidence=min(similarities),
                 )
-                clusters.append(cluster)
-                used_ids.update(cluster_ids)
-
-            if len(clusters) >= limit:
-                break
+            )
 
         return clusters
 
+    def forget(self, agent_id: str, memory_ids: list[UUID]) -> None:
+        """Drop archived memories from the agent's clustering graph."""
+        state = self._cluster_state.get(agent_id)
+        if state is None:
+            return
+        state.graph.remove(memory_ids)
+        for memory_id in memory_ids:
+            state.texts.pop(memory_id, None)
+
     async def consolidate_cluster(
         self,
         cluster: ConsolidationCluster,
@@ -152,6 +189,10 @@ class ConsolidationHandler:
 
         # Get full memory objects
         memories = await self.store.get_batch(cluster.memory_ids)
+        archived = [m.id for m in memories if m.is_archived]
+        if archived:
+            self.forget(memories[0].agent_id, archived)
+            memories = [m for m in memories if not m.is_archived]
         if len(memories) < 2:
             return None
 
@@ -202,6 +243,7 @@ class ConsolidationHandler:
         # Archive old memories
         for old_id in cluster.memory_ids:
             await self.store.archive(old_id)
+        self.forget(agent_id, cluster.memory_ids)
 
         # Return the new memory
         return await self.store.get(new_id)
@@ -246,26 +288,19 @@ class ConsolidationHandler:
         self,
         agent_id: str,
         limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
     ) -> list[AgentMemory]:
-        """Get memories that are candidates for consolidation."""
-        config = self.config
+        """
+        Get memories that are candidates for consolidation.
 
-        async with self.store.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT * FROM agent_memories
-                WHERE agent_id = $1
-                  AND importance_score >= $2
-                  AND is_archived = FALSE
-                  AND embedding IS NOT NULL
-                ORDER BY created_at DESC
-                LIMIT $3
-                """,
-                agent_id,
-                config.min_importance,
-                limit,
-            )
-            return [self.store._row_to_memory(row) for row in rows]
+        Without `after`, returns the most recent candidates. With it, returns
+        the oldest candidates after that (created_at, id) key, so successive
+        calls page forward through new memories without skipping any that
+        share a created_at.
+        """
+        return await self.store.get_consolidation_candidates(
+            agent_id, min_importance=self.config.min_importance, limit=limit, after=after
+        )
 
     async def _generate_consolidated_text(
         self,
@@ -13,17 +13,245 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
 import structlog
 
+from cyntra.state.sqlite_pool import SQLitePool, open_pool
+
 logger = structlog.get_logger()
 
 # Default location following claude-mem pattern
 DEFAULT_DB_PATH = Path(".cyntra/memory/cyntra-mem.db")
 
+_SCHEMA = """
+-- Sessions table (workcell executions)
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    workcell_id TEXT NOT NULL,
+    issue_id TEXT,
+    domain TEXT,
+    job_type TEXT,
+    toolchain TEXT,
+    started_at TEXT NOT NULL,
+    ended_at TEXT,
+    status TEXT,
+    token_count INTEGER DEFAULT 0,
+    observation_count INTEGER DEFAULT 0,
+    UNIQUE(workcell_id)
+);
+
+-- Observations table (claude-mem style)
+CREATE TABLE IF NOT EXISTS observations (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    concept TEXT,
+    content TEXT NOT NULL,
+    tool_name TEXT,
+    tool_args TEXT,
+    file_refs TEXT,
+    outcome TEXT,
+    token_count INTEGER DEFAULT 0,
+    importance TEXT DEFAULT 'info',
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (session_id) REFERENCES sessions(id)
+);
+
+-- Summaries table (compressed session knowledge)
+CREATE TABLE IF NOT EXISTS summaries (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    summary_type TEXT NOT NULL,
+    content TEXT NOT NULL,
+    patterns TEXT,
+    anti_patterns TEXT,
+    key_decisions TEXT,
+    token_count INTEGER DEFAULT 0,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (session_id) REFERENCES sessions(id)
+);
+
+-- FTS5 virtual table for observations
+CREATE VIRTUAL TABLE IF NOT EXISTS observations_fts USING fts5(
+    content,
+    tool_name,
+    file_refs,
+    concept,
+    content='observations',
+    content_rowid='rowid'
+);
+
+-- Triggers to keep FTS in sync
+CREATE TRIGGER IF NOT EXISTS observations_ai AFTER INSERT ON observations BEGIN
+    INSERT INTO observations_fts(rowid, content, tool_name, file_refs, concept)
+    VALUES (new.rowid, new.content, new.tool_name, new.file_refs, new.concept);
+END;
+
+CREATE TRIGGER IF NOT EXISTS observations_ad AFTER DELETE ON observations BEGIN
+    INSERT INTO observations_fts(observations_fts, rowid, content, tool_name, file_refs, concept)
+    VALUES ('delete', old.rowid, old.content, old.tool_name, old.file_refs, old.concept);
+END;
+
+-- FTS5 for summaries
+CREATE VIRTUAL TABLE IF NOT EXISTS summaries_fts USING fts5(
+    content,
+    patterns,
+    key_decisions,
+    content='summaries',
+    content_rowid='rowid'
+);
+
+CREATE TRIGGER IF NOT EXISTS summaries_ai AFTER INSERT ON summaries BEGIN
+    INSERT INTO summaries_fts(rowid, content, patterns, key_decisions)
+    VALUES (new.rowid, new.content, new.patterns, new.key_decisions);
+END;
+
+-- Indexes
+CREATE INDEX IF NOT EXISTS idx_observations_session ON observations(session_id);
+CREATE INDEX IF NOT EXISTS idx_observations_type ON observations(type);
+CREATE INDEX IF NOT EXISTS idx_observations_concept ON observations(concept);
+CREATE INDEX IF NOT EXISTS idx_sessions_domain ON sessions(domain);
+CREATE INDEX IF NOT EXISTS idx_sessions_issue ON sessions(issue_id);
+
+-- Injection digest: injectable items (critical/decision observations and
+-- summaries) per domain ('' = all domains), in insertion order, with the
+-- running token total of everything older. Newest-first token prefixes
+-- are then `totals.tokens - tokens_before`, so filling a budget is one
+-- bounded range scan on idx_injection_digest_rank.
+CREATE TABLE IF NOT EXISTS injection_digest (
+    domain TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    item_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    token_count INTEGER NOT NULL DEFAULT 0,
+    tokens_before INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (domain, kind, item_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_injection_digest_rank
+    ON injection_digest(domain, kind, tokens_before, seq);
+
+CREATE TABLE IF NOT EXISTS injection_digest_totals (
+    domain TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    items INTEGER NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (domain, kind)
+);
+
+-- Backfill databases created before the digest existed
+INSERT OR IGNORE INTO injection_digest (domain, kind, item_id, seq, token_count, tokens_before)
+SELECT domain, kind, id, ROW_NUMBER() OVER w - 1, tokens, SUM(tokens) OVER w - tokens
+FROM (
+    SELECT '' AS domain, 'observation' AS kind, id, COALESCE(token_count, 0) AS tokens,
+           created_at, rowid AS rid
+    FROM observations
+    WHERE importance IN ('critical', 'decision')
+      AND NOT EXISTS (SELECT 1 FROM injection_digest_totals)
+    UNION ALL
+    SELECT s.domain, 'observation', o.id, COALESCE(o.token_count, 0), o.created_at, o.rowid
+    FROM observations o JOIN sessions s ON s.id = o.session_id
+    WHERE o.importance IN ('critical', 'decision') AND COALESCE(s.domain, '') != ''
+      AND NOT EXISTS (SELECT 1 FROM injection_digest_totals)
+    UNION ALL
+    SELECT '', 'summary', id, COALESCE(token_count, 0), created_at, rowid
+    FROM summaries
+    WHERE NOT EXISTS (SELECT 1 FROM injection_digest_totals)
+    UNION ALL
+    SELECT s.domain, 'summary', m.id, COALESCE(m.token_count, 0), m.created_at, m.rowid
+    FROM summaries m JOIN sessions s ON s.id = m.session_id
+    WHERE COALESCE(s.domain, '') != ''
+      AND NOT EXISTS (SELECT 1 FROM injection_digest_totals)
+)
+WINDOW w AS (PARTITION BY domain, kind ORDER BY created_at, rid);
+
+INSERT OR IGNORE INTO injection_digest_totals (domain, kind, items, tokens)
+SELECT domain, kind, COUNT(*), SUM(token_count)
+FROM injection_digest
+WHERE NOT EXISTS (SELECT 1 FROM injection_digest_totals)
+GROUP BY domain, kind;
+
+CREATE TRIGGER IF NOT EXISTS observations_digest_ai AFTER INSERT ON observations
+WHEN new.importance IN ('critical', 'decision') BEGIN
+    INSERT OR IGNORE INTO injection_digest_totals (domain, kind)
+    SELECT '', 'observation'
+    UNION ALL
+    SELECT domain, 'observation' FROM sessions WHERE id = new.session_id AND domain IS NOT NULL;
+
+    INSERT INTO injection_digest (domain, kind, item_id, seq, token_count, tokens_before)
+    SELECT domain, kind, new.id, items, COALESCE(new.token_count, 0), tokens
+    FROM injection_digest_totals
+    WHERE kind = 'observation'
+      AND (domain = '' OR domain = (SELECT domain FROM sessions WHERE id = new.session_id));
+
+    UPDATE injection_digest_totals
+    SET items = items + 1, tokens = tokens + COALESCE(new.token_count, 0)
+    WHERE kind = 'observation'
+      AND (domain = '' OR domain = (SELECT domain FROM sessions WHERE id = new.session_id));
+END;
+
+CREATE TRIGGER IF NOT EXISTS summaries_digest_ai AFTER INSERT ON summaries BEGIN
+    INSERT OR IGNORE INTO injection_digest_totals (domain, kind)
+    SELECT '', 'summary'
+    UNION ALL
+    SELECT domain, 'summary' FROM sessions WHERE id = new.session_id AND domain IS NOT NULL;
+
+    INSERT INTO injection_digest (domain, kind, item_id, seq, token_count, tokens_before)
+    SELECT domain, kind, new.id, items, COALESCE(new.token_count, 0), tokens
+    FROM injection_digest_totals
+    WHERE kind = 'summary'
+      AND (domain = '' OR domain = (SELECT domain FROM sessions WHERE id = new.session_id));
+
+    UPDATE injection_digest_totals
+    SET items = items + 1, tokens = tokens + COALESCE(new.token_count, 0)
+    WHERE kind = 'summary'
+      AND (domain = '' OR domain = (SELECT domain FROM sessions WHERE id = new.session_id));
+END;
+
+-- Deleted items leave their tokens in the running totals, so budgets stay
+-- conservative (never overfilled) without rewriting newer rows
+CREATE TRIGGER IF NOT EXISTS observations_digest_ad AFTER DELETE ON observations BEGIN
+    DELETE FROM injection_digest WHERE kind = 'observation' AND item_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS summaries_digest_ad AFTER DELETE ON summaries BEGIN
+    DELETE FROM injection_digest WHERE kind = 'summary' AND item_id = old.id;
+END;
+"""
+
+_DIGEST_SUMMARIES = """
+    SELECT s.* FROM injection_digest d
+    JOIN summaries s ON s.id = d.item_id
+    WHERE d.domain = ? AND d.kind = 'summary'
+    ORDER BY d.tokens_before DESC, d.seq DESC
+    LIMIT ?
+"""
+
+# Newest observations whose cumulative (newest-first) tokens fit the budget
+_DIGEST_OBSERVATIONS = """
+    SELECT o.id, o.type, o.concept, o.importance, o.token_count,
+           substr(o.content, 1, 100) as preview
+    FROM injection_digest d
+    JOIN observations o ON o.id = d.item_id
+    WHERE d.domain = :domain AND d.kind = 'observation'
+      AND d.tokens_before >= COALESCE(
+          (SELECT tokens FROM injection_digest_totals
+           WHERE domain = :domain AND kind = 'observation'), 0) - :budget
+    ORDER BY d.tokens_before DESC, d.seq DESC
+    LIMIT :limit
+"""
+
+_INSERT_OBSERVATION = """
+    INSERT {conflict} INTO observations
+    (id, session_id, type, concept, content, tool_name, tool_args,
+     file_refs, outcome, importance, token_count, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class MemoryDB:
     """
@@ -38,119 +266,24 @@ class MemoryDB:
     def __init__(self, db_path: Path | str | None = None):
         self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn: sqlite3.Connection | None = None
-        self._init_db()
-
-    def _init_db(self) -> None:
-        """Initialize database schema."""
-        conn = self._get_conn()
-
-        conn.executescript("""
-            -- Sessions table (workcell executions)
-            CREATE TABLE IF NOT EXISTS sessions (
-                id TEXT PRIMARY KEY,
-                workcell_id TEXT NOT NULL,
-                issue_id TEXT,
-                domain TEXT,
-                job_type TEXT,
-                toolchain TEXT,
-                started_at TEXT NOT NULL,
-                ended_at TEXT,
-                status TEXT,
-                token_count INTEGER DEFAULT 0,
-                observation_count INTEGER DEFAULT 0,
-                UNIQUE(workcell_id)
-            );
-
-            -- Observations table (claude-mem style)
-            CREATE TABLE IF NOT EXISTS observations (
-                id TEXT PRIMARY KEY,
-                session_id TEXT NOT NULL,
-                type TEXT NOT NULL,
-                concept TEXT,
-                content TEXT NOT NULL,
-                tool_name TEXT,
-                tool_args TEXT,
-                file_refs TEXT,
-                outcome TEXT,
-                token_count INTEGER DEFAULT 0,
-                importance TEXT DEFAULT 'info',
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (session_id) REFERENCES sessions(id)
-            );
-
-            -- Summaries table (compressed session knowledge)
-            CREATE TABLE IF NOT EXISTS summaries (
-                id TEXT PRIMARY KEY,
-                session_id TEXT NOT NULL,
-                summary_type TEXT NOT NULL,
-                content TEXT NOT NULL,
-                patterns TEXT,
-                anti_patterns TEXT,
-                key_decisions TEXT,
-                token_count INTEGER DEFAULT 0,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (session_id) REFERENCES sessions(id)
-            );
-
-            -- FTS5 virtual table for observations
-            CREATE VIRTUAL TABLE IF NOT EXISTS observations_fts USING fts5(
-                content,
-                tool_name,
-                file_refs,
-                concept,
-                content='observations',
-                content_rowid='rowid'
-            );
-
-            -- Triggers to keep FTS in sync
-            CREATE TRIGGER IF NOT EXISTS observations_ai AFTER INSERT ON observations BEGIN
-                INSERT INTO observations_fts(rowid, content, tool_name, file_refs, concept)
-                VALUES (new.rowid, new.content, new.tool_name, new.file_refs, new.concept);
-            END;
-
-            CREATE TRIGGER IF NOT EXISTS observations_ad AFTER DELETE ON observations BEGIN
-                INSERT INTO observations_fts(observations_fts, rowid, content, tool_name, file_refs, concept)
-                VALUES ('delete', old.rowid, old.content, old.tool_name, old.file_refs, old.concept);
-            END;
-
-            -- FTS5 for summaries
-            CREATE VIRTUAL TABLE IF NOT EXISTS summaries_fts USING fts5(
-                content,
-                patterns,
-                key_decisions,
-                content='summaries',
-                content_rowid='rowid'
-            );
-
-            CREATE TRIGGER IF NOT EXISTS summaries_ai AFTER INSERT ON summaries BEGIN
-                INSERT INTO summaries_fts(rowid, content, patterns, key_decisions)
-                VALUES (new.rowid, new.content, new.patterns, new.key_decisions);
-            END;
-
-            -- Indexes
-            CREATE INDEX IF NOT EXISTS idx_observations_session ON observations(session_id);
-            CREATE INDEX IF NOT EXISTS idx_observations_type ON observations(type);
-            CREATE INDEX IF NOT EXISTS idx_observations_concept ON observations(concept);
-            CREATE INDEX IF NOT EXISTS idx_sessions_domain ON sessions(domain);
-            CREATE INDEX IF NOT EXISTS idx_sessions_issue ON sessions(issue_id);
-        """)
-
-        conn.commit()
-        logger.debug("Memory database initialized", path=str(self.db_path))
+        self._pool: SQLitePool | None = open_pool(self.db_path, schema=_SCHEMA)
+
+    @property
+    def pool(self) -> SQLitePool:
+        """Process-wide connection pool for this database file (reopened after close)."""
+        if self._pool is None:
+            self._pool = open_pool(self.db_path, schema=_SCHEMA)
+        return self._pool
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
+        """Get the shared writer connection."""
+        return self.pool.writer
 
     def close(self) -> None:
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Release the shared connection pool."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     # Session operations
 
@@ -164,50 +297,44 @@ class MemoryDB:
         toolchain: str | None = None,
     ) -> None:
         """Create a new session."""
-        conn = self._get_conn()
         now = datetime.now(UTC).isoformat()
-
-        conn.execute(
-            """
-            INSERT OR REPLACE INTO sessions
-            (id, workcell_id, issue_id, domain, job_type, toolchain, started_at, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, 'active')
-        """,
-            (session_id, workcell_id, issue_id, domain, job_type, toolchain, now),
-        )
-
-        conn.commit()
+        with self.pool.write() as conn, conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO sessions
+                (id, workcell_id, issue_id, domain, job_type, toolchain, started_at, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 'active')
+            """,
+                (session_id, workcell_id, issue_id, domain, job_type, toolchain, now),
+            )
 
     def end_session(self, session_id: str, status: str = "completed") -> None:
         """Mark session as ended."""
-        conn = self._get_conn()
         now = datetime.now(UTC).isoformat()
+        with self.pool.write() as conn, conn:
+            conn.execute(
+                """
+                UPDATE sessions SET ended_at = ?, status = ? WHERE id = ?
+            """,
+                (now, status, session_id),
+            )
 
-        conn.execute(
-            """
-            UPDATE sessions SET ended_at = ?, status = ? WHERE id = ?
-        """,
-            (now, status, session_id),
-        )
-
-        # Update counts
-        conn.execute(
-            """
-            UPDATE sessions SET
-                observation_count = (SELECT COUNT(*) FROM observations WHERE session_id = ?),
-                token_count = (SELECT COALESCE(SUM(token_count), 0) FROM observations WHERE session_id = ?)
-            WHERE id = ?
-        """,
-            (session_id, session_id, session_id),
-        )
-
-        conn.commit()
+            # Update counts
+            conn.execute(
+                """
+                UPDATE sessions SET
+                    observation_count = (SELECT COUNT(*) FROM observations WHERE session_id = ?),
+                    token_count = (SELECT COALESCE(SUM(token_count), 0) FROM observations WHERE session_id = ?)
+                WHERE id = ?
+            """,
+                (session_id, session_id, session_id),
+            )
 
     def get_session(self, session_id: str) -> dict[str, Any] | None:
         """Get session by ID."""
-        conn = self._get_conn()
-        row = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
-        return dict(row) if row else None
+        with self.pool.read() as conn:
+            row = conn.execute("SELECT * FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            return dict(row) if row else None
 
     # Observation operations
 
@@ -226,33 +353,71 @@ class MemoryDB:
         token_count: int = 0,
     ) -> None:
         """Add an observation."""
-        conn = self._get_conn()
-        now = datetime.now(UTC).isoformat()
+        self.add_observations(
+            [
+                {
+                    "observation_id": observation_id,
+                    "session_id": session_id,
+                    "obs_type": obs_type,
+                    "content": content,
+                    "concept": concept,
+                    "tool_name": tool_name,
+                    "tool_args": tool_args,
+                    "file_refs": file_refs,
+                    "outcome": outcome,
+                    "importance": importance,
+                    "token_count": token_count,
+                }
+            ]
+        )
+
+    def add_observations(
+        self,
+        observations: Iterable[dict[str, Any]],
+        skip_duplicates: bool = False,
+    ) -> int:
+        """
+        Add many observations in one transaction.
+
+        Each item takes the keyword arguments of `add_observation`. Rows
+        (and their FTS entries, via the insert trigger) are written with a
+        single `executemany` and one commit.
 
-        conn.execute(
-            """
-            INSERT INTO observations
-            (id, session_id, type, concept, content, tool_name, tool_args,
-             file_refs, outcome, importance, token_count, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
+        Args:
+            observations: Observation fields, one dict per row
+            skip_duplicates: Ignore rows whose ID already exists instead of
+                failing the whole batch (observation IDs are content hashes)
+
+        Returns:
+            Number of observations written
+        """
+        now = datetime.now(UTC).isoformat()
+        rows = [
             (
-                observation_id,
-                session_id,
-                obs_type,
-                concept,
-                content,
-                tool_name,
-                json.dumps(tool_args) if tool_args else None,
-                json.dumps(file_refs) if file_refs else None,
-                outcome,
-                importance,
-                token_count,
+                obs["observation_id"],
+                obs["session_id"],
+                obs["obs_type"],
+                obs.get("concept"),
+                obs["content"],
+                obs.get("tool_name"),
+                json.dumps(obs["tool_args"]) if obs.get("tool_args") else None,
+                json.dumps(obs["file_refs"]) if obs.get("file_refs") else None,
+                obs.get("outcome"),
+                obs.get("importance", "info"),
+                obs.get("token_count", 0),
                 now,
-            ),
-        )
-
-        conn.commit()
+            )
+            for obs in observations
+        ]
+        if not rows:
+            return 0
+
+        with self.pool.write() as conn, conn:
+            cursor = conn.executemany(
+                _INSERT_OBSERVATION.format(conflict="OR IGNORE" if skip_duplicates else ""),
+                rows,
+            )
+        return cursor.rowcount
 
     def get_observations(
         self,
@@ -262,26 +427,25 @@ class MemoryDB:
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get observations with optional filters."""
-        conn = self._get_conn()
-
-        query = "SELECT * FROM observations WHERE 1=1"
-        params: list[Any] = []
-
-        if session_id:
-            query += " AND session_id = ?"
-            params.append(session_id)
-        if obs_type:
-            query += " AND type = ?"
-            params.append(obs_type)
-        if concept:
-            query += " AND concept = ?"
-            params.append(concept)
-
-        query += " ORDER BY created_at DESC LIMIT ?"
-        params.append(limit)
-
-        rows = conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+        with self.pool.read() as conn:
+            query = "SELECT * FROM observations WHERE 1=1"
+            params: list[Any] = []
+
+            if session_id:
+                query += " AND session_id = ?"
+                params.append(session_id)
+            if obs_type:
+                query += " AND type = ?"
+                params.append(obs_type)
+            if concept:
+                query += " AND concept = ?"
+                params.append(concept)
+
+            query += " ORDER BY created_at DESC LIMIT ?"
+            params.append(limit)
+
+            rows = conn.execute(query, params).fetchall()
+            return [dict(row) for row in rows]
 
     def search_observations(
         self,
@@ -289,21 +453,20 @@ class MemoryDB:
         limit: int = 20,
     ) -> list[dict[str, Any]]:
         """Full-text search over observations."""
-        conn = self._get_conn()
-
-        rows = conn.execute(
-            """
-            SELECT o.*, bm25(observations_fts) as score
-            FROM observations_fts
-            JOIN observations o ON observations_fts.rowid = o.rowid
-            WHERE observations_fts MATCH ?
-            ORDER BY score
-            LIMIT ?
-        """,
-            (query, limit),
-        ).fetchall()
+        with self.pool.read() as conn:
+            rows = conn.execute(
+                """
+                SELECT o.*, bm25(observations_fts) as score
+                FROM observations_fts
+                JOIN observations o ON observations_fts.rowid = o.rowid
+                WHERE observations_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+            """,
+                (query, limit),
+            ).fetchall()
 
-        return [dict(row) for row in rows]
+            return [dict(row) for row in rows]
 
     # Summary operations
 
@@ -319,48 +482,44 @@ class MemoryDB:
         token_count: int = 0,
     ) -> None:
         """Add a session summary."""
-        conn = self._get_conn()
         now = datetime.now(UTC).isoformat()
-
-        conn.execute(
-            """
-            INSERT INTO summaries
-            (id, session_id, summary_type, content, patterns, anti_patterns,
-             key_decisions, token_count, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                summary_id,
-                session_id,
-                summary_type,
-                content,
-                json.dumps(patterns) if patterns else None,
-                json.dumps(anti_patterns) if anti_patterns else None,
-                json.dumps(key_decisions) if key_decisions else None,
-                token_count,
-                now,
-            ),
-        )
-
-        conn.commit()
+        with self.pool.write() as conn, conn:
+            conn.execute(
+                """
+                INSERT INTO summaries
+                (id, session_id, summary_type, content, patterns, anti_patterns,
+                 key_decisions, token_count, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    summary_id,
+                    session_id,
+                    summary_type,
+                    content,
+                    json.dumps(patterns) if patterns else None,
+                    json.dumps(anti_patterns) if anti_patterns else None,
+                    json.dumps(key_decisions) if key_decisions else None,
+                    token_count,
+                    now,
+                ),
+            )
 
     def search_summaries(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Full-text search over summaries."""
-        conn = self._get_conn()
-
-        rows = conn.execute(
-            """
-            SELECT s.*, bm25(summaries_fts) as score
-            FROM summaries_fts
-            JOIN summaries s ON summaries_fts.rowid = s.rowid
-            WHERE summaries_fts MATCH ?
-            ORDER BY score
-            LIMIT ?
-        """,
-            (query, limit),
-        ).fetchall()
+        with self.pool.read() as conn:
+            rows = conn.execute(
+                """
+                SELECT s.*, bm25(summaries_fts) as score
+                FROM summaries_fts
+                JOIN summaries s ON summaries_fts.rowid = s.rowid
+                WHERE summaries_fts MATCH ?
+                ORDER BY score
+                LIMIT ?
+            """,
+                (query, limit),
+            ).fetchall()
 
-        return [dict(row) for row in rows]
+            return [dict(row) for row in rows]
 
     def get_recent_summaries(
         self,
@@ -368,29 +527,8 @@ class MemoryDB:
         limit: int = 10,
     ) -> list[dict[str, Any]]:
         """Get recent summaries, optionally filtered by domain."""
-        conn = self._get_conn()
-
-        if domain:
-            rows = conn.execute(
-                """
-                SELECT s.* FROM summaries s
-                JOIN sessions sess ON s.session_id = sess.id
-                WHERE sess.domain = ?
-                ORDER BY s.created_at DESC
-                LIMIT ?
-            """,
-                (domain, limit),
-            ).fetchall()
-        else:
-            rows = conn.execute(
-                """
-                SELECT * FROM summaries
-                ORDER BY created_at DESC
-                LIMIT ?
-            """,
-                (limit,),
-            ).fetchall()
-
+        with self.pool.read() as conn:
+            rows = conn.execute(_DIGEST_SUMMARIES, (domain or "", limit)).fetchall()
         return [dict(row) for row in rows]
 
     # Context injection (progressive disclosure Layer 1)
@@ -405,45 +543,30 @@ class MemoryDB:
         Get memory context for injection at session start.
 
         Progressive disclosure Layer 1: Index of available observations
-        with token costs, plus recent summaries.
+        with token costs, plus recent summaries. Both come from the
+        injection digest: the observation index is the newest run of
+        critical/decision observations that fits in the tokens left after
+        the summaries, read as one index range scan.
         """
-        conn = self._get_conn()
-
-        # Get recent summaries (highest value, compressed knowledge)
-        summaries = self.get_recent_summaries(domain=domain, limit=5)
-
-        # Get observation index (type counts, recent important ones)
-        if domain:
-            obs_rows = conn.execute(
-                """
-                SELECT o.id, o.type, o.concept, o.importance, o.token_count,
-                       substr(o.content, 1, 100) as preview
-                FROM observations o
-                JOIN sessions s ON o.session_id = s.id
-                WHERE s.domain = ? AND o.importance IN ('critical', 'decision')
-                ORDER BY o.created_at DESC
-                LIMIT ?
-            """,
-                (domain, max_observations),
-            ).fetchall()
-        else:
+        with self.pool.read() as conn:
+            # Recent summaries (highest value, compressed knowledge)
+            summaries = [
+                dict(row) for row in conn.execute(_DIGEST_SUMMARIES, (domain or "", 5)).fetchall()
+            ]
+            summary_tokens = sum(s.get("token_count") or 0 for s in summaries)
+
+            # Observation index: newest important observations within budget
             obs_rows = conn.execute(
-                """
-                SELECT id, type, concept, importance, token_count,
-                       substr(content, 1, 100) as preview
-                FROM observations
-                WHERE importance IN ('critical', 'decision')
-                ORDER BY created_at DESC
-                LIMIT ?
-            """,
-                (max_observations,),
+                _DIGEST_OBSERVATIONS,
+                {
+                    "domain": domain or "",
+                    "budget": max(max_tokens - summary_tokens, 0),
+                    "limit": max_observations,
+                },
             ).fetchall()
 
         observation_index = [dict(row) for row in obs_rows]
-
-        # Calculate token budget
-        summary_tokens = sum(s.get("token_count", 0) for s in summaries)
-        remaining_tokens = max_tokens - summary_tokens
+        observation_tokens = sum(o.get("token_count") or 0 for o in observation_index)
 
         return {
             "summaries": summaries,
@@ -451,6 +574,7 @@ class MemoryDB:
             "total_observations": len(observation_index),
             "token_budget": {
                 "summaries": summary_tokens,
-                "remaining": remaining_tokens,
+                "observations": observation_tokens,
+                "remaining": max_tokens - summary_tokens - observation_tokens,
             },
         }
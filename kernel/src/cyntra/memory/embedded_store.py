@@ -0,0 +1,1101 @@
+"""
+Embedded Memory Store - MemoryStore backend without Postgres.
+
+Same async interface as `MemoryStore`, for edge workers and CI:
+
+- SQLite holds memory metadata, links, run counters and extraction batches
+- Embeddings live in a memory-mapped float32 matrix (`VectorIndex`) with an
+  IVF index for approximate search; rows are referenced by `vec_row`
+- Issue tags and file paths have inverted index tables
+
+Layout for `sqlite:///path/to/memory.db` (relative; `sqlite:////abs/...` for
+absolute paths):
+
+    memory.db            # SQLite metadata
+    memory.db.f32        # normalised embedding rows
+
+There is no connection pool: callers go through store methods, and
+`transaction()` yields the SQLite connection (`?` placeholders) inside one
+write transaction. Store writes made inside it (by the same task or tasks it
+starts) join that transaction; writers from other tasks wait for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+from .models import (
+    AgentMemory,
+    ExtractedMemory,
+    ExtractionBatch,
+    MemoryLink,
+    MemoryScope,
+    MemoryType,
+)
+from .scoring import calculate_importance
+from .vector_index import DEFAULT_IVF_MIN_ROWS, DEFAULT_NPROBE, VectorIndex
+
+logger = logging.getLogger(__name__)
+
+# id()s of stores with a transaction open in the current context; tasks
+# started inside `transaction()` inherit it and join that transaction
+_open_transactions: ContextVar[frozenset[int]] = ContextVar(
+    "embedded_store_transactions", default=frozenset()
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS agent_memories (
+    id TEXT PRIMARY KEY,
+    agent_id TEXT NOT NULL,
+    text TEXT NOT NULL,
+    vec_row INTEGER,
+    importance_score REAL NOT NULL DEFAULT 0.5,
+    memory_type TEXT NOT NULL,
+    scope TEXT NOT NULL DEFAULT 'individual',
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    expires_at TEXT,
+    last_accessed TEXT,
+    happens_at TEXT,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    mention_count INTEGER NOT NULL DEFAULT 0,
+    confidence REAL NOT NULL DEFAULT 0.9,
+    is_archived INTEGER NOT NULL DEFAULT 0,
+    archived_at TEXT,
+    is_refined INTEGER NOT NULL DEFAULT 0,
+    last_refined_at TEXT,
+    refinement_rejection_count INTEGER NOT NULL DEFAULT 0,
+    runs_at_creation INTEGER,
+    runs_at_last_access INTEGER,
+    run_id TEXT,
+    world_id TEXT,
+    issue_tags TEXT NOT NULL DEFAULT '[]',
+    file_paths TEXT NOT NULL DEFAULT '[]'
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_vec_row ON agent_memories(vec_row);
+CREATE INDEX IF NOT EXISTS idx_memories_agent
+    ON agent_memories(agent_id, is_archived, importance_score);
+CREATE INDEX IF NOT EXISTS idx_memories_type ON agent_memories(memory_type, is_archived);
+
+-- Inverted indexes for tag / file overlap queries
+CREATE TABLE IF NOT EXISTS memory_tags (
+    tag TEXT NOT NULL,
+    memory_id TEXT NOT NULL,
+    PRIMARY KEY (tag, memory_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS memory_files (
+    path TEXT NOT NULL,
+    memory_id TEXT NOT NULL,
+    PRIMARY KEY (path, memory_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS memory_links (
+    source_id TEXT NOT NULL,
+    target_id TEXT NOT NULL,
+    link_type TEXT NOT NULL,
+    confidence REAL,
+    reasoning TEXT,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (source_id, target_id, link_type)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_links_target ON memory_links(target_id);
+
+CREATE TABLE IF NOT EXISTS agent_activity_counters (
+    agent_id TEXT PRIMARY KEY,
+    total_runs INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS memory_extraction_batches (
+    id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL,
+    custom_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    request_payload TEXT NOT NULL,
+    run_metadata TEXT,
+    memory_context TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    submitted_at TEXT NOT NULL,
+    completed_at TEXT,
+    expires_at TEXT,
+    result_url TEXT,
+    result_payload TEXT,
+    extracted_memories TEXT,
+    error_message TEXT,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    processing_time_ms INTEGER,
+    tokens_used INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_batches_status ON memory_extraction_batches(status, created_at);
+"""
+
+# Columns `update()` may set directly (others need index maintenance)
+_UPDATABLE = {
+    "text",
+    "importance_score",
+    "memory_type",
+    "scope",
+    "updated_at",
+    "expires_at",
+    "last_accessed",
+    "happens_at",
+    "access_count",
+    "mention_count",
+    "confidence",
+    "is_archived",
+    "archived_at",
+    "is_refined",
+    "last_refined_at",
+    "refinement_rejection_count",
+    "runs_at_creation",
+    "runs_at_last_access",
+    "run_id",
+    "world_id",
+}
+_BATCH_JSON = {
+    "request_payload",
+    "run_metadata",
+    "memory_context",
+    "result_payload",
+    "extracted_memories",
+}
+
+# Candidate over-fetch for filtered vector search (doubled until satisfied)
+_SEARCH_OVERFETCH = 4
+# Vector rows per metadata lookup (stays under SQLite's variable limit)
+_SEARCH_CHUNK = 512
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def _ts(value: datetime | None) -> str | None:
+    """Normalise a datetime to a sortable UTC ISO string (naive means UTC)."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(UTC).isoformat()
+
+
+def _dt(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _sql_value(field: str, value: Any) -> Any:
+    if isinstance(value, datetime):
+        return _ts(value)
+    if isinstance(value, (MemoryType, MemoryScope)):
+        return value.value
+    if field in _BATCH_JSON and value is not None:
+        return json.dumps(value)
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+class EmbeddedMemoryStore:
+    """
+    SQLite + memory-mapped vector backend with the `MemoryStore` interface.
+
+    Usage:
+        store = await EmbeddedMemoryStore.connect("sqlite:///.cyntra/memory/agent.db")
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        *,
+        ivf_min_rows: int = DEFAULT_IVF_MIN_ROWS,
+        nprobe: int = DEFAULT_NPROBE,
+    ):
+        """
+        Open (or create) an embedded store.
+
+        Args:
+            db_path: SQLite file; vectors go to `<db_path>.f32`
+            ivf_min_rows: Vector count below which search is exact
+            nprobe: IVF lists scored per query (recall/latency trade-off)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        self.vectors = VectorIndex(
+            self.db_path.with_name(self.db_path.name + ".f32"),
+            int(row["value"]) if row else None,
+            ivf_min_rows=ivf_min_rows,
+            nprobe=nprobe,
+        )
+        self._write_lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, dsn: str) -> EmbeddedMemoryStore:
+        """Open a store from a `sqlite:///path` DSN (or a plain path)."""
+        return cls(dsn.removeprefix("sqlite:///"))
+
+    async def initialize(self) -> None:
+        """No-op (schema is created on open); present for interface parity."""
+
+    async def close(self) -> None:
+        """Flush vectors and close the database."""
+        self.vectors.flush()
+        self.conn.close()
+
+    @asynccontextmanager
+    async def _write(self) -> AsyncIterator[sqlite3.Connection]:
+        """Run a write in its own transaction, or join the open `transaction()`."""
+        if id(self) in _open_transactions.get():
+            yield self.conn
+            return
+        async with self._write_lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[sqlite3.Connection]:
+        """
+        Provide the SQLite connection inside one write transaction.
+
+        Store calls made inside the block join it; nested `transaction()`
+        blocks join the outer one. Other tasks' writes wait until it ends.
+        """
+        open_transactions = _open_transactions.get()
+        if id(self) in open_transactions:
+            yield self.conn
+            return
+        async with self._write() as conn:
+            token = _open_transactions.set(open_transactions | {id(self)})
+            try:
+                yield conn
+            finally:
+                _open_transactions.reset(token)
+
+    # ==================== MEMORY CRUD ====================
+
+    async def create(
+        self,
+        memory: ExtractedMemory,
+        agent_id: str,
+        embedding: Sequence[float] | None = None,
+        run_id: str | None = None,
+        world_id: str | None = None,
+        scope: MemoryScope = MemoryScope.INDIVIDUAL,
+    ) -> UUID:
+        """Create a new agent memory (see `MemoryStore.create`)."""
+        return (
+            await self.create_batch(
+                [memory],
+                agent_id,
+                embeddings=[embedding] if embedding is not None else None,
+                run_id=run_id,
+                world_id=world_id,
+                scope=scope,
+            )
+        )[0]
+
+    async def create_batch(
+        self,
+        memories: list[ExtractedMemory],
+        agent_id: str,
+        embeddings: Sequence[Sequence[float] | None] | None = None,
+        run_id: str | None = None,
+        world_id: str | None = None,
+        scope: MemoryScope = MemoryScope.INDIVIDUAL,
+    ) -> list[UUID]:
+        """Batch create multiple memories (see `MemoryStore.create_batch`)."""
+        if not memories:
+            return []
+        if embeddings is not None and len(embeddings) != len(memories):
+            raise ValueError("Embeddings count must match memories count")
+
+        current_runs = await self.get_agent_run_count(agent_id)
+        vec_rows: list[int | None] = [None] * len(memories)
+        if embeddings is not None:
+            present = [i for i, e in enumerate(embeddings) if e is not None]
+            if present:
+                rows = self._append_vectors([embeddings[i] for i in present])
+                for i, row in zip(present, rows, strict=True):
+                    vec_rows[i] = row
+
+        now = _now()
+        created_ids = [uuid4() for _ in memories]
+        async with self._write() as conn:
+            for memory_id, memory, vec_row in zip(created_ids, memories, vec_rows, strict=True):
+                conn.execute(
+                    """
+                    INSERT INTO agent_memories (
+                        id, agent_id, text, vec_row, importance_score,
+                        memory_type, scope, confidence, created_at,
+                        expires_at, happens_at,
+                        runs_at_creation, runs_at_last_access,
+                        run_id, world_id, issue_tags, file_paths
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        str(memory_id),
+                        agent_id,
+                        memory.text,
+                        vec_row,
+                        memory.importance_score,
+                        memory.memory_type.value,
+                        scope.value,
+                        memory.confidence,
+                        now,
+                        _ts(memory.expires_at),
+                        _ts(memory.happens_at),
+                        current_runs,
+                        current_runs,
+                        run_id,
+                        world_id,
+                        json.dumps(memory.issue_tags),
+                        json.dumps(memory.file_paths),
+                    ),
+                )
+                self._index_terms(conn, str(memory_id), memory.issue_tags, memory.file_paths)
+
+        logger.info(f"Created {len(created_ids)} memories for agent {agent_id}")
+        return created_ids
+
+    async def get(self, memory_id: UUID) -> AgentMemory | None:
+        """Fetch memory by ID."""
+        memories = await self.get_batch([memory_id])
+        return memories[0] if memories else None
+
+    async def get_batch(self, memory_ids: list[UUID]) -> list[AgentMemory]:
+        """Fetch multiple memories by IDs, highest importance first."""
+        if not memory_ids:
+            return []
+        rows = self._select(
+            f"""
+            SELECT * FROM agent_memories
+            WHERE id IN ({_placeholders(memory_ids)})
+            ORDER BY importance_score DESC
+            """,
+            [str(i) for i in memory_ids],
+        )
+        return self._rows_to_memories(rows)
+
+    async def update(
+        self,
+        memory_id: UUID,
+        updates: dict[str, Any],
+    ) -> AgentMemory:
+        """
+        Update memory fields.
+
+        Raises:
+            ValueError: If memory not found or a field is not updatable
+        """
+        updates = dict(updates)
+        sets: dict[str, Any] = {}
+        if "embedding" in updates:
+            embedding = updates.pop("embedding")
+            sets["vec_row"] = None if embedding is None else self._append_vectors([embedding])[0]
+        for field in ("issue_tags", "file_paths"):
+            if field in updates:
+                sets[field] = json.dumps(list(updates.pop(field)))
+        unknown = set(updates) - _UPDATABLE
+        if unknown:
+            raise ValueError(f"Cannot update fields: {sorted(unknown)}")
+        sets.update({field: _sql_value(field, value) for field, value in updates.items()})
+        sets["updated_at"] = _now()
+
+        key = str(memory_id)
+        async with self._write() as conn:
+            cursor = conn.execute(
+                f"UPDATE agent_memories SET {', '.join(f'{f} = ?' for f in sets)} WHERE id = ?",
+                [*sets.values(), key],
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Memory {memory_id} not found")
+            if "issue_tags" in sets or "file_paths" in sets:
+                row = conn.execute(
+                    "SELECT issue_tags, file_paths FROM agent_memories WHERE id = ?", (key,)
+                ).fetchone()
+                conn.execute("DELETE FROM memory_tags WHERE memory_id = ?", (key,))
+                conn.execute("DELETE FROM memory_files WHERE memory_id = ?", (key,))
+                self._index_terms(
+                    conn, key, json.loads(row["issue_tags"]), json.loads(row["file_paths"])
+                )
+
+        memory = await self.get(memory_id)
+        assert memory is not None
+        return memory
+
+    async def archive(self, memory_id: UUID) -> None:
+        """Archive a memory (soft delete)."""
+        now = _now()
+        async with self._write() as conn:
+            conn.execute(
+                """
+                UPDATE agent_memories
+                SET is_archived = 1, archived_at = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (now, now, str(memory_id)),
+            )
+
+    # ==================== SEARCH OPERATIONS ====================
+
+    async def search_similar(
+        self,
+        embedding: Sequence[float],
+        agent_id: str | None = None,
+        limit: int = 10,
+        similarity_threshold: float = 0.7,
+        min_importance: float = 0.1,
+        include_collective: bool = True,
+        exact: bool = False,
+    ) -> list[AgentMemory]:
+        """
+        Vector similarity search (approximate unless `exact`).
+
+        Candidates come from the vector index above the threshold; metadata
+        filters are applied in SQLite, widening the candidate set until
+        `limit` memories pass or the index is exhausted.
+        """
+        where = [
+            "importance_score >= ?",
+            "(expires_at IS NULL OR expires_at > ?)",
+            "is_archived = 0",
+        ]
+        params: list[Any] = [min_importance, _now()]
+        if agent_id and include_collective:
+            where.append("(agent_id = ? OR scope = 'collective')")
+            params.append(agent_id)
+        elif agent_id:
+            where.append("agent_id = ?")
+            params.append(agent_id)
+        return self._search_vectors(embedding, where, params, limit, similarity_threshold, exact)
+
+    def _search_vectors(
+        self,
+        embedding: Sequence[float],
+        where: list[str],
+        params: list[Any],
+        limit: int,
+        similarity_threshold: float,
+        exact: bool = False,
+    ) -> list[AgentMemory]:
+        if limit <= 0 or len(self.vectors) == 0:
+            return []
+
+        k = limit * _SEARCH_OVERFETCH
+        while True:
+            hits = self.vectors.search(embedding, k, threshold=similarity_threshold, exact=exact)
+            scores = dict(hits)
+            rows: list[sqlite3.Row] = []
+            # Hits arrive best first; look up metadata chunk by chunk until enough pass
+            for start in range(0, len(hits), _SEARCH_CHUNK):
+                chunk = [row for row, _ in hits[start : start + _SEARCH_CHUNK]]
+                found = self._select(
+                    f"""
+                    SELECT * FROM agent_memories
+                    WHERE vec_row IN ({_placeholders(chunk)}) AND {" AND ".join(where)}
+                    """,
+                    chunk + params,
+                )
+                rows += sorted(found, key=lambda r: scores[r["vec_row"]], reverse=True)
+                if len(rows) >= limit:
+                    break
+            if len(rows) >= limit or len(hits) < k:
+                break
+            k *= 2
+
+        rows = rows[:limit]
+        memories = self._rows_to_memories(rows)
+        for memory, row in zip(memories, rows, strict=True):
+            memory.similarity_score = scores[row["vec_row"]]
+        return memories
+
+    async def search_by_tags(
+        self,
+        tags: list[str],
+        agent_id: str | None = None,
+        limit: int = 20,
+    ) -> list[AgentMemory]:
+        """Search memories sharing any of `tags` (inverted index)."""
+        return self._search_terms("memory_tags", "tag", tags, agent_id, limit)
+
+    async def search_by_type(
+        self,
+        memory_type: MemoryType,
+        agent_id: str | None = None,
+        limit: int = 20,
+    ) -> list[AgentMemory]:
+        """Search memories by type."""
+        where, params = self._visibility(agent_id)
+        rows = self._select(
+            f"""
+            SELECT * FROM agent_memories m
+            WHERE memory_type = ? AND {where}
+            ORDER BY importance_score DESC
+            LIMIT ?
+            """,
+            [memory_type.value, *params, limit],
+        )
+        return self._rows_to_memories(rows)
+
+    async def search_by_files(
+        self,
+        file_paths: list[str],
+        agent_id: str | None = None,
+        limit: int = 20,
+    ) -> list[AgentMemory]:
+        """Search memories referencing any of `file_paths` (inverted index)."""
+        return self._search_terms("memory_files", "path", file_paths, agent_id, limit)
+
+    async def search_multi_signal(
+        self,
+        agent_id: str | None = None,
+        embedding: Sequence[float] | None = None,
+        tags: list[str] | None = None,
+        file_paths: list[str] | None = None,
+        limit_per_signal: int = 10,
+        similarity_threshold: float = 0.7,
+        min_importance: float = 0.1,
+        semantic_weight: float = 0.4,
+        tag_weight: float = 0.25,
+        file_weight: float = 0.25,
+    ) -> list[tuple[AgentMemory, float]]:
+        """
+        Semantic, tag and file retrieval scored like `MemoryStore.search_multi_signal`.
+
+        Everything is local, so the signals are simply run in turn and
+        merged, keeping each memory's best score.
+        """
+        scored: dict[UUID, tuple[AgentMemory, float]] = {}
+
+        def merge(memory: AgentMemory, score: float) -> None:
+            if memory.id in scored:
+                previous, best = scored[memory.id]
+                memory.similarity_score = previous.similarity_score
+                score = max(score, best)
+            scored[memory.id] = (memory, score)
+
+        if embedding is not None:
+            for memory in await self.search_similar(
+                embedding,
+                agent_id=agent_id,
+                limit=limit_per_signal,
+                similarity_threshold=similarity_threshold,
+                min_importance=min_importance,
+            ):
+                merge(memory, (memory.similarity_score or 0.0) * semantic_weight)
+
+        for table, column, attr, terms, weight in (
+            ("memory_tags", "tag", "issue_tags", tags, tag_weight),
+            ("memory_files", "path", "file_paths", file_paths, file_weight),
+        ):
+            terms = terms or []
+            for memory in self._search_terms(table, column, terms, agent_id, limit_per_signal):
+                overlap = len(set(terms) & set(getattr(memory, attr)))
+                merge(memory, min(overlap / len(terms), 1.0) * weight)
+
+        return sorted(scored.values(), key=lambda item: item[1], reverse=True)
+
+    def _search_terms(
+        self,
+        table: str,
+        column: str,
+        terms: list[str],
+        agent_id: str | None,
+        limit: int,
+    ) -> list[AgentMemory]:
+        if not terms:
+            return []
+        where, params = self._visibility(agent_id)
+        rows = self._select(
+            f"""
+            SELECT * FROM agent_memories m
+            WHERE m.id IN (
+                SELECT memory_id FROM {table} WHERE {column} IN ({_placeholders(terms)})
+            ) AND {where}
+            ORDER BY importance_score DESC
+            LIMIT ?
+            """,
+            [*terms, *params, limit],
+        )
+        return self._rows_to_memories(rows)
+
+    @staticmethod
+    def _visibility(agent_id: str | None) -> tuple[str, list[Any]]:
+        if agent_id:
+            return "(m.agent_id = ? OR m.scope = 'collective') AND m.is_archived = 0", [agent_id]
+        return "m.is_archived = 0", []
+
+    # ==================== HUB OPERATIONS ====================
+
+    async def find_hubs(
+        self,
+        agent_id: str,
+        min_importance: float = 0.5,
+        min_access: int = 3,
+        min_links: int = 2,
+        limit: int = 50,
+    ) -> list[AgentMemory]:
+        """Find hub memories (high connectivity, frequently accessed)."""
+        rows = self._select(
+            """
+            SELECT m.* FROM agent_memories m
+            JOIN (
+                SELECT target_id, COUNT(*) AS inbound FROM memory_links GROUP BY target_id
+            ) l ON l.target_id = m.id
+            WHERE m.agent_id = ?
+              AND m.importance_score >= ?
+              AND m.access_count >= ?
+              AND l.inbound >= ?
+              AND m.is_archived = 0
+            ORDER BY m.importance_score DESC, l.inbound DESC
+            LIMIT ?
+            """,
+            [agent_id, min_importance, min_access, min_links, limit],
+        )
+        return self._rows_to_memories(rows)
+
+    # ==================== ACTIVITY TRACKING ====================
+
+    async def increment_access(
+        self,
+        memory_id: UUID,
+        current_runs: int | None = None,
+    ) -> None:
+        """Record memory access."""
+        if current_runs is None:
+            row = self.conn.execute(
+                "SELECT agent_id FROM agent_memories WHERE id = ?", (str(memory_id),)
+            ).fetchone()
+            if not row:
+                return
+            current_runs = await self.get_agent_run_count(row["agent_id"])
+
+        now = _now()
+        async with self._write() as conn:
+            conn.execute(
+                """
+                UPDATE agent_memories
+                SET access_count = access_count + 1,
+                    last_accessed = ?,
+                    runs_at_last_access = ?,
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (now, current_runs, now, str(memory_id)),
+            )
+
+    async def get_agent_run_count(self, agent_id: str) -> int:
+        """Get current run count for agent."""
+        row = self.conn.execute(
+            "SELECT total_runs FROM agent_activity_counters WHERE agent_id = ?", (agent_id,)
+        ).fetchone()
+        return row["total_runs"] if row else 0
+
+    async def increment_agent_runs(self, agent_id: str) -> int:
+        """Increment agent run counter."""
+        async with self._write() as conn:
+            row = conn.execute(
+                """
+                INSERT INTO agent_activity_counters (agent_id, total_runs) VALUES (?, 1)
+                ON CONFLICT(agent_id) DO UPDATE SET total_runs = total_runs + 1
+                RETURNING total_runs
+                """,
+                (agent_id,),
+            ).fetchone()
+        return row["total_runs"]
+
+    # ==================== LINK OPERATIONS ====================
+
+    async def create_link(self, link: MemoryLink) -> None:
+        """Create bidirectional link between memories."""
+        await self.create_links_batch([link])
+
+    async def create_links_batch(self, links: list[MemoryLink]) -> None:
+        """Batch create multiple links."""
+        if not links:
+            return
+        async with self._write() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO memory_links (
+                    source_id, target_id, link_type, confidence, reasoning, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        str(link.source_id),
+                        str(link.target_id),
+                        link.link_type.value,
+                        link.confidence,
+                        link.reasoning,
+                        link.created_at.isoformat(),
+                    )
+                    for link in links
+                ],
+            )
+
+    async def get_links(self, memory_id: UUID) -> dict[str, list[dict[str, Any]]]:
+        """Get all links for a memory."""
+        return self._links_for([str(memory_id)]).get(
+            str(memory_id), {"inbound": [], "outbound": []}
+        )
+
+    async def heal_dead_links(self, dead_ids: list[UUID]) -> int:
+        """Remove links to or from dead memories; returns memories affected."""
+        if not dead_ids:
+            return 0
+        dead = [str(uid) for uid in dead_ids]
+        marks = _placeholders(dead)
+        async with self._write() as conn:
+            affected = conn.execute(
+                f"""
+                SELECT COUNT(*) FROM (
+                    SELECT source_id AS id FROM memory_links WHERE target_id IN ({marks})
+                    UNION
+                    SELECT target_id FROM memory_links WHERE source_id IN ({marks})
+                )
+                """,
+                dead + dead,
+            ).fetchone()[0]
+            conn.execute(
+                f"DELETE FROM memory_links WHERE source_id IN ({marks}) OR target_id IN ({marks})",
+                dead + dead,
+            )
+        if affected > 0:
+            logger.info(f"Cleaned up {affected} dead links")
+        return affected
+
+    # ==================== SCORING OPERATIONS ====================
+
+    async def recalculate_scores(self, agent_id: str) -> int:
+        """Recalculate importance scores with `scoring.calculate_importance`."""
+        current_runs = await self.get_agent_run_count(agent_id)
+        rows = self._select(
+            "SELECT * FROM agent_memories WHERE agent_id = ? AND is_archived = 0", [agent_id]
+        )
+        memories = self._rows_to_memories(rows, with_embeddings=False)
+        now = _now()
+        updates = [
+            (
+                calculate_importance(
+                    m,
+                    current_runs,
+                    inbound_links=len(m.inbound_links),
+                    outbound_links=len(m.outbound_links),
+                ),
+                now,
+                str(m.id),
+            )
+            for m in memories
+        ]
+        async with self._write() as conn:
+            conn.executemany(
+                "UPDATE agent_memories SET importance_score = ?, updated_at = ? WHERE id = ?",
+                updates,
+            )
+        return len(updates)
+
+    async def get_archival_candidates(
+        self,
+        agent_id: str,
+        threshold: float = 0.001,
+        limit: int = 100,
+    ) -> list[UUID]:
+        """Find memories below archival threshold."""
+        rows = self._select(
+            """
+            SELECT id FROM agent_memories
+            WHERE agent_id = ? AND importance_score <= ? AND is_archived = 0
+            LIMIT ?
+            """,
+            [agent_id, threshold, limit],
+        )
+        return [UUID(row["id"]) for row in rows]
+
+    # ==================== CONSOLIDATION / COLLECTIVE ====================
+
+    async def get_consolidation_candidates(
+        self,
+        agent_id: str,
+        min_importance: float = 0.2,
+        limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[AgentMemory]:
+        """Memories with embeddings to consolidate (see `MemoryStore`)."""
+        where = "agent_id = ? AND importance_score >= ? AND is_archived = 0 AND vec_row IS NOT NULL"
+        params: list[Any] = [agent_id, min_importance]
+        if after is None:
+            order = "created_at DESC, id DESC"
+        else:
+            # Canonical UUID strings sort like the UUIDs themselves.
+            where += " AND (created_at, id) > (?, ?)"
+            params += [_ts(after[0]), str(after[1])]
+            order = "created_at ASC, id ASC"
+        rows = self._select(
+            f"SELECT * FROM agent_memories WHERE {where} ORDER BY {order} LIMIT ?",
+            [*params, limit],
+        )
+        return self._rows_to_memories(rows)
+
+    async def search_collective(
+        self,
+        memory_type: MemoryType,
+        limit: int = 50,
+    ) -> list[AgentMemory]:
+        """Collective-scope memories of one type, highest importance first."""
+        rows = self._select(
+            """
+            SELECT * FROM agent_memories
+            WHERE scope = 'collective' AND memory_type = ? AND is_archived = 0
+            ORDER BY importance_score DESC
+            LIMIT ?
+            """,
+            [memory_type.value, limit],
+        )
+        return self._rows_to_memories(rows)
+
+    async def search_similar_other_agents(
+        self,
+        embedding: Sequence[float],
+        agent_id: str,
+        memory_type: MemoryType,
+        similarity_threshold: float = 0.85,
+        limit: int = 10,
+    ) -> list[AgentMemory]:
+        """Similarity search over other agents' memories of one type."""
+        return self._search_vectors(
+            embedding,
+            ["agent_id != ?", "memory_type = ?", "is_archived = 0"],
+            [agent_id, memory_type.value],
+            limit,
+            similarity_threshold,
+        )
+
+    async def get_promotion_candidates(
+        self,
+        memory_types: list[MemoryType],
+        min_importance: float,
+        min_access_count: int,
+        min_confidence: float,
+        limit: int = 40,
+    ) -> list[AgentMemory]:
+        """Individual-scope memories that may be promoted (see `MemoryStore`)."""
+        if not memory_types:
+            return []
+        rows = self._select(
+            f"""
+            SELECT * FROM agent_memories
+            WHERE scope = 'individual'
+              AND memory_type IN ({_placeholders(memory_types)})
+              AND importance_score >= ?
+              AND access_count >= ?
+              AND confidence >= ?
+              AND is_archived = 0
+            ORDER BY importance_score DESC, access_count DESC
+            LIMIT ?
+            """,
+            [
+                *(t.value for t in memory_types),
+                min_importance,
+                min_access_count,
+                min_confidence,
+                limit,
+            ],
+        )
+        return self._rows_to_memories(rows)
+
+    # ==================== BATCH TRACKING ====================
+
+    async def create_extraction_batch(
+        self,
+        batch: ExtractionBatch,
+    ) -> UUID:
+        """Create extraction batch tracking record."""
+        batch_id = batch.id or uuid4()
+        fields = batch.model_dump(exclude={"id"})
+        async with self._write() as conn:
+            conn.execute(
+                f"""
+                INSERT INTO memory_extraction_batches (id, {", ".join(fields)})
+                VALUES (?, {_placeholders(fields)})
+                """,
+                [str(batch_id), *(_sql_value(f, v) for f, v in fields.items())],
+            )
+        return batch_id
+
+    async def get_pending_extraction_batches(
+        self,
+        agent_id: str | None = None,
+    ) -> list[ExtractionBatch]:
+        """Get pending extraction batches."""
+        where, params = "status IN ('submitted', 'processing')", []
+        if agent_id:
+            where, params = f"agent_id = ? AND {where}", [agent_id]
+        rows = self._select(
+            f"SELECT * FROM memory_extraction_batches WHERE {where} ORDER BY created_at", params
+        )
+        return [self._row_to_extraction_batch(row) for row in rows]
+
+    async def update_extraction_batch(
+        self,
+        batch_id: UUID,
+        updates: dict[str, Any],
+    ) -> None:
+        """Update extraction batch status."""
+        unknown = set(updates) - set(ExtractionBatch.model_fields) - {"id"}
+        if unknown or "id" in updates:
+            raise ValueError(f"Cannot update fields: {sorted(unknown | ({'id'} & set(updates)))}")
+        async with self._write() as conn:
+            conn.execute(
+                f"""
+                UPDATE memory_extraction_batches
+                SET {", ".join(f"{f} = ?" for f in updates)}
+                WHERE id = ?
+                """,
+                [*(_sql_value(f, v) for f, v in updates.items()), str(batch_id)],
+            )
+
+    # ==================== HELPER METHODS ====================
+
+    def _append_vectors(self, embeddings: Sequence[Sequence[float]]) -> list[int]:
+        first_dim = self.vectors.dim is None
+        rows = self.vectors.append(embeddings)
+        if first_dim:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('dim', ?)",
+                (str(self.vectors.dim),),
+            )
+        return rows
+
+    @staticmethod
+    def _index_terms(
+        conn: sqlite3.Connection, memory_id: str, tags: list[str], paths: list[str]
+    ) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO memory_tags (tag, memory_id) VALUES (?, ?)",
+            [(tag, memory_id) for tag in tags],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO memory_files (path, memory_id) VALUES (?, ?)",
+            [(path, memory_id) for path in paths],
+        )
+
+    def _select(self, sql: str, params: Sequence[Any]) -> list[sqlite3.Row]:
+        return self.conn.execute(sql, list(params)).fetchall()
+
+    def _links_for(self, ids: list[str]) -> dict[str, dict[str, list[dict[str, Any]]]]:
+        links: dict[str, dict[str, list[dict[str, Any]]]] = {
+            i: {"inbound": [], "outbound": []} for i in ids
+        }
+        if not ids:
+            return links
+        marks = _placeholders(ids)
+        rows = self._select(
+            f"""
+            SELECT * FROM memory_links
+            WHERE source_id IN ({marks}) OR target_id IN ({marks})
+            """,
+            ids + ids,
+        )
+        for row in rows:
+            link = {
+                "type": row["link_type"],
+                "confidence": row["confidence"],
+                "reasoning": row["reasoning"],
+                "created_at": row["created_at"],
+            }
+            if row["source_id"] in links:
+                links[row["source_id"]]["outbound"].append({"uuid": row["target_id"], **link})
+            if row["target_id"] in links:
+                links[row["target_id"]]["inbound"].append({"uuid": row["source_id"], **link})
+        return links
+
+    def _rows_to_memories(
+        self, rows: list[sqlite3.Row], with_embeddings: bool = True
+    ) -> list[AgentMemory]:
+        links = self._links_for([row["id"] for row in rows])
+        return [
+            self._row_to_memory(row, links[row["id"]], with_embeddings=with_embeddings)
+            for row in rows
+        ]
+
+    def _row_to_memory(
+        self,
+        row: sqlite3.Row,
+        links: dict[str, list[dict[str, Any]]],
+        with_embeddings: bool = True,
+    ) -> AgentMemory:
+        """Convert a SQLite row (plus its links) to AgentMemory."""
+        vec_row = row["vec_row"]
+        return AgentMemory(
+            id=UUID(row["id"]),
+            agent_id=row["agent_id"],
+            text=row["text"],
+            embedding=(
+                self.vectors.vector(vec_row) if with_embeddings and vec_row is not None else None
+            ),
+            importance_score=row["importance_score"],
+            memory_type=MemoryType(row["memory_type"]),
+            scope=MemoryScope(row["scope"]),
+            created_at=_dt(row["created_at"]),
+            updated_at=_dt(row["updated_at"]),
+            expires_at=_dt(row["expires_at"]),
+            last_accessed=_dt(row["last_accessed"]),
+            happens_at=_dt(row["happens_at"]),
+            access_count=row["access_count"],
+            mention_count=row["mention_count"],
+            inbound_links=links["inbound"],
+            outbound_links=links["outbound"],
+            confidence=row["confidence"],
+            is_archived=bool(row["is_archived"]),
+            archived_at=_dt(row["archived_at"]),
+            is_refined=bool(row["is_refined"]),
+            last_refined_at=_dt(row["last_refined_at"]),
+            refinement_rejection_count=row["refinement_rejection_count"],
+            runs_at_creation=row["runs_at_creation"],
+            runs_at_last_access=row["runs_at_last_access"],
+            run_id=row["run_id"],
+            world_id=row["world_id"],
+            issue_tags=json.loads(row["issue_tags"]),
+            file_paths=json.loads(row["file_paths"]),
+        )
+
+    @staticmethod
+    def _row_to_extraction_batch(row: sqlite3.Row) -> ExtractionBatch:
+        data = dict(row)
+        for field in _BATCH_JSON:
+            if data[field] is not None:
+                data[field] = json.loads(data[field])
+        data["request_payload"] = data["request_payload"] or {}
+        return ExtractionBatch(**data)
+
+
+def _placeholders(values: Sequence[Any] | dict[str, Any]) -> str:
+    return ", ".join("?" * len(values))
@@ -0,0 +1,209 @@
+"""
+Embedding Cache - Persistent, content-addressed store for embeddings.
+
+Second tier behind the in-memory LRU in `VectorOps`: embeddings survive
+kernel restarts, so sleeptime consolidation and extraction do not re-embed
+observation text they have already seen.
+
+Layout (one set of files per embedding model, under the `cache_dir` passed
+to `VectorOps`, conventionally `<repo root>/.cyntra/memory/embeddings`):
+
+    <cache_dir>/
+      <model>.json   # {"model": ..., "dim": ...}
+      <model>.f32    # float32 rows, appended; read through a memmap
+      <model>.idx    # 16-byte text digests, row i <-> digest i
+
+Entries are keyed by (model name, blake2b(text)). Vectors are written
+before their index record, so a crash can leave at most a torn trailing
+record, which is ignored on load. Appends hold an advisory lock and other
+processes' appends are picked up when the index file grows.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_DIGEST_SIZE = 16
+
+
+def text_digest(text: str) -> bytes:
+    """Content address for a text."""
+    return hashlib.blake2b(text.encode(), digest_size=_DIGEST_SIZE).digest()
+
+
+def _model_slug(model_name: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", model_name).strip("_") or "model"
+    return f"{safe[:64]}-{hashlib.blake2b(model_name.encode(), digest_size=4).hexdigest()}"
+
+
+class EmbeddingStore:
+    """Append-only on-disk embedding store for a single model."""
+
+    def __init__(self, cache_dir: Path | str, model_name: str) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.model_name = model_name
+        slug = _model_slug(model_name)
+        self.meta_path = self.cache_dir / f"{slug}.json"
+        self.vectors_path = self.cache_dir / f"{slug}.f32"
+        self.index_path = self.cache_dir / f"{slug}.idx"
+
+        self.dim: int | None = None
+        self._rows: dict[bytes, int] = {}
+        self._index_bytes = 0
+        self._vectors: np.memmap | None = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # ===== Loading =====
+
+    def _load(self) -> None:
+        try:
+            meta = json.loads(self.meta_path.read_text())
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable embedding cache metadata: {e}")
+            return
+        self.dim = int(meta["dim"])
+        self._sync()
+
+    def _sync(self) -> None:
+        """Pick up index records appended since the last sync."""
+        if self.dim is None:
+            return
+        try:
+            size = self.index_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size <= self._index_bytes:
+            return
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_bytes)
+            data = f.read(size - self._index_bytes)
+        # Only rows whose vector made it to disk (and whole records).
+        try:
+            stored_rows = self.vectors_path.stat().st_size // (self.dim * 4)
+        except FileNotFoundError:
+            stored_rows = 0
+        row = self._index_bytes // _DIGEST_SIZE
+        end = len(data) - len(data) % _DIGEST_SIZE
+        for pos in range(0, end, _DIGEST_SIZE):
+            if row >= stored_rows:
+                break
+            self._rows.setdefault(data[pos : pos + _DIGEST_SIZE], row)
+            row += 1
+        self._index_bytes = row * _DIGEST_SIZE
+
+    def _matrix(self) -> np.memmap:
+        """Memmap covering every indexed row (remapped as the file grows)."""
+        assert self.dim is not None
+        rows = self._index_bytes // _DIGEST_SIZE
+        if self._vectors is None or self._vectors.shape[0] < rows:
+            self._vectors = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim)
+            )
+        return self._vectors
+
+    # ===== Access =====
+
+    def get_many(self, texts: Sequence[str]) -> list[np.ndarray | None]:
+        """Stored vectors for `texts` (None where missing)."""
+        digests = [text_digest(t) for t in texts]
+        if any(d not in self._rows for d in digests):
+            self._sync()
+        rows = [self._rows.get(d) for d in digests]
+        if all(r is None for r in rows):
+            return [None] * len(texts)
+        matrix = self._matrix()
+        return [None if r is None else np.array(matrix[r]) for r in rows]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> int:
+        """Store vectors for texts not already present; returns how many were added."""
+        if not texts:
+            return 0
+        array = np.asarray(vectors, dtype=np.float32)
+        if array.ndim != 2 or array.shape[0] != len(texts):
+            raise ValueError("Expected one vector per text")
+
+        with self._lock():
+            if self.dim is None:
+                self._load()
+            if self.dim is None:
+                self.dim = int(array.shape[1])
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp = self.meta_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps({"model": self.model_name, "dim": self.dim}))
+                os.replace(tmp, self.meta_path)
+            if array.shape[1] != self.dim:
+                logger.warning(
+                    f"Not caching {self.model_name} embeddings of dim {array.shape[1]} "
+                    f"(store has dim {self.dim})"
+                )
+                return 0
+
+            self._sync()
+            new_rows: list[int] = []
+            digests: list[bytes] = []
+            for i, text in enumerate(texts):
+                digest = text_digest(text)
+                if digest not in self._rows and digest not in digests:
+                    new_rows.append(i)
+                    digests.append(digest)
+            if not new_rows:
+                return 0
+
+            first = self._align_files()
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.ascontiguousarray(array[new_rows]).tobytes())
+                f.flush()
+            with open(self.index_path, "ab") as f:
+                f.write(b"".join(digests))
+                f.flush()
+            for offset, digest in enumerate(digests):
+                self._rows[digest] = first + offset
+            self._index_bytes = (first + len(digests)) * _DIGEST_SIZE
+        return len(digests)
+
+    def _align_files(self) -> int:
+        """Drop torn tails so both files end at the same row; returns that row."""
+        assert self.dim is not None
+        row_bytes = self.dim * 4
+        rows = self._index_bytes // _DIGEST_SIZE
+        for path, size in ((self.vectors_path, row_bytes), (self.index_path, _DIGEST_SIZE)):
+            with contextlib.suppress(FileNotFoundError), open(path, "r+b") as f:
+                f.truncate(rows * size)
+        self._vectors = None
+        return rows
+
+    @contextlib.contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Hold the store's append lock (advisory; a no-op without fcntl)."""
+        if fcntl is None:
+            yield
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.index_path.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
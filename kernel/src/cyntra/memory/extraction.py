@@ -13,7 +13,10 @@ from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
+import numpy as np
+
 from .models import ExtractedMemory, MemoryType
+from .vector_ops import normalize_rows, similarity_matrix
 
 logger = logging.getLogger(__name__)
 
@@ -153,16 +156,14 @@ class MemoryExtractor:
 
         texts = [m.text for m in memories]
         embeddings = await self.vector_ops.batch_embeddings(texts)
+        duplicates = similarity_matrix(normalize_rows(embeddings)) >= threshold
 
         keep: set[int] = set(range(len(memories)))
         for i in range(len(memories)):
             if i not in keep:
                 continue
-            for j in range(i + 1, len(memories)):
-                if j not in keep:
-                    continue
-                sim = self.vector_ops.cosine_similarity(embeddings[i], embeddings[j])
-                if sim >= threshold:
+            for j in (np.flatnonzero(duplicates[i, i + 1 :]) + i + 1).tolist():
+                if j in keep:
                     # Keep higher-importance memory
                     if memories[i].importance_score >= memories[j].importance_score:
                         keep.discard(j)
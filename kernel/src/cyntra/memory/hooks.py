@@ -14,6 +14,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -88,6 +91,74 @@ class MemoryHooks:
         self._domain: str | None = None
         self._observations: list[Observation] = []
 
+        # Observation rows awaiting a bulk write (None when not batching)
+        self._pending: list[dict[str, Any]] | None = None
+        self._flush_every = 0
+
+    @contextmanager
+    def batched(self, flush_every: int = 500) -> Iterator[None]:
+        """
+        Buffer observation writes and store them in bulk.
+
+        Inside the block, hooks queue their rows and `MemoryDB.add_observations`
+        writes them `flush_every` at a time (one transaction per chunk); the
+        remainder is flushed on exit.
+
+        Usage:
+            with hooks.batched():
+                for event in events:
+                    hooks.tool_use(...)
+        """
+        if self._pending is not None:
+            yield
+            return
+
+        self._pending, self._flush_every = [], flush_every
+        try:
+            yield
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._pending = None
+
+    def flush(self) -> None:
+        """
+        Write any buffered observations.
+
+        If the bulk write fails, the chunk is retried row by row so only the
+        offending rows are dropped (and logged).
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        dropped = 0
+        try:
+            written = self.db.add_observations(pending, skip_duplicates=True)
+        except (sqlite3.Error, KeyError, TypeError, ValueError):
+            written = 0
+            for fields in pending:
+                try:
+                    written += self.db.add_observations([fields], skip_duplicates=True)
+                except (sqlite3.Error, KeyError, TypeError, ValueError) as e:
+                    dropped += 1
+                    logger.warning(
+                        "Dropped observation",
+                        observation_id=fields.get("observation_id"),
+                        error=str(e),
+                    )
+        if written + dropped < len(pending):
+            logger.debug("Skipped duplicate observations", count=len(pending) - written - dropped)
+
+    def _write_observation(self, **fields: Any) -> None:
+        """Store an observation row now, or queue it while batching."""
+        if self._pending is None:
+            self.db.add_observation(**fields)
+            return
+        self._pending.append(fields)
+        if len(self._pending) >= self._flush_every:
+            self.flush()
+
     # Hook 1: WorkcellStart (SessionStart)
 
     def workcell_start(
@@ -219,7 +290,7 @@ class MemoryHooks:
         self._observations.append(observation)
 
         # Store in database
-        self.db.add_observation(
+        self._write_observation(
             observation_id=observation.id,
             session_id=self._session_id,
             obs_type=observation.obs_type.value,
@@ -262,7 +333,7 @@ class MemoryHooks:
 
         self._observations.append(observation)
 
-        self.db.add_observation(
+        self._write_observation(
             observation_id=observation.id,
             session_id=self._session_id,
             obs_type=observation.obs_type.value,
@@ -360,6 +431,9 @@ class MemoryHooks:
             logger.warning("workcell_end called without active session")
             return {"success": False, "error": "No active session"}
 
+        # Buffered observations must land before session counts are taken
+        self.flush()
+
         # Generate summary before closing
         summary = self.generate_summary()
 
@@ -405,7 +479,7 @@ class MemoryHooks:
 
         self._observations.append(observation)
 
-        self.db.add_observation(
+        self._write_observation(
             observation_id=observation.id,
             session_id=self._session_id,
             obs_type=observation.obs_type.value,
@@ -429,7 +503,7 @@ class MemoryHooks:
 
         self._observations.append(observation)
 
-        self.db.add_observation(
+        self._write_observation(
             observation_id=observation.id,
             session_id=self._session_id,
             obs_type=observation.obs_type.value,
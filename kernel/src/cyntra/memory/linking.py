@@ -108,7 +108,7 @@ class LinkingService:
         """
         limit = limit or self.config.max_candidates
 
-        if not memory.embedding:
+        if memory.embedding is None:
             return []
 
         candidates = await self.store.search_similar(
@@ -260,31 +260,56 @@ class LinkingService:
         Returns:
             List of related memories (excluding start)
         """
-        visited = {memory_id}
-        related: list[AgentMemory] = []
-        current_level = [memory_id]
-
-        for _depth in range(max_depth):
-            next_level: list[UUID] = []
-            for mid in current_level:
-                links = await self.store.get_links(mid)
-                for direction in ("outbound", "inbound"):
-                    for link in (links.get(direction) or [])[:max_per_level]:
+        neighborhood = await self.traverse_neighborhood([memory_id], max_depth, max_per_level)
+        return [mem for mem, _depth in neighborhood]
+
+    async def traverse_neighborhood(
+        self,
+        memory_ids: list[UUID],
+        max_depth: int = 2,
+        max_per_level: int = 5,
+    ) -> list[tuple[AgentMemory, int]]:
+        """
+        Traverse links from several memories at once.
+
+        Uses the store's single-query `get_neighborhood` when available;
+        otherwise walks breadth-first with one `get_batch` per level (rows
+        carry their own link arrays).
+
+        Args:
+            memory_ids: Starting memory IDs
+            max_depth: Maximum traversal depth
+            max_per_level: Links followed per direction per memory
+
+        Returns:
+            List of (memory, depth) excluding the starting memories
+        """
+        if not memory_ids or max_depth <= 0:
+            return []
+        if callable(getattr(type(self.store), "get_neighborhood", None)):
+            return await self.store.get_neighborhood(memory_ids, max_depth, max_per_level)
+
+        visited = set(memory_ids)
+        related: list[tuple[AgentMemory, int]] = []
+        current_level = await self.store.get_batch(list(memory_ids))
+
+        for depth in range(1, max_depth + 1):
+            next_ids: list[UUID] = []
+            for mem in current_level:
+                for links in (mem.outbound_links, mem.inbound_links):
+                    for link in (links or [])[:max_per_level]:
                         try:
                             linked_id = UUID(str(link.get("uuid", "")))
-                        except Exception:
-                            continue
-                        if linked_id in visited:
+                        except ValueError:
                             continue
-                        visited.add(linked_id)
-                        mem = await self.store.get(linked_id)
-                        if mem:
-                            related.append(mem)
-                            next_level.append(mem.id)
+                        if linked_id not in visited:
+                            visited.add(linked_id)
+                            next_ids.append(linked_id)
 
-            if not next_level:
+            if not next_ids:
                 break
-            current_level = next_level
+            current_level = await self.store.get_batch(next_ids)
+            related.extend((mem, depth) for mem in current_level)
 
         return related
 
@@ -13,10 +13,30 @@ Key Adaptations from Mira:
 
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+import numpy as np
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PlainSerializer, field_validator
+
+
+def _to_embedding(value: Any) -> np.ndarray | None:
+    """Coerce an embedding (list, pgvector value, array) to contiguous float32."""
+    if value is None:
+        return None
+    array = np.ascontiguousarray(value, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Embedding must be a 1-D vector, got shape {array.shape}")
+    return array
+
+
+# Embeddings are held as contiguous float32 arrays so batches can be stacked
+# straight into similarity matrices; they serialise back to plain lists.
+Embedding = Annotated[
+    np.ndarray | None,
+    BeforeValidator(_to_embedding),
+    PlainSerializer(lambda v: None if v is None else v.tolist(), return_type=list[float] | None),
+]
 
 
 class MemoryScope(str, Enum):
@@ -95,10 +115,12 @@ class AgentMemory(BaseModel):
     Adapted from Mira's Memory model with agent context.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: UUID
     agent_id: str  # Toolchain identifier (codex, claude, opencode, crush)
     text: str
-    embedding: list[float] | None = None  # mdbr-leaf-ir-asym (768d)
+    embedding: Embedding = None  # mdbr-leaf-ir-asym (768d), float32
     importance_score: float = Field(ge=0.0, le=1.0, default=0.5)
 
     # Memory classification
@@ -152,7 +174,8 @@ class MemoryLink(BaseModel):
     """
     Relationship link between agent memories.
 
-    Stored bidirectionally in memory inbound_links/outbound_links JSONB arrays.
+    Stored as one row in the memory_links edge table; surfaced on both
+    memories as AgentMemory.outbound_links / inbound_links.
     Adapted from Mira with agent-specific relationship types.
     """
 
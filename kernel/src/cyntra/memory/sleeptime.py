@@ -14,6 +14,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from uuid import UUID
 
 from .collective import CollectiveMemoryService
 from .consolidation import ConsolidationHandler
@@ -292,15 +293,16 @@ class SleeptimeProcessor:
             return 0
 
         # Archive each candidate
-        archived = 0
+        archived: list[UUID] = []
         for memory_id in candidate_ids:
             try:
                 await self.store.archive(memory_id)
-                archived += 1
+                archived.append(memory_id)
             except Exception as e:
                 logger.warning(f"Failed to archive memory {memory_id}: {e}")
 
-        return archived
+        self.consolidation_handler.forget(agent_id, archived)
+        return len(archived)
 
     async def _promote_patterns(
         self,
@@ -10,8 +10,9 @@ from __future__ import annotations
 import json
 import logging
 from contextlib import asynccontextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 from .models import (
@@ -23,9 +24,36 @@ from .models import (
     MemoryType,
 )
 
+if TYPE_CHECKING:
+    from .embedded_store import EmbeddedMemoryStore
+
 logger = logging.getLogger(__name__)
 
 
+def _link_list(key: str, direction: str) -> str:
+    """Correlated subquery aggregating one direction of links for row `m`."""
+    other = "source_id" if key == "target_id" else "target_id"
+    return f"""
+        (SELECT COALESCE(jsonb_agg(jsonb_build_object(
+                    'uuid', l.{other}, 'type', l.link_type, 'confidence', l.confidence,
+                    'reasoning', l.reasoning, 'created_at', l.created_at
+                ) ORDER BY l.created_at), '[]'::jsonb)
+         FROM memory_links l WHERE l.{key} = m.id) AS {direction}_edges"""
+
+
+# Select-list fragment giving agent_memories rows (aliased `m`) their links.
+# The aliases differ from the deprecated JSONB link columns, which `m.*` still
+# returns until migration 004 drops them.
+_LINK_COLUMNS = f"{_link_list('target_id', 'inbound')},{_link_list('source_id', 'outbound')}"
+
+
+def _json_list(value: Any) -> list[Any]:
+    """Decode a jsonb column (text unless a codec is registered) to a list."""
+    if isinstance(value, str):
+        value = json.loads(value)
+    return list(value or [])
+
+
 def _load_scoring_formula() -> str:
     """Load SQL scoring formula from file."""
     formula_path = (
@@ -36,6 +64,36 @@ def _load_scoring_formula() -> str:
     return ""
 
 
+async def _init_connection(conn: Any) -> None:
+    """Register the pgvector codec so vectors round-trip as float32 NumPy arrays."""
+    try:
+        from pgvector.asyncpg import register_vector  # type: ignore[import-not-found]
+    except ImportError:
+        logger.warning("pgvector not installed; vector columns will use the text codec")
+        return
+    await register_vector(conn)
+
+
+async def connect_store(dsn: str) -> MemoryStore | EmbeddedMemoryStore:
+    """
+    Open a memory store, choosing the backend from the DSN scheme.
+
+    - `postgresql://...` / `postgres://...`: `MemoryStore` (asyncpg + pgvector)
+    - `sqlite:///path/to/memory.db`: `EmbeddedMemoryStore` (no Postgres needed)
+
+    Raises:
+        ValueError: For unsupported schemes
+    """
+    scheme = dsn.split("://", 1)[0].lower() if "://" in dsn else ""
+    if scheme in ("postgres", "postgresql"):
+        return await MemoryStore.connect(dsn)
+    if scheme == "sqlite":
+        from .embedded_store import EmbeddedMemoryStore
+
+        return await EmbeddedMemoryStore.connect(dsn)
+    raise ValueError(f"Unsupported memory store DSN scheme: {scheme or dsn!r}")
+
+
 class MemoryStore:
     """
     Database gateway for agent memory operations.
@@ -90,7 +148,9 @@ class MemoryStore:
                 "Install with: pip install cyntra[memory]"
             ) from e
 
-        self.pool = await asyncpg.create_pool(self.db_url, min_size=2, max_size=10)
+        self.pool = await asyncpg.create_pool(
+            self.db_url, min_size=2, max_size=10, init=_init_connection
+        )
         self._initialized = True
 
     @classmethod
@@ -112,7 +172,7 @@ class MemoryStore:
                 "Install with: pip install cyntra[memory]"
             ) from e
 
-        pool = await asyncpg.create_pool(dsn, min_size=2, max_size=10)
+        pool = await asyncpg.create_pool(dsn, min_size=2, max_size=10, init=_init_connection)
         return cls(pool=pool)
 
     async def close(self) -> None:
@@ -269,7 +329,7 @@ class MemoryStore:
         """
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
-                "SELECT * FROM agent_memories WHERE id = $1",
+                f"SELECT m.*, {_LINK_COLUMNS} FROM agent_memories m WHERE m.id = $1",
                 memory_id,
             )
             if not row:
@@ -291,8 +351,9 @@ class MemoryStore:
 
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(
-                """
-                SELECT * FROM agent_memories
+                f"""
+                SELECT m.*, {_LINK_COLUMNS}
+                FROM agent_memories m
                 WHERE id = ANY($1::uuid[])
                 ORDER BY importance_score DESC
                 """,
@@ -330,10 +391,13 @@ class MemoryStore:
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow(
                 f"""
-                UPDATE agent_memories
-                SET {set_clause}, updated_at = NOW()
-                WHERE id = $1
-                RETURNING *
+                WITH m AS (
+                    UPDATE agent_memories
+                    SET {set_clause}, updated_at = NOW()
+                    WHERE id = $1
+                    RETURNING *
+                )
+                SELECT m.*, {_LINK_COLUMNS} FROM m
                 """,
                 memory_id,
                 *values,
@@ -387,8 +451,8 @@ class MemoryStore:
         async with self.pool.acquire() as conn:
             if agent_id and include_collective:
                 rows = await conn.fetch(
-                    """
-                    SELECT m.*,
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS},
                            1 - (m.embedding <=> $1::vector) as similarity_score
                     FROM agent_memories m
                     WHERE m.importance_score >= $2
@@ -407,8 +471,8 @@ class MemoryStore:
                 )
             elif agent_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT m.*,
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS},
                            1 - (m.embedding <=> $1::vector) as similarity_score
                     FROM agent_memories m
                     WHERE m.importance_score >= $2
@@ -427,8 +491,8 @@ class MemoryStore:
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT m.*,
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS},
                            1 - (m.embedding <=> $1::vector) as similarity_score
                     FROM agent_memories m
                     WHERE m.importance_score >= $2
@@ -471,8 +535,9 @@ class MemoryStore:
         async with self.pool.acquire() as conn:
             if agent_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM agent_memories
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
                     WHERE issue_tags && $1
                       AND (agent_id = $2 OR scope = 'collective')
                       AND is_archived = FALSE
@@ -485,8 +550,9 @@ class MemoryStore:
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM agent_memories
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
                     WHERE issue_tags && $1
                       AND is_archived = FALSE
                     ORDER BY importance_score DESC
@@ -517,8 +583,9 @@ class MemoryStore:
         async with self.pool.acquire() as conn:
             if agent_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM agent_memories
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
                     WHERE memory_type = $1
                       AND (agent_id = $2 OR scope = 'collective')
                       AND is_archived = FALSE
@@ -531,8 +598,9 @@ class MemoryStore:
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM agent_memories
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
                     WHERE memory_type = $1
                       AND is_archived = FALSE
                     ORDER BY importance_score DESC
@@ -563,8 +631,9 @@ class MemoryStore:
         async with self.pool.acquire() as conn:
             if agent_id:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM agent_memories
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
                     WHERE file_paths && $1
                       AND (agent_id = $2 OR scope = 'collective')
                       AND is_archived = FALSE
@@ -577,8 +646,9 @@ class MemoryStore:
                 )
             else:
                 rows = await conn.fetch(
-                    """
-                    SELECT * FROM agent_memories
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
                     WHERE file_paths && $1
                       AND is_archived = FALSE
                     ORDER BY importance_score DESC
@@ -589,6 +659,124 @@ class MemoryStore:
                 )
             return [self._row_to_memory(row) for row in rows]
 
+    async def search_multi_signal(
+        self,
+        agent_id: str | None = None,
+        embedding: list[float] | None = None,
+        tags: list[str] | None = None,
+        file_paths: list[str] | None = None,
+        limit_per_signal: int = 10,
+        similarity_threshold: float = 0.7,
+        min_importance: float = 0.1,
+        semantic_weight: float = 0.4,
+        tag_weight: float = 0.25,
+        file_weight: float = 0.25,
+    ) -> list[tuple[AgentMemory, float]]:
+        """
+        Semantic, tag and file retrieval in a single round trip.
+
+        Each signal is a CTE with the same filters and limit as its
+        standalone search (`search_similar`, `search_by_tags`,
+        `search_by_files`). Signals are scored server-side and unioned;
+        a memory hit by several signals keeps its best score.
+
+        Scores:
+            semantic: similarity * semantic_weight
+            tags:     min(overlap / len(tags), 1) * tag_weight
+            files:    min(overlap / len(file_paths), 1) * file_weight
+
+        Args:
+            agent_id: Optional agent filter (collective memories always included)
+            embedding: Query vector; semantic signal skipped if None
+            tags: Issue tags; tag signal skipped if empty
+            file_paths: File paths; file signal skipped if empty
+            limit_per_signal: Maximum hits per signal
+            similarity_threshold: Minimum cosine similarity for semantic hits
+            min_importance: Minimum importance for semantic hits
+            semantic_weight: Weight applied to similarity
+            tag_weight: Weight applied to tag overlap
+            file_weight: Weight applied to file overlap
+
+        Returns:
+            List of (memory, score) sorted by score descending
+        """
+        params: list[Any] = [agent_id, limit_per_signal]
+        visibility = "($1::text IS NULL OR m.agent_id = $1 OR m.scope = 'collective')"
+        signals: list[str] = []
+
+        if embedding is not None:
+            params += [embedding, min_importance, similarity_threshold, semantic_weight]
+            e, imp, thr, w = (f"${i}" for i in range(len(params) - 3, len(params) + 1))
+            signals.append(
+                f"""
+                SELECT m.id,
+                       (1 - (m.embedding <=> {e}::vector)) * {w} AS score,
+                       1 - (m.embedding <=> {e}::vector) AS similarity
+                FROM agent_memories m
+                WHERE m.importance_score >= {imp}
+                  AND (m.expires_at IS NULL OR m.expires_at > NOW())
+                  AND m.is_archived = FALSE
+                  AND {visibility}
+                  AND 1 - (m.embedding <=> {e}::vector) >= {thr}
+                ORDER BY m.embedding <=> {e}::vector
+                LIMIT $2
+                """
+            )
+
+        for column, values, weight in (
+            ("issue_tags", tags, tag_weight),
+            ("file_paths", file_paths, file_weight),
+        ):
+            if not values:
+                continue
+            params += [values, weight]
+            v, w = f"${len(params) - 1}", f"${len(params)}"
+            signals.append(
+                f"""
+                SELECT m.id,
+                       LEAST(
+                           cardinality(ARRAY(
+                               SELECT unnest(m.{column}) INTERSECT SELECT unnest({v}::text[])
+                           ))::float / cardinality({v}::text[]),
+                           1.0
+                       ) * {w} AS score,
+                       NULL::float AS similarity
+                FROM agent_memories m
+                WHERE m.{column} && {v}::text[]
+                  AND {visibility}
+                  AND m.is_archived = FALSE
+                ORDER BY m.importance_score DESC
+                LIMIT $2
+                """
+            )
+
+        if not signals:
+            return []
+
+        union = "\nUNION ALL\n".join(f"({signal})" for signal in signals)
+        query = f"""
+            WITH signals AS ({union}),
+            scored AS (
+                SELECT id, MAX(score) AS relevance, MAX(similarity) AS similarity_score
+                FROM signals
+                GROUP BY id
+            )
+            SELECT m.*, {_LINK_COLUMNS}, s.relevance, s.similarity_score
+            FROM scored s
+            JOIN agent_memories m ON m.id = s.id
+            ORDER BY s.relevance DESC
+        """
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+
+        results = []
+        for row in rows:
+            memory = self._row_to_memory(row)
+            memory.similarity_score = row["similarity_score"]
+            results.append((memory, float(row["relevance"])))
+        return results
+
     # ==================== HUB OPERATIONS ====================
 
     async def find_hubs(
@@ -616,14 +804,18 @@ class MemoryStore:
         """
         async with self.pool.acquire() as conn:
             rows = await conn.fetch(
-                """
-                SELECT * FROM agent_memories
-                WHERE agent_id = $1
-                  AND importance_score >= $2
-                  AND access_count >= $3
-                  AND jsonb_array_length(inbound_links) >= $4
-                  AND is_archived = FALSE
-                ORDER BY importance_score DESC, jsonb_array_length(inbound_links) DESC
+                f"""
+                SELECT m.*, {_LINK_COLUMNS}
+                FROM agent_memories m
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS inbound FROM memory_links l WHERE l.target_id = m.id
+                ) degree
+                WHERE m.agent_id = $1
+                  AND m.importance_score >= $2
+                  AND m.access_count >= $3
+                  AND degree.inbound >= $4
+                  AND m.is_archived = FALSE
+                ORDER BY m.importance_score DESC, degree.inbound DESC
                 LIMIT $5
                 """,
                 agent_id,
@@ -716,70 +908,44 @@ class MemoryStore:
         Args:
             link: MemoryLink to create
         """
-        outbound_obj = {
-            "uuid": str(link.target_id),
-            "type": link.link_type.value,
-            "confidence": link.confidence,
-            "reasoning": link.reasoning,
-            "created_at": link.created_at.isoformat(),
-        }
-
-        inbound_obj = {
-            "uuid": str(link.source_id),
-            "type": link.link_type.value,
-            "confidence": link.confidence,
-            "reasoning": link.reasoning,
-            "created_at": link.created_at.isoformat(),
-        }
-
-        async with self.transaction() as conn:
-            # Add outbound link to source
-            await conn.execute(
-                """
-                UPDATE agent_memories
-                SET outbound_links = outbound_links || $2::jsonb,
-                    updated_at = NOW()
-                WHERE id = $1
-                  AND NOT EXISTS (
-                      SELECT 1 FROM jsonb_array_elements(outbound_links) AS elem
-                      WHERE elem->>'uuid' = $3
-                        AND elem->>'type' = $4
-                  )
-                """,
-                link.source_id,
-                json.dumps(outbound_obj),
-                str(link.target_id),
-                link.link_type.value,
-            )
-
-            # Add inbound link to target
-            await conn.execute(
-                """
-                UPDATE agent_memories
-                SET inbound_links = inbound_links || $2::jsonb,
-                    updated_at = NOW()
-                WHERE id = $1
-                  AND NOT EXISTS (
-                      SELECT 1 FROM jsonb_array_elements(inbound_links) AS elem
-                      WHERE elem->>'uuid' = $3
-                        AND elem->>'type' = $4
-                  )
-                """,
-                link.target_id,
-                json.dumps(inbound_obj),
-                str(link.source_id),
-                link.link_type.value,
-            )
+        await self.create_links_batch([link])
 
     async def create_links_batch(self, links: list[MemoryLink]) -> None:
         """
         Batch create multiple links.
 
+        One INSERT into `memory_links`; duplicates and links to missing
+        memories are skipped.
+
         Args:
             links: List of MemoryLink objects
         """
-        for link in links:
-            await self.create_link(link)
+        if not links:
+            return
+
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO memory_links (
+                    source_id, target_id, link_type, confidence, reasoning, created_at
+                )
+                SELECT l.source_id, l.target_id, l.link_type, l.confidence, l.reasoning,
+                       l.created_at
+                FROM unnest(
+                    $1::uuid[], $2::uuid[], $3::text[], $4::float8[], $5::text[],
+                    $6::timestamptz[]
+                ) AS l(source_id, target_id, link_type, confidence, reasoning, created_at)
+                JOIN agent_memories s ON s.id = l.source_id
+                JOIN agent_memories t ON t.id = l.target_id
+                ON CONFLICT DO NOTHING
+                """,
+                [link.source_id for link in links],
+                [link.target_id for link in links],
+                [link.link_type.value for link in links],
+                [link.confidence for link in links],
+                [link.reasoning for link in links],
+                [link.created_at for link in links],
+            )
 
     async def get_links(self, memory_id: UUID) -> dict[str, list[dict[str, Any]]]:
         """
@@ -791,14 +957,94 @@ class MemoryStore:
         Returns:
             Dict with 'inbound' and 'outbound' link lists
         """
-        memory = await self.get(memory_id)
-        if not memory:
-            return {"inbound": [], "outbound": []}
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT 'outbound' AS direction, target_id AS uuid, link_type, confidence,
+                       reasoning, created_at
+                FROM memory_links WHERE source_id = $1
+                UNION ALL
+                SELECT 'inbound', source_id, link_type, confidence, reasoning, created_at
+                FROM memory_links WHERE target_id = $1
+                ORDER BY created_at
+                """,
+                memory_id,
+            )
 
-        return {
-            "inbound": memory.inbound_links,
-            "outbound": memory.outbound_links,
-        }
+        links: dict[str, list[dict[str, Any]]] = {"inbound": [], "outbound": []}
+        for row in rows:
+            links[row["direction"]].append(
+                {
+                    "uuid": str(row["uuid"]),
+                    "type": row["link_type"],
+                    "confidence": (
+                        float(row["confidence"]) if row["confidence"] is not None else None
+                    ),
+                    "reasoning": row["reasoning"],
+                    "created_at": row["created_at"].isoformat(),
+                }
+            )
+        return links
+
+    async def get_neighborhood(
+        self,
+        memory_ids: list[UUID],
+        max_depth: int = 2,
+        max_per_level: int = 5,
+    ) -> list[tuple[AgentMemory, int]]:
+        """
+        Memories reachable over links from `memory_ids`, in one query.
+
+        A recursive CTE walks `memory_links`, following the `max_per_level`
+        oldest links per direction from each memory.
+
+        Args:
+            memory_ids: Starting memory IDs
+            max_depth: Maximum traversal depth
+            max_per_level: Links followed per direction per memory
+
+        Returns:
+            List of (memory, depth) excluding the starting memories,
+            ordered by depth then importance
+        """
+        if not memory_ids or max_depth <= 0:
+            return []
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                WITH RECURSIVE walk(id, depth, path) AS (
+                    SELECT id, 0, ARRAY[id]
+                    FROM unnest($1::uuid[]) AS id
+                  UNION ALL
+                    SELECT step.id, w.depth + 1, w.path || step.id
+                    FROM walk w
+                    CROSS JOIN LATERAL (
+                        (SELECT target_id AS id FROM memory_links
+                         WHERE source_id = w.id ORDER BY created_at LIMIT $3)
+                        UNION ALL
+                        (SELECT source_id FROM memory_links
+                         WHERE target_id = w.id ORDER BY created_at LIMIT $3)
+                    ) step
+                    WHERE w.depth < $2
+                      AND NOT step.id = ANY(w.path)
+                ),
+                reached AS (
+                    SELECT id, MIN(depth) AS depth
+                    FROM walk
+                    WHERE depth > 0 AND NOT id = ANY($1::uuid[])
+                    GROUP BY id
+                )
+                SELECT m.*, {_LINK_COLUMNS}, r.depth AS link_depth
+                FROM reached r
+                JOIN agent_memories m ON m.id = r.id
+                ORDER BY r.depth, m.importance_score DESC
+                """,
+                memory_ids,
+                max_depth,
+                max_per_level,
+            )
+            return [(self._row_to_memory(row), row["link_depth"]) for row in rows]
 
     async def heal_dead_links(self, dead_ids: list[UUID]) -> int:
         """
@@ -815,35 +1061,22 @@ class MemoryStore:
         if not dead_ids:
             return 0
 
-        dead_strs = [str(uid) for uid in dead_ids]
-
         async with self.pool.acquire() as conn:
-            result = await conn.execute(
+            count = await conn.fetchval(
                 """
-                UPDATE agent_memories
-                SET
-                    inbound_links = (
-                        SELECT COALESCE(jsonb_agg(elem), '[]'::jsonb)
-                        FROM jsonb_array_elements(inbound_links) AS elem
-                        WHERE elem->>'uuid' != ALL($1)
-                    ),
-                    outbound_links = (
-                        SELECT COALESCE(jsonb_agg(elem), '[]'::jsonb)
-                        FROM jsonb_array_elements(outbound_links) AS elem
-                        WHERE elem->>'uuid' != ALL($1)
-                    ),
-                    updated_at = NOW()
-                WHERE EXISTS (
-                    SELECT 1 FROM jsonb_array_elements(inbound_links) AS elem
-                    WHERE elem->>'uuid' = ANY($1)
-                ) OR EXISTS (
-                    SELECT 1 FROM jsonb_array_elements(outbound_links) AS elem
-                    WHERE elem->>'uuid' = ANY($1)
+                WITH removed AS (
+                    DELETE FROM memory_links
+                    WHERE source_id = ANY($1::uuid[]) OR target_id = ANY($1::uuid[])
+                    RETURNING source_id, target_id
                 )
+                SELECT COUNT(*) FROM (
+                    SELECT source_id FROM removed WHERE target_id = ANY($1::uuid[])
+                    UNION
+                    SELECT target_id FROM removed WHERE source_id = ANY($1::uuid[])
+                ) touched
                 """,
-                dead_strs,
+                list(dead_ids),
             )
-            count = int(result.split()[-1]) if result else 0
             if count > 0:
                 logger.info(f"Cleaned up {count} dead links")
             return count
@@ -899,6 +1132,187 @@ class MemoryStore:
             )
             return [row["id"] for row in rows]
 
+    # ==================== CONSOLIDATION / COLLECTIVE ====================
+
+    async def get_consolidation_candidates(
+        self,
+        agent_id: str,
+        min_importance: float = 0.2,
+        limit: int = 100,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[AgentMemory]:
+        """
+        Get unarchived memories with embeddings that may be consolidated.
+
+        Args:
+            agent_id: Agent identifier
+            min_importance: Minimum importance score
+            limit: Maximum results
+            after: (created_at, id) key; None returns the most recent memories
+
+        Returns:
+            Most recent memories, or the oldest ones after `after` so that
+            successive calls page forward without skipping created_at ties
+        """
+        async with self.pool.acquire() as conn:
+            if after is None:
+                rows = await conn.fetch(
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
+                    WHERE agent_id = $1
+                      AND importance_score >= $2
+                      AND is_archived = FALSE
+                      AND embedding IS NOT NULL
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT $3
+                    """,
+                    agent_id,
+                    min_importance,
+                    limit,
+                )
+            else:
+                rows = await conn.fetch(
+                    f"""
+                    SELECT m.*, {_LINK_COLUMNS}
+                    FROM agent_memories m
+                    WHERE agent_id = $1
+                      AND importance_score >= $2
+                      AND is_archived = FALSE
+                      AND embedding IS NOT NULL
+                      AND (created_at, id) > ($4, $5)
+                    ORDER BY created_at ASC, id ASC
+                    LIMIT $3
+                    """,
+                    agent_id,
+                    min_importance,
+                    limit,
+                    *after,
+                )
+            return [self._row_to_memory(row) for row in rows]
+
+    async def search_collective(
+        self,
+        memory_type: MemoryType,
+        limit: int = 50,
+    ) -> list[AgentMemory]:
+        """
+        Search collective-scope memories of one type, across all agents.
+
+        Args:
+            memory_type: Memory type filter
+            limit: Maximum results
+
+        Returns:
+            List of collective memories, highest importance first
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT m.*, {_LINK_COLUMNS}
+                FROM agent_memories m
+                WHERE scope = 'collective'
+                  AND memory_type = $1
+                  AND is_archived = FALSE
+                ORDER BY importance_score DESC
+                LIMIT $2
+                """,
+                memory_type.value,
+                limit,
+            )
+            return [self._row_to_memory(row) for row in rows]
+
+    async def search_similar_other_agents(
+        self,
+        embedding: list[float],
+        agent_id: str,
+        memory_type: MemoryType,
+        similarity_threshold: float = 0.85,
+        limit: int = 10,
+    ) -> list[AgentMemory]:
+        """
+        Vector similarity search over other agents' memories of one type.
+
+        Args:
+            embedding: Query vector (768d)
+            agent_id: Agent whose memories are excluded
+            memory_type: Memory type filter
+            similarity_threshold: Minimum cosine similarity (0-1)
+            limit: Maximum results
+
+        Returns:
+            List of similar memories sorted by similarity
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT m.*, {_LINK_COLUMNS},
+                       1 - (m.embedding <=> $1::vector) as similarity_score
+                FROM agent_memories m
+                WHERE m.agent_id != $2
+                  AND m.memory_type = $3
+                  AND m.is_archived = FALSE
+                  AND 1 - (m.embedding <=> $1::vector) >= $4
+                ORDER BY m.embedding <=> $1::vector
+                LIMIT $5
+                """,
+                embedding,
+                agent_id,
+                memory_type.value,
+                similarity_threshold,
+                limit,
+            )
+
+            memories = []
+            for row in rows:
+                memory = self._row_to_memory(row)
+                memory.similarity_score = row["similarity_score"]
+                memories.append(memory)
+            return memories
+
+    async def get_promotion_candidates(
+        self,
+        memory_types: list[MemoryType],
+        min_importance: float,
+        min_access_count: int,
+        min_confidence: float,
+        limit: int = 40,
+    ) -> list[AgentMemory]:
+        """
+        Get individual-scope memories that may be promoted to collective.
+
+        Args:
+            memory_types: Memory types to consider
+            min_importance: Minimum importance score
+            min_access_count: Minimum access count
+            min_confidence: Minimum confidence
+            limit: Maximum results
+
+        Returns:
+            List of memories, highest importance and access count first
+        """
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT m.*, {_LINK_COLUMNS}
+                FROM agent_memories m
+                WHERE scope = 'individual'
+                  AND memory_type = ANY($1)
+                  AND importance_score >= $2
+                  AND access_count >= $3
+                  AND confidence >= $4
+                  AND is_archived = FALSE
+                ORDER BY importance_score DESC, access_count DESC
+                LIMIT $5
+                """,
+                [t.value for t in memory_types],
+                min_importance,
+                min_access_count,
+                min_confidence,
+                limit,
+            )
+            return [self._row_to_memory(row) for row in rows]
+
     # ==================== BATCH TRACKING ====================
 
     async def create_extraction_batch(
@@ -1004,7 +1418,7 @@ class MemoryStore:
             id=row["id"],
             agent_id=row["agent_id"],
             text=row["text"],
-            embedding=list(row["embedding"]) if get("embedding") else None,
+            embedding=get("embedding"),
             importance_score=float(get("importance_score", 0.5)),
             memory_type=MemoryType(row["memory_type"]),
             scope=MemoryScope(get("scope", "individual")),
@@ -1015,8 +1429,8 @@ class MemoryStore:
             happens_at=get("happens_at"),
             access_count=get("access_count", 0),
             mention_count=get("mention_count", 0),
-            inbound_links=get("inbound_links") or [],
-            outbound_links=get("outbound_links") or [],
+            inbound_links=_json_list(get("inbound_edges")),
+            outbound_links=_json_list(get("outbound_edges")),
             confidence=float(get("confidence", 0.9)),
             is_archived=get("is_archived", False),
             archived_at=get("archived_at"),
@@ -10,6 +10,7 @@ Multi-signal retrieval that combines:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from uuid import UUID
@@ -99,55 +100,42 @@ class MemorySurfacingService:
         limit = limit or self.config.max_memories
         config = self.config
 
-        # Collect memories from each signal
-        all_memories: dict[UUID, tuple[AgentMemory, float]] = {}
-
-        # 1. Semantic similarity
-        if query_text:
-            fingerprint, embedding = await self.generate_fingerprint(query_text)
-            semantic_memories = await self.store.search_similar(
-                embedding=embedding,
+        if callable(getattr(type(self.store), "search_multi_signal", None)):
+            embedding = None
+            if query_text:
+                _, embedding = await self.generate_fingerprint(query_text)
+            scored = await self.store.search_multi_signal(
                 agent_id=agent_id,
-                limit=config.max_per_signal,
+                embedding=embedding,
+                tags=tags,
+                file_paths=file_paths,
+                limit_per_signal=config.max_per_signal,
                 similarity_threshold=config.semantic_threshold,
                 min_importance=config.min_importance,
-                include_collective=True,
-            )
-            for mem in semantic_memories:
-                score = (mem.similarity_score or 0.5) * config.semantic_weight
-                self._add_memory(all_memories, mem, score)
-
-        # 2. Tag matching
-        if tags:
-            tag_memories = await self.store.search_by_tags(
-                tags=tags,
-                agent_id=agent_id,
-                limit=config.max_per_signal,
+                semantic_weight=config.semantic_weight,
+                tag_weight=config.tag_weight,
+                file_weight=config.file_weight,
             )
-            for mem in tag_memories:
-                # Score based on tag overlap
-                overlap = len(set(mem.issue_tags) & set(tags))
-                tag_score = min(overlap / len(tags), 1.0) * config.tag_weight
-                self._add_memory(all_memories, mem, tag_score)
-
-        # 3. File path matching
-        if file_paths:
-            file_memories = await self.store.search_by_files(
-                file_paths=file_paths,
-                agent_id=agent_id,
-                limit=config.max_per_signal,
+        else:
+            # Stores without a combined query: issue the signals concurrently
+            signals = await asyncio.gather(
+                self._semantic_signal(query_text, agent_id),
+                self._overlap_signal("issue_tags", tags, agent_id),
+                self._overlap_signal("file_paths", file_paths, agent_id),
             )
-            for mem in file_memories:
-                # Score based on file overlap
-                overlap = len(set(mem.file_paths) & set(file_paths))
-                file_score = min(overlap / len(file_paths), 1.0) * config.file_weight
-                self._add_memory(all_memories, mem, file_score)
+            scored = [item for signal in signals for item in signal]
+
+        # Collect memories from each signal
+        all_memories: dict[UUID, tuple[AgentMemory, float]] = {}
+        for mem, score in scored:
+            self._add_memory(all_memories, mem, score)
 
-        # 4. Link expansion
+        # Link expansion from the best-scoring memories (batched traversal)
         if self.linking_service and all_memories:
-            linked = await self.expand_via_links(list(all_memories.keys()))
+            ranked = sorted(all_memories.values(), key=lambda x: x[1], reverse=True)
+            linked = await self.expand_via_links([mem.id for mem, _ in ranked])
             for mem in linked:
-                if mem.id not in all_memories:
+                if mem.id not in all_memories and not mem.is_archived:
                     self._add_memory(all_memories, mem, config.link_weight)
 
         # Sort by combined score and return top results
@@ -155,6 +143,51 @@ class MemorySurfacingService:
 
         return [mem for mem, score in sorted_memories[:limit]]
 
+    async def _semantic_signal(
+        self,
+        query_text: str,
+        agent_id: str,
+    ) -> list[tuple[AgentMemory, float]]:
+        """Embed the query and score memories by similarity."""
+        if not query_text:
+            return []
+        config = self.config
+        _, embedding = await self.generate_fingerprint(query_text)
+        memories = await self.store.search_similar(
+            embedding=embedding,
+            agent_id=agent_id,
+            limit=config.max_per_signal,
+            similarity_threshold=config.semantic_threshold,
+            min_importance=config.min_importance,
+            include_collective=True,
+        )
+        return [(mem, (mem.similarity_score or 0.5) * config.semantic_weight) for mem in memories]
+
+    async def _overlap_signal(
+        self,
+        field: str,
+        values: list[str] | None,
+        agent_id: str,
+    ) -> list[tuple[AgentMemory, float]]:
+        """Score memories by overlap with the given issue tags or file paths."""
+        if not values:
+            return []
+        config = self.config
+        if field == "issue_tags":
+            memories = await self.store.search_by_tags(
+                tags=values, agent_id=agent_id, limit=config.max_per_signal
+            )
+            weight = config.tag_weight
+        else:
+            memories = await self.store.search_by_files(
+                file_paths=values, agent_id=agent_id, limit=config.max_per_signal
+            )
+            weight = config.file_weight
+        return [
+            (mem, min(len(set(getattr(mem, field)) & set(values)) / len(values), 1.0) * weight)
+            for mem in memories
+        ]
+
     async def generate_fingerprint(
         self,
         query_text: str,
@@ -199,32 +232,12 @@ class MemorySurfacingService:
         max_depth = max_depth or self.config.max_link_depth
         config = self.config
 
-        visited: set[UUID] = set(memory_ids)
-        result: list[AgentMemory] = []
-        current_level = list(memory_ids)
-
-        for _depth in range(max_depth):
-            next_level = []
-
-            for mid in current_level[: config.max_per_link_level]:
-                # Use linking service for traversal
-                related = await self.linking_service.traverse_related(
-                    memory_id=mid,
-                    max_depth=1,
-                    max_per_level=config.max_per_link_level,
-                )
-
-                for mem in related:
-                    if mem.id not in visited:
-                        visited.add(mem.id)
-                        result.append(mem)
-                        next_level.append(mem.id)
-
-            current_level = next_level
-            if not current_level:
-                break
-
-        return result
+        neighborhood = await self.linking_service.traverse_neighborhood(
+            memory_ids=list(memory_ids)[: config.max_per_link_level],
+            max_depth=max_depth,
+            max_per_level=config.max_per_link_level,
+        )
+        return [mem for mem, _depth in neighborhood]
 
     def _add_memory(
         self,
@@ -7,6 +7,7 @@ Provides specific fixes for known failure modes.
 from __future__ import annotations
 
 from ..models import AgentMemory, MemoryType
+from ..vector_ops import normalize_rows, top_k
 from .base import AgentTrinket, RunContext
 
 
@@ -80,16 +81,12 @@ class PlaybookTrinket(AgentTrinket):
         if ctx.last_error and self.vector_ops:
             error_embedding = await self.vector_ops.generate_embedding(ctx.last_error)
 
-            # Score playbooks by similarity to error
-            scored = []
-            for pb in all_playbooks:
-                if pb.embedding:
-                    sim = self.vector_ops.cosine_similarity(error_embedding, pb.embedding)
-                    scored.append((pb, sim))
-
-            # Sort by similarity
-            scored.sort(key=lambda x: x[1], reverse=True)
-            playbooks = [pb for pb, sim in scored[: self.max_instructions] if sim > 0.5]
+            # Rank playbooks by similarity to error
+            embedded = [pb for pb in all_playbooks if pb.embedding is not None]
+            if embedded:
+                matrix = normalize_rows([pb.embedding for pb in embedded])
+                ranked = top_k(error_embedding, matrix, self.max_instructions)
+                playbooks = [embedded[i] for i, sim in ranked if sim > 0.5]
 
         # Fallback to highest importance playbooks
         if not playbooks:
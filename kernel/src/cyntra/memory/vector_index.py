@@ -0,0 +1,219 @@
+"""
+Vector Index - Memory-mapped float32 matrix with an IVF ANN index.
+
+Backs the embedded memory store. Vectors are L2-normalised and appended
+to a flat file (`<name>.f32`) that is read through a memmap; row numbers
+are stable, so metadata stores refer to vectors by row.
+
+Search is exact (one matrix-vector product) until the matrix reaches
+`ivf_min_rows`. Past that, an inverted-file index is trained: spherical
+k-means over a sample assigns each row to one of ~sqrt(n) lists, and a
+query scores only the rows in its `nprobe` nearest lists. New rows are
+assigned to the existing centroids; the index retrains once the matrix
+has grown `retrain_factor` times since the last training.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+
+from .vector_ops import normalize_rows
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IVF_MIN_ROWS = 4096
+DEFAULT_NPROBE = 8
+
+
+class VectorIndex:
+    """Append-only normalised vector matrix with approximate search."""
+
+    def __init__(
+        self,
+        path: Path | str,
+        dim: int | None = None,
+        *,
+        ivf_min_rows: int = DEFAULT_IVF_MIN_ROWS,
+        nprobe: int = DEFAULT_NPROBE,
+        retrain_factor: float = 4.0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Open (or create) a vector file.
+
+        Args:
+            path: Vector file; created on first append
+            dim: Vector dimension (required until the first append)
+            ivf_min_rows: Rows below which search stays exact
+            nprobe: Inverted lists scored per query
+            retrain_factor: Growth since training that triggers a retrain
+            seed: Seed for k-means sampling
+        """
+        self.path = Path(path)
+        self.dim = dim
+        self.ivf_min_rows = ivf_min_rows
+        self.nprobe = nprobe
+        self.retrain_factor = retrain_factor
+        self._rng = np.random.default_rng(seed)
+
+        self._rows = 0
+        self._matrix: np.memmap | None = None
+        self._centroids: np.ndarray | None = None
+        self._lists: list[array] = []
+        self._assigned = 0
+        self._trained_rows = 0
+
+        if self.dim is not None and self.path.exists():
+            self._rows = self.path.stat().st_size // (self.dim * 4)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def trained(self) -> bool:
+        return self._centroids is not None
+
+    # ===== Storage =====
+
+    def append(self, vectors: Sequence[Sequence[float]] | np.ndarray) -> list[int]:
+        """Normalise and append vectors; returns their row numbers."""
+        matrix = normalize_rows(vectors)
+        if len(matrix) == 0:
+            return []
+        if self.dim is None:
+            self.dim = int(matrix.shape[1])
+        if matrix.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-d vectors, got {matrix.shape[1]}-d")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            # Drop a torn trailing row left by an interrupted append
+            if f.tell() != self._rows * self.dim * 4:
+                f.truncate(self._rows * self.dim * 4)
+            f.write(matrix.tobytes())
+        first = self._rows
+        self._rows += len(matrix)
+        self._matrix = None
+        return list(range(first, self._rows))
+
+    def vector(self, row: int) -> np.ndarray:
+        """Copy of the stored (normalised) vector at `row`."""
+        return np.array(self.matrix()[row])
+
+    def matrix(self) -> np.ndarray:
+        """Memmap over all rows (remapped after appends)."""
+        if self.dim is None or self._rows == 0:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        if self._matrix is None or len(self._matrix) != self._rows:
+            self._matrix = np.memmap(
+                self.path, dtype=np.float32, mode="r", shape=(self._rows, self.dim)
+            )
+        return self._matrix
+
+    def flush(self) -> None:
+        """fsync the vector file."""
+        if self.path.exists():
+            fd = os.open(self.path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    # ===== Search =====
+
+    def search(
+        self,
+        query: Sequence[float] | np.ndarray,
+        k: int,
+        threshold: float | None = None,
+        exact: bool = False,
+    ) -> list[tuple[int, float]]:
+        """
+        Rows most similar to `query`, best first.
+
+        Args:
+            query: Query vector (normalised here)
+            k: Maximum results
+            threshold: Optional minimum cosine similarity
+            exact: Score every row instead of probing the IVF lists
+
+        Returns:
+            List of (row, similarity) pairs
+        """
+        if k <= 0 or self._rows == 0:
+            return []
+        q = normalize_rows(np.asarray(query, dtype=np.float32)[None, :])[0]
+        matrix = self.matrix()
+
+        if exact or not self._ensure_ivf():
+            rows = None
+            scores = matrix @ q
+        else:
+            assert self._centroids is not None
+            probe = min(self.nprobe, len(self._centroids))
+            centroid_scores = self._centroids @ q
+            nearest = np.argpartition(-centroid_scores, probe - 1)[:probe]
+            rows = np.concatenate([np.frombuffer(self._lists[c], dtype=np.int64) for c in nearest])
+            rows.sort()
+            scores = matrix[rows] @ q
+
+        keep = np.arange(len(scores)) if threshold is None else np.flatnonzero(scores >= threshold)
+        if len(keep) > k:
+            keep = keep[np.argpartition(-scores[keep], k - 1)[:k]]
+        keep = keep[np.argsort(-scores[keep], kind="stable")]
+        found = keep if rows is None else rows[keep]
+        return [(int(r), float(scores[i])) for r, i in zip(found, keep, strict=True)]
+
+    # ===== IVF =====
+
+    def _ensure_ivf(self) -> bool:
+        """Train or extend the IVF lists as needed; False while search is exact."""
+        if self._rows < self.ivf_min_rows:
+            return False
+        if self._centroids is None or self._rows >= self._trained_rows * self.retrain_factor:
+            self._train()
+        elif self._assigned < self._rows:
+            self._assign(self._assigned, self._rows)
+        return True
+
+    def _train(self, iterations: int = 10) -> None:
+        matrix = self.matrix()
+        nlist = max(1, int(math.sqrt(self._rows)))
+        sample_size = min(self._rows, nlist * 64)
+        sample = np.asarray(
+            matrix[np.sort(self._rng.choice(self._rows, sample_size, replace=False))]
+        )
+
+        centroids = sample[self._rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            empty = np.bincount(labels, minlength=nlist) == 0
+            # Re-seed empty lists from random sample rows
+            sums[empty] = sample[self._rng.choice(sample_size, int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self._centroids = centroids
+        self._lists = [array("q") for _ in range(nlist)]
+        self._assigned = 0
+        self._trained_rows = self._rows
+        self._assign(0, self._rows)
+        logger.debug(f"Trained IVF index: {nlist} lists over {self._rows} vectors")
+
+    def _assign(self, start: int, end: int, block: int = 8192) -> None:
+        assert self._centroids is not None
+        matrix = self.matrix()
+        for block_start in range(start, end, block):
+            block_end = min(block_start + block, end)
+            labels = np.argmax(matrix[block_start:block_end] @ self._centroids.T, axis=1)
+            for row, label in enumerate(labels.tolist(), start=block_start):
+                self._lists[label].append(row)
+        self._assigned = end
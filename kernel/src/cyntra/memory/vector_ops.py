@@ -2,7 +2,12 @@
 Vector Operations - Embedding generation and similarity calculations.
 
 Provides async embedding generation using sentence-transformers or
-OpenAI embeddings with caching support.
+OpenAI embeddings with two cache tiers: an in-memory LRU, and optionally
+a persistent on-disk store (see embedding_cache.py) that survives restarts.
+
+Similarity kernels work on contiguous float32 matrices: normalise once
+with `normalize_rows`, then score a whole batch with `similarity_matrix`
+(all pairs) or `top_k` (one query against many rows).
 """
 
 from __future__ import annotations
@@ -10,7 +15,15 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
-from typing import cast
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from cyntra.memory.embedding_cache import EmbeddingStore
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +32,79 @@ DEFAULT_MODEL = "nomic-ai/nomic-embed-text-v1.5"
 EMBEDDING_DIM = 768
 
 
+# ===== Similarity kernels =====
+
+
+def as_matrix(vectors: np.ndarray | Sequence[Sequence[float]]) -> np.ndarray:
+    """Stack vectors into a C-contiguous float32 matrix of shape (n, dim)."""
+    if isinstance(vectors, np.ndarray):
+        matrix = vectors
+    elif len(vectors) == 0:
+        return np.zeros((0, 0), dtype=np.float32)
+    else:
+        matrix = np.stack([np.asarray(v, dtype=np.float32) for v in vectors])
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D matrix of vectors, got shape {matrix.shape}")
+    return matrix
+
+
+def normalize_rows(vectors: np.ndarray | Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    L2-normalise each row so dot products are cosine similarities.
+
+    Zero rows stay zero (similarity 0 to everything), matching
+    `VectorOps.cosine_similarity`.
+    """
+    matrix = as_matrix(vectors)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.maximum(norms, np.finfo(np.float32).tiny, out=norms)
+    return matrix / norms
+
+
+def similarity_matrix(a: np.ndarray, b: np.ndarray | None = None) -> np.ndarray:
+    """
+    All-pairs cosine similarity between rows of `a` and rows of `b`.
+
+    Args:
+        a: Row-normalised float32 matrix (n, dim)
+        b: Row-normalised float32 matrix (m, dim); defaults to `a`
+
+    Returns:
+        (n, m) float32 similarity matrix
+    """
+    return a @ (a if b is None else b).T
+
+
+def top_k(
+    query: np.ndarray | Sequence[float],
+    matrix: np.ndarray,
+    k: int,
+    threshold: float | None = None,
+) -> list[tuple[int, float]]:
+    """
+    Rows of `matrix` most similar to `query`, best first.
+
+    Args:
+        query: Query vector (normalised here)
+        matrix: Row-normalised float32 matrix (n, dim)
+        k: Maximum number of results
+        threshold: Optional minimum similarity
+
+    Returns:
+        List of (row index, similarity) pairs
+    """
+    if k <= 0 or len(matrix) == 0:
+        return []
+    scores = matrix @ normalize_rows(np.asarray(query, dtype=np.float32)[None, :])[0]
+    k = min(k, len(scores))
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    order = candidates[np.argsort(-scores[candidates], kind="stable")]
+    if threshold is not None:
+        order = order[scores[order] >= threshold]
+    return [(int(i), float(scores[i])) for i in order]
+
+
 class VectorOps:
     """
     Async vector operations for memory embeddings.
@@ -34,6 +120,7 @@ class VectorOps:
         use_openai: bool = False,
         openai_model: str = "text-embedding-3-small",
         cache_size: int = 1000,
+        cache_dir: Path | str | None = None,
     ):
         """
         Initialize vector operations.
@@ -43,21 +130,82 @@ class VectorOps:
             use_openai: Use OpenAI API instead of local model
             openai_model: OpenAI embedding model name
             cache_size: LRU cache size for embeddings
+            cache_dir: Directory for the persistent embedding store (None disables it)
         """
         self.model_name = model_name
         self.use_openai = use_openai
         self.openai_model = openai_model
         self._model = None
         self._openai_client = None
-        self._cache: dict = {}
+        self._cache: OrderedDict[str, list[float]] = OrderedDict()
         self._cache_size = cache_size
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._store: EmbeddingStore | None = None
+        self._cache_hits = 0
+        self._store_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def embedding_model(self) -> str:
+        """Name of the model that actually produces embeddings."""
+        return self.openai_model if self.use_openai else self.model_name
+
+    def _cache_get(self, cache_key: str) -> list[float] | None:
+        """Look up the in-memory tier, marking the entry most recently used."""
+        embedding = self._cache.get(cache_key)
+        if embedding is not None:
+            self._cache.move_to_end(cache_key)
+        return embedding
 
     def _cache_put(self, cache_key: str, embedding: list[float]) -> None:
-        """Insert into cache with simple FIFO eviction."""
-        if len(self._cache) >= self._cache_size:
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
+        """Insert into the in-memory tier, evicting the least recently used entry."""
         self._cache[cache_key] = embedding
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _get_store(self) -> EmbeddingStore | None:
+        """Lazily open the persistent tier (None if disabled or unavailable)."""
+        if self._store is None and self._cache_dir is not None:
+            try:
+                from cyntra.memory.embedding_cache import EmbeddingStore
+
+                self._store = EmbeddingStore(self._cache_dir, self.embedding_model)
+            except (ImportError, OSError) as e:
+                logger.warning(f"Persistent embedding cache disabled: {e}")
+                self._cache_dir = None
+        return self._store
+
+    def _store_get(self, texts: list[str]) -> list[list[float] | None]:
+        store = self._get_store()
+        if store is None:
+            return [None] * len(texts)
+        try:
+            found = store.get_many(texts)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedding cache read failed: {e}")
+            return [None] * len(texts)
+        return [None if v is None else v.tolist() for v in found]
+
+    def _store_put(self, texts: list[str], embeddings: list[list[float]]) -> None:
+        store = self._get_store()
+        if store is None:
+            return
+        try:
+            store.put_many(texts, embeddings)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    def cache_info(self) -> dict[str, Any]:
+        """Hit/miss counters for both cache tiers."""
+        return {
+            "memory_hits": self._cache_hits,
+            "disk_hits": self._store_hits,
+            "misses": self._cache_misses,
+            "memory_size": len(self._cache),
+            "memory_capacity": self._cache_size,
+            "disk_size": len(self._store) if self._store is not None else 0,
+        }
 
     async def _get_model(self):
         """Lazy load sentence-transformers model."""
@@ -104,17 +252,27 @@ class VectorOps:
         Returns:
             Embedding vector (768d or model-specific)
         """
-        # Check cache
+        # Check cache tiers
         cache_key = self._cache_key(text)
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
+
+        stored = self._store_get([text])[0]
+        if stored is not None:
+            self._store_hits += 1
+            self._cache_put(cache_key, stored)
+            return stored
+
+        self._cache_misses += 1
         if self.use_openai:
             embedding = await self._embed_openai(text)
         else:
             embedding = await self._embed_local(text)
 
         self._cache_put(cache_key, embedding)
+        self._store_put([text], [embedding])
 
         return embedding
 
@@ -141,15 +299,30 @@ class VectorOps:
         uncached_indices: list[int] = []
 
         for i, text in enumerate(texts):
-            cache_key = self._cache_key(text)
-            cached = self._cache.get(cache_key)
+            cached = self._cache_get(self._cache_key(text))
             if cached is not None:
+                self._cache_hits += 1
                 results[i] = cached
             else:
                 uncached_texts.append(text)
                 uncached_indices.append(i)
 
         if uncached_texts:
+            stored = self._store_get(uncached_texts)
+            missing_texts: list[str] = []
+            missing_indices: list[int] = []
+            for idx, text, embedding in zip(uncached_indices, uncached_texts, stored, strict=True):
+                if embedding is not None:
+                    self._store_hits += 1
+                    self._cache_put(self._cache_key(text), embedding)
+                    results[idx] = embedding
+                else:
+                    missing_texts.append(text)
+                    missing_indices.append(idx)
+            uncached_texts, uncached_indices = missing_texts, missing_indices
+
+        if uncached_texts:
+            self._cache_misses += len(uncached_texts)
             if self.use_openai:
                 embeddings = await self._batch_embed_openai(uncached_texts, batch_size)
             else:
@@ -164,6 +337,7 @@ class VectorOps:
                 cache_key = self._cache_key(text)
                 self._cache_put(cache_key, embedding)
                 results[idx] = embedding
+            self._store_put(uncached_texts, embeddings)
 
         if any(r is None for r in results):
             raise RuntimeError("Embedding generation failed to produce results")
@@ -217,10 +391,12 @@ class VectorOps:
         return results
 
     @staticmethod
-    def cosine_similarity(a: list[float], b: list[float]) -> float:
+    def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
         """
         Calculate cosine similarity between two vectors.
 
+        For many comparisons use `similarity_matrix` / `top_k` instead.
+
         Args:
             a: First vector
             b: Second vector
@@ -228,19 +404,18 @@ class VectorOps:
         Returns:
             Cosine similarity (0-1)
         """
-        import math
-
-        dot_product = sum(x * y for x, y in zip(a, b, strict=False))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(y * y for y in b))
+        va = np.asarray(a, dtype=np.float64)
+        vb = np.asarray(b, dtype=np.float64)
+        norm_a = np.linalg.norm(va)
+        norm_b = np.linalg.norm(vb)
 
         if norm_a == 0 or norm_b == 0:
             return 0.0
 
-        return dot_product / (norm_a * norm_b)
+        return float(np.dot(va, vb) / (norm_a * norm_b))
 
     @staticmethod
-    def euclidean_distance(a: list[float], b: list[float]) -> float:
+    def euclidean_distance(a: Sequence[float], b: Sequence[float]) -> float:
         """
         Calculate Euclidean distance between two vectors.
 
@@ -251,9 +426,9 @@ class VectorOps:
         Returns:
             Euclidean distance
         """
-        import math
-
-        return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b, strict=False)))
+        return float(
+            np.linalg.norm(np.asarray(a, dtype=np.float64) - np.asarray(b, dtype=np.float64))
+        )
 
 
 # Singleton instance for convenience
@@ -263,6 +438,7 @@ _default_ops: VectorOps | None = None
 def get_vector_ops(
     model_name: str = DEFAULT_MODEL,
     use_openai: bool = False,
+    cache_dir: Path | str | None = None,
 ) -> VectorOps:
     """
     Get default VectorOps instance.
@@ -270,6 +446,8 @@ def get_vector_ops(
     Args:
         model_name: Sentence-transformers model name
         use_openai: Use OpenAI API
+        cache_dir: Directory for the persistent embedding store, e.g.
+            `<repo root>/.cyntra/memory/embeddings` (None disables it)
 
     Returns:
         VectorOps instance
@@ -279,5 +457,6 @@ def get_vector_ops(
         _default_ops = VectorOps(
             model_name=model_name,
             use_openai=use_openai,
+            cache_dir=cache_dir,
         )
     return _default_ops
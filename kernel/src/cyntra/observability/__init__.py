@@ -3,6 +3,8 @@ Observability - Logging, events, and audit trail.
 
 Modules:
     events      - Structured event logging
+    event_index - Incremental offset index for events.jsonl
+    event_log   - Rolling, compressed event log segments
     history     - Run history queries
     stats       - Statistics and metrics
 """
@@ -0,0 +1,416 @@
+"""
+Event Index - SQLite sidecar index for events.jsonl.
+
+The index stores, for every complete line of the event log, its byte offset
+and length plus typed columns (type, issue, timestamp, toolchain, size,
+tokens, duration), along with running aggregates used by
+`EventReader.get_stats` and a rollup keyed by (day, type, toolchain, size)
+used by `EventReader.group_by`. It is brought up to date incrementally:
+only bytes after the last indexed offset are parsed.
+
+The index is rebuilt from scratch if the log is replaced (inode change),
+truncated, or its head no longer matches what was indexed.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Bytes hashed from the start of the log to detect an in-place rewrite.
+_HEAD_BYTES = 4096
+# Bytes parsed per refresh step; keeps memory flat on multi-GB logs.
+_CHUNK_BYTES = 8 << 20
+
+AGGREGATES = (
+    "total_events",
+    "issues_completed",
+    "issues_failed",
+    "total_tokens",
+    "total_cost_usd",
+    "duration_sum_ms",
+    "duration_count",
+)
+
+ROLLUP_KEYS = ("day", "type", "toolchain", "size")
+ROLLUP_VALUES = ("n", "tokens", "dur_n", "dur_sum", "dur_min", "dur_max")
+
+RollupKey = tuple[str, ...]
+Rollup = dict[RollupKey, list[Any]]
+
+# Bump when the layout changes; older sidecars are dropped and rebuilt.
+_SCHEMA_VERSION = 2
+
+_DROP = """
+DROP TABLE IF EXISTS meta;
+DROP TABLE IF EXISTS events;
+DROP TABLE IF EXISTS aggregates;
+DROP TABLE IF EXISTS rollup;
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS events (
+    offset INTEGER PRIMARY KEY,
+    length INTEGER NOT NULL,
+    issue_id TEXT,
+    ts REAL,
+    day TEXT,
+    type TEXT,
+    toolchain TEXT,
+    size TEXT,
+    tokens INTEGER,
+    duration_ms INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_events_type ON events(type, offset);
+CREATE INDEX IF NOT EXISTS idx_events_issue ON events(issue_id, offset);
+CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
+
+CREATE TABLE IF NOT EXISTS aggregates (
+    name TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rollup (
+    day TEXT NOT NULL,
+    type TEXT NOT NULL,
+    toolchain TEXT NOT NULL,
+    size TEXT NOT NULL,
+    n INTEGER NOT NULL,
+    tokens INTEGER NOT NULL,
+    dur_n INTEGER NOT NULL,
+    dur_sum INTEGER NOT NULL,
+    dur_min INTEGER,
+    dur_max INTEGER,
+    PRIMARY KEY (day, type, toolchain, size)
+);
+"""
+
+_UPSERT_ROLLUP = """
+INSERT INTO rollup VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(day, type, toolchain, size) DO UPDATE SET
+    n = n + excluded.n,
+    tokens = tokens + excluded.tokens,
+    dur_n = dur_n + excluded.dur_n,
+    dur_sum = dur_sum + excluded.dur_sum,
+    dur_min = CASE WHEN dur_min IS NULL OR excluded.dur_min < dur_min
+                   THEN excluded.dur_min ELSE dur_min END,
+    dur_max = CASE WHEN dur_max IS NULL OR excluded.dur_max > dur_max
+                   THEN excluded.dur_max ELSE dur_max END
+"""
+
+
+def accumulate(totals: dict[str, float], event: dict[str, Any]) -> None:
+    """Add one event to running `AGGREGATES` totals."""
+    event_type = event.get("type")
+    totals["total_events"] += 1
+    totals["total_tokens"] += event.get("tokens_used", 0) or 0
+    totals["total_cost_usd"] += event.get("cost_usd", 0) or 0
+    if event_type == "issue.completed":
+        totals["issues_completed"] += 1
+        if event.get("duration_ms"):
+            totals["duration_sum_ms"] += event["duration_ms"]
+            totals["duration_count"] += 1
+    elif event_type == "issue.failed":
+        totals["issues_failed"] += 1
+
+
+def _number(value: Any) -> int | float | None:
+    if isinstance(value, bool) or not isinstance(value, int | float) or not value:
+        return None
+    return value
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """Parse an event timestamp to an aware UTC datetime (naive = UTC)."""
+    if isinstance(value, datetime):
+        dt = value
+    elif isinstance(value, str) and value:
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt.astimezone(UTC)
+
+
+def event_fields(event: dict[str, Any]) -> tuple[Any, ...]:
+    """(ts, day, type, toolchain, size, tokens, duration_ms) as stored in the index."""
+    data = event.get("data")
+    if not isinstance(data, dict):
+        data = {}
+    ts = parse_timestamp(event.get("timestamp"))
+    event_type = event.get("type")
+    toolchain = data.get("toolchain")
+    size = data.get("size")
+    return (
+        ts.timestamp() if ts else None,
+        ts.date().isoformat() if ts else None,
+        event_type if isinstance(event_type, str) else None,
+        str(toolchain) if toolchain is not None else None,
+        str(size) if size is not None else None,
+        _number(data.get("tokens_used")),
+        _number(data.get("duration_ms")),
+    )
+
+
+def add_to_rollup(rollup: Rollup, key: RollupKey, values: Sequence[Any]) -> None:
+    """Merge one row of `ROLLUP_VALUES` into `rollup` under `key`."""
+    agg = rollup.get(key)
+    if agg is None:
+        rollup[key] = list(values)
+        return
+    n, tokens, dur_n, dur_sum, dur_min, dur_max = values
+    agg[0] += n
+    agg[1] += tokens
+    agg[2] += dur_n
+    agg[3] += dur_sum
+    if dur_min is not None and (agg[4] is None or dur_min < agg[4]):
+        agg[4] = dur_min
+    if dur_max is not None and (agg[5] is None or dur_max > agg[5]):
+        agg[5] = dur_max
+
+
+def _rollup_fields(rollup: Rollup, fields: tuple[Any, ...]) -> None:
+    _, day, event_type, toolchain, size, tokens, duration = fields
+    key = (day or "", event_type or "", toolchain or "", size or "")
+    dur_n = 1 if duration else 0
+    add_to_rollup(rollup, key, (1, tokens or 0, dur_n, duration or 0, duration, duration))
+
+
+def rollup_event(rollup: Rollup, event: dict[str, Any]) -> None:
+    """Add one event to `rollup` (missing key values become "")."""
+    _rollup_fields(rollup, event_fields(event))
+
+
+def _connect(path: Path | str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+        # Older layout: drop it; the next refresh re-indexes the log.
+        conn.executescript(
+            f"BEGIN IMMEDIATE; {_DROP} {_SCHEMA} PRAGMA user_version = {_SCHEMA_VERSION}; COMMIT;"
+        )
+    return conn
+
+
+def _head_digest(path: Path, length: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(length), digest_size=16).hexdigest()
+
+
+class EventIndex:
+    """
+    Incrementally maintained offset index over an append-only events.jsonl.
+
+    Falls back to an in-memory database if the sidecar cannot be created
+    (e.g. a read-only logs directory); the index then lives for the
+    lifetime of the process.
+    """
+
+    def __init__(self, events_file: Path, index_path: Path | None = None) -> None:
+        self.events_file = events_file
+        self.index_path = index_path or events_file.with_suffix(".idx.sqlite")
+        try:
+            self.conn = _connect(self.index_path)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Event index sidecar unavailable", error=str(e))
+            self.conn = _connect(":memory:")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ===== Metadata =====
+
+    def _meta(self, key: str, default: int | str = 0) -> Any:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+        return type(default)(row[0])
+
+    def _set_meta(self, **values: Any) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(k, str(v)) for k, v in values.items()],
+        )
+
+    # ===== Refresh =====
+
+    def refresh(self) -> int:
+        """Index lines appended since the last refresh; returns how many were added."""
+        # IMMEDIATE: take the write lock before reading meta, so concurrent
+        # refreshers queue up instead of indexing the same bytes twice.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            added = self._refresh_locked()
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+        return added
+
+    def _refresh_locked(self) -> int:
+        try:
+            st = self.events_file.stat()
+        except OSError:
+            if self._meta("offset"):
+                self._reset()
+            return 0
+
+        offset = self._meta("offset")
+        head_len = self._meta("head_len")
+        if (
+            self._meta("inode") != st.st_ino
+            or st.st_size < offset
+            or (head_len and _head_digest(self.events_file, head_len) != self._meta("head", ""))
+        ):
+            if offset:
+                logger.info("Event log replaced or rewritten, rebuilding index")
+            self._reset()
+            offset = 0
+
+        if st.st_size == offset:
+            return 0
+
+        added = 0
+        with open(self.events_file, "rb") as f:
+            while offset < st.st_size:
+                f.seek(offset)
+                chunk = f.read(min(_CHUNK_BYTES, st.st_size - offset))
+                end = chunk.rfind(b"\n") + 1
+                if end == 0:
+                    if len(chunk) < _CHUNK_BYTES:
+                        break  # Trailing partial line; wait for the writer.
+                    end = len(chunk)  # Pathological line longer than a chunk.
+                added += self._index_chunk(chunk[:end], offset)
+                offset += end
+
+        head_len = min(_HEAD_BYTES, offset)
+        self._set_meta(
+            inode=st.st_ino,
+            offset=offset,
+            head_len=head_len,
+            head=_head_digest(self.events_file, head_len),
+        )
+        return added
+
+    def _reset(self) -> None:
+        self.conn.execute("DELETE FROM events")
+        self.conn.execute("DELETE FROM aggregates")
+        self.conn.execute("DELETE FROM rollup")
+        self.conn.execute("DELETE FROM meta")
+
+    def _index_chunk(self, chunk: bytes, base: int) -> int:
+        rows: list[tuple[Any, ...]] = []
+        totals = dict.fromkeys(AGGREGATES, 0.0)
+        rollup: Rollup = {}
+
+        pos = 0
+        for raw in chunk.splitlines(keepends=True):
+            start = pos
+            pos += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(event, dict):
+                continue
+
+            fields = event_fields(event)
+            issue_id = event.get("issue_id")
+            rows.append(
+                (base + start, len(raw), str(issue_id) if issue_id is not None else None, *fields)
+            )
+
+            accumulate(totals, event)
+            _rollup_fields(rollup, fields)
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+        )
+        self.conn.executemany(_UPSERT_ROLLUP, [(*k, *v) for k, v in rollup.items()])
+        self.conn.executemany(
+            """
+            INSERT INTO aggregates (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+            """,
+            list(totals.items()),
+        )
+        return len(rows)
+
+    # ===== Queries =====
+
+    def aggregates(self) -> dict[str, float]:
+        """Running totals over every indexed event."""
+        totals = dict.fromkeys(AGGREGATES, 0.0)
+        totals.update(self.conn.execute("SELECT name, value FROM aggregates").fetchall())
+        return totals
+
+    def rollup(self, since: datetime | None = None) -> Rollup:
+        """
+        Indexed events rolled up by `ROLLUP_KEYS`.
+
+        Without `since` this reads the maintained rollup; with it, the typed
+        events table is grouped, keeping events without a timestamp.
+        """
+        if since is None:
+            query, params = "SELECT * FROM rollup", ()
+        else:
+            query = """
+                SELECT COALESCE(day, ''), COALESCE(type, ''), COALESCE(toolchain, ''),
+                       COALESCE(size, ''), COUNT(*), COALESCE(SUM(tokens), 0),
+                       COUNT(duration_ms), COALESCE(SUM(duration_ms), 0),
+                       MIN(duration_ms), MAX(duration_ms)
+                FROM events WHERE ts IS NULL OR ts >= ?
+                GROUP BY 1, 2, 3, 4
+            """
+            params = (since.timestamp(),)
+        return {tuple(row[:4]): list(row[4:]) for row in self.conn.execute(query, params)}
+
+    def spans(
+        self,
+        *,
+        event_type: str | None = None,
+        issue_id: str | None = None,
+    ) -> list[tuple[int, int]]:
+        """(offset, length) of matching events, in log order."""
+        if event_type is not None:
+            query, arg = "SELECT offset, length FROM events WHERE type = ?", event_type
+        elif issue_id is not None:
+            query, arg = "SELECT offset, length FROM events WHERE issue_id = ?", issue_id
+        else:
+            raise ValueError("event_type or issue_id is required")
+        return self.conn.execute(query + " ORDER BY offset", (arg,)).fetchall()
+
+    def read_spans(self, spans: list[tuple[int, int]]) -> list[dict[str, Any]]:
+        """Load the events at the given spans."""
+        events: list[dict[str, Any]] = []
+        if not spans:
+            return events
+        fd = os.open(self.events_file, os.O_RDONLY)
+        try:
+            for offset, length in spans:
+                with contextlib.suppress(json.JSONDecodeError):
+                    events.append(json.loads(os.pread(fd, length, offset)))
+        finally:
+            os.close(fd)
+        return events
@@ -0,0 +1,513 @@
+"""
+Segmented Event Log - Rolling, compressed storage for events.jsonl.
+
+The live log stays at `logs/events.jsonl` (the "head") so that simple
+appenders (`StateManager.add_event`, the telemetry mirror) keep working.
+`SegmentedEventLog` keeps a buffered handle on the head and, once it
+passes a size limit or a day boundary, rolls it into `logs/segments/`:
+
+    logs/
+      events.jsonl                         # head, appended to
+      segments/
+        manifest.json                      # one entry per segment
+        events-20250101T000000-0001.jsonl.gz
+
+Rolled segments are sealed (compressed with zstd when `zstandard` is
+installed, gzip otherwise) after a short grace period, so a writer that
+opened the head just before the roll can finish its append first.
+
+Each manifest entry records the segment's time range, event count, event
+type counts, issue ids, running totals and a rollup by (day, type,
+toolchain, size), so readers can skip segments outside a time window or
+without a given issue, and stats never have to decompress old segments.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import io
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import IO, Any
+
+import structlog
+
+from cyntra.observability.event_index import (
+    AGGREGATES,
+    Rollup,
+    accumulate,
+    parse_timestamp,
+    rollup_event,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+
+logger = structlog.get_logger()
+
+HEAD_FILE = "events.jsonl"
+SEGMENTS_DIR = "segments"
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = ".events.lock"
+
+DEFAULT_MAX_SEGMENT_BYTES = 64 << 20
+# Rolled segments younger than this stay uncompressed for late appenders.
+DEFAULT_SEAL_GRACE_SECONDS = 60.0
+
+_CODEC_SUFFIX = {"zstd": ".zst", "gzip": ".gz"}
+
+
+def _format_timestamp(dt: datetime | None) -> str | None:
+    return dt.isoformat().replace("+00:00", "Z") if dt else None
+
+
+def in_window(event: dict[str, Any], since: datetime | None, until: datetime | None) -> bool:
+    """True if the event's timestamp is within [since, until] (or unknown)."""
+    if since is None and until is None:
+        return True
+    ts = parse_timestamp(event.get("timestamp"))
+    if ts is None:
+        return True
+    return (since is None or ts >= since) and (until is None or ts <= until)
+
+
+def _parse_line(raw: bytes | str) -> dict[str, Any] | None:
+    line = raw.strip()
+    if not line:
+        return None
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def resolve_codec(compression: str) -> str | None:
+    """Map a compression setting (auto/zstd/gzip/none) to an available codec."""
+    compression = (compression or "none").lower()
+    if compression in ("none", "off", "false"):
+        return None
+    if compression in ("auto", "zstd") and zstandard is not None:
+        return "zstd"
+    if compression == "zstd":
+        logger.warning("zstandard not installed, sealing event segments with gzip")
+    return "gzip"
+
+
+@contextlib.contextmanager
+def event_log_lock(logs_dir: Path) -> Iterator[None]:
+    """Hold the event log lock (advisory; a no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    fd = os.open(logs_dir / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+# ===== Manifest =====
+
+
+@dataclass
+class SegmentInfo:
+    """Manifest entry for one rolled segment."""
+
+    file: str
+    start: str | None = None
+    end: str | None = None
+    events: int = 0
+    bytes: int = 0
+    codec: str | None = None
+    # Inode the segment had as the live head, so incremental consumers of
+    # the head can tell which segment their rows ended up in.
+    head_inode: int = 0
+    types: dict[str, int] = field(default_factory=dict)
+    issues: list[str] = field(default_factory=list)
+    totals: dict[str, float] = field(default_factory=dict)
+    # `ROLLUP_KEYS + ROLLUP_VALUES` rows (see event_index.py); None for
+    # segments rolled before rollups were recorded.
+    rollup: list[list[Any]] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SegmentInfo:
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+    def rollup_dict(self) -> Rollup | None:
+        """The recorded rollup keyed by `ROLLUP_KEYS`, if any."""
+        if self.rollup is None:
+            return None
+        return {tuple(row[:4]): list(row[4:]) for row in self.rollup}
+
+    def overlaps(self, since: datetime | None, until: datetime | None) -> bool:
+        """Whether any event in the segment can fall within [since, until]."""
+        start, end = parse_timestamp(self.start), parse_timestamp(self.end)
+        if since is not None and end is not None and end < since:
+            return False
+        return not (until is not None and start is not None and start > until)
+
+
+def summarize(lines: Iterator[bytes]) -> SegmentInfo:
+    """Scan a segment's lines into a manifest entry (file is left blank)."""
+    info = SegmentInfo(file="", totals=dict.fromkeys(AGGREGATES, 0.0))
+    issues: set[str] = set()
+    rollup: Rollup = {}
+    start: datetime | None = None
+    end: datetime | None = None
+
+    for raw in lines:
+        info.bytes += len(raw)
+        event = _parse_line(raw)
+        if event is None:
+            continue
+        info.events += 1
+        event_type = event.get("type")
+        if isinstance(event_type, str):
+            info.types[event_type] = info.types.get(event_type, 0) + 1
+        if event.get("issue_id") is not None:
+            issues.add(str(event["issue_id"]))
+        ts = parse_timestamp(event.get("timestamp"))
+        if ts is not None:
+            start = ts if start is None or ts < start else start
+            end = ts if end is None or ts > end else end
+        accumulate(info.totals, event)
+        rollup_event(rollup, event)
+
+    info.issues = sorted(issues)
+    info.rollup = [[*key, *values] for key, values in sorted(rollup.items())]
+    info.start, info.end = _format_timestamp(start), _format_timestamp(end)
+    return info
+
+
+class SegmentManifest:
+    """Reader/writer for `segments/manifest.json`."""
+
+    def __init__(self, logs_dir: Path) -> None:
+        self.logs_dir = logs_dir
+        self.segments_dir = logs_dir / SEGMENTS_DIR
+        self.path = self.segments_dir / MANIFEST_FILE
+
+    def load(self) -> list[SegmentInfo]:
+        """Segments in roll order (oldest first)."""
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            return []
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Unreadable event segment manifest", error=str(e))
+            return []
+        return [
+            SegmentInfo.from_dict(entry)
+            for entry in data.get("segments", [])
+            if isinstance(entry, dict) and entry.get("file")
+        ]
+
+    def save(self, segments: list[SegmentInfo]) -> None:
+        """Atomically replace the manifest."""
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"version": 1, "segments": [asdict(s) for s in segments]}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+
+    def segments(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[SegmentInfo]:
+        """Segments that may hold events within [since, until]."""
+        return [s for s in self.load() if s.overlaps(since, until)]
+
+    def open(self, info: SegmentInfo) -> IO[bytes]:
+        """Open a segment for binary line iteration, decompressing if sealed."""
+        path = self.segments_dir / info.file
+        if info.codec == "gzip":
+            return gzip.open(path, "rb")
+        if info.codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError(f"zstandard is required to read {path}")
+            raw = open(path, "rb")  # noqa: SIM115 - closed with the returned reader
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True))
+        return open(path, "rb")
+
+    def iter_events(self, info: SegmentInfo) -> Iterator[dict[str, Any]]:
+        """Events in one segment, in log order."""
+        try:
+            with self.open(info) as f:
+                for raw in f:
+                    event = _parse_line(raw)
+                    if event is not None:
+                        yield event
+        except FileNotFoundError:
+            logger.warning("Event segment missing", file=info.file)
+
+
+# ===== Writer =====
+
+
+class SegmentedEventLog:
+    """
+    Buffered writer for the event log head, with size/daily rolling.
+
+    Lines are buffered and written at most every `flush_interval` seconds
+    (0 writes on every append); call `flush()` / `close()` at shutdown.
+    Writes and rolls hold an advisory lock on `logs/.events.lock`, and a
+    writer whose head was rolled by another process reopens it.
+    """
+
+    def __init__(
+        self,
+        logs_dir: Path,
+        *,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        roll_daily: bool = True,
+        flush_interval: float = 0.0,
+        compression: str = "auto",
+        retention_days: float | None = None,
+        seal_grace_seconds: float = DEFAULT_SEAL_GRACE_SECONDS,
+    ) -> None:
+        self.logs_dir = logs_dir
+        self.head_path = logs_dir / HEAD_FILE
+        self.manifest = SegmentManifest(logs_dir)
+        self.max_segment_bytes = max_segment_bytes
+        self.roll_daily = roll_daily
+        self.flush_interval = flush_interval
+        self.codec = resolve_codec(compression)
+        self.retention_days = retention_days
+        self.seal_grace_seconds = seal_grace_seconds
+
+        self._buffer: list[bytes] = []
+        self._last_flush = time.monotonic()
+        self._handle: IO[bytes] | None = None
+        # (inode, day of first event) of the head, read lazily.
+        self._head_day: tuple[int, str | None] | None = None
+
+    def lock(self) -> contextlib.AbstractContextManager[None]:
+        """Hold the event log lock."""
+        return event_log_lock(self.logs_dir)
+
+    # ===== Writing =====
+
+    def append(self, line: str) -> None:
+        """Buffer one JSON line; flushes once the interval has elapsed."""
+        self._buffer.append(line.rstrip("\n").encode() + b"\n")
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered lines to the head, rolling it first if due."""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        payload = b"".join(self._buffer)
+        self._buffer.clear()
+
+        with self.lock():
+            handle = self._open_head()
+            if self._roll_due(handle, len(payload)):
+                self._roll_locked()
+                handle = self._open_head()
+            handle.write(payload)
+            handle.flush()
+
+    def close(self) -> None:
+        """Flush, seal segments past their grace period and close the head."""
+        with contextlib.suppress(OSError):
+            self.flush()
+            with self.lock():
+                self._maintain_locked()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def _open_head(self) -> IO[bytes]:
+        """The open head handle, reopened if the head was rolled elsewhere."""
+        if self._handle is not None:
+            try:
+                current = self.head_path.stat().st_ino
+            except FileNotFoundError:
+                current = None
+            if current != os.fstat(self._handle.fileno()).st_ino:
+                self._handle.close()
+                self._handle = None
+        if self._handle is None:
+            self.logs_dir.mkdir(parents=True, exist_ok=True)
+            self._handle = open(self.head_path, "ab")  # noqa: SIM115 - long-lived handle
+        return self._handle
+
+    # ===== Rolling =====
+
+    def _roll_due(self, handle: IO[bytes], incoming: int) -> bool:
+        st = os.fstat(handle.fileno())
+        if st.st_size == 0:
+            return False
+        if self.max_segment_bytes and st.st_size + incoming > self.max_segment_bytes:
+            return True
+        if self.roll_daily:
+            day = self._first_event_day(st.st_ino)
+            return day is not None and day < datetime.now(UTC).date().isoformat()
+        return False
+
+    def _first_event_day(self, inode: int) -> str | None:
+        if self._head_day is None or self._head_day[0] != inode:
+            day = None
+            with open(self.head_path, "rb") as f:
+                event = _parse_line(f.readline(1 << 16))
+            ts = parse_timestamp(event.get("timestamp")) if event else None
+            if ts is not None:
+                day = ts.date().isoformat()
+            self._head_day = (inode, day)
+        return self._head_day[1]
+
+    def roll(self) -> SegmentInfo | None:
+        """Roll the current head into a segment (no-op if empty)."""
+        self.flush()
+        with self.lock():
+            return self._roll_locked()
+
+    def _roll_locked(self) -> SegmentInfo | None:
+        try:
+            if self.head_path.stat().st_size == 0:
+                return None
+        except FileNotFoundError:
+            return None
+
+        self.manifest.segments_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.head_path, "rb") as f:
+            info = summarize(iter(f))
+            info.head_inode = os.fstat(f.fileno()).st_ino
+
+        stamp = (parse_timestamp(info.start) or datetime.now(UTC)).strftime("%Y%m%dT%H%M%S")
+        segments = self.manifest.load()
+        seq = len(segments) + 1
+        while True:
+            name = f"events-{stamp}-{seq:04d}.jsonl"
+            if not any(
+                (self.manifest.segments_dir / (name + suffix)).exists()
+                for suffix in ("", *_CODEC_SUFFIX.values())
+            ):
+                break
+            seq += 1
+
+        os.replace(self.head_path, self.manifest.segments_dir / name)
+        info.file = name
+        segments.append(info)
+        self.manifest.save(segments)
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self._head_day = None
+
+        logger.info("Rolled event log segment", segment=name, events=info.events)
+        self._maintain_locked(segments)
+        return info
+
+    # ===== Sealing and retention =====
+
+    def seal(self, *, force: bool = False) -> int:
+        """Compress rolled segments; returns how many were sealed."""
+        with self.lock():
+            return self._maintain_locked(force=force)
+
+    def _maintain_locked(
+        self,
+        segments: list[SegmentInfo] | None = None,
+        *,
+        force: bool = False,
+    ) -> int:
+        if segments is None:
+            segments = self.manifest.load()
+            if not segments:
+                return 0
+
+        changed = False
+        sealed = 0
+        if self.codec is not None:
+            now = time.time()
+            for info in segments:
+                if info.codec is not None:
+                    continue
+                path = self.manifest.segments_dir / info.file
+                try:
+                    age = now - path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if not force and age < self.seal_grace_seconds:
+                    continue
+                self._seal_segment(info)
+                changed = True
+                sealed += 1
+
+        if self.retention_days is not None:
+            cutoff = datetime.now(UTC) - timedelta(days=self.retention_days)
+            kept: list[SegmentInfo] = []
+            for info in segments:
+                end = parse_timestamp(info.end)
+                if end is not None and end < cutoff:
+                    with contextlib.suppress(FileNotFoundError):
+                        (self.manifest.segments_dir / info.file).unlink()
+                    logger.info("Expired event log segment", segment=info.file)
+                    changed = True
+                else:
+                    kept.append(info)
+            segments[:] = kept
+
+        if changed:
+            self.manifest.save(segments)
+        return sealed
+
+    def _seal_segment(self, info: SegmentInfo) -> None:
+        """Compress a rolled segment in place, refreshing its summary."""
+        assert self.codec is not None
+        src = self.manifest.segments_dir / info.file
+        dest = src.with_name(src.name + _CODEC_SUFFIX[self.codec])
+        tmp = dest.with_name(dest.name + ".tmp")
+
+        with open(src, "rb") as f:
+            # Pick up appends made by writers that opened the head before the roll.
+            summary = summarize(iter(f))
+            f.seek(0)
+            with open(tmp, "wb") as out:
+                if self.codec == "zstd":
+                    with zstandard.ZstdCompressor().stream_writer(out, closefd=False) as w:
+                        shutil.copyfileobj(f, w)
+                else:
+                    with gzip.GzipFile(fileobj=out, mode="wb", mtime=0) as w:
+                        shutil.copyfileobj(f, w)
+                out.flush()
+                os.fsync(out.fileno())
+        os.replace(tmp, dest)
+        src.unlink()
+
+        summary.file = dest.name
+        summary.codec = self.codec
+        summary.head_inode = info.head_inode
+        for key, value in asdict(summary).items():
+            setattr(info, key, value)
+
+
+def append_event_line(logs_dir: Path, line: str) -> None:
+    """Append one event line to the head under the event log lock."""
+    with event_log_lock(logs_dir), open(logs_dir / HEAD_FILE, "ab") as f:
+        f.write(line.rstrip("\n").encode() + b"\n")
@@ -2,12 +2,16 @@
 Event System - Structured event logging for observability.
 
 Events are logged to .cyntra/logs/events.jsonl and can be
-consumed by beads_viewer or other observability tools.
+consumed by beads_viewer or other observability tools. Older events are
+rolled into compressed segments under .cyntra/logs/segments/ (see
+event_log.py); `EventReader` reads across both.
 """
 
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -16,6 +20,23 @@ from typing import Any
 
 import structlog
 
+from cyntra.observability.event_index import (
+    AGGREGATES,
+    ROLLUP_KEYS,
+    ROLLUP_VALUES,
+    EventIndex,
+    Rollup,
+    add_to_rollup,
+    rollup_event,
+)
+from cyntra.observability.event_log import (
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentedEventLog,
+    SegmentManifest,
+    in_window,
+    parse_timestamp,
+)
+
 logger = structlog.get_logger()
 
 
@@ -37,6 +58,7 @@ class EventType(str, Enum):
     SCHEDULE_COMPUTED = "schedule.computed"
     ISSUE_SCHEDULED = "issue.scheduled"
     ISSUE_SKIPPED = "issue.skipped"
+    DISPATCH_METRICS = "dispatch.metrics"
 
     # Dispatch events
     WORKCELL_CREATED = "workcell.created"
@@ -113,19 +135,37 @@ class EventEmitter:
     """
     Emits and logs structured events.
 
-    Events are written to .cyntra/logs/events.jsonl
+    Events are written to .cyntra/logs/events.jsonl through a buffered
+    `SegmentedEventLog`; with a non-zero `flush_interval`, call `flush()` or
+    `close()` before reading the log back.
     """
 
-    def __init__(self, logs_dir: Path) -> None:
+    def __init__(
+        self,
+        logs_dir: Path,
+        *,
+        flush_interval: float = 0.0,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        roll_daily: bool = True,
+        compression: str = "auto",
+        retention_days: float | None = None,
+    ) -> None:
         self.logs_dir = logs_dir
         self.logs_dir.mkdir(parents=True, exist_ok=True)
         self.events_file = self.logs_dir / "events.jsonl"
+        self.log = SegmentedEventLog(
+            logs_dir,
+            max_segment_bytes=max_segment_bytes,
+            roll_daily=roll_daily,
+            flush_interval=flush_interval,
+            compression=compression,
+            retention_days=retention_days,
+        )
 
     def emit(self, event: Event) -> None:
         """Emit an event to the log file."""
         try:
-            with open(self.events_file, "a") as f:
-                f.write(event.to_json() + "\n")
+            self.log.append(event.to_json())
 
             logger.debug(
                 "Event emitted",
@@ -135,6 +175,17 @@ class EventEmitter:
         except OSError as e:
             logger.error("Failed to write event", error=str(e))
 
+    def flush(self) -> None:
+        """Write any buffered events."""
+        try:
+            self.log.flush()
+        except OSError as e:
+            logger.error("Failed to write event", error=str(e))
+
+    def close(self) -> None:
+        """Flush buffered events and release the log handle."""
+        self.log.close()
+
     def kernel_started(self, config: dict[str, Any]) -> None:
         """Log kernel start event."""
         self.emit(
@@ -203,6 +254,15 @@ class EventEmitter:
             )
         )
 
+    def dispatch_metrics(self, metrics: dict[str, Any]) -> None:
+        """Log dispatch pool slot utilisation and queue wait times."""
+        self.emit(
+            Event(
+                type=EventType.DISPATCH_METRICS,
+                data=metrics,
+            )
+        )
+
     def workcell_started(
         self,
         workcell_id: str,
@@ -317,49 +377,249 @@ class EventEmitter:
 class EventReader:
     """
     Reads events from log file for analysis and dashboard.
+
+    Reads span the rolled segments listed in the segment manifest plus the
+    live events.jsonl head. Segments whose time range, event types or issue
+    ids cannot match a query are skipped without being opened. On the head,
+    type / issue lookups and stats are served from an incrementally updated
+    sidecar index (see event_index.py), and `read_recent` reads backwards
+    from the end of the file, so queries stay fast as the log grows.
     """
 
-    def __init__(self, logs_dir: Path) -> None:
+    # Bytes read per step when scanning backwards from the end of the log.
+    _TAIL_BLOCK = 64 * 1024
+
+    def __init__(self, logs_dir: Path, *, use_index: bool = True) -> None:
         self.logs_dir = logs_dir
         self.events_file = self.logs_dir / "events.jsonl"
-
-    def read_all(self) -> list[dict[str, Any]]:
-        """Read all events from file."""
+        self.manifest = SegmentManifest(logs_dir)
+        self._use_index = use_index
+        self._index: EventIndex | None = None
+
+    @property
+    def index(self) -> EventIndex:
+        """The sidecar index, refreshed to the current end of the log."""
+        if self._index is None:
+            self._index = EventIndex(self.events_file)
+        self._index.refresh()
+        return self._index
+
+    def iter_events(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream events in log order, optionally limited to [since, until]."""
+        since, until = parse_timestamp(since), parse_timestamp(until)
+        for info in self.manifest.segments(since, until):
+            for event in self.manifest.iter_events(info):
+                if in_window(event, since, until):
+                    yield event
+        for event in self._iter_head():
+            if in_window(event, since, until):
+                yield event
+
+    def _iter_head(self) -> Iterator[dict[str, Any]]:
         if not self.events_file.exists():
+            return
+        with open(self.events_file, "rb") as f:
+            for raw in f:
+                event = self._parse_line(raw)
+                if event is not None:
+                    yield event
+
+    def read_all(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read all events across segments and the head."""
+        return list(self.iter_events(since, until))
+
+    def read_recent(self, limit: int = 100) -> list[dict[str, Any]]:
+        """Read most recent events, scanning backwards from the end of the log."""
+        if limit <= 0:
             return []
 
-        events = []
-        with open(self.events_file) as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        events.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue
+        events = self._read_head_tail(limit)
+        # Older events come from segments, newest segment first.
+        for info in reversed(self.manifest.load()):
+            if len(events) >= limit:
+                break
+            older = list(self.manifest.iter_events(info))
+            events = older[-(limit - len(events)) :] + events
         return events
 
-    def read_recent(self, limit: int = 100) -> list[dict[str, Any]]:
-        """Read most recent events."""
-        all_events = self.read_all()
-        return all_events[-limit:]
+    def _read_head_tail(self, limit: int) -> list[dict[str, Any]]:
+        if not self.events_file.exists():
+            return []
 
-    def read_by_type(self, event_type: str) -> list[dict[str, Any]]:
-        """Read events of a specific type."""
-        return [e for e in self.read_all() if e.get("type") == event_type]
+        events: list[dict[str, Any]] = []
+        with open(self.events_file, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            carry = b""
+            while pos > 0 and len(events) < limit:
+                step = min(self._TAIL_BLOCK, pos)
+                pos -= step
+                f.seek(pos)
+                block = f.read(step) + carry
+                lines = block.split(b"\n")
+                # The first piece may be a partial line unless we hit the start.
+                carry = lines.pop(0) if pos > 0 else b""
+                for raw in reversed(lines):
+                    event = self._parse_line(raw)
+                    if event is not None:
+                        events.append(event)
+                        if len(events) == limit:
+                            break
+
+        events.reverse()
+        return events
 
-    def read_by_issue(self, issue_id: str) -> list[dict[str, Any]]:
+    def read_by_type(
+        self,
+        event_type: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read events of a specific type."""
+        since, until = parse_timestamp(since), parse_timestamp(until)
+        events = [
+            e
+            for info in self.manifest.segments(since, until)
+            if info.types.get(event_type)
+            for e in self.manifest.iter_events(info)
+            if e.get("type") == event_type and in_window(e, since, until)
+        ]
+        if not self._use_index:
+            head = [e for e in self._iter_head() if e.get("type") == event_type]
+        else:
+            index = self.index
+            head = index.read_spans(index.spans(event_type=event_type))
+        return events + [e for e in head if in_window(e, since, until)]
+
+    def read_by_issue(
+        self,
+        issue_id: str,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[dict[str, Any]]:
         """Read all events for an issue."""
-        return [e for e in self.read_all() if e.get("issue_id") == issue_id]
+        since, until = parse_timestamp(since), parse_timestamp(until)
+        events = [
+            e
+            for info in self.manifest.segments(since, until)
+            if issue_id in info.issues
+            for e in self.manifest.iter_events(info)
+            if e.get("issue_id") == issue_id and in_window(e, since, until)
+        ]
+        if not self._use_index:
+            head = [e for e in self._iter_head() if e.get("issue_id") == issue_id]
+        else:
+            index = self.index
+            head = index.read_spans(index.spans(issue_id=issue_id))
+        return events + [e for e in head if in_window(e, since, until)]
+
+    @staticmethod
+    def _parse_line(raw: bytes) -> dict[str, Any] | None:
+        line = raw.strip()
+        if not line:
+            return None
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return event if isinstance(event, dict) else None
 
     def get_stats(self) -> dict[str, Any]:
         """
         Compute statistics from events.
 
-        Returns metrics suitable for dashboard display.
+        Returns metrics suitable for dashboard display. Rolled segments
+        contribute the totals recorded in the manifest.
+        """
+        if not self._use_index:
+            return self._compute_stats(self.read_all())
+
+        totals = self.index.aggregates()
+        for info in self.manifest.load():
+            for key in AGGREGATES:
+                totals[key] += info.totals.get(key, 0)
+
+        total_events = int(totals["total_events"])
+        if not total_events:
+            return self._compute_stats([])
+
+        completed = int(totals["issues_completed"])
+        failed = int(totals["issues_failed"])
+        total_tokens = totals["total_tokens"]
+        avg_duration = (
+            totals["duration_sum_ms"] / totals["duration_count"] if totals["duration_count"] else 0
+        )
+
+        return {
+            "total_events": total_events,
+            "issues_completed": completed,
+            "issues_failed": failed,
+            "total_tokens": int(total_tokens) if total_tokens.is_integer() else total_tokens,
+            "total_cost_usd": round(totals["total_cost_usd"], 4),
+            "avg_duration_ms": int(avg_duration),
+            "success_rate": completed / (completed + failed) if completed or failed else 0,
+        }
+
+    def group_by(
+        self,
+        *keys: str,
+        types: Iterable[str] | None = None,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
         """
-        events = self.read_all()
+        Aggregate events grouped by `keys` (any of `ROLLUP_KEYS`).
 
+        Each row holds the keys (missing values as "") plus `n` (events),
+        `tokens`, `dur_n`, `dur_sum`, `dur_min` and `dur_max` (from the
+        event's `data`). Segments contribute the rollup recorded in the
+        manifest and the head the index's rollup; only segments straddling
+        `since` are read.
+        """
+        unknown = set(keys) - set(ROLLUP_KEYS)
+        if unknown:
+            raise ValueError(f"unknown group keys: {sorted(unknown)}")
+        since = parse_timestamp(since)
+
+        rollup: Rollup = {}
+        for info in self.manifest.segments(since):
+            recorded = info.rollup_dict()
+            start = parse_timestamp(info.start)
+            if recorded is not None and (since is None or start is None or start >= since):
+                for key, values in recorded.items():
+                    add_to_rollup(rollup, key, values)
+                continue
+            for event in self.manifest.iter_events(info):
+                if in_window(event, since, None):
+                    rollup_event(rollup, event)
+        if self._use_index:
+            for key, values in self.index.rollup(since).items():
+                add_to_rollup(rollup, key, values)
+        else:
+            for event in self._iter_head():
+                if in_window(event, since, None):
+                    rollup_event(rollup, event)
+
+        wanted = set(types) if types is not None else None
+        positions = [ROLLUP_KEYS.index(k) for k in keys]
+        grouped: Rollup = {}
+        for key, values in rollup.items():
+            if wanted is None or key[1] in wanted:
+                add_to_rollup(grouped, tuple(key[i] for i in positions), values)
+        return [
+            dict(zip(keys, key, strict=True)) | dict(zip(ROLLUP_VALUES, values, strict=True))
+            for key, values in grouped.items()
+        ]
+
+    @staticmethod
+    def _compute_stats(events: list[dict[str, Any]]) -> dict[str, Any]:
+        """Statistics from a full scan (used when the index is disabled)."""
         if not events:
             return {
                 "total_events": 0,
@@ -12,6 +12,7 @@ from rich.console import Console
 from rich.table import Table
 
 from cyntra.kernel.config import KernelConfig
+from cyntra.observability.events import EventReader
 
 console = Console()
 
@@ -22,10 +23,11 @@ def show_history(
     issue_id: str | None = None,
     limit: int = 50,
     json_output: bool = False,
+    since: datetime | None = None,
 ) -> None:
     """Show run history."""
     config = KernelConfig.load(config_path)
-    events = _load_events(config, run_id=run_id, issue_id=issue_id, limit=limit)
+    events = _load_events(config, run_id=run_id, issue_id=issue_id, limit=limit, since=since)
 
     if json_output:
         console.print(json.dumps(events, indent=2))
@@ -64,6 +66,7 @@ def _load_events(
     run_id: str | None = None,
     issue_id: str | None = None,
     limit: int = 50,
+    since: datetime | None = None,
 ) -> list[dict]:
     """Load events from log files."""
     logs_dir = config.logs_dir
@@ -71,24 +74,17 @@ def _load_events(
     if not logs_dir.exists():
         return []
 
-    events = []
+    reader = EventReader(logs_dir)
 
-    # Load from events.jsonl
-    events_file = logs_dir / "events.jsonl"
-    if events_file.exists():
-        with open(events_file) as f:
-            for line in f:
-                try:
-                    event = json.loads(line.strip())
-                    events.append(event)
-                except json.JSONDecodeError:
-                    continue
+    # Segments outside the window (or without the issue) are never opened.
+    if issue_id:
+        events = reader.read_by_issue(issue_id, since=since)
+    else:
+        events = reader.read_all(since=since)
 
     # Filter
     if run_id:
         events = [e for e in events if e.get("run_id") == run_id]
-    if issue_id:
-        events = [e for e in events if e.get("issue_id") == issue_id]
 
     # Sort by timestamp (newest first) and limit
     events.sort(key=lambda e: e.get("timestamp", ""), reverse=True)
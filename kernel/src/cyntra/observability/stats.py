@@ -1,17 +1,22 @@
 """
 Stats - Display kernel statistics.
+
+Reports are computed with `EventReader.group_by` over the rollups kept in
+the segment manifest and the event index, rather than by loading every
+event.
 """
 
 from __future__ import annotations
 
-import json
 from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
 
 from rich.console import Console
 from rich.table import Table
 
 from cyntra.kernel.config import KernelConfig
+from cyntra.observability.events import EventReader
 
 console = Console()
 
@@ -21,69 +26,55 @@ def show_stats(
     show_cost: bool = False,
     show_success_rate: bool = False,
     show_timing: bool = False,
+    since: datetime | None = None,
 ) -> None:
     """Show kernel statistics."""
     config = KernelConfig.load(config_path)
-    events = _load_all_events(config)
+    if not config.logs_dir.exists():
+        console.print("[dim]No statistics available yet[/dim]")
+        return
+
+    reader = EventReader(config.logs_dir)
+    by_type = {row["type"]: row["n"] for row in reader.group_by("type", since=since)}
 
-    if not events:
+    if not by_type:
         console.print("[dim]No statistics available yet[/dim]")
         return
 
     console.print("\n[bold blue]Cyntra Statistics[/bold blue]\n")
 
     # Overall stats
-    total_runs = len([e for e in events if e.get("type") == "cycle_start"])
-    total_tasks = len([e for e in events if e.get("type") == "task_complete"])
-    total_failures = len([e for e in events if e.get("type") == "task_failed"])
+    total_runs = by_type.get("cycle_start", 0)
+    total_tasks = by_type.get("task_complete", 0)
+    total_failures = by_type.get("task_failed", 0)
 
     console.print(f"[dim]Total Runs:[/dim] {total_runs}")
     console.print(f"[dim]Tasks Completed:[/dim] {total_tasks}")
     console.print(f"[dim]Tasks Failed:[/dim] {total_failures}")
 
     if show_success_rate:
-        _show_success_rates(events)
+        _show_success_rates(reader, since)
 
     if show_cost:
-        _show_cost_breakdown(events)
+        _show_cost_breakdown(reader, since)
 
     if show_timing:
-        _show_timing_analysis(events)
-
-
-def _load_all_events(config: KernelConfig) -> list[dict]:
-    """Load all events from logs."""
-    logs_dir = config.logs_dir
-
-    if not logs_dir.exists():
-        return []
+        _show_timing_analysis(reader, since)
 
-    events = []
-    events_file = logs_dir / "events.jsonl"
 
-    if events_file.exists():
-        with open(events_file) as f:
-            for line in f:
-                try:
-                    events.append(json.loads(line.strip()))
-                except json.JSONDecodeError:
-                    continue
-
-    return events
-
-
-def _show_success_rates(events: list[dict]) -> None:
+def _show_success_rates(reader: EventReader, since: datetime | None = None) -> None:
     """Show success rates by toolchain."""
     console.print("\n[bold]Success Rates by Toolchain[/bold]")
 
     by_toolchain: dict[str, dict[str, int]] = defaultdict(lambda: {"success": 0, "total": 0})
 
-    for event in events:
-        if event.get("type") in ("task_complete", "task_failed"):
-            toolchain = event.get("data", {}).get("toolchain", "unknown")
-            by_toolchain[toolchain]["total"] += 1
-            if event.get("type") == "task_complete":
-                by_toolchain[toolchain]["success"] += 1
+    for row in reader.group_by(
+        "toolchain", "type", types=("task_complete", "task_failed"), since=since
+    ):
+        toolchain = row["toolchain"] or "unknown"
+        by_toolchain[toolchain]["total"] += row["n"]
+        if row["type"] == "task_complete":
+            by_toolchain[toolchain]["success"] += row["n"]
 
     table = Table()
     table.add_column("Toolchain", style="cyan")
@@ -104,20 +95,15 @@ def _show_success_rates(events: list[dict]) -> None:
     console.print(table)
 
 
-def _show_cost_breakdown(events: list[dict]) -> None:
+def _show_cost_breakdown(reader: EventReader, since: datetime | None = None) -> None:
     """Show token/cost breakdown."""
     console.print("\n[bold]Token Usage[/bold]")
 
-    total_tokens = 0
     by_toolchain: dict[str, int] = defaultdict(int)
-
-    for event in events:
-        data = event.get("data", {})
-        tokens = data.get("tokens_used", 0)
-        if tokens:
-            total_tokens += tokens
-            toolchain = data.get("toolchain", "unknown")
-            by_toolchain[toolchain] += tokens
+    for row in reader.group_by("toolchain", since=since):
+        if row["tokens"]:
+            by_toolchain[row["toolchain"] or "unknown"] += row["tokens"]
+    total_tokens = sum(by_toolchain.values())
 
     console.print(f"[dim]Total Tokens:[/dim] {total_tokens:,}")
 
@@ -135,27 +121,28 @@ def _show_cost_breakdown(events: list[dict]) -> None:
         console.print(table)
 
 
-def _show_timing_analysis(events: list[dict]) -> None:
+def _show_timing_analysis(reader: EventReader, since: datetime | None = None) -> None:
     """Show timing analysis."""
     console.print("\n[bold]Timing Analysis[/bold]")
 
-    durations: list[int] = []
-    by_size: dict[str, list[int]] = defaultdict(list)
-
-    for event in events:
-        if event.get("type") == "task_complete":
-            data = event.get("data", {})
-            duration = data.get("duration_ms")
-            if duration:
-                durations.append(duration)
-                size = data.get("size", "M")
-                by_size[size].append(duration)
-
-    if durations:
-        avg_ms = sum(durations) / len(durations)
+    rows = [
+        row
+        for row in reader.group_by("size", types=("task_complete",), since=since)
+        if row["dur_n"]
+    ]
+    # Tasks without a size count as "M": sum them into the explicit "M" row.
+    by_size: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+    for row in rows:
+        totals = by_size[row["size"] or "M"]
+        totals[0] += row["dur_sum"]
+        totals[1] += row["dur_n"]
+
+    if rows:
+        count = sum(row["dur_n"] for row in rows)
+        avg_ms = sum(row["dur_sum"] for row in rows) / count
         console.print(f"[dim]Average Duration:[/dim] {avg_ms / 1000:.1f}s")
-        console.print(f"[dim]Min:[/dim] {min(durations) / 1000:.1f}s")
-        console.print(f"[dim]Max:[/dim] {max(durations) / 1000:.1f}s")
+        console.print(f"[dim]Min:[/dim] {min(row['dur_min'] for row in rows) / 1000:.1f}s")
+        console.print(f"[dim]Max:[/dim] {max(row['dur_max'] for row in rows) / 1000:.1f}s")
 
         if by_size:
             table = Table()
@@ -165,8 +152,7 @@ def _show_timing_analysis(events: list[dict]) -> None:
 
             for size in ["XS", "S", "M", "L", "XL"]:
                 if size in by_size:
-                    times = by_size[size]
-                    avg = sum(times) / len(times)
-                    table.add_row(size, f"{avg / 1000:.1f}s", str(len(times)))
+                    dur_sum, dur_n = by_size[size]
+                    table.add_row(size, f"{dur_sum / dur_n / 1000:.1f}s", str(dur_n))
 
             console.print(table)
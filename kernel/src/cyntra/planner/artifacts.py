@@ -15,6 +15,7 @@ from cyntra.planner.constants import (
 )
 from cyntra.planner.dataset import hash_planner_input
 from cyntra.planner.keywords import extract_keywords
+from cyntra.planner.run_catalog import load_run_summaries
 from cyntra.planner.run_summaries import iter_archive_run_summaries, iter_world_run_summaries
 from cyntra.planner.similar_runs import SimilarRunsQuery, select_similar_runs
 from cyntra.planner.time_utils import ms_to_rfc3339
@@ -77,6 +78,10 @@ def collect_history_candidates(
     include_world: bool = True,
 ) -> list[dict[str, Any]]:
     repo_root = repo_root.resolve()
+    cataloged = load_run_summaries(repo_root=repo_root, include_world=include_world)
+    if cataloged is not None:
+        return cataloged
+
     archives_dir = repo_root / ".cyntra" / "archives"
     runs_dir = repo_root / ".cyntra" / "runs"
 
@@ -3,7 +3,8 @@ from __future__ import annotations
 import hashlib
 import json
 from collections.abc import Iterable
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -22,14 +23,16 @@ from cyntra.planner.constants import (
     SCHEMA_PLANNER_INPUT_V1,
 )
 from cyntra.planner.keywords import extract_keywords
+from cyntra.planner.run_catalog import load_run_summaries
 from cyntra.planner.run_summaries import (
     iter_archive_run_summaries,
     iter_world_run_summaries,
 )
-from cyntra.planner.similar_runs import SimilarRunsQuery, select_similar_runs
+from cyntra.planner.similar_runs import SimilarRunsIndex, SimilarRunsQuery, select_similar_runs
 from cyntra.planner.time_utils import ms_to_rfc3339
 from cyntra.planner.tokenizer import tokenize_planner_input
 from cyntra.state.models import Issue
+from cyntra.state.mutation_log import IssueMutationLog, replay, snapshot_key
 
 logger = structlog.get_logger()
 
@@ -58,8 +61,10 @@ def _read_jsonl(path: Path) -> Iterable[dict[str, Any]]:
 
 def load_issues(beads_dir: Path) -> dict[str, Issue]:
     issues_path = beads_dir / "issues.jsonl"
+    key = snapshot_key(issues_path)
+    mutations, _ = IssueMutationLog(beads_dir).read()
     issues: dict[str, Issue] = {}
-    for row in _read_jsonl(issues_path):
+    for row in replay(list(_read_jsonl(issues_path)), mutations, key):
         try:
             issue = Issue.from_dict(row)
         except Exception:
@@ -144,6 +149,10 @@ def collect_run_summaries(
     repo_root: Path,
     include_world: bool,
 ) -> list[dict[str, Any]]:
+    cataloged = load_run_summaries(repo_root=repo_root, include_world=include_world)
+    if cataloged is not None:
+        return cataloged
+
     archives_dir = repo_root / ".cyntra" / "archives"
     runs_dir = repo_root / ".cyntra" / "runs"
 
@@ -262,7 +271,7 @@ def hash_planner_input(planner_input: dict[str, Any]) -> str:
 def build_planner_input(
     *,
     run_summary: dict[str, Any],
-    history_candidates: list[dict[str, Any]],
+    history_candidates: list[dict[str, Any]] | SimilarRunsIndex,
     action_space: ActionSpace,
     universe_id: str,
     universe_defaults: dict[str, Any],
@@ -321,6 +330,149 @@ def _split_counts(n: int) -> DatasetSplitCounts:
     return DatasetSplitCounts(train=train, val=val, test=test)
 
 
+# Below this many examples per shard, process startup outweighs the work.
+MIN_SHARD_SIZE = 256
+# Shards per worker, so uneven shards don't leave workers idle at the tail.
+SHARDS_PER_WORKER = 4
+
+
+@dataclass
+class _ExampleContext:
+    """Everything an example needs besides its own summary and the history index."""
+
+    issues: dict[str, Issue]
+    action_space: ActionSpace
+    universe_id: str
+    universe_defaults: dict[str, Any]
+    include_world: bool
+    n_similar: int
+
+
+def _build_example(
+    summary: dict[str, Any],
+    *,
+    history: SimilarRunsIndex,
+    ctx: _ExampleContext,
+) -> dict[str, Any] | None:
+    job_type = str(summary.get("job_type") or "code")
+    if job_type == "fab-world" and not ctx.include_world:
+        return None
+
+    issue_id = str(summary.get("issue_id") or "")
+    issue = ctx.issues.get(issue_id) if issue_id else None
+
+    planner_input = build_planner_input(
+        run_summary=summary,
+        history_candidates=history,
+        action_space=ctx.action_space,
+        universe_id=ctx.universe_id,
+        universe_defaults=ctx.universe_defaults,
+        issue=issue,
+        n_similar=ctx.n_similar,
+    )
+    tokens = tokenize_planner_input(planner_input, max_similar_runs=ctx.n_similar)
+    input_hash = hash_planner_input(planner_input)
+
+    label = _label_from_run_summary(summary, action_space=ctx.action_space)
+    label["input_hash"] = input_hash
+
+    return {
+        "run_id": str(summary.get("run_id") or ""),
+        "started_ms": int(summary["started_ms"]),
+        "planner_input": planner_input,
+        "tokens": tokens,
+        "label_action": label,
+    }
+
+
+@dataclass
+class _ShardJob:
+    """
+    Read-only state shared by shard workers.
+
+    Forked workers inherit the parent's index; under spawn/forkserver the
+    job, index included, is pickled once per worker.
+    """
+
+    run_summaries: list[dict[str, Any]]
+    ctx: _ExampleContext
+    history: SimilarRunsIndex | None = field(default=None)
+
+    def index(self) -> SimilarRunsIndex:
+        if self.history is None:
+            self.history = SimilarRunsIndex(self.run_summaries)
+        return self.history
+
+
+_shard_job: _ShardJob | None = None
+
+
+def _init_shard_worker(job: _ShardJob) -> None:
+    global _shard_job
+    job.index()
+    _shard_job = job
+
+
+def _build_shard(bounds: tuple[int, int]) -> list[dict[str, Any]]:
+    job = _shard_job
+    if job is None:
+        raise RuntimeError("Shard worker not initialized")
+    history = job.index()
+    examples: list[dict[str, Any]] = []
+    for summary in job.run_summaries[bounds[0] : bounds[1]]:
+        example = _build_example(summary, history=history, ctx=job.ctx)
+        if example is not None:
+            examples.append(example)
+    return examples
+
+
+def _is_time_ordered(run_summaries: list[dict[str, Any]]) -> bool:
+    previous: int | None = None
+    for summary in run_summaries:
+        started_ms = summary.get("started_ms")
+        if not isinstance(started_ms, int):
+            return False
+        if previous is not None and started_ms < previous:
+            return False
+        previous = started_ms
+    return True
+
+
+def _shard_bounds(n: int, workers: int) -> list[tuple[int, int]]:
+    shards = max(1, min(workers * SHARDS_PER_WORKER, n // MIN_SHARD_SIZE))
+    size = -(-n // shards)
+    return [(start, min(n, start + size)) for start in range(0, n, size)]
+
+
+def _build_examples_sharded(
+    run_summaries: list[dict[str, Any]],
+    *,
+    ctx: _ExampleContext,
+    workers: int,
+) -> list[dict[str, Any]]:
+    """
+    Build examples for contiguous shards of a time-ordered snapshot in parallel.
+
+    `SimilarRunsIndex.select` only returns runs started strictly before the
+    query, so one index over the whole snapshot gives every example exactly
+    the history the serial build sees at that point; shards are independent
+    and their results concatenate in input order.
+    """
+    job = _ShardJob(run_summaries=run_summaries, ctx=ctx)
+    job.index()
+    bounds = _shard_bounds(len(run_summaries), workers)
+
+    examples: list[dict[str, Any]] = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(bounds)),
+        initializer=_init_shard_worker,
+        initargs=(job,),
+    ) as pool:
+        for shard in pool.map(_build_shard, bounds):
+            examples.extend(shard)
+    return examples
+
+
 def build_dataset_examples(
     *,
     repo_root: Path,
@@ -329,7 +481,15 @@ def build_dataset_examples(
     universe_id: str,
     include_world: bool,
     n_similar: int = 8,
+    workers: int = 1,
 ) -> list[dict[str, Any]]:
+    """
+    Build one example per run summary, each seeing only earlier runs as history.
+
+    With `workers > 1` and a time-ordered snapshot large enough to shard,
+    examples are built in worker processes; the output is identical to the
+    serial build.
+    """
     swarm_ids = (
         load_universe_swarm_ids(repo_root, universe_id)
         if universe_id
@@ -341,45 +501,26 @@ def build_dataset_examples(
         if universe_id
         else {"swarm_id": None, "objective_id": None}
     )
+    ctx = _ExampleContext(
+        issues=issues,
+        action_space=action_space,
+        universe_id=universe_id or "unknown",
+        universe_defaults=universe_defaults,
+        include_world=include_world,
+        n_similar=n_similar,
+    )
 
-    examples: list[dict[str, Any]] = []
-    history: list[dict[str, Any]] = []
-
-    for summary in run_summaries:
-        job_type = str(summary.get("job_type") or "code")
-        if job_type == "fab-world" and not include_world:
-            history.append(summary)
-            continue
-
-        issue_id = str(summary.get("issue_id") or "")
-        issue = issues.get(issue_id) if issue_id else None
-
-        planner_input = build_planner_input(
-            run_summary=summary,
-            history_candidates=history,
-            action_space=action_space,
-            universe_id=universe_id or "unknown",
-            universe_defaults=universe_defaults,
-            issue=issue,
-            n_similar=n_similar,
-        )
-        tokens = tokenize_planner_input(planner_input, max_similar_runs=n_similar)
-        input_hash = hash_planner_input(planner_input)
-
-        label = _label_from_run_summary(summary, action_space=action_space)
-        label["input_hash"] = input_hash
-
-        examples.append(
-            {
-                "run_id": str(summary.get("run_id") or ""),
-                "started_ms": int(summary["started_ms"]),
-                "planner_input": planner_input,
-                "tokens": tokens,
-                "label_action": label,
-            }
-        )
-
-        history.append(summary)
+    if workers > 1 and len(run_summaries) >= 2 * MIN_SHARD_SIZE and _is_time_ordered(run_summaries):
+        examples = _build_examples_sharded(run_summaries, ctx=ctx, workers=workers)
+    else:
+        examples = []
+        # Indexed so each example's similar-run lookup doesn't rescan all history.
+        history = SimilarRunsIndex()
+        for summary in run_summaries:
+            example = _build_example(summary, history=history, ctx=ctx)
+            if example is not None:
+                examples.append(example)
+            history.add(summary)
 
     examples.sort(key=lambda e: (int(e["started_ms"]), str(e.get("run_id") or "")))
     return examples
@@ -411,6 +552,7 @@ def build_and_write_dataset(
     include_world: bool = True,
     n_similar: int = 8,
     universe_id: str | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     universe_id = universe_id or infer_default_universe_id(repo_root) or "unknown"
 
@@ -424,6 +566,7 @@ def build_and_write_dataset(
         universe_id=universe_id,
         include_world=include_world,
         n_similar=n_similar,
+        workers=workers,
     )
 
     counts = _split_counts(len(examples))
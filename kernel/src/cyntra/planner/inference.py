@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import json
 import math
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -46,6 +49,16 @@ def _as_bins(items: Any) -> tuple[BudgetBin, ...]:
     return tuple(deduped) if deduped else (NA,)
 
 
+# Per-head probabilities for one input: (swarm, candidates, minutes, iterations)
+HeadProbs = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+DEFAULT_CACHE_SIZE = 1024
+DEFAULT_MAX_BATCH_SIZE = 64
+
+_HEAD_NAMES = ("swarm_id", "max_candidates_bin", "max_minutes_bin", "max_iterations_bin")
+_LOG_FLOOR = 1e-12
+
+
 def _softmax(logits: np.ndarray, temperature: float) -> np.ndarray:
     t = max(1e-6, float(temperature))
     z = logits / t
@@ -66,8 +79,39 @@ class BundleConfig:
     seq_len: int
 
 
+@dataclass(frozen=True)
+class _ActionIndex:
+    """
+    Valid actions for one job type and their per-head bin indices.
+
+    `actions` is ordered by the JSON tie-break key used when decoding, so the
+    first maximum found by `argmax` is the action the scalar decoder would pick.
+    """
+
+    actions: tuple[ActionTuple, ...]
+    index: np.ndarray  # (n_actions, 4) int64
+
+
 class OnnxPlanner:
-    def __init__(self, bundle_dir: Path) -> None:
+    """
+    ONNX planner bundle wrapper.
+
+    `predict_actions` encodes a batch of inputs, runs one session call per
+    `max_batch_size` chunk, and decodes with vectorised log-prob sums. Head
+    probabilities are kept in an LRU cache keyed by `hash_planner_input`, so
+    repeated inputs skip inference (`cache_size=0` disables it). Thread counts
+    default to onnxruntime's own choice when left as None.
+    """
+
+    def __init__(
+        self,
+        bundle_dir: Path,
+        *,
+        intra_op_threads: int | None = None,
+        inter_op_threads: int | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
         bundle_dir = bundle_dir.resolve()
         vocab_data = _read_json(bundle_dir / "vocab.json")
         tokens = vocab_data.get("tokens")
@@ -106,8 +150,14 @@ class OnnxPlanner:
 
         # Infer seq_len from ONNX model inputs when available; otherwise fall back.
         onnx_path = bundle_dir / "planner.onnx"
+        sess_options = ort.SessionOptions()
+        if intra_op_threads is not None:
+            sess_options.intra_op_num_threads = int(intra_op_threads)
+        if inter_op_threads is not None:
+            sess_options.inter_op_num_threads = int(inter_op_threads)
         sess = ort.InferenceSession(
             str(onnx_path),
+            sess_options=sess_options,
             providers=["CPUExecutionProvider"],
         )
         input_ids_info = next((i for i in sess.get_inputs() if i.name == "input_ids"), None)
@@ -120,9 +170,18 @@ class OnnxPlanner:
             dim = input_ids_info.shape[1]
             if isinstance(dim, int) and dim > 0:
                 seq_len = dim
+            # Bundles exported with a fixed batch axis only accept that size.
+            batch_dim = input_ids_info.shape[0]
+            if isinstance(batch_dim, int) and batch_dim > 0:
+                max_batch_size = batch_dim
 
         self.bundle_dir = bundle_dir
         self.session = sess
+        self.cache_size = max(0, int(cache_size))
+        self.max_batch_size = max(1, int(max_batch_size))
+        self._cache: OrderedDict[str, HeadProbs] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._action_indices: dict[str, _ActionIndex] = {}
         self.cfg = BundleConfig(
             vocab=vocab,
             action_space=action_space,
@@ -135,38 +194,57 @@ class OnnxPlanner:
         )
 
     def predict_action(self, planner_input: dict[str, Any]) -> dict[str, Any]:
-        job_type = str(planner_input.get("job_type") or "code")
-
-        swarm_probs, candidates_probs, minutes_probs, iterations_probs = self._predict_probs(
-            planner_input
-        )
+        return self.predict_actions([planner_input])[0]
 
-        chosen = self._decode_valid_action(
-            job_type=job_type,
-            swarm_probs=swarm_probs,
-            candidates_probs=candidates_probs,
-            minutes_probs=minutes_probs,
-            iterations_probs=iterations_probs,
-        )
+    def predict_actions(self, batch: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Predict `planner_action.v1` records for many inputs at once.
 
-        input_hash = hash_planner_input(planner_input)
-        confidence = chosen["confidence"]
-
-        return {
-            "schema_version": SCHEMA_PLANNER_ACTION_V1,
-            "created_at": utc_now_rfc3339(),
-            "swarm_id": chosen["swarm_id"],
-            "budgets": {
-                "max_candidates_bin": chosen["max_candidates_bin"],
-                "max_minutes_bin": chosen["max_minutes_bin"],
-                "max_iterations_bin": chosen["max_iterations_bin"],
-            },
-            "confidence": confidence,
-            "abstain_to_default": False,
-            "reason": None,
-            "model": {"checkpoint_id": self.bundle_dir.name},
-            "input_hash": input_hash,
-        }
+        Equivalent to calling `predict_action` per input, but cache misses are
+        encoded together and scored in batched session runs.
+        """
+        if not batch:
+            return []
+
+        input_hashes = [hash_planner_input(planner_input) for planner_input in batch]
+        probs = self._predict_probs_batch(batch, input_hashes)
+
+        rows_by_job_type: dict[str, list[int]] = {}
+        for row, planner_input in enumerate(batch):
+            job_type = str(planner_input.get("job_type") or "code")
+            rows_by_job_type.setdefault(job_type, []).append(row)
+
+        chosen: list[dict[str, Any]] = [{} for _ in batch]
+        for job_type, rows in rows_by_job_type.items():
+            decoded = self._decode_valid_actions(
+                job_type=job_type,
+                swarm_probs=np.stack([probs[r][0] for r in rows]),
+                candidates_probs=np.stack([probs[r][1] for r in rows]),
+                minutes_probs=np.stack([probs[r][2] for r in rows]),
+                iterations_probs=np.stack([probs[r][3] for r in rows]),
+            )
+            for row, action in zip(rows, decoded, strict=True):
+                chosen[row] = action
+
+        created_at = utc_now_rfc3339()
+        return [
+            {
+                "schema_version": SCHEMA_PLANNER_ACTION_V1,
+                "created_at": created_at,
+                "swarm_id": action["swarm_id"],
+                "budgets": {
+                    "max_candidates_bin": action["max_candidates_bin"],
+                    "max_minutes_bin": action["max_minutes_bin"],
+                    "max_iterations_bin": action["max_iterations_bin"],
+                },
+                "confidence": action["confidence"],
+                "abstain_to_default": False,
+                "reason": None,
+                "model": {"checkpoint_id": self.bundle_dir.name},
+                "input_hash": input_hash,
+            }
+            for action, input_hash in zip(chosen, input_hashes, strict=True)
+        ]
 
     def select_best_action(
         self,
@@ -236,112 +314,184 @@ class OnnxPlanner:
 
         return best
 
-    def _predict_probs(
-        self, planner_input: dict[str, Any]
-    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-        tokens = tokenize_planner_input(planner_input)
-        input_ids, attention_mask = encode_tokens(
-            tokens, vocab=self.cfg.vocab, seq_len=self.cfg.seq_len
-        )
+    def _predict_probs(self, planner_input: dict[str, Any]) -> HeadProbs:
+        return self._predict_probs_batch([planner_input], [hash_planner_input(planner_input)])[0]
+
+    def _predict_probs_batch(
+        self,
+        batch: Sequence[dict[str, Any]],
+        input_hashes: Sequence[str],
+    ) -> list[HeadProbs]:
+        results: list[HeadProbs | None] = [None] * len(batch)
+        # Rows waiting on each uncached hash (duplicates in a batch run once)
+        pending: dict[str, list[int]] = {}
+        with self._cache_lock:
+            for row, input_hash in enumerate(input_hashes):
+                cached = self._cache.get(input_hash)
+                if cached is not None:
+                    self._cache.move_to_end(input_hash)
+                    results[row] = cached
+                else:
+                    pending.setdefault(input_hash, []).append(row)
+
+        misses = list(pending)
+        for start in range(0, len(misses), self.max_batch_size):
+            chunk = misses[start : start + self.max_batch_size]
+            chunk_probs = self._run_session([batch[pending[h][0]] for h in chunk])
+            with self._cache_lock:
+                for input_hash, head_probs in zip(chunk, chunk_probs, strict=True):
+                    for row in pending[input_hash]:
+                        results[row] = head_probs
+                    if self.cache_size:
+                        self._cache[input_hash] = head_probs
+                        self._cache.move_to_end(input_hash)
+                        while len(self._cache) > self.cache_size:
+                            self._cache.popitem(last=False)
+
+        return results  # type: ignore[return-value]
+
+    def _run_session(self, batch: Sequence[dict[str, Any]]) -> list[HeadProbs]:
+        input_ids = np.empty((len(batch), self.cfg.seq_len), dtype=np.int64)
+        attention_mask = np.empty((len(batch), self.cfg.seq_len), dtype=np.int64)
+        for row, planner_input in enumerate(batch):
+            ids, mask = encode_tokens(
+                tokenize_planner_input(planner_input),
+                vocab=self.cfg.vocab,
+                seq_len=self.cfg.seq_len,
+            )
+            input_ids[row] = ids
+            attention_mask[row] = mask
 
-        ort_inputs = {
-            "input_ids": np.asarray([input_ids], dtype=np.int64),
-            "attention_mask": np.asarray([attention_mask], dtype=np.int64),
-        }
-        outputs = self.session.run(None, ort_inputs)
+        outputs = self.session.run(None, {"input_ids": input_ids, "attention_mask": attention_mask})
         if len(outputs) != 4:
             raise RuntimeError("Unexpected ONNX outputs; expected 4 heads")
 
-        swarm_logits = np.asarray(outputs[0])[0]
-        candidates_logits = np.asarray(outputs[1])[0]
-        minutes_logits = np.asarray(outputs[2])[0]
-        iterations_logits = np.asarray(outputs[3])[0]
-
         temps = self.cfg.temperatures
-        swarm_probs = _softmax(swarm_logits, temps.get("swarm_id", 1.0))
-        candidates_probs = _softmax(candidates_logits, temps.get("max_candidates_bin", 1.0))
-        minutes_probs = _softmax(minutes_logits, temps.get("max_minutes_bin", 1.0))
-        iterations_probs = _softmax(iterations_logits, temps.get("max_iterations_bin", 1.0))
-        return swarm_probs, candidates_probs, minutes_probs, iterations_probs
+        heads = [
+            _softmax(np.asarray(logits), temps.get(name, 1.0))
+            for logits, name in zip(outputs, _HEAD_NAMES, strict=True)
+        ]
+        return [(heads[0][r], heads[1][r], heads[2][r], heads[3][r]) for r in range(len(batch))]
+
+    def _action_index(self, job_type: str) -> _ActionIndex:
+        index = self._action_indices.get(job_type)
+        if index is not None:
+            return index
 
-    def _decode_valid_action(
-        self,
-        *,
-        job_type: str,
-        swarm_probs: np.ndarray,
-        candidates_probs: np.ndarray,
-        minutes_probs: np.ndarray,
-        iterations_probs: np.ndarray,
-    ) -> dict[str, Any]:
         swarm_to_id = {s: i for i, s in enumerate(self.cfg.swarm_ids)}
         candidates_to_id = {b: i for i, b in enumerate(self.cfg.max_candidates_bins)}
         minutes_to_id = {b: i for i, b in enumerate(self.cfg.max_minutes_bins)}
         iterations_to_id = {b: i for i, b in enumerate(self.cfg.max_iterations_bins)}
 
-        best_score = -math.inf
-        best: tuple[str, BudgetBin, BudgetBin, BudgetBin] | None = None
-
-        for swarm_id, max_candidates, max_minutes, max_iterations in valid_actions(
-            job_type, self.cfg.action_space
-        ):
+        rows: list[tuple[ActionTuple, tuple[int, int, int, int]]] = []
+        for action in valid_actions(job_type, self.cfg.action_space):
+            swarm_id, max_candidates, max_minutes, max_iterations = action
             si = swarm_to_id.get(swarm_id)
             ci = candidates_to_id.get(max_candidates)
             mi = minutes_to_id.get(max_minutes)
             ii = iterations_to_id.get(max_iterations)
             if si is None or ci is None or mi is None or ii is None:
                 continue
+            rows.append((action, (si, ci, mi, ii)))
+        rows.sort(key=lambda r: json.dumps(r[0], sort_keys=True))
 
-            score = (
-                math.log(max(1e-12, float(swarm_probs[si])))
-                + math.log(max(1e-12, float(candidates_probs[ci])))
-                + math.log(max(1e-12, float(minutes_probs[mi])))
-                + math.log(max(1e-12, float(iterations_probs[ii])))
-            )
-            if score > best_score:
-                best_score = score
-                best = (swarm_id, max_candidates, max_minutes, max_iterations)
-            elif score == best_score and best is not None:
-                if json.dumps(
-                    (swarm_id, max_candidates, max_minutes, max_iterations), sort_keys=True
-                ) < json.dumps(best, sort_keys=True):
-                    best = (swarm_id, max_candidates, max_minutes, max_iterations)
+        index = _ActionIndex(
+            actions=tuple(action for action, _ in rows),
+            index=np.asarray([ids for _, ids in rows], dtype=np.int64).reshape(-1, 4),
+        )
+        self._action_indices[job_type] = index
+        return index
 
-        if best is None:
+    def _decode_valid_action(
+        self,
+        *,
+        job_type: str,
+        swarm_probs: np.ndarray,
+        candidates_probs: np.ndarray,
+        minutes_probs: np.ndarray,
+        iterations_probs: np.ndarray,
+    ) -> dict[str, Any]:
+        return self._decode_valid_actions(
+            job_type=job_type,
+            swarm_probs=swarm_probs[None, :],
+            candidates_probs=candidates_probs[None, :],
+            minutes_probs=minutes_probs[None, :],
+            iterations_probs=iterations_probs[None, :],
+        )[0]
+
+    def _decode_valid_actions(
+        self,
+        *,
+        job_type: str,
+        swarm_probs: np.ndarray,
+        candidates_probs: np.ndarray,
+        minutes_probs: np.ndarray,
+        iterations_probs: np.ndarray,
+    ) -> list[dict[str, Any]]:
+        """
+        Decode `argmax_a Σ_h log p_h(a_h)` over valid actions for a (batch, bins) stack.
+
+        Ties go to the smallest JSON-encoded action, as in `select_best_action`.
+        """
+        heads = [
+            np.asarray(p, dtype=np.float64)
+            for p in (swarm_probs, candidates_probs, minutes_probs, iterations_probs)
+        ]
+        batch_size = heads[0].shape[0]
+        action_index = self._action_index(job_type)
+
+        if action_index.actions:
+            idx = action_index.index
+            log_probs = [np.log(np.maximum(_LOG_FLOOR, p)) for p in heads]
+            scores = (
+                log_probs[0][:, idx[:, 0]]
+                + log_probs[1][:, idx[:, 1]]
+                + log_probs[2][:, idx[:, 2]]
+                + log_probs[3][:, idx[:, 3]]
+            )
+            best = np.argmax(scores, axis=1)
+            best_ids = idx[best]
+            best_actions = [action_index.actions[a] for a in best.tolist()]
+        else:
             # Fallback to per-head argmax without validity guarantees.
-            swarm_idx = int(np.argmax(swarm_probs))
-            candidates_idx = int(np.argmax(candidates_probs))
-            minutes_idx = int(np.argmax(minutes_probs))
-            iterations_idx = int(np.argmax(iterations_probs))
-            best = (
-                self.cfg.swarm_ids[min(swarm_idx, len(self.cfg.swarm_ids) - 1)],
-                self.cfg.max_candidates_bins[
-                    min(candidates_idx, len(self.cfg.max_candidates_bins) - 1)
-                ],
-                self.cfg.max_minutes_bins[min(minutes_idx, len(self.cfg.max_minutes_bins) - 1)],
-                self.cfg.max_iterations_bins[
-                    min(iterations_idx, len(self.cfg.max_iterations_bins) - 1)
+            best_ids = np.stack(
+                [
+                    np.minimum(np.argmax(p, axis=1), len(bins) - 1)
+                    for p, bins in zip(
+                        heads,
+                        (
+                            self.cfg.swarm_ids,
+                            self.cfg.max_candidates_bins,
+                            self.cfg.max_minutes_bins,
+                            self.cfg.max_iterations_bins,
+                        ),
+                        strict=True,
+                    )
                 ],
+                axis=1,
             )
-
-        swarm_id, max_candidates, max_minutes, max_iterations = best
-        si = swarm_to_id.get(swarm_id, 0)
-        ci = candidates_to_id.get(max_candidates, 0)
-        mi = minutes_to_id.get(max_minutes, 0)
-        ii = iterations_to_id.get(max_iterations, 0)
-
-        confidence = float(
-            min(
-                float(swarm_probs[si]),
-                float(candidates_probs[ci]),
-                float(minutes_probs[mi]),
-                float(iterations_probs[ii]),
+            best_actions = [
+                (
+                    self.cfg.swarm_ids[si],
+                    self.cfg.max_candidates_bins[ci],
+                    self.cfg.max_minutes_bins[mi],
+                    self.cfg.max_iterations_bins[ii],
+                )
+                for si, ci, mi, ii in best_ids.tolist()
+            ]
+
+        rows = np.arange(batch_size)
+        confidences = np.minimum.reduce([heads[h][rows, best_ids[:, h]] for h in range(4)]).tolist()
+
+        return [
+            {
+                "swarm_id": swarm_id,
+                "max_candidates_bin": max_candidates,
+                "max_minutes_bin": max_minutes,
+                "max_iterations_bin": max_iterations,
+                "confidence": float(confidence),
+            }
+            for (swarm_id, max_candidates, max_minutes, max_iterations), confidence in zip(
+                best_actions, confidences, strict=True
             )
-        )
-
-        return {
-            "swarm_id": swarm_id,
-            "max_candidates_bin": max_candidates,
-            "max_minutes_bin": max_minutes,
-            "max_iterations_bin": max_iterations,
-            "confidence": confidence,
-        }
+        ]
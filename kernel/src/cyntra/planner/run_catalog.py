@@ -0,0 +1,303 @@
+"""
+Persistent catalog of `run_summary.v1` records.
+
+Building summaries means reading several JSON files per run directory, and
+`.cyntra/archives` grows without bound. The catalog stores one row per run
+directory, keyed by directory and a modification signature. A refresh lists
+each root, stats the summary inputs, and rebuilds only new or changed
+directories; removed directories are dropped. Rows are indexed by
+`(started_ms, run_id)` so reads come back pre-sorted.
+
+Location: .cyntra/planner/run_catalog.db
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from cyntra.planner.run_summaries import build_archive_run_summary, build_world_run_summary
+from cyntra.planner.time_utils import parse_rfc3339_to_ms
+from cyntra.state.sqlite_pool import SQLitePool, open_pool
+
+logger = structlog.get_logger()
+
+CATALOG_RELPATH = Path(".cyntra") / "planner" / "run_catalog.db"
+
+# Files a summary is built from; a change to any of them (or to the directory
+# listing itself) marks the run for rebuilding
+ARCHIVE_INPUTS = ("rollout.json", "manifest.json", "proof.json")
+WORLD_INPUTS = ("manifest.json", "context.json")
+# World summaries also read the run's universe config (swarm population size);
+# editing any universe counts as a change to every world run
+UNIVERSE_INPUTS = ("universe.yaml", "agents.yaml", "swarms.yaml", "objectives.yaml")
+
+# Bump when the layout changes; older catalogs are dropped and rebuilt.
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    root TEXT NOT NULL,
+    name TEXT NOT NULL,
+    signature INTEGER NOT NULL,
+    started_ms INTEGER NOT NULL,
+    run_id TEXT NOT NULL DEFAULT '',
+    -- manifest.json `started_at` (the ingester watermark field), NULL when absent
+    manifest_started_ms INTEGER,
+    summary_json TEXT,
+    PRIMARY KEY (root, name)
+);
+
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_ms, run_id);
+CREATE INDEX IF NOT EXISTS idx_runs_manifest_started ON runs(root, manifest_started_ms);
+"""
+
+_catalogs: dict[Path, RunCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def _signature(run_dir: Path, inputs: tuple[str, ...], floor_ns: int = 0) -> int:
+    """Latest mtime (ns) of the directory and whichever summary inputs exist."""
+    latest = max(floor_ns, run_dir.stat().st_mtime_ns)
+    for name in inputs:
+        try:
+            latest = max(latest, (run_dir / name).stat().st_mtime_ns)
+        except OSError:
+            continue
+    return latest
+
+
+def _universe_mtime_ns(repo_root: Path) -> int:
+    """Latest mtime (ns) of the universe configs world summaries read (0 if none)."""
+    latest = 0
+    try:
+        universes = list(os.scandir(repo_root / "universes"))
+    except OSError:
+        return 0
+    for universe in universes:
+        if not universe.is_dir():
+            continue
+        for name in UNIVERSE_INPUTS:
+            try:
+                latest = max(latest, (Path(universe.path) / name).stat().st_mtime_ns)
+            except OSError:
+                continue
+    return latest
+
+
+def _read_manifest(run_dir: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads((run_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _manifest_ms(manifest: dict[str, Any], key: str) -> int | None:
+    value = manifest.get(key)
+    return parse_rfc3339_to_ms(value) if isinstance(value, str) else None
+
+
+def _fallback_started_ms(run_dir: Path, manifest: dict[str, Any]) -> int:
+    """Start time for directories without a summary (manifest time, else mtime)."""
+    for key in ("started_at", "created_at"):
+        started_ms = _manifest_ms(manifest, key)
+        if started_ms is not None:
+            return started_ms
+    return int(run_dir.stat().st_mtime * 1000)
+
+
+class RunCatalog:
+    """
+    Incrementally refreshed run summaries for an archives and a runs directory.
+
+    Usage:
+        catalog = RunCatalog.for_repo(repo_root)
+        catalog.refresh(include_world=True)
+        summaries = catalog.summaries(include_world=True)
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        repo_root: Path,
+        archives_dir: Path | None = None,
+        runs_dir: Path | None = None,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.repo_root = Path(repo_root).resolve()
+        self.archives_dir = Path(archives_dir).resolve() if archives_dir else None
+        self.runs_dir = Path(runs_dir).resolve() if runs_dir else None
+        self.pool: SQLitePool = open_pool(self.db_path)
+        self._refresh_lock = threading.Lock()
+        with self.pool.write() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                # Older layout: drop it; the next refresh re-catalogs every run.
+                conn.executescript(
+                    "BEGIN IMMEDIATE; DROP TABLE IF EXISTS runs; "
+                    f"{_SCHEMA} PRAGMA user_version = {_SCHEMA_VERSION}; COMMIT;"
+                )
+
+    @classmethod
+    def for_repo(cls, repo_root: Path) -> RunCatalog:
+        """Process-wide catalog for `<repo_root>/.cyntra/{archives,runs}`."""
+        repo_root = Path(repo_root).resolve()
+        with _catalogs_lock:
+            catalog = _catalogs.get(repo_root)
+            if catalog is None:
+                catalog = cls(
+                    repo_root / CATALOG_RELPATH,
+                    repo_root=repo_root,
+                    archives_dir=repo_root / ".cyntra" / "archives",
+                    runs_dir=repo_root / ".cyntra" / "runs",
+                )
+                _catalogs[repo_root] = catalog
+            return catalog
+
+    def close(self) -> None:
+        self.pool.close()
+
+    # ===== Refresh =====
+
+    def refresh(self, *, include_world: bool = True) -> int:
+        """Rebuild new or changed runs and drop removed ones; returns rows touched."""
+        with self._refresh_lock:
+            touched = 0
+            if self.archives_dir is not None:
+                touched += self._sync(self.archives_dir, ARCHIVE_INPUTS, build_archive_run_summary)
+            if include_world and self.runs_dir is not None:
+                touched += self._sync(
+                    self.runs_dir,
+                    WORLD_INPUTS,
+                    lambda run_dir: build_world_run_summary(run_dir, repo_root=self.repo_root),
+                    floor_ns=_universe_mtime_ns(self.repo_root),
+                )
+            return touched
+
+    def _sync(
+        self,
+        root: Path,
+        inputs: tuple[str, ...],
+        build: Callable[[Path], dict[str, Any] | None],
+        floor_ns: int = 0,
+    ) -> int:
+        with self.pool.read() as conn:
+            known = dict(
+                conn.execute("SELECT name, signature FROM runs WHERE root = ?", (str(root),))
+            )
+
+        seen: set[str] = set()
+        upserts: list[tuple[Any, ...]] = []
+        if root.is_dir():
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    run_dir = Path(entry.path)
+                    try:
+                        signature = _signature(run_dir, inputs, floor_ns)
+                    except OSError:
+                        continue
+                    seen.add(entry.name)
+                    if known.get(entry.name) == signature:
+                        continue
+
+                    summary = build(run_dir)
+                    manifest = _read_manifest(run_dir)
+                    started_ms = summary.get("started_ms") if summary else None
+                    if not isinstance(started_ms, int):
+                        summary = None
+                        started_ms = _fallback_started_ms(run_dir, manifest)
+                    upserts.append(
+                        (
+                            str(root),
+                            entry.name,
+                            signature,
+                            started_ms,
+                            str(summary.get("run_id") or "") if summary else "",
+                            _manifest_ms(manifest, "started_at"),
+                            json.dumps(summary, separators=(",", ":")) if summary else None,
+                        )
+                    )
+
+        removed = [(str(root), name) for name in known.keys() - seen]
+        if upserts or removed:
+            with self.pool.write() as conn, conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO runs "
+                    "(root, name, signature, started_ms, run_id, manifest_started_ms, "
+                    "summary_json) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                conn.executemany("DELETE FROM runs WHERE root = ? AND name = ?", removed)
+            logger.debug(
+                "Run catalog refreshed",
+                root=str(root),
+                updated=len(upserts),
+                removed=len(removed),
+            )
+        return len(upserts) + len(removed)
+
+    # ===== Queries =====
+
+    def summaries(self, *, include_world: bool = True) -> list[dict[str, Any]]:
+        """`run_summary.v1` records sorted by `(started_ms, run_id)`, then directory."""
+        roots = [self.archives_dir]
+        if include_world:
+            roots.append(self.runs_dir)
+        roots = [str(root) for root in roots if root is not None]
+        if not roots:
+            return []
+
+        with self.pool.read() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT summary_json FROM runs
+                WHERE summary_json IS NOT NULL AND root IN ({", ".join("?" * len(roots))})
+                ORDER BY started_ms, run_id, root, name
+                """,
+                roots,
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def run_dirs(self, root: Path, *, since_ms: int | None = None) -> list[Path]:
+        """
+        Cataloged directories under `root`, newest manifest `started_at` first.
+
+        With `since_ms`, only directories whose manifest `started_at` is later
+        are returned; directories without one sort last and never pass it.
+        """
+        root = Path(root).resolve()
+        query = "SELECT name FROM runs WHERE root = ?"
+        params: list[Any] = [str(root)]
+        if since_ms is not None:
+            query += " AND manifest_started_ms > ?"
+            params.append(since_ms)
+        query += " ORDER BY manifest_started_ms IS NULL, manifest_started_ms DESC, name DESC"
+        with self.pool.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [root / row[0] for row in rows]
+
+
+def load_run_summaries(*, repo_root: Path, include_world: bool) -> list[dict[str, Any]] | None:
+    """
+    Refresh the repo's catalog and return its sorted summaries.
+
+    Returns None when the catalog can't be opened (e.g. a read-only `.cyntra`)
+    so callers can fall back to scanning.
+    """
+    try:
+        catalog = RunCatalog.for_repo(repo_root)
+        catalog.refresh(include_world=include_world)
+        return catalog.summaries(include_world=include_world)
+    except (sqlite3.Error, OSError) as exc:
+        logger.debug("Run catalog unavailable", error=str(exc))
+        return None
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 
@@ -63,7 +66,7 @@ class SimilarRunsQuery:
 
 def select_similar_runs(
     query: SimilarRunsQuery,
-    candidates: list[dict[str, Any]],
+    candidates: list[dict[str, Any]] | SimilarRunsIndex,
     *,
     n: int = 8,
 ) -> list[dict[str, Any]]:
@@ -72,9 +75,14 @@ def select_similar_runs(
 
     Selection is score-based (tag overlap, failure-signal overlap, recency), with stable tie-breaks.
     Returned runs are ordered by `started_ms` descending (most recent first).
+
+    `candidates` may be a `SimilarRunsIndex`, which returns the same runs
+    without scoring every candidate.
     """
     if n <= 0:
         return []
+    if isinstance(candidates, SimilarRunsIndex):
+        return candidates.select(query, n=n)
 
     query_tags = set(query.tags)
     query_fail = set()
@@ -122,3 +130,139 @@ def select_similar_runs(
     # Output order: most recent first for token sequence layout.
     top.sort(key=lambda r: (-int(r.get("started_ms")), str(r.get("run_id") or "")))
     return top
+
+
+class _AnyType:
+    """Partition wildcard for world/objective filters the query leaves unset."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "_ANY"
+
+    def __reduce__(self) -> str:
+        # Pickle by reference so partition keys still match after unpickling.
+        return "_ANY"
+
+
+_ANY: Any = _AnyType()
+
+
+@dataclass
+class _TagGroup:
+    """Runs sharing one exact tag set, kept in `select` order when read backwards."""
+
+    starts: list[int] = field(default_factory=list)
+    entries: list[tuple[int, str, int, dict[str, Any]]] = field(default_factory=list)
+
+    def add(self, started_ms: int, run_id: str, seq: int, run: dict[str, Any]) -> None:
+        # Ascending started_ms; within equal started_ms, descending run_id and
+        # newest insertion first, so reading from the end yields the
+        # (-started_ms, run_id, insertion order) tie-break order.
+        i = len(self.entries)
+        while i > 0:
+            prev_started, prev_run_id, _, _ = self.entries[i - 1]
+            if prev_started < started_ms or (prev_started == started_ms and prev_run_id > run_id):
+                break
+            i -= 1
+        self.starts.insert(i, started_ms)
+        self.entries.insert(i, (started_ms, run_id, seq, run))
+
+
+class SimilarRunsIndex:
+    """
+    Incremental index answering `select_similar_runs` without a full scan.
+
+    Runs are partitioned by the filters `select_similar_runs` applies
+    (job type, plus world/objective for fab-world), then grouped by exact
+    tag set. Every run in a group has the same tag overlap with a query,
+    and within a group newer runs always score at least as well (recency
+    only decays), so a query computes one Jaccard per group and k-way
+    merges the groups newest-first until it has N runs. Cost scales with
+    the number of distinct tag sets rather than the number of runs.
+
+    Queries never carry failure signals, so the failure-overlap term is
+    always zero and needs no postings.
+
+    Runs are expected to arrive in `started_ms` order (as history does);
+    out-of-order inserts are still placed correctly, just not in O(1).
+    """
+
+    def __init__(self, runs: Iterable[dict[str, Any]] = ()) -> None:
+        self._partitions: dict[tuple[Any, Any, Any], dict[frozenset[str], _TagGroup]] = {}
+        self._size = 0
+        self.extend(runs)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, runs: Iterable[dict[str, Any]]) -> None:
+        for run in runs:
+            self.add(run)
+
+    def add(self, run: dict[str, Any]) -> None:
+        started_ms = run.get("started_ms")
+        if not isinstance(started_ms, int):
+            return
+
+        job_type = run.get("job_type")
+        keys = [(job_type, _ANY, _ANY)]
+        if job_type == "fab-world":
+            world_id = run.get("world_id")
+            objective_id = run.get("objective_id")
+            keys += [
+                (job_type, world_id, _ANY),
+                (job_type, _ANY, objective_id),
+                (job_type, world_id, objective_id),
+            ]
+
+        tags = frozenset(_as_str_set(run.get("tags")))
+        run_id = str(run.get("run_id") or "")
+        for key in keys:
+            groups = self._partitions.setdefault(key, {})
+            group = groups.get(tags)
+            if group is None:
+                group = groups[tags] = _TagGroup()
+            group.add(started_ms, run_id, self._size, run)
+        self._size += 1
+
+    def select(self, query: SimilarRunsQuery, *, n: int = 8) -> list[dict[str, Any]]:
+        """Same result as `select_similar_runs(query, <runs added so far>, n=n)`."""
+        if n <= 0:
+            return []
+
+        key: tuple[Any, Any, Any] = (query.job_type, _ANY, _ANY)
+        if query.job_type == "fab-world":
+            key = (query.job_type, query.world_id or _ANY, query.objective_id or _ANY)
+        groups = self._partitions.get(key)
+        if not groups:
+            return []
+
+        query_tags = set(query.tags)
+        fail_score = 0.0
+
+        def ranked(group: _TagGroup, tag_score: float, i: int) -> tuple:
+            started_ms, run_id, seq, _ = group.entries[i]
+            age_days = float(query.started_ms - started_ms) / (1000.0 * 60.0 * 60.0 * 24.0)
+            recency = _recency_score(age_days)
+            score = (0.6 * tag_score) + (0.3 * fail_score) + (0.1 * recency)
+            return (-score, -started_ms, run_id, seq, i, group, tag_score)
+
+        heap: list[tuple] = []
+        for tags, group in groups.items():
+            # Leakage control: only runs strictly before the query.
+            end = bisect_left(group.starts, query.started_ms)
+            if end:
+                heap.append(ranked(group, _jaccard(query_tags, set(tags)), end - 1))
+        heapq.heapify(heap)
+
+        top: list[dict[str, Any]] = []
+        while heap and len(top) < n:
+            *_, i, group, tag_score = heapq.heappop(heap)
+            top.append(group.entries[i][3])
+            if i:
+                heapq.heappush(heap, ranked(group, tag_score, i - 1))
+
+        # Output order: most recent first for token sequence layout.
+        top.sort(key=lambda r: (-int(r.get("started_ms")), str(r.get("run_id") or "")))
+        return top
@@ -0,0 +1,282 @@
+"""
+Compiled (pre-encoded, memory-mapped) planner training datasets.
+
+`encode_dataset` re-tokenizes every JSONL row into Python objects on each
+training run. A compiled dataset stores the same encoding once as int32
+`.npy` arrays next to the JSONL:
+
+    <dataset dir>/compiled/<sha256[:16]>-L<seq_len>/
+        manifest.json         counts, split files, head vocab, vocab hash
+        vocab.json
+        input_ids.npy         (N, seq_len) int32
+        attention_mask.npy    (N, seq_len) int32
+        labels.npy            (N, 4) int32: swarm, candidates, minutes, iterations
+        split_<i>.npy         int64 row indices, one file per split
+
+The directory is keyed by the dataset file's content hash and `seq_len`, so a
+rebuilt dataset compiles afresh; the vocab is derived from the rows and stored
+alongside. Arrays are opened with `mmap_mode="r"` and batches are gathered
+straight from the maps, so neither startup nor resident memory scale with
+the number of examples.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from cyntra.planner.training.data import (
+    HeadVocab,
+    dataset_action_space,
+    iter_dataset,
+    label_ids,
+    row_label,
+    row_tokens,
+)
+from cyntra.planner.vocab import Vocab, build_vocab_from_token_streams, encode_tokens
+
+SCHEMA_COMPILED_DATASET_V1 = "cyntra.planner_compiled_dataset.v1"
+
+# Bump when the tokenizer or on-disk layout changes to invalidate old builds.
+COMPILED_FORMAT_VERSION = 1
+
+_HASH_CHUNK = 1 << 20
+
+
+def file_sha256(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def compiled_dir_for(dataset_path: Path, *, seq_len: int, dataset_sha256: str) -> Path:
+    return dataset_path.parent / "compiled" / f"{dataset_sha256[:16]}-L{seq_len}"
+
+
+@dataclass(frozen=True)
+class CompiledDataset:
+    root: Path
+    vocab: Vocab
+    head_vocab: HeadVocab
+    seq_len: int
+    input_ids: np.ndarray
+    attention_mask: np.ndarray
+    labels: np.ndarray
+    splits: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return int(self.input_ids.shape[0])
+
+    def count(self, split: str) -> int:
+        index = self.splits.get(split)
+        return int(index.shape[0]) if index is not None else 0
+
+    def iter_batches(
+        self,
+        split: str,
+        batch_size: int,
+        *,
+        rng: np.random.Generator | None = None,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Yield `(input_ids, attention_mask, labels)` arrays for `split`.
+
+        With `rng`, rows are visited in a fresh permutation. Indices within a
+        batch are sorted so each gather reads the maps front to back.
+        """
+        index = self.splits.get(split)
+        if index is None or index.shape[0] == 0:
+            return
+        order = rng.permutation(index) if rng is not None else np.asarray(index)
+        for start in range(0, order.shape[0], max(1, batch_size)):
+            rows = np.sort(order[start : start + batch_size])
+            yield self.input_ids[rows], self.attention_mask[rows], self.labels[rows]
+
+    @classmethod
+    def open(cls, root: Path) -> CompiledDataset:
+        manifest = json.loads((root / "manifest.json").read_text(encoding="utf-8"))
+        vocab_data = json.loads((root / "vocab.json").read_text(encoding="utf-8"))
+        return cls(
+            root=root,
+            vocab=Vocab.from_tokens([str(t) for t in vocab_data["tokens"]]),
+            head_vocab=HeadVocab.from_action_space_dict(manifest["head_vocab"]),
+            seq_len=int(manifest["seq_len"]),
+            input_ids=np.load(root / "input_ids.npy", mmap_mode="r"),
+            attention_mask=np.load(root / "attention_mask.npy", mmap_mode="r"),
+            labels=np.load(root / "labels.npy", mmap_mode="r"),
+            splits={
+                name: np.load(root / info["file"], mmap_mode="r")
+                for name, info in manifest["splits"].items()
+            },
+        )
+
+
+def _head_vocab_dict(head_vocab: HeadVocab) -> dict[str, Any]:
+    return {
+        "swarm_ids": list(head_vocab.swarm_ids),
+        "max_candidates_bins": list(head_vocab.max_candidates_bins),
+        "max_minutes_bins": list(head_vocab.max_minutes_bins),
+        "max_iterations_bins": list(head_vocab.max_iterations_bins),
+    }
+
+
+def compile_dataset(
+    dataset_path: Path,
+    out_dir: Path,
+    *,
+    seq_len: int,
+    dataset_sha256: str | None = None,
+) -> CompiledDataset:
+    """
+    Encode `dataset_path` into `out_dir` with two streaming passes.
+
+    The first pass collects the vocab, head vocab and label counts (to size
+    the arrays exactly); the second encodes rows straight into the maps.
+    Output is written to a temporary sibling and renamed into place.
+    """
+    if seq_len <= 0:
+        raise ValueError("seq_len must be > 0")
+    dataset_sha256 = dataset_sha256 or file_sha256(dataset_path)
+
+    # Pass 1: vocab, head vocab, labels.
+    observed: set[str] = set()
+    label_counts: Counter[tuple[Any, ...]] = Counter()
+    head_vocab: HeadVocab | None = None
+    for row in iter_dataset(dataset_path):
+        tokens = row_tokens(row)
+        if tokens is not None:
+            observed.update(tokens)
+        planner_input = row.get("planner_input")
+        if not isinstance(planner_input, dict):
+            continue
+        action_space = planner_input.get("action_space")
+        if head_vocab is None and isinstance(action_space, dict):
+            candidate = HeadVocab.from_action_space_dict(action_space)
+            if candidate.swarm_ids:
+                head_vocab = candidate
+        label = row_label(row)
+        if label is not None:
+            label_counts[label] += 1
+    if head_vocab is None:
+        head_vocab = dataset_action_space([])
+    vocab = build_vocab_from_token_streams([observed])
+
+    count = sum(n for label, n in label_counts.items() if label_ids(label, head_vocab) is not None)
+
+    tmp_dir = out_dir.with_name(f"{out_dir.name}.tmp-{os.getpid()}")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+    try:
+        input_ids = np.lib.format.open_memmap(
+            tmp_dir / "input_ids.npy", mode="w+", dtype=np.int32, shape=(count, seq_len)
+        )
+        attention_mask = np.lib.format.open_memmap(
+            tmp_dir / "attention_mask.npy", mode="w+", dtype=np.int32, shape=(count, seq_len)
+        )
+        labels = np.lib.format.open_memmap(
+            tmp_dir / "labels.npy", mode="w+", dtype=np.int32, shape=(count, 4)
+        )
+
+        # Pass 2: encode in file order (the order `encode_dataset` produces).
+        split_rows: dict[str, array[int]] = {}
+        i = 0
+        for row in iter_dataset(dataset_path):
+            planner_input = row.get("planner_input")
+            if not isinstance(planner_input, dict):
+                continue
+            label = row_label(row)
+            ids = label_ids(label, head_vocab) if label is not None else None
+            if ids is None:
+                continue
+            row_ids, row_mask = encode_tokens(row_tokens(row) or [], vocab=vocab, seq_len=seq_len)
+            input_ids[i] = row_ids
+            attention_mask[i] = row_mask
+            labels[i] = ids
+            split_rows.setdefault(str(row.get("split") or "train"), array("q")).append(i)
+            i += 1
+        if i != count:
+            raise RuntimeError(f"Dataset changed while compiling: {dataset_path}")
+
+        for arr in (input_ids, attention_mask, labels):
+            arr.flush()
+        del input_ids, attention_mask, labels
+
+        splits: dict[str, dict[str, Any]] = {}
+        for n, (name, rows) in enumerate(sorted(split_rows.items())):
+            file_name = f"split_{n}.npy"
+            np.save(tmp_dir / file_name, np.frombuffer(rows, dtype=np.int64))
+            splits[name] = {"file": file_name, "count": len(rows)}
+
+        (tmp_dir / "vocab.json").write_text(
+            json.dumps(vocab.to_dict(), indent=2, sort_keys=True) + "\n"
+        )
+        manifest = {
+            "schema_version": SCHEMA_COMPILED_DATASET_V1,
+            "format_version": COMPILED_FORMAT_VERSION,
+            "dataset": str(dataset_path),
+            "dataset_sha256": dataset_sha256,
+            "seq_len": seq_len,
+            "count": count,
+            "splits": splits,
+            "head_vocab": _head_vocab_dict(head_vocab),
+            "vocab_size": len(vocab.tokens),
+            "vocab_sha256": hashlib.sha256("\n".join(vocab.tokens).encode("utf-8")).hexdigest(),
+        }
+        (tmp_dir / "manifest.json").write_text(
+            json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+        )
+
+        shutil.rmtree(out_dir, ignore_errors=True)
+        os.replace(tmp_dir, out_dir)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    return CompiledDataset.open(out_dir)
+
+
+def _is_current(root: Path, *, seq_len: int, dataset_sha256: str) -> bool:
+    try:
+        manifest = json.loads((root / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return (
+        isinstance(manifest, dict)
+        and manifest.get("format_version") == COMPILED_FORMAT_VERSION
+        and manifest.get("dataset_sha256") == dataset_sha256
+        and manifest.get("seq_len") == seq_len
+    )
+
+
+def load_compiled_dataset(
+    dataset_path: Path,
+    *,
+    seq_len: int,
+    cache_dir: Path | None = None,
+) -> CompiledDataset:
+    """
+    Open the compiled form of `dataset_path`, compiling it on first use.
+
+    Only the dataset file is hashed on a cache hit; nothing is tokenized.
+    """
+    dataset_path = Path(dataset_path).resolve()
+    dataset_sha256 = file_sha256(dataset_path)
+    root = compiled_dir_for(dataset_path, seq_len=seq_len, dataset_sha256=dataset_sha256)
+    if cache_dir is not None:
+        root = Path(cache_dir) / root.name
+
+    if _is_current(root, seq_len=seq_len, dataset_sha256=dataset_sha256):
+        return CompiledDataset.open(root)
+    return compile_dataset(dataset_path, root, seq_len=seq_len, dataset_sha256=dataset_sha256)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -74,21 +74,25 @@ class EncodedExample:
     label_max_iterations: int
 
 
-def _read_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+def iter_dataset(path: Path) -> Iterator[dict[str, Any]]:
+    """Stream JSONL rows without holding the file in memory."""
     if not path.exists():
-        return rows
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            item = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(item, dict):
-            rows.append(item)
-    return rows
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(item, dict):
+                yield item
+
+
+def _read_jsonl(path: Path) -> list[dict[str, Any]]:
+    return list(iter_dataset(path))
 
 
 def load_dataset(path: Path) -> list[dict[str, Any]]:
@@ -114,16 +118,73 @@ def dataset_action_space(rows: list[dict[str, Any]]) -> HeadVocab:
     )
 
 
-def build_vocab(rows: list[dict[str, Any]]) -> Vocab:
+def row_tokens(row: dict[str, Any]) -> list[str] | None:
+    """Pre-tokenized `tokens` when present, else tokens of `planner_input`."""
+    tokens = row.get("tokens")
+    if isinstance(tokens, list) and all(isinstance(t, str) for t in tokens):
+        return [str(t) for t in tokens]
+    planner_input = row.get("planner_input")
+    if isinstance(planner_input, dict):
+        return tokenize_planner_input(planner_input)
+    return None
+
+
+def _as_bin(value: Any) -> BudgetBin:
+    if value == NA:
+        return NA
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, str) and value.strip().upper() == "NA":
+        return NA
+    return NA
+
+
+def row_label(row: dict[str, Any]) -> tuple[str, BudgetBin, BudgetBin, BudgetBin] | None:
+    """`label_action` as `(swarm_id, max_candidates, max_minutes, max_iterations)` bins."""
+    label_action = row.get("label_action")
+    if not isinstance(label_action, dict):
+        return None
+    swarm_id = label_action.get("swarm_id")
+    if not isinstance(swarm_id, str):
+        return None
+    budgets = label_action.get("budgets")
+    budgets = budgets if isinstance(budgets, dict) else {}
+    return (
+        swarm_id,
+        _as_bin(budgets.get("max_candidates_bin")),
+        _as_bin(budgets.get("max_minutes_bin")),
+        _as_bin(budgets.get("max_iterations_bin")),
+    )
+
+
+def label_ids(
+    label: tuple[str, BudgetBin, BudgetBin, BudgetBin],
+    head_vocab: HeadVocab,
+) -> tuple[int, int, int, int] | None:
+    """Per-head class ids for a label, or None when any bin is outside `head_vocab`."""
+    ids: list[int] = []
+    for value, bins in zip(
+        label,
+        (
+            head_vocab.swarm_ids,
+            head_vocab.max_candidates_bins,
+            head_vocab.max_minutes_bins,
+            head_vocab.max_iterations_bins,
+        ),
+        strict=True,
+    ):
+        if value not in bins:
+            return None
+        ids.append(bins.index(value))
+    return ids[0], ids[1], ids[2], ids[3]
+
+
+def build_vocab(rows: Iterable[dict[str, Any]]) -> Vocab:
     streams: list[list[str]] = []
     for row in rows:
-        tokens = row.get("tokens")
-        if isinstance(tokens, list) and all(isinstance(t, str) for t in tokens):
-            streams.append([str(t) for t in tokens])
-            continue
-        planner_input = row.get("planner_input")
-        if isinstance(planner_input, dict):
-            streams.append(tokenize_planner_input(planner_input))
+        tokens = row_tokens(row)
+        if tokens is not None:
+            streams.append(tokens)
     return build_vocab_from_token_streams(streams)
 
 
@@ -134,11 +195,6 @@ def encode_dataset(
     head_vocab: HeadVocab,
     seq_len: int,
 ) -> list[EncodedExample]:
-    swarm_to_id = {s: i for i, s in enumerate(head_vocab.swarm_ids)}
-    candidates_to_id = {b: i for i, b in enumerate(head_vocab.max_candidates_bins)}
-    minutes_to_id = {b: i for i, b in enumerate(head_vocab.max_minutes_bins)}
-    iterations_to_id = {b: i for i, b in enumerate(head_vocab.max_iterations_bins)}
-
     encoded: list[EncodedExample] = []
     for row in rows:
         split = str(row.get("split") or "train")
@@ -147,43 +203,13 @@ def encode_dataset(
             continue
         job_type = str(planner_input.get("job_type") or "code")
 
-        tokens = row.get("tokens")
-        if isinstance(tokens, list) and all(isinstance(t, str) for t in tokens):
-            toks = [str(t) for t in tokens]
-        else:
-            toks = tokenize_planner_input(planner_input)
-
-        input_ids, attention_mask = encode_tokens(toks, vocab=vocab, seq_len=seq_len)
-
-        label_action = row.get("label_action")
-        if not isinstance(label_action, dict):
-            continue
-        swarm_id = label_action.get("swarm_id")
-        if not isinstance(swarm_id, str) or swarm_id not in swarm_to_id:
+        label = row_label(row)
+        ids = label_ids(label, head_vocab) if label is not None else None
+        if ids is None:
             continue
 
-        budgets = label_action.get("budgets")
-        budgets = budgets if isinstance(budgets, dict) else {}
-
-        def _as_bin(value: Any) -> BudgetBin:
-            if value == NA:
-                return NA
-            if isinstance(value, int):
-                return int(value)
-            if isinstance(value, str) and value.strip().upper() == "NA":
-                return NA
-            return NA
-
-        max_candidates = _as_bin(budgets.get("max_candidates_bin"))
-        max_minutes = _as_bin(budgets.get("max_minutes_bin"))
-        max_iterations = _as_bin(budgets.get("max_iterations_bin"))
-
-        if max_candidates not in candidates_to_id:
-            continue
-        if max_minutes not in minutes_to_id:
-            continue
-        if max_iterations not in iterations_to_id:
-            continue
+        toks = row_tokens(row) or []
+        input_ids, attention_mask = encode_tokens(toks, vocab=vocab, seq_len=seq_len)
 
         encoded.append(
             EncodedExample(
@@ -191,10 +217,10 @@ def encode_dataset(
                 job_type=job_type,
                 input_ids=input_ids,
                 attention_mask=attention_mask,
-                label_swarm=swarm_to_id[swarm_id],
-                label_max_candidates=candidates_to_id[max_candidates],
-                label_max_minutes=minutes_to_id[max_minutes],
-                label_max_iterations=iterations_to_id[max_iterations],
+                label_swarm=ids[0],
+                label_max_candidates=ids[1],
+                label_max_minutes=ids[2],
+                label_max_iterations=ids[3],
             )
         )
 
@@ -7,13 +7,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from cyntra.planner.training.data import (
-    EncodedExample,
-    build_vocab,
-    dataset_action_space,
-    encode_dataset,
-    load_dataset,
-)
+import numpy as np
+
+from cyntra.planner.training.compiled import CompiledDataset, load_compiled_dataset
 from cyntra.planner.training.model import (
     HeadSizes,
     PlannerMLP,
@@ -46,21 +42,18 @@ def _set_seeds(seed: int) -> None:
         torch.cuda.manual_seed_all(seed)
 
 
-def _batches(items: list[EncodedExample], batch_size: int) -> list[list[EncodedExample]]:
-    out: list[list[EncodedExample]] = []
-    for i in range(0, len(items), batch_size):
-        out.append(items[i : i + batch_size])
-    return out
-
-
-def _as_tensor(batch: list[EncodedExample], *, seq_len: int) -> tuple[Any, Any, Any]:
-    input_ids = torch.tensor([ex.input_ids for ex in batch], dtype=torch.long)
-    attention_mask = torch.tensor([ex.attention_mask for ex in batch], dtype=torch.long)
+def _as_tensor(
+    batch: tuple[np.ndarray, np.ndarray, np.ndarray], *, seq_len: int
+) -> tuple[Any, Any, Any]:
+    ids, mask, label_ids = batch
+    input_ids = torch.from_numpy(np.asarray(ids, dtype=np.int64))
+    attention_mask = torch.from_numpy(np.asarray(mask, dtype=np.int64))
+    label_tensor = torch.from_numpy(np.asarray(label_ids, dtype=np.int64))
     labels = {
-        "swarm": torch.tensor([ex.label_swarm for ex in batch], dtype=torch.long),
-        "max_candidates": torch.tensor([ex.label_max_candidates for ex in batch], dtype=torch.long),
-        "max_minutes": torch.tensor([ex.label_max_minutes for ex in batch], dtype=torch.long),
-        "max_iterations": torch.tensor([ex.label_max_iterations for ex in batch], dtype=torch.long),
+        "swarm": label_tensor[:, 0],
+        "max_candidates": label_tensor[:, 1],
+        "max_minutes": label_tensor[:, 2],
+        "max_iterations": label_tensor[:, 3],
     }
     # Defensive shape checks.
     if input_ids.shape[1] != seq_len:
@@ -97,9 +90,12 @@ def _exact_match(
 
 
 @torch.no_grad()
-def evaluate(model: Any, items: list[EncodedExample], *, config: TrainConfig) -> dict[str, Any]:
+def evaluate(
+    model: Any, data: CompiledDataset, split: str, *, config: TrainConfig
+) -> dict[str, Any]:
     model.eval()
-    if not items:
+    count = data.count(split)
+    if not count:
         return {
             "count": 0,
             "loss": None,
@@ -118,7 +114,7 @@ def evaluate(model: Any, items: list[EncodedExample], *, config: TrainConfig) ->
     acc_iterations = 0.0
     exact = 0.0
 
-    for batch in _batches(items, config.batch_size):
+    for batch in data.iter_batches(split, config.batch_size):
         input_ids, attention_mask, labels = _as_tensor(batch, seq_len=config.seq_len)
         logits = model(input_ids, attention_mask)
         swarm_logits, candidates_logits, minutes_logits, iterations_logits = logits
@@ -146,7 +142,7 @@ def evaluate(model: Any, items: list[EncodedExample], *, config: TrainConfig) ->
 
     denom = float(total_batches) if total_batches else 1.0
     return {
-        "count": len(items),
+        "count": count,
         "loss": total_loss / denom,
         "acc_swarm": acc_swarm / denom,
         "acc_max_candidates": acc_candidates / denom,
@@ -162,16 +158,12 @@ def train_mlp(
     out_dir: Path,
     config: TrainConfig,
 ) -> dict[str, Any]:
-    rows = load_dataset(dataset_path)
-    head_vocab = dataset_action_space(rows)
-    vocab = build_vocab(rows)
-    examples = encode_dataset(rows, vocab=vocab, head_vocab=head_vocab, seq_len=config.seq_len)
-
-    train_items = [ex for ex in examples if ex.split == "train"]
-    val_items = [ex for ex in examples if ex.split == "val"]
-    test_items = [ex for ex in examples if ex.split == "test"]
+    data = load_compiled_dataset(dataset_path, seq_len=config.seq_len)
+    vocab = data.vocab
+    head_vocab = data.head_vocab
 
     _set_seeds(config.seed)
+    rng = np.random.default_rng(config.seed)
 
     head_sizes = HeadSizes(
         swarm=len(head_vocab.swarm_ids),
@@ -200,10 +192,9 @@ def train_mlp(
     best_state: dict[str, Any] | None = None
 
     for epoch in range(config.epochs):
-        random.shuffle(train_items)
         total = 0.0
         n = 0
-        for batch in _batches(train_items, config.batch_size):
+        for batch in data.iter_batches("train", config.batch_size, rng=rng):
             input_ids, attention_mask, labels = _as_tensor(batch, seq_len=config.seq_len)
             opt.zero_grad(set_to_none=True)
 
@@ -222,9 +213,9 @@ def train_mlp(
             total += float(loss.item())
             n += 1
 
-        val_metrics = evaluate(model, val_items, config=config)
+        val_metrics = evaluate(model, data, "val", config=config)
         val_loss = float(val_metrics["loss"] or 0.0)
-        if val_items and val_loss < best_val:
+        if val_metrics["count"] and val_loss < best_val:
             best_val = val_loss
             best_state = {k: v.detach().cpu() for k, v in model.state_dict().items()}
 
@@ -282,10 +273,11 @@ def train_mlp(
     metrics = {
         "schema_version": "cyntra.planner_train_report.v1",
         "dataset": str(dataset_path),
-        "counts": {"train": len(train_items), "val": len(val_items), "test": len(test_items)},
-        "train": evaluate(model, train_items, config=config),
-        "val": evaluate(model, val_items, config=config),
-        "test": evaluate(model, test_items, config=config),
+        "compiled_dataset": str(data.root),
+        "counts": {split: data.count(split) for split in ("train", "val", "test")},
+        "train": evaluate(model, data, "train", config=config),
+        "val": evaluate(model, data, "val", config=config),
+        "test": evaluate(model, data, "test", config=config),
         "vocab_size": len(vocab.tokens),
         "head_sizes": head_sizes.__dict__,
     }
@@ -300,16 +292,12 @@ def train_transformer(
     out_dir: Path,
     config: TrainConfig,
 ) -> dict[str, Any]:
-    rows = load_dataset(dataset_path)
-    vocab = build_vocab(rows)
-    head_vocab = dataset_action_space(rows)
-    encoded = encode_dataset(rows, vocab=vocab, head_vocab=head_vocab, seq_len=config.seq_len)
-
-    train_items = [e for e in encoded if e.split == "train"]
-    val_items = [e for e in encoded if e.split == "val"]
-    test_items = [e for e in encoded if e.split == "test"]
+    data = load_compiled_dataset(dataset_path, seq_len=config.seq_len)
+    vocab = data.vocab
+    head_vocab = data.head_vocab
 
     _set_seeds(config.seed)
+    rng = np.random.default_rng(config.seed)
 
     head_sizes = HeadSizes(
         swarm=len(head_vocab.swarm_ids),
@@ -340,10 +328,9 @@ def train_transformer(
     best_state: dict[str, Any] | None = None
 
     for epoch in range(config.epochs):
-        random.shuffle(train_items)
         total = 0.0
         n = 0
-        for batch in _batches(train_items, config.batch_size):
+        for batch in data.iter_batches("train", config.batch_size, rng=rng):
             input_ids, attention_mask, labels = _as_tensor(batch, seq_len=config.seq_len)
             opt.zero_grad(set_to_none=True)
 
@@ -362,9 +349,9 @@ def train_transformer(
             total += float(loss.item())
             n += 1
 
-        val_metrics = evaluate(model, val_items, config=config)
+        val_metrics = evaluate(model, data, "val", config=config)
         val_loss = float(val_metrics["loss"] or 0.0)
-        if val_items and val_loss < best_val:
+        if val_metrics["count"] and val_loss < best_val:
             best_val = val_loss
             best_state = {k: v.detach().cpu() for k, v in model.state_dict().items()}
 
@@ -429,10 +416,11 @@ def train_transformer(
     metrics = {
         "schema_version": "cyntra.planner_train_report.v1",
         "dataset": str(dataset_path),
-        "counts": {"train": len(train_items), "val": len(val_items), "test": len(test_items)},
-        "train": evaluate(model, train_items, config=config),
-        "val": evaluate(model, val_items, config=config),
-        "test": evaluate(model, test_items, config=config),
+        "compiled_dataset": str(data.root),
+        "counts": {split: data.count(split) for split in ("train", "val", "test")},
+        "train": evaluate(model, data, "train", config=config),
+        "val": evaluate(model, data, "val", config=config),
+        "test": evaluate(model, data, "test", config=config),
         "vocab_size": len(vocab.tokens),
         "head_sizes": head_sizes.__dict__,
         "arch": "transformer",
@@ -452,16 +440,12 @@ def train_recurrent(
     out_dir: Path,
     config: TrainConfig,
 ) -> dict[str, Any]:
-    rows = load_dataset(dataset_path)
-    vocab = build_vocab(rows)
-    head_vocab = dataset_action_space(rows)
-    encoded = encode_dataset(rows, vocab=vocab, head_vocab=head_vocab, seq_len=config.seq_len)
-
-    train_items = [e for e in encoded if e.split == "train"]
-    val_items = [e for e in encoded if e.split == "val"]
-    test_items = [e for e in encoded if e.split == "test"]
+    data = load_compiled_dataset(dataset_path, seq_len=config.seq_len)
+    vocab = data.vocab
+    head_vocab = data.head_vocab
 
     _set_seeds(config.seed)
+    rng = np.random.default_rng(config.seed)
 
     head_sizes = HeadSizes(
         swarm=len(head_vocab.swarm_ids),
@@ -490,10 +474,9 @@ def train_recurrent(
     best_state: dict[str, Any] | None = None
 
     for epoch in range(config.epochs):
-        random.shuffle(train_items)
         total = 0.0
         n = 0
-        for batch in _batches(train_items, config.batch_size):
+        for batch in data.iter_batches("train", config.batch_size, rng=rng):
             input_ids, attention_mask, labels = _as_tensor(batch, seq_len=config.seq_len)
             opt.zero_grad(set_to_none=True)
 
@@ -516,9 +499,9 @@ def train_recurrent(
             total += float(loss.item())
             n += 1
 
-        val_metrics = evaluate(model, val_items, config=config)
+        val_metrics = evaluate(model, data, "val", config=config)
         val_loss = float(val_metrics["loss"] or 0.0)
-        if val_items and val_loss < best_val:
+        if val_metrics["count"] and val_loss < best_val:
             best_val = val_loss
             best_state = {k: v.detach().cpu() for k, v in model.state_dict().items()}
 
@@ -582,10 +565,11 @@ def train_recurrent(
     metrics = {
         "schema_version": "cyntra.planner_train_report.v1",
         "dataset": str(dataset_path),
-        "counts": {"train": len(train_items), "val": len(val_items), "test": len(test_items)},
-        "train": evaluate(model, train_items, config=config),
-        "val": evaluate(model, val_items, config=config),
-        "test": evaluate(model, test_items, config=config),
+        "compiled_dataset": str(data.root),
+        "counts": {split: data.count(split) for split in ("train", "val", "test")},
+        "train": evaluate(model, data, "train", config=config),
+        "val": evaluate(model, data, "val", config=config),
+        "test": evaluate(model, data, "test", config=config),
         "vocab_size": len(vocab.tokens),
         "head_sizes": head_sizes.__dict__,
         "arch": "recurrent",
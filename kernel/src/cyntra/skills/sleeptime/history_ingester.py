@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sqlite3
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -62,9 +63,16 @@ class HistoryIngester:
         self,
         runs_dir: Path | str = ".cyntra/runs",
         watermark_path: Path | str = ".cyntra/sleeptime/ingester_watermark.json",
+        catalog_path: Path | str | None = None,
     ):
         self.runs_dir = Path(runs_dir)
         self.watermark_path = Path(watermark_path)
+        # Shared with the planner's run-summary catalog by default
+        self.catalog_path = (
+            Path(catalog_path)
+            if catalog_path
+            else self.runs_dir.parent / "planner" / "run_catalog.db"
+        )
 
     def load_watermark(self) -> WatermarkState | None:
         """Load last processing watermark."""
@@ -73,7 +81,7 @@ class HistoryIngester:
         try:
             data = json.loads(self.watermark_path.read_text())
             return WatermarkState(**data)
-        except Exception:
+        except (OSError, ValueError, TypeError):
             return None
 
     def save_watermark(self, state: WatermarkState) -> None:
@@ -86,10 +94,40 @@ class HistoryIngester:
         since_timestamp: str | None = None,
         max_runs: int = 20,
     ) -> list[Path]:
-        """Find run directories newer than watermark."""
+        """
+        Find run directories newer than watermark.
+
+        Reads the run-summary catalog, which only re-reads run directories
+        that are new or changed since the last refresh. Falls back to
+        scanning every manifest if the catalog can't be opened.
+        """
         if not self.runs_dir.exists():
             return []
 
+        try:
+            from cyntra.planner.run_catalog import RunCatalog
+            from cyntra.planner.time_utils import parse_rfc3339_to_ms
+
+            catalog = RunCatalog(
+                self.catalog_path,
+                repo_root=self.runs_dir.resolve().parent.parent,
+                runs_dir=self.runs_dir,
+            )
+            try:
+                catalog.refresh()
+                run_dirs = catalog.run_dirs(
+                    self.runs_dir,
+                    since_ms=parse_rfc3339_to_ms(since_timestamp) if since_timestamp else None,
+                )
+            finally:
+                catalog.close()
+        except (OSError, sqlite3.Error):
+            return self._scan_runs(since_timestamp, max_runs)
+
+        return [d for d in run_dirs if (d / "manifest.json").exists()][:max_runs]
+
+    def _scan_runs(self, since_timestamp: str | None, max_runs: int) -> list[Path]:
+        """Read every run manifest to find runs newer than the watermark."""
         runs = []
         for run_dir in self.runs_dir.iterdir():
             if not run_dir.is_dir():
@@ -100,12 +138,14 @@ class HistoryIngester:
 
             try:
                 meta = json.loads(manifest.read_text())
-                started = meta.get("started_at", "")
-                if since_timestamp and started <= since_timestamp:
-                    continue
-                runs.append((started, run_dir))
-            except Exception:
+            except (OSError, ValueError):
+                continue
+            if not isinstance(meta, dict):
                 continue
+            started = str(meta.get("started_at", ""))
+            if since_timestamp and started <= since_timestamp:
+                continue
+            runs.append((started, run_dir))
 
         # Sort by start time, take most recent
         runs.sort(key=lambda x: x[0], reverse=True)
@@ -121,19 +161,21 @@ class HistoryIngester:
             for line in tools_log.read_text().splitlines():
                 try:
                     entry = json.loads(line)
-                    tool_name = entry.get("tool", "unknown")
-                    sequence.append(tool_name)
-                    calls.append(
-                        ToolCall(
-                            name=tool_name,
-                            timestamp=entry.get("timestamp", ""),
-                            duration_ms=entry.get("duration_ms", 0),
-                            success=entry.get("success", True),
-                            error=entry.get("error"),
-                        )
-                    )
-                except Exception:
+                except ValueError:
                     continue
+                if not isinstance(entry, dict):
+                    continue
+                tool_name = entry.get("tool", "unknown")
+                sequence.append(tool_name)
+                calls.append(
+                    ToolCall(
+                        name=tool_name,
+                        timestamp=entry.get("timestamp", ""),
+                        duration_ms=entry.get("duration_ms", 0),
+                        success=entry.get("success", True),
+                        error=entry.get("error"),
+                    )
+                )
 
         return sequence, calls
 
@@ -175,9 +217,10 @@ class HistoryIngester:
         if not gates_file.exists():
             return {}
         try:
-            return json.loads(gates_file.read_text())
-        except Exception:
+            gates = json.loads(gates_file.read_text())
+        except (OSError, ValueError):
             return {}
+        return gates if isinstance(gates, dict) else {}
 
     def summarize_run(self, run_dir: Path) -> RunSummary | None:
         """Generate structured summary for a single run."""
@@ -187,7 +230,9 @@ class HistoryIngester:
 
         try:
             meta = json.loads(manifest.read_text())
-        except Exception:
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict):
             return None
 
         tool_sequence, tool_calls = self.extract_tool_sequence(run_dir)
@@ -5,7 +5,10 @@ Modules:
     manager     - Atomic read/write to Beads
     beads       - Beads CLI wrapper
     models      - Issue, Dep, and related data models
+    mutation_log - Append-only log for file-mode issue writes
+    sqlite_pool - Shared SQLite writer + read-only connection pool
     transitions - Status state machine transitions
+    watch       - Beads change notification (inotify or stat polling)
 """
 
 from cyntra.state.manager import StateManager
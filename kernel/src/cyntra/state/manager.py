@@ -10,14 +10,24 @@ Responsibilities:
 
 Supports two modes:
 1. bd CLI (preferred) - uses Beads CLI commands
-2. Direct file parsing (fallback) - reads .beads/*.jsonl files directly
+2. Direct file parsing (fallback) - reads .beads/*.jsonl files directly;
+   issue writes are appended to an IssueMutationLog that is replayed on
+   top of issues.jsonl and compacted into it (see mutation_log.py)
+
+With `cached=True` the manager keeps the graph in memory: reads are served
+from the cache, mutations are applied to it immediately and queued, and
+`flush()` writes the queue out as one batched bd call (or one mutation log
+append). Other writers' logged issue writes are applied to the cache as
+deltas; any other change to the .beads files drops it.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import subprocess
+from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -25,7 +35,24 @@ from typing import TYPE_CHECKING, Any
 import structlog
 import yaml
 
-from cyntra.state.models import BeadsGraph, Dep, Issue
+from cyntra.observability.event_log import append_event_line
+from cyntra.state.models import BeadsGraph, Dep, GraphDelta, Issue
+from cyntra.state.mutation_log import (
+    LOCK_FILE,
+    MUTATION_LOG_FILE,
+    NO_SNAPSHOT,
+    CommitResult,
+    IssueMutationLog,
+    LogCursor,
+    SnapshotKey,
+    apply_update,
+    committed_since,
+    create_record,
+    next_issue_id,
+    replay,
+    snapshot_key,
+    update_record,
+)
 
 
 def _utc_now() -> datetime:
@@ -39,17 +66,37 @@ if TYPE_CHECKING:
 logger = structlog.get_logger()
 
 
+@dataclass
+class _PendingUpdate:
+    """Queued changes for one issue, merged across update_issue calls."""
+
+    status: str | None = None
+    tags: list[str] = field(default_factory=list)
+    fields: dict[str, str] = field(default_factory=dict)
+
+    def merge(self, status: str | None, tags: list[str] | None, fields: dict[str, str]) -> None:
+        if status:
+            self.status = status
+        for tag in tags or ():
+            if tag not in self.tags:
+                self.tags.append(tag)
+        self.fields.update(fields)
+
+
 class StateManager:
     """
     Manages Beads state with atomic operations.
 
-    Supports both bd CLI and direct file access modes.
+    Supports both bd CLI and direct file access modes, optionally behind a
+    write-through in-memory cache (`cached=True`).
     """
 
     def __init__(
         self,
         config: KernelConfig | None = None,
         repo_root: Path | None = None,
+        *,
+        cached: bool = False,
     ) -> None:
         if config:
             self.repo_root = config.repo_root
@@ -69,6 +116,17 @@ class StateManager:
             self.logs_dir = self.repo_root / ".cyntra" / "logs"
         self._bd_available: bool | None = None
 
+        # Write-through cache (cached mode only)
+        self.cached = cached
+        self._graph: BeadsGraph | None = None
+        self._graph_signature: tuple | None = None
+        self._pending_updates: dict[str, _PendingUpdate] = {}
+        self._pending_issues: list[dict[str, Any]] = []
+        self._pending_deps: list[Dep] = []
+        self._log_cursor: LogCursor | None = None
+
+        self.mutation_log = IssueMutationLog(self.beads_dir)
+
     @property
     def bd_available(self) -> bool:
         """Check if bd CLI is available."""
@@ -80,8 +138,16 @@ class StateManager:
         """
         Load the full Beads work graph.
 
-        Tries bd CLI first, falls back to direct file parsing.
+        Tries bd CLI first, falls back to direct file parsing. In cached mode
+        the in-memory graph (including unflushed mutations) is returned as a
+        shallow copy and only re-read if the .beads files changed externally.
         """
+        if self.cached:
+            return self._cached_graph()
+        return self._read_graph()
+
+    def _read_graph(self) -> BeadsGraph:
+        """Read the graph from bd or the .beads files."""
         issues = self._load_issues()
         deps = self._load_deps()
 
@@ -141,8 +207,12 @@ class StateManager:
         """
         Update an issue atomically.
 
-        Uses bd CLI if available, otherwise updates file directly.
+        Uses bd CLI if available, otherwise updates file directly. In cached
+        mode the change is applied in memory and queued until `flush()`.
         """
+        if self.cached:
+            return self._queue_update(issue_id, status, tags, fields)
+
         if self.bd_available:
             return self._update_issue_via_cli(issue_id, status, tags, **fields)
 
@@ -160,8 +230,15 @@ class StateManager:
 
         Returns the new issue ID or None on failure.
         """
+        if self.cached and not self.bd_available:
+            return self._queue_create(title, description, priority, tags)
+
         if self.bd_available:
-            return self._create_issue_via_cli(title, description, priority, tags)
+            # bd assigns the id, so creation cannot be deferred.
+            issue_id = self._create_issue_via_cli(title, description, priority, tags)
+            if self.cached and issue_id:
+                self._invalidate_cache()
+            return issue_id
 
         return self._create_issue_via_file(title, description, priority, tags)
 
@@ -178,6 +255,12 @@ class StateManager:
         """
         Add a dependency edge between issues.
         """
+        if self.cached:
+            dep = Dep(from_id=from_id, to_id=to_id, dep_type=dep_type, created=_utc_now())
+            self._cached_graph(copy=False).deps.append(dep)
+            self._pending_deps.append(dep)
+            return True
+
         if self.bd_available:
             return self._add_dep_via_cli(from_id, to_id, dep_type)
 
@@ -217,34 +300,53 @@ class StateManager:
             return []
 
     def _load_issues_from_files(self) -> list[Issue]:
-        """Load issues directly from .beads files."""
-        issues: list[Issue] = []
+        """Load issues directly from .beads files, with the mutation log replayed."""
+        with self.mutation_log.lock(shared=True):
+            key = snapshot_key(self.mutation_log.snapshot_path)
+            records = self._load_issue_records()
+            entries, self._log_cursor = self.mutation_log.read()
+
+        # A later record for an id replaces the earlier one, as it does when
+        # the watcher reads it appended (an upsert).
+        issues: dict[str, Issue] = {}
+        for data in replay(records, entries, key):
+            try:
+                issue = Issue.from_dict(data)
+            except Exception as e:
+                logger.warning("Failed to parse issue", issue_id=data.get("id"), error=str(e))
+                continue
+            issues[issue.id] = issue
+        return list(issues.values())
+
+    def _load_issue_records(self) -> list[dict[str, Any]]:
+        """Load raw issue dicts from the snapshot (issues.jsonl, YAML or issues/)."""
+        records: list[dict[str, Any]] = []
 
         # Try issues.jsonl (JSON Lines format)
         jsonl_file = self.beads_dir / "issues.jsonl"
         if jsonl_file.exists():
-            issues.extend(self._parse_jsonl_file(jsonl_file, Issue.from_dict))
-            if issues:
-                return issues
+            records.extend(self._parse_jsonl_file(jsonl_file, dict))
+            if records:
+                return records
 
         # Try issues.yaml / issues.yml
         for ext in ("yaml", "yml"):
             yaml_file = self.beads_dir / f"issues.{ext}"
             if yaml_file.exists():
-                issues.extend(self._parse_yaml_file(yaml_file, Issue.from_dict))
-                if issues:
-                    return issues
+                records.extend(self._parse_yaml_file(yaml_file, dict))
+                if records:
+                    return records
 
         # Try individual issue files in issues/ directory
         issues_dir = self.beads_dir / "issues"
         if issues_dir.exists() and issues_dir.is_dir():
             for path in issues_dir.iterdir():
                 if path.suffix in (".json", ".yaml", ".yml"):
-                    issue = self._parse_single_issue_file(path)
-                    if issue:
-                        issues.append(issue)
+                    data = self._read_issue_file(path)
+                    if data is not None:
+                        records.append(data)
 
-        return issues
+        return records
 
     def _parse_jsonl_file(self, path: Path, factory: callable) -> list:
         """Parse a JSON Lines file."""
@@ -298,6 +400,11 @@ class StateManager:
 
     def _parse_single_issue_file(self, path: Path) -> Issue | None:
         """Parse a single issue file (JSON or YAML)."""
+        data = self._read_issue_file(path)
+        return Issue.from_dict(data) if data is not None else None
+
+    def _read_issue_file(self, path: Path) -> dict[str, Any] | None:
+        """Read a single issue file (JSON or YAML) as a raw dict."""
         try:
             with open(path) as f:
                 data = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
@@ -306,7 +413,7 @@ class StateManager:
                 # Use filename (without extension) as ID if not present
                 if "id" not in data:
                     data["id"] = path.stem
-                return Issue.from_dict(data)
+                return data
 
         except (json.JSONDecodeError, yaml.YAMLError) as e:
             logger.warning("Invalid issue file", file=str(path), error=str(e))
@@ -366,7 +473,17 @@ class StateManager:
         **fields: str,
     ) -> bool:
         """Update issue via bd CLI."""
-        cmd = ["bd", "update", issue_id]
+        return self._update_issues_via_cli([issue_id], status, tags, **fields)
+
+    def _update_issues_via_cli(
+        self,
+        issue_ids: list[str],
+        status: str | None = None,
+        tags: list[str] | None = None,
+        **fields: str,
+    ) -> bool:
+        """Apply the same update to several issues with one bd call."""
+        cmd = ["bd", "update", *issue_ids]
 
         if status:
             cmd.extend(["--status", status])
@@ -388,10 +505,10 @@ class StateManager:
         )
 
         if result.returncode != 0:
-            logger.error("Failed to update issue", issue_id=issue_id, error=result.stderr)
+            logger.error("Failed to update issue", issue_ids=issue_ids, error=result.stderr)
             return False
 
-        logger.info("Issue updated", issue_id=issue_id, status=status)
+        logger.info("Issue updated", issue_ids=issue_ids, status=status)
         return True
 
     def _create_issue_via_cli(
@@ -468,50 +585,28 @@ class StateManager:
         **fields: str,
     ) -> bool:
         """Update issue directly in file."""
-        jsonl_file = self.beads_dir / "issues.jsonl"
-
-        if not jsonl_file.exists():
-            logger.error("issues.jsonl not found", path=str(jsonl_file))
-            return False
-
-        # Read all issues
-        issues_data: list[dict] = []
-        found = False
-
-        with open(jsonl_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    if data.get("id") == issue_id:
-                        found = True
-                        if status:
-                            data["status"] = status
-                        if tags:
-                            data["tags"] = list(set(data.get("tags", []) + tags))
-                        for key, value in fields.items():
-                            data[key] = value
-                        data["updated"] = _utc_now().isoformat().replace("+00:00", "Z")
-                    issues_data.append(data)
-                except json.JSONDecodeError:
-                    continue
-
-        if not found:
+        result = self._commit_mutations({issue_id: _PendingUpdate(status, tags or [], fields)})
+        if result.missing:
             logger.error("Issue not found", issue_id=issue_id)
             return False
 
-        # Write back atomically
-        tmp_file = jsonl_file.with_suffix(".tmp")
-        with open(tmp_file, "w") as f:
-            for data in issues_data:
-                f.write(json.dumps(data) + "\n")
-
-        tmp_file.rename(jsonl_file)
         logger.info("Issue updated via file", issue_id=issue_id, status=status)
         return True
 
+    def _commit_mutations(
+        self,
+        updates: dict[str, _PendingUpdate],
+        new_issues: list[dict[str, Any]] | None = None,
+    ) -> CommitResult:
+        """Append creates and updates to the mutation log as one entry."""
+        now = _utc_now().isoformat().replace("+00:00", "Z")
+        records = [create_record(data) for data in new_issues or ()]
+        records.extend(
+            update_record(issue_id, u.status, u.tags, u.fields, now)
+            for issue_id, u in updates.items()
+        )
+        return self.mutation_log.commit(records)
+
     def _create_issue_via_file(
         self,
         title: str,
@@ -519,32 +614,57 @@ class StateManager:
         priority: str = "P2",
         tags: list[str] | None = None,
     ) -> str | None:
-        """Create issue directly in file."""
+        """Create issue directly in file; the id is assigned under the issue lock."""
+        issue_data = self._new_issue_record("", title, description, priority, tags)
+        issue_id = self._commit_mutations({}, [issue_data]).created[0]
+
+        logger.info("Issue created via file", issue_id=issue_id, title=title)
+        return issue_id
+
+    def _add_dep_via_file(self, from_id: str, to_id: str, dep_type: str) -> bool:
+        """Add dependency directly to file."""
+        dep = Dep(from_id=from_id, to_id=to_id, dep_type=dep_type, created=_utc_now())
+        self._append_deps_via_file([dep])
+
+        logger.info("Dependency added via file", from_id=from_id, to_id=to_id, type=dep_type)
+        return True
+
+    def _append_deps_via_file(self, deps: list[Dep]) -> SnapshotKey:
+        """Append dependency records to deps.jsonl in one write; returns its new key."""
         self.beads_dir.mkdir(parents=True, exist_ok=True)
-        jsonl_file = self.beads_dir / "issues.jsonl"
+        deps_file = self.beads_dir / "deps.jsonl"
 
-        # Generate ID
-        existing_ids = set()
-        if jsonl_file.exists():
-            with open(jsonl_file) as f:
-                for line in f:
-                    try:
-                        data = json.loads(line.strip())
-                        if "id" in data:
-                            existing_ids.add(data["id"])
-                    except json.JSONDecodeError:
-                        continue
+        lines = []
+        for dep in deps:
+            dep_data = {
+                "from": dep.from_id,
+                "to": dep.to_id,
+                "type": dep.dep_type,
+                "created": dep.created.isoformat().replace("+00:00", "Z"),
+            }
+            lines.append(json.dumps(dep_data) + "\n")
+
+        with open(deps_file, "a") as f:
+            f.write("".join(lines))
+            f.flush()
+            st = os.fstat(f.fileno())
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
 
-        # Find next available ID
-        issue_id = "1"
-        counter = 1
-        while issue_id in existing_ids:
-            counter += 1
-            issue_id = str(counter)
+    def _next_issue_id(self, existing_ids: set[str]) -> str:
+        """Find the next available numeric issue ID."""
+        return next_issue_id(existing_ids)
 
-        # Create issue data
+    def _new_issue_record(
+        self,
+        issue_id: str,
+        title: str,
+        description: str | None,
+        priority: str,
+        tags: list[str] | None,
+    ) -> dict[str, Any]:
+        """Build the JSONL record for a newly created issue."""
         now = _utc_now().isoformat().replace("+00:00", "Z")
-        issue_data = {
+        issue_data: dict[str, Any] = {
             "id": issue_id,
             "title": title,
             "status": "open",
@@ -559,32 +679,293 @@ class StateManager:
         if tags:
             issue_data["tags"] = tags
 
-        # Append to file
-        with open(jsonl_file, "a") as f:
-            f.write(json.dumps(issue_data) + "\n")
+        return issue_data
 
-        logger.info("Issue created via file", issue_id=issue_id, title=title)
-        return issue_id
+    # ===== Write-through Cache =====
 
-    def _add_dep_via_file(self, from_id: str, to_id: str, dep_type: str) -> bool:
-        """Add dependency directly to file."""
-        self.beads_dir.mkdir(parents=True, exist_ok=True)
-        deps_file = self.beads_dir / "deps.jsonl"
+    def flush(self) -> bool:
+        """
+        Write queued mutations to Beads (cached mode).
 
-        now = _utc_now().isoformat().replace("+00:00", "Z")
-        dep_data = {
-            "from": from_id,
-            "to": to_id,
-            "type": dep_type,
-            "created": now,
-        }
+        Issue updates sharing the same change go out as one `bd update`; in
+        file mode all updates and new issues are one mutation log append and
+        new deps one deps.jsonl append. Returns False if any
+        write failed.
+        """
+        if not self._has_pending():
+            return True
 
-        with open(deps_file, "a") as f:
-            f.write(json.dumps(dep_data) + "\n")
+        updates, self._pending_updates = self._pending_updates, {}
+        new_issues, self._pending_issues = self._pending_issues, []
+        new_deps, self._pending_deps = self._pending_deps, []
+        ok = True
 
-        logger.info("Dependency added via file", from_id=from_id, to_id=to_id, type=dep_type)
+        # Changes on disk since the cache was loaded are merged (logged
+        # issue writes) or force a reload; our writes land on top either way.
+        signature = self._beads_signature()
+        stale = self._graph is not None and self._changed_since_load(signature)
+        if stale and not self.bd_available and self._apply_log_tail(signature):
+            stale = False
+
+        if self.bd_available:
+            groups: dict[tuple, list[str]] = {}
+            for issue_id, update in updates.items():
+                key = (update.status, tuple(update.tags), tuple(sorted(update.fields.items())))
+                groups.setdefault(key, []).append(issue_id)
+            for (status, tags, fields), issue_ids in groups.items():
+                ok &= self._update_issues_via_cli(issue_ids, status, list(tags), **dict(fields))
+            for dep in new_deps:
+                ok &= self._add_dep_via_cli(dep.from_id, dep.to_id, dep.dep_type)
+        else:
+            if updates or new_issues:
+                result = self._commit_mutations(updates, new_issues)
+                if result.missing:
+                    logger.warning("Queued updates matched no issue", issue_ids=result.missing)
+                    ok = False
+                renamed = {
+                    data["id"]: issue_id
+                    for data, issue_id in zip(new_issues, result.created, strict=True)
+                    if data["id"] != issue_id
+                }
+                if renamed:
+                    # Another writer took these ids first.
+                    logger.warning("Reassigned ids of created issues", ids=renamed)
+                    new_deps = [
+                        replace(
+                            dep,
+                            from_id=renamed.get(dep.from_id, dep.from_id),
+                            to_id=renamed.get(dep.to_id, dep.to_id),
+                        )
+                        for dep in new_deps
+                    ]
+                    stale = True
+                elif self._log_cursor == result.before:
+                    # Nobody else wrote in between: take what was written and
+                    # skip our own log entry when tailing the log.
+                    self._log_cursor = result.after
+                    if self._graph is not None:
+                        self._put_issues(result.issues)
+                else:
+                    stale = True
+                signature = self._with_key(
+                    signature, self.mutation_log.snapshot_path, result.snapshot
+                )
+            if new_deps:
+                deps_key = self._append_deps_via_file(new_deps)
+                signature = self._with_key(signature, self.beads_dir / "deps.jsonl", deps_key)
+
+        logger.info(
+            "Flushed Beads mutations",
+            updates=len(updates),
+            created=len(new_issues),
+            deps=len(new_deps),
+            mode="cli" if self.bd_available else "file",
+        )
+
+        if stale:
+            logger.info("Beads changed externally, reloading cache")
+            self._invalidate_cache()
+        elif self._graph is not None:
+            # Our own writes must not look like an external edit. In file
+            # mode only the keys of the files we wrote are taken, so an edit
+            # that races the flush is still noticed.
+            if self.bd_available:
+                signature = self._beads_signature()
+            self._graph_signature = signature
+        return ok
+
+    def compact(self) -> None:
+        """
+        Flush, then fold the issue mutation log into issues.jsonl (file mode).
+
+        Call when idle or exiting, so tools that read issues.jsonl directly
+        see the kernel's writes. The cache stays valid.
+        """
+        self.flush()
+        if not self.bd_available and self.mutation_log.compact():
+            logger.debug("Compacted Beads issue log", path=str(self.mutation_log.path))
+
+    def _has_pending(self) -> bool:
+        return bool(self._pending_updates or self._pending_issues or self._pending_deps)
+
+    def _invalidate_cache(self) -> None:
+        self._graph = None
+        self._graph_signature = None
+
+    def _cached_graph(self, *, copy: bool = True) -> BeadsGraph:
+        """
+        Return the cached graph, refreshing it from Beads if needed.
+
+        Other writers' logged issue writes are applied in place; any other
+        change to the .beads files triggers a full reload.
+        """
+        signature = self._beads_signature()
+        changed = self._graph is None or self._changed_since_load(signature)
+        if (
+            self._graph is not None
+            and changed
+            and not self._has_pending()
+            and self._apply_log_tail(signature)
+        ):
+            self._graph_signature = signature
+            changed = False
+
+        if changed:
+            if self._graph is not None:
+                logger.info("Beads changed externally, reloading cache")
+            if self._has_pending():
+                # Re-apply our queued writes on top of the external edit.
+                self.flush()
+            self._graph_signature = self._beads_signature()
+            self._graph = self._read_graph()
+
+        if not copy:
+            return self._graph
+        return BeadsGraph(issues=list(self._graph.issues), deps=list(self._graph.deps))
+
+    def _apply_log_tail(self, signature: tuple) -> bool:
+        """
+        Apply logged issue writes we have not seen; False if a reload is needed.
+
+        Only possible when no file other than issues.jsonl changed and the
+        log entries after our cursor account for every change to it
+        (compactions).
+        """
+        known, rest = self._split_signature(self._graph_signature)
+        current, current_rest = self._split_signature(signature)
+        if self._log_cursor is None or rest != current_rest:
+            return False
+
+        try:
+            entries, cursor = self.mutation_log.read(self._log_cursor)
+        except ValueError:
+            return False
+        written = committed_since(entries, known, current)
+        if written is None:
+            return False
+
+        self._log_cursor = cursor
+        self._put_issues(written)
+        return True
+
+    def _changed_since_load(self, signature: tuple) -> bool:
+        """True if the .beads files or the mutation log moved since the cache was loaded."""
+        if signature != self._graph_signature:
+            return True
+        return not self.bd_available and self.mutation_log.cursor() != self._log_cursor
+
+    @staticmethod
+    def _with_key(signature: tuple, path: Path, key: SnapshotKey) -> tuple:
+        """`signature` with the entry for `path` set to `key` (inode, size, mtime)."""
+        entries = [entry for entry in signature if entry[0] != str(path)]
+        if key != NO_SNAPSHOT:
+            entries.append((str(path), *key))
+        return tuple(sorted(entries))
+
+    def _split_signature(self, signature: tuple | None) -> tuple[SnapshotKey, tuple]:
+        """Split a signature into the issues.jsonl key and everything else."""
+        snapshot = str(self.mutation_log.snapshot_path)
+        key = NO_SNAPSHOT
+        rest = []
+        for entry in signature or ():
+            if entry[0] == snapshot:
+                key = (entry[1], entry[2], entry[3])
+            else:
+                rest.append(entry)
+        return key, tuple(rest)
+
+    def _put_issues(self, written: list[dict[str, Any]]) -> None:
+        """Upsert logged issues into the cache, keeping fields not serialized."""
+        graph = self._graph
+        upserts: list[Issue] = []
+        for data in written:
+            try:
+                issue = Issue.from_dict(data)
+            except Exception as e:
+                logger.warning("Failed to parse issue", issue_id=data.get("id"), error=str(e))
+                continue
+            existing = graph.get_issue(issue.id)
+            if existing is not None:
+                issue = replace(
+                    issue, ready_since=existing.ready_since, dk_starved=existing.dk_starved
+                )
+            upserts.append(issue)
+        graph.apply(GraphDelta(upserted_issues=upserts))
+
+    def _beads_signature(self) -> tuple:
+        """
+        (name, inode, size, mtime) of everything bd or the file loader reads.
+
+        The mutation log is tracked separately by cursor.
+        """
+        if not self.beads_dir.is_dir():
+            return ()
+        paths = list(self.beads_dir.iterdir())
+        issues_dir = self.beads_dir / "issues"
+        if issues_dir.is_dir():
+            paths.extend(issues_dir.iterdir())
+
+        entries = []
+        for path in paths:
+            # SQLite touches its shared-memory file on reads.
+            if path.name.endswith(("-shm", ".tmp")) or path.name in (MUTATION_LOG_FILE, LOCK_FILE):
+                continue
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((str(path), st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(sorted(entries))
+
+    @staticmethod
+    def _updated_issue(issue: Issue, record: dict[str, Any]) -> Issue:
+        """Apply an update record to an Issue, keeping fields not serialized."""
+        data = issue.to_dict()
+        apply_update(data, record)
+        return replace(
+            Issue.from_dict(data),
+            ready_since=issue.ready_since,
+            dk_starved=issue.dk_starved,
+        )
+
+    def _queue_update(
+        self,
+        issue_id: str,
+        status: str | None,
+        tags: list[str] | None,
+        fields: dict[str, str],
+    ) -> bool:
+        graph = self._cached_graph(copy=False)
+        issue = graph.get_issue(issue_id)
+
+        if issue is None and not self.bd_available:
+            logger.error("Issue not found", issue_id=issue_id)
+            return False
+
+        if issue is not None:
+            now = _utc_now().isoformat().replace("+00:00", "Z")
+            record = update_record(issue_id, status, tags, fields, now)
+            graph.replace_issue(self._updated_issue(issue, record))
+
+        self._pending_updates.setdefault(issue_id, _PendingUpdate()).merge(status, tags, fields)
         return True
 
+    def _queue_create(
+        self,
+        title: str,
+        description: str | None,
+        priority: str,
+        tags: list[str] | None,
+    ) -> str:
+        graph = self._cached_graph(copy=False)
+        issue_id = self._next_issue_id({i.id for i in graph.issues})
+        record = self._new_issue_record(issue_id, title, description, priority, tags)
+
+        graph.issues.append(Issue.from_dict(record))
+        self._pending_issues.append(record)
+        logger.info("Issue created (pending flush)", issue_id=issue_id, title=title)
+        return issue_id
+
     # ===== Alias Methods =====
 
     def load_beads_graph(self) -> BeadsGraph:
@@ -620,9 +1001,6 @@ class StateManager:
         workcell_id: str | None = None,
     ) -> None:
         """Add an event to the event log."""
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        events_file = self.logs_dir / "events.jsonl"
-
         event = {
             "type": event_type,
             "timestamp": _utc_now().isoformat().replace("+00:00", "Z"),
@@ -632,7 +1010,7 @@ class StateManager:
         if workcell_id:
             event["workcell_id"] = workcell_id
 
-        with open(events_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        # Locked so the append cannot race a segment roll by the EventEmitter.
+        append_event_line(self.logs_dir, json.dumps(event))
 
         logger.debug("Event logged", event_type=event_type, issue_id=issue_id)
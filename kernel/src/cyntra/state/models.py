@@ -198,43 +198,98 @@ class Dep:
 
 @dataclass
 class BeadsGraph:
-    """Represents the full Beads work graph."""
+    """
+    Represents the full Beads work graph.
+
+    Lookups are served from indexes built on first access: an id→position map
+    for issues, per-issue incident dep lists, and forward/reverse "blocks"
+    adjacency. The indexes are rebuilt automatically if `issues` or `deps`
+    is replaced or changes length; call `reindex()` after mutating either
+    list in place without changing its length.
+    """
 
     issues: list[Issue]
     deps: list[Dep]
 
+    _issue_positions: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _incident_deps: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _blocks_out: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _blocks_in: dict[str, list[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _index_key: tuple[int, int, int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _current_index_key(self) -> tuple[int, int, int, int]:
+        return (id(self.issues), len(self.issues), id(self.deps), len(self.deps))
+
+    def _ensure_index(self) -> None:
+        if self._index_key != self._current_index_key():
+            self.reindex()
+
+    def reindex(self) -> None:
+        """Rebuild lookup indexes from `issues` and `deps`."""
+        positions: dict[str, list[int]] = {}
+        for pos, issue in enumerate(self.issues):
+            positions.setdefault(issue.id, []).append(pos)
+
+        self._issue_positions = positions
+        self._incident_deps = {}
+        self._blocks_out = {}
+        self._blocks_in = {}
+        for idx, dep in enumerate(self.deps):
+            self._index_dep(idx, dep)
+        self._index_key = self._current_index_key()
+
+    def _index_dep(self, idx: int, dep: Dep) -> None:
+        self._incident_deps.setdefault(dep.from_id, []).append(idx)
+        if dep.to_id != dep.from_id:
+            self._incident_deps.setdefault(dep.to_id, []).append(idx)
+        if dep.dep_type == "blocks":
+            self._blocks_out.setdefault(dep.from_id, []).append(idx)
+            self._blocks_in.setdefault(dep.to_id, []).append(idx)
+
     def get_issue(self, issue_id: str) -> Issue | None:
         """Get issue by ID."""
-        for issue in self.issues:
-            if issue.id == issue_id:
-                return issue
-        return None
+        self._ensure_index()
+        positions = self._issue_positions.get(issue_id)
+        if not positions:
+            return None
+        return self.issues[positions[0]]
 
     def get_deps(self, issue_id: str, dep_type: str | None = None) -> list[Dep]:
         """Get dependencies for an issue."""
-        deps = [d for d in self.deps if d.from_id == issue_id or d.to_id == issue_id]
+        self._ensure_index()
+        deps = [self.deps[idx] for idx in self._incident_deps.get(issue_id, ())]
         if dep_type:
             deps = [d for d in deps if d.dep_type == dep_type]
         return deps
 
     def get_blocking_deps(self, issue_id: str) -> list[Issue]:
         """Get issues that block this issue."""
+        self._ensure_index()
         blocking: list[Issue] = []
-        for dep in self.deps:
-            if dep.to_id == issue_id and dep.dep_type == "blocks":
-                blocker = self.get_issue(dep.from_id)
-                if blocker:
-                    blocking.append(blocker)
+        for idx in self._blocks_in.get(issue_id, ()):
+            blocker = self.get_issue(self.deps[idx].from_id)
+            if blocker:
+                blocking.append(blocker)
         return blocking
 
     def get_blocked_by(self, issue_id: str) -> list[Issue]:
         """Get issues blocked by this issue."""
+        self._ensure_index()
         blocked: list[Issue] = []
-        for dep in self.deps:
-            if dep.from_id == issue_id and dep.dep_type == "blocks":
-                issue = self.get_issue(dep.to_id)
-                if issue:
-                    blocked.append(issue)
+        for idx in self._blocks_out.get(issue_id, ()):
+            issue = self.get_issue(self.deps[idx].to_id)
+            if issue:
+                blocked.append(issue)
         return blocked
 
     def filter_to_issue(self, issue_id: str) -> BeadsGraph:
@@ -254,10 +309,102 @@ class BeadsGraph:
         for blocked in self.get_blocked_by(issue_id):
             related_ids.add(blocked.id)
 
-        # Filter issues and deps
-        filtered_issues = [i for i in self.issues if i.id in related_ids]
-        filtered_deps = [
-            d for d in self.deps if d.from_id in related_ids and d.to_id in related_ids
-        ]
+        # Filter issues and deps using the indexes, preserving original order
+        issue_positions = sorted(
+            pos for rid in related_ids for pos in self._issue_positions.get(rid, ())
+        )
+        dep_indices = sorted(
+            {
+                idx
+                for rid in related_ids
+                for idx in self._incident_deps.get(rid, ())
+                if self.deps[idx].from_id in related_ids and self.deps[idx].to_id in related_ids
+            }
+        )
+
+        return BeadsGraph(
+            issues=[self.issues[pos] for pos in issue_positions],
+            deps=[self.deps[idx] for idx in dep_indices],
+        )
 
-        return BeadsGraph(issues=filtered_issues, deps=filtered_deps)
+    def replace_issue(self, issue: Issue) -> bool:
+        """Replace every issue with `issue.id` in place; returns False if absent."""
+        self._ensure_index()
+        positions = self._issue_positions.get(issue.id)
+        if not positions:
+            return False
+        for pos in positions:
+            self.issues[pos] = issue
+        return True
+
+    def apply(self, delta: GraphDelta) -> None:
+        """
+        Apply a GraphDelta in place.
+
+        Upserted issues replace every issue with the same id (or are
+        appended) and added deps are appended; both update the indexes in
+        place, so the cost is proportional to the delta. Removals shift
+        positions and rebuild the indexes.
+        """
+        if delta.is_empty():
+            return
+        self._ensure_index()
+        if delta.removed_issue_ids or delta.removed_deps:
+            self._apply_removals(delta)
+
+        for issue in delta.upserted_issues:
+            positions = self._issue_positions.get(issue.id)
+            if positions:
+                for pos in positions:
+                    self.issues[pos] = issue
+            else:
+                self._issue_positions[issue.id] = [len(self.issues)]
+                self.issues.append(issue)
+
+        for dep in delta.added_deps:
+            self._index_dep(len(self.deps), dep)
+            self.deps.append(dep)
+        self._index_key = self._current_index_key()
+
+    def _apply_removals(self, delta: GraphDelta) -> None:
+        """Drop removed issues (unless also upserted) and one match per removed dep."""
+        upserted = {issue.id for issue in delta.upserted_issues}
+        removed = set(delta.removed_issue_ids) - upserted
+
+        dropped: set[int] = set()
+        for dep in delta.removed_deps:
+            key = (dep.from_id, dep.to_id, dep.dep_type)
+            for idx in self._incident_deps.get(dep.from_id, ()):
+                existing = self.deps[idx]
+                if idx not in dropped and (
+                    (existing.from_id, existing.to_id, existing.dep_type) == key
+                ):
+                    dropped.add(idx)
+                    break
+
+        if removed:
+            self.issues = [issue for issue in self.issues if issue.id not in removed]
+        if dropped:
+            self.deps = [dep for idx, dep in enumerate(self.deps) if idx not in dropped]
+        self.reindex()
+
+
+@dataclass
+class GraphDelta:
+    """
+    A set of changes to a BeadsGraph since some earlier snapshot.
+
+    Produced by change feeds (file watchers, write-through caches) so that
+    consumers like the incremental scheduler can avoid a full rescan.
+    """
+
+    upserted_issues: list[Issue] = field(default_factory=list)
+    removed_issue_ids: list[str] = field(default_factory=list)
+    added_deps: list[Dep] = field(default_factory=list)
+    removed_deps: list[Dep] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Return True if the delta carries no changes."""
+        return not (
+            self.upserted_issues or self.removed_issue_ids or self.added_deps or self.removed_deps
+        )
@@ -0,0 +1,551 @@
+"""
+IssueMutationLog - Append-only mutation log for file-mode Beads issue writes.
+
+File-mode issue writes append one line per batch to
+`.beads/issue_mutations.jsonl` instead of rewriting issues.jsonl, so a
+status change costs a few hundred bytes however large the graph is:
+
+    {"base": [ino, size, mtime_ns], "ops": [{...request...}, ...],
+     "issues": [{...full issue after the write...}, ...]}
+
+`ops` are the update/create requests with their final ids and only the
+changed fields; `issues` are the touched issues as written, for readers that
+follow the log as a change feed. `base` is the (inode, size, mtime_ns) key
+of the issues.jsonl the entry was appended on top of.
+
+Current issues are issues.jsonl with every logged op replayed in order
+(`replay`). Ops are idempotent, so an entry that already reached
+issues.jsonl can be replayed again. If issues.jsonl was rewritten by another
+tool, the logged changes are applied on top of its version, except updates
+older than the issue's `updated` there; creates never overwrite an
+existing issue.
+
+Compaction folds the log into a new issues.jsonl (tmp + fsync + rename) and
+starts a new log whose first line links it to the old one:
+
+    {"base": [old key], "snapshot": [new key], "rotated_from": [ino, size],
+     "issues": [{...latest version of each issue the old log wrote...}]}
+
+It runs once the log passes a size threshold, right after issues are
+created (tools that allocate ids from issues.jsonl must see them), and when
+the kernel is idle or exits (`compact`). Tools that read issues.jsonl
+directly see kernel writes from the next compaction on.
+
+A reader holding a `LogCursor` and the issues.jsonl key it loaded applies
+the entries after its cursor as a delta (`committed_since`). After a
+compaction it continues from the link, which covers whatever it had not
+read of the old log. Any gap (issues.jsonl rewritten by something else, two
+compactions, a log replaced without a link) means "reload".
+
+Writes hold an exclusive flock on `.beads/.issues.lock`. The writer keeps
+the replayed issues in memory and only reads the log tail appended since
+its last write, so a commit neither reads nor rewrites issues.jsonl unless
+someone else replaced it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+from collections.abc import Container, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+logger = structlog.get_logger()
+
+MUTATION_LOG_FILE = "issue_mutations.jsonl"
+LOCK_FILE = ".issues.lock"
+DEFAULT_MAX_LOG_BYTES = 1 << 20
+
+# (inode, size, mtime_ns) of issues.jsonl; NO_SNAPSHOT when it does not exist.
+SnapshotKey = tuple[int, int, int]
+NO_SNAPSHOT: SnapshotKey = (0, 0, 0)
+
+
+@dataclass(frozen=True)
+class LogCursor:
+    """Position in a specific log file (identified by inode)."""
+
+    inode: int
+    offset: int
+
+
+@dataclass
+class CommitResult:
+    """Outcome of `IssueMutationLog.commit`."""
+
+    before: LogCursor
+    after: LogCursor
+    # Key of issues.jsonl after the commit (changes only if it compacted)
+    snapshot: SnapshotKey = NO_SNAPSHOT
+    # Issues as written, one per touched id
+    issues: list[dict[str, Any]] = field(default_factory=list)
+    # Final ids of created issues, in request order
+    created: list[str] = field(default_factory=list)
+    # Update ids that matched no issue
+    missing: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _Replayed:
+    """The writer's view: issues.jsonl `key` plus the log up to `cursor`."""
+
+    key: SnapshotKey
+    cursor: LogCursor
+    issues: list[dict[str, Any]]
+    positions: dict[str, list[int]]
+    # Latest version of each issue logged since the last compaction
+    written: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+def snapshot_key(path: Path) -> SnapshotKey:
+    """Identity of the file at `path` as (inode, size, mtime_ns)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return NO_SNAPSHOT
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _entry_key(value: Any) -> SnapshotKey | None:
+    if isinstance(value, list) and len(value) == 3 and all(isinstance(v, int) for v in value):
+        return (value[0], value[1], value[2])
+    return None
+
+
+def update_record(
+    issue_id: str,
+    status: str | None,
+    tags: list[str] | None,
+    fields: dict[str, Any],
+    updated: str,
+) -> dict[str, Any]:
+    """Build an update request holding only the changed fields."""
+    record: dict[str, Any] = {"op": "update", "id": issue_id, "updated": updated}
+    if status:
+        record["status"] = status
+    if tags:
+        record["tags"] = list(tags)
+    if fields:
+        record["fields"] = dict(fields)
+    return record
+
+
+def create_record(issue: dict[str, Any]) -> dict[str, Any]:
+    """Build a create request; an empty id is assigned on commit."""
+    return {"op": "create", "issue": issue}
+
+
+def apply_update(data: dict[str, Any], record: dict[str, Any]) -> None:
+    """Apply one update request to a raw issue dict in place."""
+    if record.get("status"):
+        data["status"] = record["status"]
+    if record.get("tags"):
+        data["tags"] = list(set(data.get("tags", []) + record["tags"]))
+    for key, value in (record.get("fields") or {}).items():
+        data[key] = value
+    if record.get("updated"):
+        data["updated"] = record["updated"]
+
+
+def next_issue_id(existing_ids: Container[str]) -> str:
+    """Find the next available numeric issue ID."""
+    counter = 1
+    while str(counter) in existing_ids:
+        counter += 1
+    return str(counter)
+
+
+def _index(issues: list[dict[str, Any]]) -> dict[str, list[int]]:
+    positions: dict[str, list[int]] = {}
+    for pos, data in enumerate(issues):
+        positions.setdefault(str(data.get("id", "")), []).append(pos)
+    return positions
+
+
+def _updated_after(data: dict[str, Any], record: dict[str, Any]) -> bool:
+    """True if `data` was edited after the update `record` was made."""
+    try:
+        return datetime.fromisoformat(str(data["updated"])) > datetime.fromisoformat(
+            str(record["updated"])
+        )
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+def _apply_ops(
+    issues: list[dict[str, Any]],
+    positions: dict[str, list[int]],
+    ops: list[Any],
+    *,
+    rebase: bool = False,
+) -> None:
+    """
+    Apply logged ops to `issues` (indexed by `positions`) in place.
+
+    Issue dicts are replaced, never modified. With `rebase` the ops are
+    applied to an issues.jsonl they were not written against, so updates
+    older than the issue there are skipped.
+    """
+    for op in ops:
+        if not isinstance(op, dict):
+            continue
+        kind = op.get("op")
+        if kind == "update":
+            for pos in positions.get(str(op.get("id", "")), ()):
+                if rebase and _updated_after(issues[pos], op):
+                    continue
+                issues[pos] = dict(issues[pos])
+                apply_update(issues[pos], op)
+        elif kind == "create" and isinstance(op.get("issue"), dict):
+            issue_id = str(op["issue"].get("id", ""))
+            if issue_id not in positions:
+                positions[issue_id] = [len(issues)]
+                issues.append(dict(op["issue"]))
+
+
+def replay(
+    issues: list[dict[str, Any]],
+    entries: list[dict[str, Any]],
+    snapshot: SnapshotKey,
+) -> list[dict[str, Any]]:
+    """
+    Apply the ops of log `entries` to issue dicts read from issues.jsonl.
+
+    `snapshot` is the key of the issues.jsonl `issues` came from. Returns a
+    new list; the inputs are not modified.
+    """
+    out = list(issues)
+    positions = _index(out)
+    for entry in entries:
+        ops = entry.get("ops")
+        if isinstance(ops, list):
+            rebase = _entry_key(entry.get("base")) != snapshot
+            _apply_ops(out, positions, ops, rebase=rebase)
+    return out
+
+
+def _written_by(entry: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    for data in entry.get("issues") or ():
+        if isinstance(data, dict):
+            yield str(data.get("id", "")), data
+
+
+def committed_since(
+    entries: list[dict[str, Any]],
+    known: SnapshotKey,
+    current: SnapshotKey,
+) -> list[dict[str, Any]] | None:
+    """
+    Issues written by `entries` if they take issues.jsonl from `known` to `current`.
+
+    Write entries keep the key; a compaction link moves it to the new
+    issues.jsonl and repeats what the old log wrote. Returns None when the
+    entries do not form an unbroken chain between the two keys (issues.jsonl
+    was rewritten by something else), in which case the caller must reload.
+    """
+    written: list[dict[str, Any]] = []
+    key = known
+    for entry in entries:
+        if _entry_key(entry.get("base")) != key:
+            return None
+        key = _entry_key(entry.get("snapshot")) or key
+        written.extend(data for data in entry.get("issues") or () if isinstance(data, dict))
+    if key != current:
+        return None
+    return written
+
+
+class IssueMutationLog:
+    """Append-only issue writer that compacts into issues.jsonl."""
+
+    def __init__(
+        self,
+        beads_dir: Path,
+        *,
+        max_log_bytes: int = DEFAULT_MAX_LOG_BYTES,
+    ) -> None:
+        self.beads_dir = beads_dir
+        self.path = beads_dir / MUTATION_LOG_FILE
+        self.snapshot_path = beads_dir / "issues.jsonl"
+        self.max_log_bytes = max_log_bytes
+        self._state: _Replayed | None = None
+
+    # ===== Locking =====
+
+    @contextlib.contextmanager
+    def lock(self, *, shared: bool = False) -> Iterator[None]:
+        """Hold the Beads issue lock (advisory; a no-op without fcntl)."""
+        if fcntl is None:
+            yield
+            return
+        self.beads_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.beads_dir / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    # ===== Writing =====
+
+    def commit(self, records: list[dict[str, Any]]) -> CommitResult:
+        """
+        Apply update/create requests and append them to the log as one entry.
+
+        Compacts afterwards if issues were created or the log outgrew
+        `max_log_bytes`.
+        """
+        if not records:
+            cursor = self.cursor()
+            return CommitResult(cursor, cursor, snapshot_key(self.snapshot_path))
+
+        with self.lock():
+            self.beads_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                state = self._catch_up_locked()
+                result = CommitResult(state.cursor, state.cursor, state.key)
+                ops, written = self._resolve(state, records, result)
+                if not ops:
+                    return result
+
+                entry = {"base": list(state.key), "ops": ops, "issues": written}
+                state.cursor = self._append_locked(json.dumps(entry) + "\n")
+                state.written.update(_written_by(entry))
+                if result.created or state.cursor.offset >= self.max_log_bytes:
+                    self._compact_locked(state)
+            except BaseException:
+                # The cached issues may hold changes that never reached the log.
+                self._state = None
+                raise
+            result.after, result.snapshot = state.cursor, state.key
+        result.issues = written
+        return result
+
+    def compact(self) -> bool:
+        """Fold the log into issues.jsonl; returns False if nothing was pending."""
+        with self.lock():
+            try:
+                state = self._catch_up_locked()
+                if not state.written:
+                    return False
+                self._compact_locked(state)
+            except BaseException:
+                self._state = None
+                raise
+        return True
+
+    @staticmethod
+    def _resolve(
+        state: _Replayed,
+        records: list[dict[str, Any]],
+        result: CommitResult,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Turn requests into ops and apply them to the cached issues.
+
+        Returns the ops and the touched issues. Creates never reuse an
+        existing id; updates in the same batch follow a reassigned id.
+        """
+        issues, positions = state.issues, state.positions
+        ops: list[dict[str, Any]] = []
+        touched: dict[str, None] = {}
+        renamed: dict[str, str] = {}
+        for record in records:
+            op = record.get("op")
+            if op == "update":
+                issue_id = str(record.get("id", ""))
+                issue_id = renamed.get(issue_id, issue_id)
+                if issue_id not in positions:
+                    result.missing.append(issue_id)
+                    continue
+                ops.append({**record, "id": issue_id})
+            elif op == "create" and isinstance(record.get("issue"), dict):
+                data = dict(record["issue"])
+                requested = str(data.get("id") or "")
+                issue_id = requested
+                if not issue_id or issue_id in positions:
+                    issue_id = next_issue_id(positions)
+                    data["id"] = issue_id
+                    if requested:
+                        renamed[requested] = issue_id
+                ops.append(create_record(data))
+                result.created.append(issue_id)
+            else:
+                continue
+            _apply_ops(issues, positions, ops[-1:])
+            touched[issue_id] = None
+        return ops, [issues[positions[issue_id][0]] for issue_id in touched]
+
+    def _catch_up_locked(self) -> _Replayed:
+        """Bring the cached issues up to date with issues.jsonl and the log."""
+        key = snapshot_key(self.snapshot_path)
+        state = self._state
+        if state is not None:
+            try:
+                entries, cursor = self.read(state.cursor)
+            except ValueError:
+                entries = None
+            if entries is not None and committed_since(entries, state.key, key) is not None:
+                for entry in entries:
+                    if _entry_key(entry.get("snapshot")) is not None:
+                        # Someone else compacted what we had.
+                        state.written = {}
+                    _apply_ops(state.issues, state.positions, entry.get("ops") or ())
+                    state.written.update(_written_by(entry))
+                state.key, state.cursor = key, cursor
+                return state
+
+        entries, cursor = self.read()
+        issues = replay(self._read_snapshot(), entries, key)
+        state = _Replayed(key, cursor, issues, _index(issues))
+        for entry in entries:
+            if isinstance(entry.get("ops"), list):
+                state.written.update(_written_by(entry))
+        self._state = state
+        return state
+
+    def _compact_locked(self, state: _Replayed) -> None:
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            for data in state.issues:
+                f.write(json.dumps(data) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+        snapshot = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+        # The new log starts with a link so cursor holders can follow it.
+        link = {
+            "base": list(state.key),
+            "snapshot": list(snapshot),
+            "rotated_from": [state.cursor.inode, state.cursor.offset],
+            "issues": list(state.written.values()),
+        }
+        log_tmp = self.path.with_suffix(".new.tmp")
+        with open(log_tmp, "w") as f:
+            f.write(json.dumps(link) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            st = os.fstat(f.fileno())
+
+        # A crash between the renames leaves the old log over the new
+        # issues.jsonl; replaying it again is harmless.
+        os.replace(tmp, self.snapshot_path)
+        os.replace(log_tmp, self.path)
+        self._fsync_dir()
+
+        state.key, state.cursor = snapshot, LogCursor(st.st_ino, st.st_size)
+        state.written = {}
+        logger.debug("Compacted issue mutation log", path=str(self.path))
+
+    def _append_locked(self, line: str) -> LogCursor:
+        payload = line.encode()
+        fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            st = os.fstat(fd)
+            start = st.st_size
+            if start and os.pread(fd, 1, start - 1) != b"\n":
+                # Terminate a torn line left by a crashed writer.
+                payload = b"\n" + payload
+            os.write(fd, payload)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        return LogCursor(st.st_ino, start + len(payload))
+
+    def _read_snapshot(self) -> list[dict[str, Any]]:
+        if not self.snapshot_path.exists():
+            return []
+        out: list[dict[str, Any]] = []
+        with open(self.snapshot_path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(data, dict):
+                    out.append(data)
+        return out
+
+    def _fsync_dir(self) -> None:
+        with contextlib.suppress(OSError, AttributeError):
+            fd = os.open(self.beads_dir, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    # ===== Reading =====
+
+    def cursor(self) -> LogCursor:
+        """Cursor at the current end of the log (inode 0 if absent)."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return LogCursor(0, 0)
+        return LogCursor(st.st_ino, st.st_size)
+
+    def read(self, since: LogCursor | None = None) -> tuple[list[dict[str, Any]], LogCursor]:
+        """
+        Read complete entries after `since` (or from the start).
+
+        If the log was compacted since, the new log is read from its link
+        line (check the result with `committed_since`). Raises ValueError if
+        `since` refers to a log that was replaced some other way or removed;
+        the caller must reload.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                switched = since is not None and (
+                    since.inode != st.st_ino or since.offset > st.st_size
+                )
+                offset = since.offset if since is not None and not switched else 0
+                f.seek(offset)
+                chunk = f.read(st.st_size - offset)
+        except FileNotFoundError:
+            if since is not None and since.inode:
+                raise ValueError("mutation log was removed") from None
+            return [], LogCursor(0, 0)
+
+        # Only complete lines; a torn tail is picked up once it is finished.
+        end = chunk.rfind(b"\n") + 1
+        entries: list[dict[str, Any]] = []
+        for raw in chunk[:end].splitlines():
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning("Skipping corrupt mutation record", file=str(self.path))
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+
+        if switched and since.inode:
+            # A new log is only followed from a link to the one we were reading.
+            link = entries[0].get("rotated_from") if entries else None
+            if not (
+                isinstance(link, list)
+                and len(link) == 2
+                and link[0] == since.inode
+                and isinstance(link[1], int)
+                and since.offset <= link[1]
+            ):
+                raise ValueError("mutation log was rotated")
+        return entries, LogCursor(st.st_ino, offset + end)
@@ -0,0 +1,180 @@
+"""
+Shared SQLite access: one writer connection plus a pool of read-only readers.
+
+`sqlite3` connections are tied to the thread that opened them, so a
+single per-object connection cannot be used from `run_in_executor`
+threads. A `SQLitePool` opens its connections with
+`check_same_thread=False` and hands them out safely: the writer under a
+lock, readers from a queue. WAL mode lets readers run alongside the
+writer instead of serialising on one connection.
+
+Pools are shared per database file within a process (see `open_pool`),
+so pragmas and schema DDL run once rather than on every handle.
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_MAX_READERS = 4
+
+# Writer pragmas: WAL lets readers run during writes; NORMAL sync is
+# durable across process crashes and fsyncs only at checkpoints
+WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-16000",  # 16 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+READER_PRAGMAS = (
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+_pools: dict[Path, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+class SQLitePool:
+    """
+    A single writer connection and up to `max_readers` read-only connections.
+
+    Usage:
+        pool = open_pool(path, schema=SCHEMA)
+        with pool.write() as conn:
+            conn.execute("INSERT ...")
+            conn.commit()
+        with pool.read() as conn:
+            rows = conn.execute("SELECT ...").fetchall()
+        pool.close()
+
+    Reader connections are opened lazily; once `max_readers` are in use,
+    further `read()` calls block until one is returned.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        schema: str | None = None,
+        max_readers: int = DEFAULT_MAX_READERS,
+    ) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_readers = max(1, max_readers)
+        self._write_lock = threading.RLock()
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
+        self._refs = 0
+        self._closed = False
+
+        self.writer = self._connect(WRITER_PRAGMAS)
+        if schema:
+            self.writer.executescript(schema)
+            self.writer.commit()
+            logger.debug("SQLite schema initialized", path=str(self.db_path))
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _connect(self, pragmas: tuple[str, ...], readonly: bool = False) -> sqlite3.Connection:
+        if readonly:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in pragmas:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer connection exclusively (re-entrant within a thread)."""
+        with self._write_lock:
+            yield self.writer
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection; it sees only committed data."""
+        conn = self._acquire_reader()
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._reader_lock:
+            create = self._reader_count < self.max_readers
+            if create:
+                self._reader_count += 1
+        if not create:
+            return self._readers.get()
+
+        try:
+            return self._connect(READER_PRAGMAS, readonly=True)
+        except sqlite3.Error:
+            with self._reader_lock:
+                self._reader_count -= 1
+            raise
+
+    def close(self) -> None:
+        """Release one `open_pool` handle; connections close with the last one."""
+        with _pools_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            if _pools.get(self.db_path) is self:
+                del _pools[self.db_path]
+
+        self._closed = True
+        with self._write_lock:
+            self.writer.close()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def open_pool(
+    db_path: Path | str,
+    schema: str | None = None,
+    max_readers: int = DEFAULT_MAX_READERS,
+) -> SQLitePool:
+    """
+    Get the process-wide pool for `db_path`, creating it on first use.
+
+    `schema` (idempotent DDL) only runs when the pool is created, so later
+    openers of the same file skip it. Every call must be paired with
+    `SQLitePool.close()`.
+    """
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SQLitePool(key, schema=schema, max_readers=max_readers)
+            _pools[key] = pool
+        pool._refs += 1
+        return pool
@@ -0,0 +1,450 @@
+"""
+BeadsWatcher - Change notification for the .beads directory.
+
+Used by watch mode to sleep until the work graph actually changes instead
+of reloading it on a fixed timer.
+
+- Linux: inotify (via libc, no extra dependency) wakes the watcher as soon
+  as a file in .beads is written, moved or removed.
+- Elsewhere: stat polling of mtime/size/inode at a short interval.
+
+Bursts of writes are debounced. Changes are turned into a GraphDelta so
+callers can update their graph incrementally when possible:
+
+- file-mode kernel writes: the issues recorded in the mutation log (see
+  mutation_log.py), provided its entries account for every change to
+  issues.jsonl since the last sync (compactions)
+- issues.jsonl / deps.jsonl that only grew (same inode, appended lines):
+  the appended records
+
+Other rewrites, truncations and changes to other files ask for a full
+reload instead. Content-identical rewrites (e.g. a touch) are ignored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import hashlib
+import json
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from cyntra.state.models import Dep, GraphDelta, Issue
+from cyntra.state.mutation_log import (
+    MUTATION_LOG_FILE,
+    NO_SNAPSHOT,
+    IssueMutationLog,
+    LogCursor,
+    committed_since,
+)
+
+logger = structlog.get_logger()
+
+ISSUES_FILE = "issues.jsonl"
+DEPS_FILE = "deps.jsonl"
+# Read incrementally rather than compared as "other files"
+_TRACKED_FILES = (ISSUES_FILE, DEPS_FILE, MUTATION_LOG_FILE)
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+@dataclass
+class BeadsChange:
+    """A debounced change to the Beads files."""
+
+    # Appended records, or None when the graph must be reloaded in full.
+    delta: GraphDelta | None
+
+    @property
+    def requires_reload(self) -> bool:
+        return self.delta is None
+
+
+@dataclass
+class _FileState:
+    inode: int
+    size: int
+    mtime_ns: int
+    offset: int
+    digest: str
+    # Bytes just before `offset`, to detect same-inode rewrites that grew
+    tail: bytes = b""
+
+
+_TAIL_BYTES = 256
+
+
+def _read_tail(path: Path, offset: int) -> bytes:
+    start = max(0, offset - _TAIL_BYTES)
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(offset - start)
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class _Inotify:
+    """Minimal inotify wrapper; raises OSError when unavailable."""
+
+    def __init__(self, directory: Path) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        self.fd = fd
+
+    def drain(self) -> list[str]:
+        """Read pending events; returns the names of files that changed."""
+        names: list[str] = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            if not buf:
+                return names
+            pos = 0
+            while pos + 16 <= len(buf):
+                _, _, _, name_len = struct.unpack_from("iIII", buf, pos)
+                raw = buf[pos + 16 : pos + 16 + name_len]
+                names.append(raw.rstrip(b"\0").decode(errors="replace"))
+                pos += 16 + name_len
+
+    def close(self) -> None:
+        with contextlib.suppress(OSError):
+            os.close(self.fd)
+
+
+class BeadsWatcher:
+    """
+    Watches a .beads directory and reports debounced graph changes.
+
+    Call `mark_synced()` right before a full graph load; `wait()` then
+    returns the first change after that point.
+    """
+
+    def __init__(
+        self,
+        beads_dir: Path,
+        *,
+        debounce_seconds: float = 0.2,
+        poll_interval: float = 0.5,
+        use_inotify: bool = True,
+    ) -> None:
+        self.beads_dir = beads_dir
+        self.debounce_seconds = debounce_seconds
+        self.poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._inotify: _Inotify | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._states: dict[str, _FileState] = {}
+        self._log = IssueMutationLog(beads_dir)
+        self._log_cursor = LogCursor(0, 0)
+        self._other_files: dict[str, tuple[int, int, int] | None] = {}
+        self._last_seen: tuple[Any, ...] | None = None
+
+    @property
+    def mode(self) -> str:
+        """'inotify' when kernel notifications are active, else 'poll'."""
+        return "inotify" if self._inotify is not None else "poll"
+
+    # ===== Baseline =====
+
+    def mark_synced(self) -> None:
+        """Record current file states as already loaded."""
+        self._log_cursor = self._log.cursor()
+        self._states = {}
+        for name in (ISSUES_FILE, DEPS_FILE):
+            path = self.beads_dir / name
+            key = _stat_key(path)
+            if key is None:
+                continue
+            inode, size, mtime_ns = key
+            try:
+                digest = _digest(path)
+                tail = _read_tail(path, size)
+            except OSError:
+                continue
+            self._states[name] = _FileState(inode, size, mtime_ns, size, digest, tail)
+        self._other_files = self._scan_other_files()
+        self._last_seen = self._activity_key()
+
+    def _scan_other_files(self) -> dict[str, tuple[int, int, int] | None]:
+        if not self.beads_dir.is_dir():
+            return {}
+        keys: dict[str, tuple[int, int, int] | None] = {}
+        for path in self.beads_dir.iterdir():
+            if path.name in _TRACKED_FILES or path.name.startswith("."):
+                continue
+            if path.suffix in (".jsonl", ".yaml", ".yml", ".json"):
+                keys[path.name] = _stat_key(path)
+            elif path.is_dir() and path.name == "issues":
+                for child in path.iterdir():
+                    keys[f"issues/{child.name}"] = _stat_key(child)
+        return keys
+
+    # ===== Waiting =====
+
+    async def wait(self, timeout: float | None = None) -> BeadsChange | None:
+        """
+        Block until the graph changes (debounced) or `timeout` elapses.
+
+        Returns None on timeout.
+        """
+        self._ensure_notifier()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            if not await self._wait_for_activity(deadline):
+                return None
+
+            # Debounce: keep absorbing activity until the directory is quiet.
+            while await self._wait_for_activity(loop.time() + self.debounce_seconds):
+                pass
+
+            change = self.poll()
+            if change is not None:
+                return change
+
+    def poll(self) -> BeadsChange | None:
+        """Check files now; returns a change, or None if content is unchanged."""
+        if self._scan_other_files() != self._other_files:
+            self.mark_synced()
+            return BeadsChange(delta=None)
+
+        delta = GraphDelta()
+        for name in (ISSUES_FILE, DEPS_FILE):
+            status = self._read_logged(delta) if name == ISSUES_FILE else "unlogged"
+            if status == "unlogged":
+                status = self._read_appended(name, delta)
+            if status == "reload":
+                self.mark_synced()
+                return BeadsChange(delta=None)
+
+        return None if delta.is_empty() else BeadsChange(delta=delta)
+
+    async def _wait_for_activity(self, deadline: float | None) -> bool:
+        """Wait for a filesystem event (or a stat change when polling)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+
+            if self._inotify is not None and self._wakeup is not None:
+                self._wakeup.clear()
+                if self._inotify.drain():
+                    return True
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+                except TimeoutError:
+                    return False
+                if self._inotify.drain():
+                    return True
+                continue
+
+            await asyncio.sleep(
+                self.poll_interval if remaining is None else min(self.poll_interval, remaining)
+            )
+            if self._stat_changed():
+                return True
+
+    def _activity_key(self) -> tuple[Any, ...]:
+        return (
+            _stat_key(self.beads_dir / ISSUES_FILE),
+            _stat_key(self.beads_dir / DEPS_FILE),
+            _stat_key(self.beads_dir / MUTATION_LOG_FILE),
+            self._scan_other_files(),
+        )
+
+    def _stat_changed(self) -> bool:
+        """True if any watched file changed since the previous check."""
+        key = self._activity_key()
+        changed = key != self._last_seen
+        self._last_seen = key
+        return changed
+
+    def _ensure_notifier(self) -> None:
+        if self._inotify is not None or not self._use_inotify:
+            return
+        try:
+            self.beads_dir.mkdir(parents=True, exist_ok=True)
+            self._inotify = _Inotify(self.beads_dir)
+            self._wakeup = asyncio.Event()
+            asyncio.get_running_loop().add_reader(self._inotify.fd, self._wakeup.set)
+        except (OSError, AttributeError, NotImplementedError) as e:
+            logger.debug("inotify unavailable, falling back to polling", error=str(e))
+            if self._inotify is not None:
+                self._inotify.close()
+            self._inotify = None
+            self._wakeup = None
+            self._use_inotify = False
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._inotify is not None:
+            with contextlib.suppress(Exception):
+                asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+            self._wakeup = None
+
+    # ===== Tail reading =====
+
+    def _read_logged(self, delta: GraphDelta) -> str:
+        """
+        Add issues written to the mutation log since the last read to `delta`.
+
+        Returns "same", "appended" or "reload", or "unlogged" when the log
+        has nothing new and issues.jsonl must be checked as an append or a
+        rewrite instead.
+        """
+        path = self.beads_dir / ISSUES_FILE
+        state = self._states.get(ISSUES_FILE)
+        known = (state.inode, state.size, state.mtime_ns) if state is not None else NO_SNAPSHOT
+        current = _stat_key(path) or NO_SNAPSHOT
+        try:
+            entries, cursor = self._log.read(self._log_cursor)
+        except ValueError:
+            # Replaced or removed other than by compaction: writes may be lost.
+            return "reload"
+        if not entries:
+            return "same" if current == known else "unlogged"
+        written = committed_since(entries, known, current)
+        if written is None:
+            return "reload"
+
+        upserts: list[Issue] = []
+        for data in written:
+            try:
+                upserts.append(Issue.from_dict(data))
+            except Exception as e:
+                logger.warning("Failed to parse issue", issue_id=data.get("id"), error=str(e))
+        delta.upserted_issues.extend(upserts)
+
+        self._log_cursor = cursor
+        if current != known:
+            # Compacted: the new issues.jsonl holds what we have already seen.
+            inode, size, mtime_ns = current
+            try:
+                tail = _read_tail(path, size)
+            except OSError:
+                tail = b""
+            # Digest of the whole file is refreshed lazily on the next full sync.
+            self._states[ISSUES_FILE] = _FileState(inode, size, mtime_ns, size, "", tail)
+        return "appended" if upserts else "same"
+
+    def _read_appended(self, name: str, delta: GraphDelta) -> str:
+        """
+        Parse lines appended to `name` since the last read into `delta`.
+
+        Returns "same", "appended" or "reload".
+        """
+        path = self.beads_dir / name
+        state = self._states.get(name)
+        key = _stat_key(path)
+
+        if key is None:
+            return "same" if state is None else "reload"
+        inode, size, mtime_ns = key
+        if state is None:
+            # Newly created file: everything in it is appended.
+            state = _FileState(inode, 0, 0, 0, "")
+            self._states[name] = state
+            if size == 0:
+                state.mtime_ns = mtime_ns
+                return "same"
+        if (inode, size, mtime_ns) == (state.inode, state.size, state.mtime_ns):
+            return "same"
+
+        if inode != state.inode or size < state.offset or size == state.size:
+            # Rewritten in place or replaced: only reload if content changed.
+            try:
+                digest = _digest(path)
+            except OSError:
+                return "reload"
+            if digest == state.digest:
+                state.inode, state.size, state.mtime_ns = inode, size, mtime_ns
+                return "same"
+            return "reload"
+
+        try:
+            if _read_tail(path, state.offset) != state.tail:
+                return "reload"
+            with open(path, "rb") as f:
+                f.seek(state.offset)
+                chunk = f.read(size - state.offset)
+        except OSError:
+            return "reload"
+
+        # Only consume complete lines; a partial trailing line is read next time.
+        end = chunk.rfind(b"\n") + 1
+        records: list[dict[str, Any]] = []
+        for raw in chunk[:end].splitlines():
+            line = raw.strip()
+            if not line or line.startswith(b"#"):
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                records.append(data)
+
+        for data in records:
+            try:
+                if name == ISSUES_FILE:
+                    delta.upserted_issues.append(Issue.from_dict(data))
+                else:
+                    delta.added_deps.append(Dep.from_dict(data))
+            except Exception as e:
+                logger.warning("Failed to parse item", file=str(path), error=str(e))
+
+        state.offset += end
+        state.tail = (state.tail + chunk[:end])[-_TAIL_BYTES:]
+        state.inode, state.size, state.mtime_ns = inode, size, mtime_ns
+        # Digest of the whole file is refreshed lazily on the next full sync.
+        state.digest = ""
+        return "appended" if records else "same"
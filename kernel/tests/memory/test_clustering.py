@@ -0,0 +1,94 @@
+"""Tests for incremental similarity clustering."""
+
+import numpy as np
+import pytest
+
+from cyntra.memory.clustering import NeighborGraph
+from cyntra.memory.consolidation import ConsolidationConfig
+
+
+def grouped_vectors(rng, groups: int, per_group: int, dim: int = 32) -> list[np.ndarray]:
+    """Vectors i and j are near-duplicates iff i % groups == j % groups."""
+    centers = rng.normal(size=(groups, dim))
+    return [
+        centers[i % groups] + rng.normal(scale=0.01, size=dim) for i in range(groups * per_group)
+    ]
+
+
+def as_sets(clusters) -> list[set]:
+    return [{key for key, _ in cluster} for cluster in clusters]
+
+
+class TestNeighborGraph:
+    """Tests for NeighborGraph."""
+
+    def test_leader_clusters(self):
+        """Leaders gather their near-duplicates, respecting size bounds."""
+        graph = NeighborGraph(threshold=0.9)
+        graph.add(list(range(9)), grouped_vectors(np.random.default_rng(0), 3, 3))
+
+        clusters = graph.leader_clusters(min_size=2, max_size=5)
+
+        assert as_sets(clusters) == [{0, 3, 6}, {1, 4, 7}, {2, 5, 8}]
+        assert all(sim == pytest.approx(1.0, abs=0.01) for c in clusters for _, sim in c)
+
+        capped = NeighborGraph(threshold=0.9)
+        capped.add(list(range(9)), grouped_vectors(np.random.default_rng(0), 3, 3))
+        assert [len(c) for c in capped.leader_clusters(min_size=2, max_size=2)] == [2, 2, 2]
+        assert capped.leader_clusters(min_size=4, max_size=5) == []
+
+    def test_incremental_add_matches_bulk(self):
+        """Adding in batches builds the same graph as one bulk insert."""
+        vectors = grouped_vectors(np.random.default_rng(1), 5, 6)
+        bulk = NeighborGraph(threshold=0.9, max_neighbors=8)
+        bulk.add(list(range(30)), vectors)
+
+        incremental = NeighborGraph(threshold=0.9, max_neighbors=8, block_size=4)
+        for start in range(0, 30, 7):
+            incremental.add(list(range(start, min(start + 7, 30))), vectors[start : start + 7])
+
+        for i in range(30):
+            assert set(incremental._neighbors[i]) == set(bulk._neighbors[i])
+
+    def test_only_new_neighbourhoods_are_pending(self):
+        """After a pass, only rows touched by new vectors are re-examined."""
+        rng = np.random.default_rng(2)
+        vectors = grouped_vectors(rng, 4, 1)
+        graph = NeighborGraph(threshold=0.9)
+        graph.add(list(range(4)), vectors)
+
+        assert graph.leader_clusters(min_size=2, max_size=5) == []
+        assert graph.pending == set()
+
+        changed = graph.add([10], [vectors[2] + rng.normal(scale=0.01, size=32)])
+        assert changed == {2, 4}
+        assert as_sets(graph.leader_clusters(min_size=2, max_size=5)) == [{2, 10}]
+
+    def test_remove(self):
+        """Removed rows drop out of clusters and neighbour lists."""
+        graph = NeighborGraph(threshold=0.9)
+        graph.add(list(range(6)), grouped_vectors(np.random.default_rng(3), 2, 3))
+        graph.remove([0, 2])
+
+        assert 0 not in graph
+        assert len(graph) == 4
+        assert as_sets(graph.leader_clusters(min_size=2, max_size=5)) == [{1, 3, 5}]
+        assert all(0 not in n and 2 not in n for n in graph._neighbors)
+
+    def test_neighbour_cap_keeps_most_similar(self):
+        """Each row keeps at most max_neighbors edges, the most similar ones."""
+        rng = np.random.default_rng(4)
+        base = rng.normal(size=16)
+        vectors = [base + rng.normal(scale=s, size=16) for s in (0.0, 0.01, 0.02, 0.03, 0.04)]
+        graph = NeighborGraph(threshold=0.5, max_neighbors=2)
+        graph.add(list(range(5)), vectors)
+
+        assert set(graph._neighbors[0]) == {1, 2}
+        assert all(len(neighbors) <= 2 for neighbors in graph._neighbors)
+
+    def test_config_rejects_clusters_larger_than_neighbour_cap(self):
+        """max_cluster_size cannot exceed the leader plus its neighbour edges."""
+        ConsolidationConfig(max_cluster_size=33, max_neighbors=32)
+
+        with pytest.raises(ValueError, match="max_neighbors"):
+            ConsolidationConfig(max_cluster_size=10, max_neighbors=4)
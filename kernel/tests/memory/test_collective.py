@@ -47,9 +47,6 @@ class TestCollectiveMemoryService:
         store = MagicMock()
         store.get = AsyncMock(return_value=None)
         store.update = AsyncMock()
-        store.pool = MagicMock()
-        store.pool.acquire = MagicMock(return_value=AsyncMock())
-        store._row_to_memory = MagicMock()
         return store
 
     @pytest.fixture
@@ -259,26 +256,9 @@ class TestCollectiveQueries:
     def mock_store(self):
         """Create mock store with query support."""
         store = MagicMock()
-        store.pool = MagicMock()
-
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(return_value=[])
-
-        store.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
-        store.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
-        store._row_to_memory = MagicMock(
-            side_effect=lambda row: AgentMemory(
-                id=uuid4(),
-                agent_id="collective",
-                text=row.get("text", "test"),
-                memory_type=MemoryType.PATTERN,
-                scope=MemoryScope.COLLECTIVE,
-                importance_score=0.8,
-                confidence=0.9,
-                created_at=datetime.utcnow(),
-            )
-        )
-
+        store.search_collective = AsyncMock(return_value=[])
+        store.search_similar_other_agents = AsyncMock(return_value=[])
+        store.get_promotion_candidates = AsyncMock(return_value=[])
         return store
 
     @pytest.fixture
@@ -294,7 +274,7 @@ class TestCollectiveQueries:
         patterns = await service.get_collective_patterns(limit=10)
 
         assert isinstance(patterns, list)
-        mock_store.pool.acquire.return_value.__aenter__.assert_called()
+        mock_store.search_collective.assert_awaited_once_with(MemoryType.PATTERN, limit=10)
 
     @pytest.mark.asyncio
     async def test_get_collective_by_type(self, service, mock_store):
@@ -305,6 +285,7 @@ class TestCollectiveQueries:
         )
 
         assert isinstance(memories, list)
+        mock_store.search_collective.assert_awaited_once_with(MemoryType.DYNAMIC, limit=20)
 
     @pytest.mark.asyncio
     async def test_find_similar_no_embedding(self, service):
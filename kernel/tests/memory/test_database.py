@@ -189,6 +189,60 @@ class TestObservationOperations:
         assert len(patterns) == 2
 
 
+class TestBulkObservations:
+    """Tests for batched observation writes."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary database with session."""
+        from cyntra.memory.database import MemoryDB
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MemoryDB(db_path=Path(tmpdir) / "test.db")
+            db.create_session(session_id="sess_bulk", workcell_id="wc-bulk")
+            yield db
+            db.close()
+
+    def test_add_observations_indexes_fts(self, db):
+        """Bulk rows are stored and searchable in one call."""
+        written = db.add_observations(
+            {
+                "observation_id": f"obs_{i}",
+                "session_id": "sess_bulk",
+                "obs_type": "change",
+                "content": f"Edited module_{i}",
+                "tool_name": "Edit",
+                "file_refs": [f"module_{i}.py"],
+            }
+            for i in range(50)
+        )
+
+        assert written == 50
+        assert len(db.get_observations(session_id="sess_bulk", limit=100)) == 50
+        assert [row["id"] for row in db.search_observations("module_7")] == ["obs_7"]
+
+    def test_add_observations_duplicates(self, db):
+        """Duplicate IDs fail the batch unless skip_duplicates is set."""
+        import sqlite3
+
+        rows = [
+            {"observation_id": "obs_dup", "session_id": "sess_bulk", "obs_type": "change"}
+            | {"content": text}
+            for text in ("first", "second")
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            db.add_observations(rows)
+        assert db.get_observations(session_id="sess_bulk") == []
+
+        assert db.add_observations(rows, skip_duplicates=True) == 1
+        assert db.get_observations(session_id="sess_bulk")[0]["content"] == "first"
+
+    def test_wal_mode(self, db):
+        """The connection runs in WAL mode."""
+        assert db._get_conn().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
 class TestFTS5Search:
     """Tests for FTS5 full-text search."""
 
@@ -376,3 +430,85 @@ class TestContextInjection:
         assert "summaries" in budget
         assert "remaining" in budget
         assert budget["remaining"] <= 2000
+
+
+class TestInjectionDigest:
+    """Tests for the trigger-maintained injection digest."""
+
+    @staticmethod
+    def _populate(db):
+        db.create_session(session_id="sess_api", workcell_id="wc-api", domain="api")
+        db.create_session(session_id="sess_ui", workcell_id="wc-ui", domain="ui")
+        for i, tokens in enumerate([30, 40, 50]):
+            db.add_observation(
+                observation_id=f"obs_api_{i}",
+                session_id="sess_api",
+                obs_type="decision",
+                content=f"api decision {i}",
+                importance="critical",
+                token_count=tokens,
+            )
+        db.add_observation(
+            observation_id="obs_api_info",
+            session_id="sess_api",
+            obs_type="tool_use",
+            content="not injected",
+            token_count=5,
+        )
+        db.add_observation(
+            observation_id="obs_ui",
+            session_id="sess_ui",
+            obs_type="decision",
+            content="ui decision",
+            importance="decision",
+            token_count=10,
+        )
+        db.add_summary(
+            summary_id="sum_api",
+            session_id="sess_api",
+            summary_type="session",
+            content="API summary",
+            token_count=20,
+        )
+
+    def test_budget_is_newest_first_prefix(self):
+        """Observations fill the budget left after summaries, newest first."""
+        from cyntra.memory.database import MemoryDB
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = MemoryDB(db_path=Path(tmpdir) / "test.db")
+            self._populate(db)
+
+            context = db.get_context_for_injection(domain="api", max_tokens=120)
+            assert [s["id"] for s in context["summaries"]] == ["sum_api"]
+            assert [o["id"] for o in context["observation_index"]] == ["obs_api_2", "obs_api_1"]
+            assert context["token_budget"] == {
+                "summaries": 20,
+                "observations": 90,
+                "remaining": 10,
+            }
+
+            everything = db.get_context_for_injection(max_tokens=1000, max_observations=2)
+            assert [o["id"] for o in everything["observation_index"]] == ["obs_ui", "obs_api_2"]
+            assert (
+                db.get_context_for_injection(domain="ui", max_tokens=5)["observation_index"] == []
+            )
+            db.close()
+
+    def test_backfills_existing_database(self):
+        """A database populated before the digest existed is backfilled on open."""
+        from cyntra.memory.database import MemoryDB
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = MemoryDB(db_path=db_path)
+            self._populate(db)
+            expected = db.get_context_for_injection(domain="api", max_tokens=120)
+            with db.pool.write() as conn, conn:
+                conn.execute("DELETE FROM injection_digest")
+                conn.execute("DELETE FROM injection_digest_totals")
+            db.close()
+
+            db = MemoryDB(db_path=db_path)
+            assert db.get_context_for_injection(domain="api", max_tokens=120) == expected
+            db.close()
@@ -0,0 +1,424 @@
+"""Tests for the embedded (SQLite + memmapped vectors) memory store."""
+
+import asyncio
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import numpy as np
+import pytest
+
+from cyntra.memory.embedded_store import EmbeddedMemoryStore
+from cyntra.memory.models import (
+    ExtractedMemory,
+    ExtractionBatch,
+    LinkType,
+    MemoryLink,
+    MemoryScope,
+    MemoryType,
+)
+from cyntra.memory.vector_index import VectorIndex
+
+
+def extracted(text: str, **kwargs) -> ExtractedMemory:
+    return ExtractedMemory(
+        text=text, memory_type=kwargs.pop("memory_type", MemoryType.PATTERN), **kwargs
+    )
+
+
+def unit(*values: float) -> list[float]:
+    return [*values, *([0.0] * (4 - len(values)))]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EmbeddedMemoryStore(tmp_path / "memory.db")
+    yield store
+    store.conn.close()
+
+
+class TestEmbeddedMemoryStore:
+    """CRUD, search and links against the embedded backend."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_round_trip(self, tmp_path, store):
+        """Memories persist with normalised float32 embeddings and survive reopening."""
+        memory_id = await store.create(
+            extracted("Check permissions", issue_tags=["bug"], file_paths=["a.py"]),
+            agent_id="claude",
+            embedding=unit(3.0, 4.0),
+            run_id="run-1",
+        )
+
+        reopened = EmbeddedMemoryStore(tmp_path / "memory.db")
+        memory = await reopened.get(memory_id)
+
+        assert memory.text == "Check permissions"
+        assert memory.issue_tags == ["bug"]
+        assert memory.run_id == "run-1"
+        assert memory.embedding.dtype == np.float32
+        assert memory.embedding.tolist() == pytest.approx([0.6, 0.8, 0.0, 0.0])
+        assert await reopened.get(UUID(int=0)) is None
+        reopened.conn.close()
+
+    @pytest.mark.asyncio
+    async def test_search_similar_filters(self, store):
+        """Similarity search honours threshold, visibility, archival and importance."""
+        near, other_agent, collective, archived, unimportant, far = await store.create_batch(
+            [
+                extracted("near"),
+                extracted("other agent"),
+                extracted("collective"),
+                extracted("archived"),
+                extracted("unimportant", importance_score=0.05),
+                extracted("far"),
+            ],
+            agent_id="claude",
+            embeddings=[
+                unit(1.0, 0.1),
+                unit(1.0, 0.2),
+                unit(1.0, 0.3),
+                unit(1.0),
+                unit(1.0),
+                unit(0.0, 1.0),
+            ],
+        )
+        store.conn.execute(
+            "UPDATE agent_memories SET agent_id = 'codex' WHERE id IN (?, ?)",
+            (str(other_agent), str(collective)),
+        )
+        await store.update(collective, {"scope": MemoryScope.COLLECTIVE})
+        await store.archive(archived)
+
+        results = await store.search_similar(unit(1.0), agent_id="claude", limit=10)
+        assert [m.id for m in results] == [near, collective]
+        assert results[0].similarity_score > results[1].similarity_score
+
+        results = await store.search_similar(unit(1.0), limit=10)
+        assert [m.id for m in results] == [near, other_agent, collective]
+        assert far not in [m.id for m in results]
+        assert unimportant not in [m.id for m in results]
+
+    @pytest.mark.asyncio
+    async def test_tag_and_file_search(self, store):
+        """Tag/file overlap queries use the inverted indexes and track updates."""
+        first, second = await store.create_batch(
+            [
+                extracted("a", issue_tags=["bug", "io"], file_paths=["a.py"], importance_score=0.9),
+                extracted("b", issue_tags=["io"], file_paths=["b.py"], importance_score=0.4),
+            ],
+            agent_id="claude",
+        )
+
+        assert [m.id for m in await store.search_by_tags(["io"])] == [first, second]
+        assert [m.id for m in await store.search_by_tags(["bug"], agent_id="claude")] == [first]
+        assert await store.search_by_tags(["io"], agent_id="codex") == []
+        assert [m.id for m in await store.search_by_files(["b.py", "c.py"])] == [second]
+
+        await store.update(second, {"file_paths": ["c.py"]})
+        assert [m.id for m in await store.search_by_files(["b.py"])] == []
+        assert [m.id for m in await store.search_by_files(["c.py"])] == [second]
+
+    @pytest.mark.asyncio
+    async def test_search_multi_signal(self, store):
+        """Signals are scored and merged, keeping each memory's best score."""
+        both, tagged, filed = await store.create_batch(
+            [
+                extracted("both", issue_tags=["io"]),
+                extracted("tagged", issue_tags=["io", "bug"]),
+                extracted("filed", file_paths=["a.py"]),
+            ],
+            agent_id="claude",
+            embeddings=[unit(1.0), unit(0.0, 1.0), unit(0.0, 0.0, 1.0)],
+        )
+
+        results = await store.search_multi_signal(
+            agent_id="claude",
+            embedding=unit(1.0),
+            tags=["io", "bug"],
+            file_paths=["a.py", "b.py"],
+        )
+
+        scores = {memory.id: score for memory, score in results}
+        assert [memory.id for memory, _ in results] == [both, tagged, filed]
+        assert scores == pytest.approx({both: 0.4, tagged: 0.25, filed: 0.125})
+        assert results[0][0].similarity_score == pytest.approx(1.0)
+        assert await store.search_multi_signal(agent_id="claude") == []
+
+    @pytest.mark.asyncio
+    async def test_links_hubs_and_healing(self, store):
+        """Links are bidirectional, feed find_hubs, and are healed for dead memories."""
+        hub, a, b = await store.create_batch(
+            [extracted("hub", importance_score=0.9), extracted("a"), extracted("b")],
+            agent_id="claude",
+        )
+        await store.update(hub, {"access_count": 5})
+        await store.create_links_batch(
+            [
+                MemoryLink(
+                    source_id=a, target_id=hub, link_type=LinkType.INSTANCE_OF, confidence=0.9
+                ),
+                MemoryLink(
+                    source_id=b, target_id=hub, link_type=LinkType.INSTANCE_OF, confidence=0.9
+                ),
+                MemoryLink(
+                    source_id=b, target_id=hub, link_type=LinkType.INSTANCE_OF, confidence=0.9
+                ),
+            ]
+        )
+
+        links = await store.get_links(hub)
+        assert sorted(link["uuid"] for link in links["inbound"]) == sorted([str(a), str(b)])
+        assert (await store.get(a)).outbound_links[0]["uuid"] == str(hub)
+        assert [m.id for m in await store.find_hubs("claude")] == [hub]
+
+        assert await store.heal_dead_links([b]) == 1
+        assert [link["uuid"] for link in (await store.get_links(hub))["inbound"]] == [str(a)]
+        assert await store.find_hubs("claude") == []
+
+    @pytest.mark.asyncio
+    async def test_link_traversal(self, store):
+        """Batched traversal walks stored links with depth annotations."""
+        from cyntra.memory.linking import LinkingService
+
+        a, b, c = await store.create_batch(
+            [extracted("a"), extracted("b"), extracted("c")], agent_id="claude"
+        )
+        await store.create_links_batch(
+            [
+                MemoryLink(source_id=a, target_id=b, link_type=LinkType.CAUSES, confidence=0.9),
+                MemoryLink(source_id=c, target_id=b, link_type=LinkType.CAUSES, confidence=0.9),
+            ]
+        )
+
+        service = LinkingService(store=store, vector_ops=None)
+        related = await service.traverse_neighborhood([a], max_depth=2)
+
+        assert [(m.id, depth) for m, depth in related] == [(b, 1), (c, 2)]
+        assert [m.id for m in await service.traverse_related(a, max_depth=1)] == [b]
+
+    @pytest.mark.asyncio
+    async def test_activity_and_scoring(self, store):
+        """Run counters, access tracking and score recalculation."""
+        assert await store.increment_agent_runs("claude") == 1
+        assert await store.increment_agent_runs("claude") == 2
+        memory_id = await store.create(extracted("m", importance_score=0.9), agent_id="claude")
+        assert (await store.get(memory_id)).runs_at_creation == 2
+
+        await store.increment_access(memory_id)
+        memory = await store.get(memory_id)
+        assert memory.access_count == 1
+        assert memory.last_accessed is not None
+
+        assert await store.recalculate_scores("claude") == 1
+        assert (await store.get(memory_id)).importance_score != 0.9
+
+        await store.update(memory_id, {"importance_score": 0.0})
+        assert await store.get_archival_candidates("claude") == [memory_id]
+        with pytest.raises(ValueError):
+            await store.update(memory_id, {"id": "nope"})
+
+    @pytest.mark.asyncio
+    async def test_extraction_batches(self, store):
+        """Extraction batch tracking round-trips JSON payloads."""
+        now = datetime.utcnow()
+        batch_id = await store.create_extraction_batch(
+            ExtractionBatch(
+                batch_id="b-1",
+                custom_id="c-1",
+                agent_id="claude",
+                run_id="run-1",
+                request_payload={"prompt": "x"},
+                status="submitted",
+                created_at=now,
+                submitted_at=now,
+            )
+        )
+
+        (pending,) = await store.get_pending_extraction_batches("claude")
+        assert pending.id == batch_id
+        assert pending.request_payload == {"prompt": "x"}
+
+        await store.update_extraction_batch(
+            batch_id, {"status": "completed", "extracted_memories": [{"text": "t"}]}
+        )
+        assert await store.get_pending_extraction_batches() == []
+
+    @pytest.mark.asyncio
+    async def test_expired_memories_are_not_surfaced(self, store):
+        """Expired memories are excluded from similarity search."""
+        await store.create(
+            extracted("old", expires_at=datetime.utcnow() - timedelta(days=1)),
+            agent_id="claude",
+            embedding=unit(1.0),
+        )
+        assert await store.search_similar(unit(1.0)) == []
+
+
+class TestVectorIndex:
+    """Approximate search over the memmapped matrix."""
+
+    def test_ivf_recall_against_exact(self, tmp_path):
+        """IVF search finds nearly all of the exact top-k."""
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(50, 32))
+        vectors = centers[rng.integers(0, 50, size=5000)] + rng.normal(scale=0.3, size=(5000, 32))
+        index = VectorIndex(tmp_path / "v.f32", ivf_min_rows=1000, nprobe=8)
+        assert index.append(vectors) == list(range(5000))
+
+        hits = 0
+        for query in vectors[:50]:
+            exact = {row for row, _ in index.search(query, 10, exact=True)}
+            approx = {row for row, _ in index.search(query, 10)}
+            hits += len(exact & approx)
+
+        assert index.trained
+        assert hits / 500 >= 0.9
+
+    def test_reopen_and_incremental_assignment(self, tmp_path):
+        """Rows appended after training are searchable; row counts survive reopening."""
+        rng = np.random.default_rng(1)
+        index = VectorIndex(tmp_path / "v.f32", ivf_min_rows=100)
+        index.append(rng.normal(size=(200, 8)))
+        index.search(rng.normal(size=8), 5)
+
+        (row,) = index.append([[1.0] * 8])
+        assert index.search([1.0] * 8, 1)[0] == (row, pytest.approx(1.0))
+        assert len(VectorIndex(tmp_path / "v.f32", 8)) == 201
+
+
+class TestSleeptimeQueries:
+    """Consolidation and collective services run against the embedded backend."""
+
+    @pytest.mark.asyncio
+    async def test_consolidation_candidates_page_past_created_at_ties(self, store):
+        """Pages keyed on (created_at, id) return every memory exactly once."""
+        from cyntra.memory.consolidation import ConsolidationHandler
+
+        ids = await store.create_batch(
+            [extracted(f"m{i}") for i in range(5)],
+            agent_id="claude",
+            embeddings=[unit(1.0, float(i)) for i in range(5)],
+        )
+        await store.create(extracted("no embedding"), agent_id="claude")
+        handler = ConsolidationHandler(store=store)
+
+        newest = await handler._get_consolidation_candidates("claude", limit=5)
+        assert {m.id for m in newest} == set(ids)
+
+        seen, after = [], (datetime(2000, 1, 1), UUID(int=0))
+        while page := await handler._get_consolidation_candidates("claude", limit=2, after=after):
+            seen += [m.id for m in page]
+            after = (page[-1].created_at, page[-1].id)
+        assert sorted(seen) == sorted(ids)
+        assert len(seen) == len(ids)
+
+    @pytest.mark.asyncio
+    async def test_collective_service(self, store):
+        """Collective queries and promotion candidates go through store methods."""
+        from cyntra.memory.collective import CollectiveMemoryService, PromotionCriteria
+
+        (collective,) = await store.create_batch(
+            [extracted("shared")], agent_id="claude", scope=MemoryScope.COLLECTIVE
+        )
+        (candidate,) = await store.create_batch(
+            [extracted("candidate", importance_score=0.9, confidence=0.9)],
+            agent_id="claude",
+            embeddings=[unit(1.0)],
+        )
+        await store.update(candidate, {"access_count": 5})
+        (peer,) = await store.create_batch(
+            [extracted("peer")], agent_id="codex", embeddings=[unit(1.0, 0.1)]
+        )
+        service = CollectiveMemoryService(store, PromotionCriteria(pattern_min_agents=2))
+
+        assert [m.id for m in await service.get_collective_patterns()] == [collective]
+        assert await service.get_collective_by_type(MemoryType.DYNAMIC) == []
+        similar = await service.find_similar_across_agents(await store.get(candidate))
+        assert [m.id for m in similar] == [peer]
+        assert [m.id for m in await service.identify_promotion_candidates()] == [candidate]
+
+    @pytest.mark.asyncio
+    async def test_transaction_rolls_back_on_error(self, store):
+        """`transaction()` yields the connection inside one write transaction."""
+        memory_id = await store.create(extracted("kept"), agent_id="claude")
+
+        with pytest.raises(RuntimeError):
+            async with store.transaction() as conn:
+                conn.execute("UPDATE agent_memories SET text = 'changed'")
+                raise RuntimeError("boom")
+        assert (await store.get(memory_id)).text == "kept"
+
+        async with store.transaction() as conn:
+            conn.execute("UPDATE agent_memories SET text = 'changed'")
+        assert (await store.get(memory_id)).text == "changed"
+
+    @pytest.mark.asyncio
+    async def test_store_calls_join_open_transaction(self, store):
+        """Writes inside `transaction()` join it and roll back with it."""
+        async with store.transaction():
+            kept = await store.create(extracted("kept"), agent_id="claude")
+            async with store.transaction():
+                await store.increment_agent_runs("claude")
+        assert (await store.get(kept)).text == "kept"
+        assert await store.get_agent_run_count("claude") == 1
+
+        with pytest.raises(RuntimeError):
+            async with store.transaction():
+                await asyncio.gather(
+                    store.create(extracted("dropped"), agent_id="claude"),
+                    store.increment_agent_runs("claude"),
+                )
+                raise RuntimeError("boom")
+        assert [m.text for m in await store.search_by_type(MemoryType.PATTERN, "claude")] == [
+            "kept"
+        ]
+        assert await store.get_agent_run_count("claude") == 1
+
+    @pytest.mark.asyncio
+    async def test_other_writers_wait_for_transaction(self, store):
+        """A write from another task runs after the open transaction commits."""
+        order = []
+        started = asyncio.Event()
+
+        async def writer():
+            await started.wait()
+            await store.increment_agent_runs("claude")
+            order.append("writer")
+
+        # Started outside the transaction, so it does not join it
+        task = asyncio.create_task(writer())
+        async with store.transaction():
+            started.set()
+            await asyncio.sleep(0.01)
+            await store.increment_agent_runs("claude")
+            order.append("transaction")
+        await task
+
+        assert order == ["transaction", "writer"]
+        assert await store.get_agent_run_count("claude") == 2
+
+
+class TestConnect:
+    """DSN handling and backend selection."""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_dsn(self, tmp_path):
+        store = await EmbeddedMemoryStore.connect(f"sqlite:///{tmp_path}/memory.db")
+        assert store.db_path == tmp_path / "memory.db"
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_store_sqlite_scheme(self, tmp_path):
+        from cyntra.memory.store import connect_store
+
+        store = await connect_store(f"sqlite:///{tmp_path}/memory.db")
+        assert isinstance(store, EmbeddedMemoryStore)
+        assert store.db_path == tmp_path / "memory.db"
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_store_unknown_scheme(self):
+        from cyntra.memory.store import connect_store
+
+        with pytest.raises(ValueError, match="mysql"):
+            await connect_store("mysql://localhost/db")
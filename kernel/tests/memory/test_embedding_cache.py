@@ -0,0 +1,76 @@
+"""Tests for the persistent embedding store."""
+
+import numpy as np
+import pytest
+
+from cyntra.memory.embedding_cache import EmbeddingStore
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "embeddings"
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+
+    def test_round_trip_and_reopen(self, cache_dir):
+        """Stored vectors are returned as float32 and survive reopening."""
+        store = EmbeddingStore(cache_dir, "model-a")
+        assert store.put_many(["one", "two"], [[1.0, 0.0, 0.5], [0.0, 1.0, 0.25]]) == 2
+
+        reopened = EmbeddingStore(cache_dir, "model-a")
+        one, missing, two = reopened.get_many(["one", "three", "two"])
+
+        assert missing is None
+        assert one.dtype == np.float32
+        assert one.tolist() == [1.0, 0.0, 0.5]
+        assert two.tolist() == [0.0, 1.0, 0.25]
+        assert len(reopened) == 2
+
+    def test_keyed_by_model(self, cache_dir):
+        """The same text under another model is a miss."""
+        EmbeddingStore(cache_dir, "model-a").put_many(["text"], [[1.0, 2.0]])
+
+        assert EmbeddingStore(cache_dir, "org/model-b").get_many(["text"]) == [None]
+
+    def test_duplicates_are_not_appended(self, cache_dir):
+        """Texts already present (or repeated in a batch) are stored once."""
+        store = EmbeddingStore(cache_dir, "model-a")
+        assert store.put_many(["a", "a", "b"], [[1.0], [1.0], [2.0]]) == 2
+        assert store.put_many(["a"], [[1.0]]) == 0
+
+        assert store.vectors_path.stat().st_size == 2 * 4
+        assert store.index_path.stat().st_size == 2 * 16
+
+    def test_sees_appends_from_other_instances(self, cache_dir):
+        """A second writer's entries are found without reopening."""
+        reader = EmbeddingStore(cache_dir, "model-a")
+        reader.put_many(["a"], [[1.0, 1.0]])
+        EmbeddingStore(cache_dir, "model-a").put_many(["b"], [[2.0, 2.0]])
+
+        assert reader.get_many(["b"])[0].tolist() == [2.0, 2.0]
+
+    def test_torn_tail_is_ignored_and_repaired(self, cache_dir):
+        """A vector written without its index record is dropped on the next append."""
+        store = EmbeddingStore(cache_dir, "model-a")
+        store.put_many(["a"], [[1.0, 1.0]])
+        with open(store.vectors_path, "ab") as f:
+            f.write(np.array([9.0, 9.0], dtype=np.float32).tobytes())
+        with open(store.index_path, "ab") as f:
+            f.write(b"torn")
+
+        reopened = EmbeddingStore(cache_dir, "model-a")
+        assert len(reopened) == 1
+        reopened.put_many(["b"], [[2.0, 2.0]])
+
+        fresh = EmbeddingStore(cache_dir, "model-a")
+        assert [v.tolist() for v in fresh.get_many(["a", "b"])] == [[1.0, 1.0], [2.0, 2.0]]
+
+    def test_dimension_mismatch_is_not_stored(self, cache_dir):
+        """Vectors of a different size than the store's are skipped."""
+        store = EmbeddingStore(cache_dir, "model-a")
+        store.put_many(["a"], [[1.0, 1.0]])
+
+        assert store.put_many(["b"], [[1.0, 1.0, 1.0]]) == 0
+        assert store.get_many(["b"]) == [None]
@@ -32,8 +32,9 @@ class TestMemoryExtractor:
         """Create mock vector operations."""
         ops = MagicMock()
         ops.generate_embedding = AsyncMock(return_value=[0.1] * 768)
-        ops.batch_embeddings = AsyncMock(return_value=[[0.1] * 768, [0.2] * 768])
-        ops.cosine_similarity = MagicMock(return_value=0.85)
+        ops.batch_embeddings = AsyncMock(
+            return_value=[[0.1] * 384 + [0.0] * 384, [0.0] * 384 + [0.2] * 384]
+        )
         return ops
 
     def test_extraction_config_defaults(self):
@@ -148,7 +149,7 @@ Assistant: Fixed the permission issue.
         ]
 
         # High similarity should deduplicate
-        mock_vector_ops.cosine_similarity.return_value = 0.95
+        mock_vector_ops.batch_embeddings.return_value = [[0.1] * 768, [0.2] * 768]
 
         deduplicated = await extractor.deduplicate_batch(
             memories,
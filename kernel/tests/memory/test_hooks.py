@@ -153,6 +153,66 @@ class TestToolUse:
             hooks.close()
 
 
+class TestBatchedWrites:
+    """Tests for buffered observation writes."""
+
+    @pytest.fixture
+    def hooks(self):
+        """Create hooks with active session."""
+        from cyntra.memory.hooks import MemoryHooks
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hooks = MemoryHooks(db_path=Path(tmpdir) / "test.db")
+            hooks.workcell_start(workcell_id="wc-batch", domain="code")
+            yield hooks
+            hooks.close()
+
+    def test_batched_flushes_in_chunks(self, hooks):
+        """Rows are written every flush_every observations and on exit."""
+        with hooks.batched(flush_every=3):
+            for i in range(4):
+                hooks.tool_use(tool_name="Bash", result=f"make target_{i}")
+                stored = len(hooks.db.get_observations(session_id=hooks._session_id))
+                assert stored == (0 if i < 2 else 3)
+
+        assert len(hooks.db.get_observations(session_id=hooks._session_id)) == 4
+        assert len(hooks.search("target_2")) == 1
+
+    def test_batched_skips_duplicates(self, hooks):
+        """Identical observations (same content-hash ID) do not fail the chunk."""
+        with hooks.batched():
+            hooks.tool_use(tool_name="Bash", result="make")
+            hooks.tool_use(tool_name="Bash", result="make")
+            hooks.add_discovery("Cache is cold")
+
+        assert len(hooks.db.get_observations(session_id=hooks._session_id)) == 2
+
+    def test_failed_chunk_only_drops_bad_rows(self, hooks):
+        """A row the bulk insert rejects is dropped alone; the rest are written."""
+        with hooks.batched(flush_every=3):
+            hooks.add_discovery("First")
+            hooks._write_observation(
+                observation_id="obs_bad",
+                session_id=hooks._session_id,
+                obs_type="discovery",
+                content="Unserialisable args",
+                tool_args={"handle": object()},
+            )
+            hooks.add_discovery("Third")
+
+        contents = {o["content"] for o in hooks.db.get_observations(session_id=hooks._session_id)}
+        assert contents == {"First", "Third"}
+
+    def test_workcell_end_flushes_pending(self, hooks):
+        """Session counts include observations still buffered."""
+        session_id = hooks._session_id
+        with hooks.batched():
+            hooks.add_discovery("Found flaky test")
+            hooks.workcell_end(status="success")
+
+        assert hooks.db.get_session(session_id)["observation_count"] == 1
+
+
 class TestGateResult:
     """Tests for gate_result hook."""
 
@@ -5,7 +5,7 @@ Some tests require external dependencies (database, LLM client).
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -176,8 +176,7 @@ class TestSleeptimePipeline:
     def mock_store(self):
         """Create mock store."""
         store = MagicMock()
-        store.pool = MagicMock()
-        store.pool.acquire = MagicMock(return_value=AsyncMock())
+        store.get_consolidation_candidates = AsyncMock(return_value=[])
         store.get = AsyncMock(return_value=None)
         store.get_batch = AsyncMock(return_value=[])
         store.update = AsyncMock()
@@ -242,36 +241,7 @@ class TestSleeptimePipeline:
             ),
         ]
 
-        # Setup mock to return similar memories
-        async def mock_fetch(*args):
-            return [
-                {
-                    "id": m.id,
-                    "agent_id": m.agent_id,
-                    "text": m.text,
-                    "memory_type": m.memory_type.value,
-                    "scope": m.scope.value,
-                    "importance_score": m.importance_score,
-                    "confidence": m.confidence,
-                    "embedding": m.embedding,
-                    "issue_tags": [],
-                    "file_paths": [],
-                    "access_count": 0,
-                    "mention_count": 0,
-                    "runs_at_creation": 1,
-                    "runs_at_last_access": 1,
-                    "is_archived": False,
-                    "created_at": m.created_at,
-                    "updated_at": m.created_at,
-                }
-                for m in similar_memories
-            ]
-
-        mock_conn = AsyncMock()
-        mock_conn.fetch = AsyncMock(side_effect=mock_fetch)
-        mock_store.pool.acquire.return_value.__aenter__ = AsyncMock(return_value=mock_conn)
-        mock_store.pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
-        mock_store._row_to_memory = MagicMock(side_effect=lambda r: similar_memories[0])
+        mock_store.get_consolidation_candidates = AsyncMock(return_value=similar_memories)
 
         handler = ConsolidationHandler(
             store=mock_store,
@@ -283,6 +253,78 @@ class TestSleeptimePipeline:
         # Should find at least one cluster of similar memories
         assert isinstance(clusters, list)
 
+    @pytest.mark.asyncio
+    async def test_find_clusters_groups_by_similarity(self, mock_store, mock_vector_ops):
+        """Test greedy clustering over the similarity matrix."""
+        import numpy as np
+
+        from cyntra.memory.consolidation import ConsolidationConfig, ConsolidationHandler
+
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(3, 64))
+        embeddings = [centers[i % 3] + rng.normal(scale=0.01, size=64) for i in range(9)]
+        embeddings.append(rng.normal(size=64))  # unrelated singleton
+        memories = [
+            AgentMemory(
+                id=uuid4(),
+                agent_id="claude",
+                text=f"memory {i}",
+                memory_type=MemoryType.PATTERN,
+                embedding=embedding,
+                created_at=datetime.utcnow(),
+            )
+            for i, embedding in enumerate(embeddings)
+        ]
+
+        handler = ConsolidationHandler(
+            store=mock_store,
+            vector_ops=mock_vector_ops,
+            config=ConsolidationConfig(similarity_threshold=0.9, max_cluster_size=3),
+        )
+        with patch.object(
+            handler, "_get_consolidation_candidates", AsyncMock(return_value=memories)
+        ):
+            clusters = await handler.find_clusters(agent_id="claude")
+
+        ids = [m.id for m in memories]
+        assert [c.memory_ids for c in clusters] == [
+            [ids[0], ids[3], ids[6]],
+            [ids[1], ids[4], ids[7]],
+            [ids[2], ids[5], ids[8]],
+        ]
+        assert all(c.consolidation_confidence >= 0.9 for c in clusters)
+
+    @pytest.mark.asyncio
+    async def test_find_clusters_watermark_breaks_created_at_ties(
+        self, mock_store, mock_vector_ops
+    ):
+        """Test the next pass pages after (created_at, id), not created_at alone."""
+        from cyntra.memory.consolidation import ConsolidationHandler
+
+        created_at = datetime(2025, 1, 1)
+        memories = [
+            AgentMemory(
+                id=uuid4(),
+                agent_id="claude",
+                text=f"memory {i}",
+                memory_type=MemoryType.PATTERN,
+                embedding=[float(i == j) for j in range(4)],
+                created_at=created_at,
+            )
+            for i in range(3)
+        ]
+
+        handler = ConsolidationHandler(store=mock_store, vector_ops=mock_vector_ops)
+        candidates = AsyncMock(side_effect=[memories, []])
+        with patch.object(handler, "_get_consolidation_candidates", candidates):
+            await handler.find_clusters(agent_id="claude")
+            await handler.find_clusters(agent_id="claude")
+
+        assert candidates.call_args.kwargs["after"] == (
+            created_at,
+            max(m.id for m in memories),
+        )
+
 
 class TestEventHandlers:
     """Integration tests for event handlers."""
@@ -206,11 +206,8 @@ class TestLinkingService:
             created_at=datetime.utcnow(),
         )
 
-        mock_store.get_links.return_value = {
-            "inbound": [],
-            "outbound": [{"uuid": str(related_memory.id), "type": "improves_on"}],
-        }
-        mock_store.get = AsyncMock(return_value=related_memory)
+        sample_memory.outbound_links = [{"uuid": str(related_memory.id), "type": "improves_on"}]
+        mock_store.get_batch = AsyncMock(side_effect=[[sample_memory], [related_memory]])
 
         service = LinkingService(
             store=mock_store,
@@ -225,6 +222,63 @@ class TestLinkingService:
         assert len(related) == 1
         assert related[0].id == related_memory.id
 
+    @pytest.mark.asyncio
+    async def test_traverse_neighborhood_batches_each_level(
+        self, mock_store, mock_vector_ops, sample_memory
+    ):
+        """A depth-2 walk costs one get_batch per level, honouring the per-memory cap."""
+        from cyntra.memory.linking import LinkingService
+
+        def memory(**kwargs) -> AgentMemory:
+            return AgentMemory(
+                id=uuid4(),
+                agent_id="claude",
+                text="Linked",
+                memory_type=MemoryType.PATTERN,
+                created_at=datetime.utcnow(),
+                **kwargs,
+            )
+
+        grandchild = memory()
+        child_a = memory(outbound_links=[{"uuid": str(grandchild.id)}])
+        child_b = memory(inbound_links=[{"uuid": str(sample_memory.id)}])
+        skipped = memory()
+        sample_memory.outbound_links = [
+            {"uuid": str(child_a.id)},
+            {"uuid": str(child_b.id)},
+            {"uuid": str(skipped.id)},
+        ]
+        mock_store.get_batch = AsyncMock(
+            side_effect=[[sample_memory], [child_a, child_b], [grandchild]]
+        )
+
+        service = LinkingService(store=mock_store, vector_ops=mock_vector_ops)
+        related = await service.traverse_neighborhood(
+            [sample_memory.id], max_depth=2, max_per_level=2
+        )
+
+        assert [(m.id, depth) for m, depth in related] == [
+            (child_a.id, 1),
+            (child_b.id, 1),
+            (grandchild.id, 2),
+        ]
+        assert mock_store.get_batch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_traverse_neighborhood_uses_store_query(self, mock_vector_ops, sample_memory):
+        """Stores with get_neighborhood answer the whole walk in one call."""
+        from cyntra.memory.linking import LinkingService
+
+        class NeighborhoodStore:
+            get_neighborhood = AsyncMock(return_value=[(sample_memory, 1)])
+
+        store = NeighborhoodStore()
+        service = LinkingService(store=store, vector_ops=mock_vector_ops)
+        start = uuid4()
+
+        assert await service.traverse_related(start, max_depth=3) == [sample_memory]
+        store.get_neighborhood.assert_awaited_once_with([start], 3, 5)
+
 
 class TestLinkTypes:
     """Tests for link type classification logic."""
@@ -37,6 +37,29 @@ class TestAgentMemory:
         assert memory.importance_score == 0.75
         assert "bug" in memory.issue_tags
 
+    def test_embedding_is_float32_array(self):
+        """Test embeddings are coerced to contiguous float32 and serialise as lists."""
+        import numpy as np
+
+        memory = AgentMemory(
+            id=uuid4(),
+            agent_id="claude",
+            text="Embedded memory",
+            memory_type=MemoryType.PATTERN,
+            embedding=[0.5, 0.25, 1.0],
+            created_at=datetime.utcnow(),
+        )
+
+        assert isinstance(memory.embedding, np.ndarray)
+        assert memory.embedding.dtype == np.float32
+        assert memory.embedding.flags.c_contiguous
+        assert memory.model_dump()["embedding"] == [0.5, 0.25, 1.0]
+        assert AgentMemory.model_validate_json(memory.model_dump_json()).embedding.tolist() == [
+            0.5,
+            0.25,
+            1.0,
+        ]
+
     def test_memory_types(self):
         """Test all memory types."""
         types = [
@@ -67,6 +67,48 @@ class TestMemoryStoreUnit:
         assert memory.scope == MemoryScope.INDIVIDUAL
         assert memory.importance_score == 0.75
 
+    def test_row_to_memory_decodes_link_json(self, mock_store):
+        """Link lists aggregated from memory_links arrive as jsonb text."""
+        target = uuid4()
+        row = {
+            "id": uuid4(),
+            "agent_id": "claude",
+            "text": "Linked pattern",
+            "memory_type": "pattern",
+            "created_at": datetime.utcnow(),
+            "outbound_edges": f'[{{"uuid": "{target}", "type": "causes"}}]',
+            "inbound_edges": "[]",
+            # Deprecated JSONB columns still returned by `m.*` before migration 004
+            "outbound_links": "[]",
+            "inbound_links": f'[{{"uuid": "{target}", "type": "stale"}}]',
+        }
+
+        memory = mock_store._row_to_memory(row)
+
+        assert memory.outbound_links == [{"uuid": str(target), "type": "causes"}]
+        assert memory.inbound_links == []
+
+    @pytest.mark.asyncio
+    async def test_create_links_batch_single_insert(self, mock_store, mock_pool):
+        """A batch of links is one INSERT into the edge table."""
+        from cyntra.memory.models import LinkType, MemoryLink
+
+        links = [
+            MemoryLink(
+                source_id=uuid4(), target_id=uuid4(), link_type=LinkType.CAUSES, confidence=0.8
+            )
+            for _ in range(3)
+        ]
+
+        await mock_store.create_links_batch(links)
+
+        conn = mock_pool.acquire.return_value.__aenter__.return_value
+        conn.execute.assert_awaited_once()
+        query, *params = conn.execute.call_args.args
+        assert "INSERT INTO memory_links" in query
+        assert params[0] == [link.source_id for link in links]
+        assert params[2] == ["causes"] * 3
+
     def test_memory_to_insert_params(self, mock_store):
         """Test converting ExtractedMemory to insert parameters."""
         memory = ExtractedMemory(
@@ -1,5 +1,6 @@
 """Tests for memory surfacing service."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -74,7 +75,7 @@ class TestMemorySurfacingService:
     def mock_linking_service(self):
         """Create mock linking service."""
         service = MagicMock()
-        service.traverse_related = AsyncMock(return_value=[])
+        service.traverse_neighborhood = AsyncMock(return_value=[])
         return service
 
     @pytest.fixture
@@ -202,6 +203,111 @@ class TestMemorySurfacingService:
         assert memories == []
 
 
+class TestSignalDispatch:
+    """Tests for how retrieval signals reach the store."""
+
+    @staticmethod
+    def memory(**kwargs) -> AgentMemory:
+        return AgentMemory(
+            id=kwargs.pop("id", None) or uuid4(),
+            agent_id="claude",
+            text=kwargs.pop("text", "Memory"),
+            memory_type=MemoryType.PATTERN,
+            scope=MemoryScope.INDIVIDUAL,
+            importance_score=0.7,
+            confidence=0.8,
+            created_at=datetime.utcnow(),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_signals_run_concurrently(self):
+        """Without a combined query, semantic/tag/file searches overlap."""
+        from cyntra.memory.surfacing import MemorySurfacingService
+
+        in_flight, peak = 0, 0
+
+        async def search(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        store = MagicMock()
+        store.search_similar = AsyncMock(side_effect=search)
+        store.search_by_tags = AsyncMock(side_effect=search)
+        store.search_by_files = AsyncMock(side_effect=search)
+        vector_ops = MagicMock()
+        vector_ops.generate_embedding = AsyncMock(return_value=[0.1] * 768)
+
+        service = MemorySurfacingService(store=store, vector_ops=vector_ops)
+        await service.get_relevant_memories("query", "claude", tags=["a"], file_paths=["b.py"])
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_combined_query_used_when_available(self):
+        """Stores with search_multi_signal get one call carrying every signal."""
+        from cyntra.memory.surfacing import MemorySurfacingService, SurfacingConfig
+
+        hit = self.memory()
+
+        class CombinedStore:
+            search_multi_signal = AsyncMock(return_value=[(hit, 0.3)])
+
+        store = CombinedStore()
+        vector_ops = MagicMock()
+        vector_ops.generate_embedding = AsyncMock(return_value=[0.1] * 768)
+        service = MemorySurfacingService(
+            store=store, vector_ops=vector_ops, config=SurfacingConfig(max_per_signal=7)
+        )
+
+        memories = await service.get_relevant_memories(
+            "query", "claude", tags=["api"], file_paths=["a.py"]
+        )
+
+        assert memories == [hit]
+        store.search_multi_signal.assert_awaited_once()
+        kwargs = store.search_multi_signal.call_args.kwargs
+        assert kwargs["embedding"] == [0.1] * 768
+        assert kwargs["tags"] == ["api"]
+        assert kwargs["file_paths"] == ["a.py"]
+        assert kwargs["limit_per_signal"] == 7
+
+    @pytest.mark.asyncio
+    async def test_link_expansion_is_one_batch_per_level(self):
+        """Seeds and their neighbours are each fetched with a single get_batch."""
+        from cyntra.memory.linking import LinkingService
+        from cyntra.memory.surfacing import MemorySurfacingService
+
+        linked_a, linked_b, archived = self.memory(), self.memory(), self.memory(is_archived=True)
+        seed = self.memory(
+            similarity_score=0.9,
+            outbound_links=[{"uuid": str(linked_a.id)}, {"uuid": "not-a-uuid"}],
+            inbound_links=[{"uuid": str(linked_b.id)}, {"uuid": str(archived.id)}],
+        )
+        store = MagicMock()
+        store.search_similar = AsyncMock(return_value=[seed])
+        store.get_batch = AsyncMock(side_effect=[[seed], [linked_a, linked_b, archived]])
+        store.get_links = AsyncMock()
+        vector_ops = MagicMock()
+        vector_ops.generate_embedding = AsyncMock(return_value=[0.1] * 768)
+
+        service = MemorySurfacingService(
+            store=store,
+            vector_ops=vector_ops,
+            linking_service=LinkingService(store=store, vector_ops=vector_ops),
+        )
+        memories = await service.get_relevant_memories("query", "claude")
+
+        assert [m.id for m in memories] == [seed.id, linked_a.id, linked_b.id]
+        assert store.get_batch.await_count == 2
+        store.get_batch.assert_awaited_with([linked_a.id, linked_b.id, archived.id])
+        store.get_links.assert_not_called()
+
+
 class TestGenerateFingerprint:
     """Tests for fingerprint generation."""
 
@@ -244,7 +350,7 @@ class TestExpandViaLinks:
     def mock_linking_service(self):
         """Create mock linking service."""
         service = MagicMock()
-        service.traverse_related = AsyncMock(return_value=[])
+        service.traverse_neighborhood = AsyncMock(return_value=[])
         return service
 
     @pytest.fixture
@@ -284,7 +390,7 @@ class TestExpandViaLinks:
             confidence=0.8,
             created_at=datetime.utcnow(),
         )
-        mock_linking_service.traverse_related.return_value = [linked_memory]
+        mock_linking_service.traverse_neighborhood.return_value = [(linked_memory, 1)]
 
         starting_id = uuid4()
         related = await service.expand_via_links(
@@ -110,6 +110,69 @@ class TestVectorOps:
         assert result[0] == [0.1] * 768
 
 
+class TestEmbeddingCacheTiers:
+    """Tests for the LRU and persistent embedding cache tiers."""
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_lru(self):
+        """Recently read entries survive eviction."""
+        from cyntra.memory.vector_ops import VectorOps
+
+        ops = VectorOps(model_name="test-model", cache_size=2)
+        embed = AsyncMock(side_effect=lambda text: [float(len(text))])
+
+        with patch.object(ops, "_embed_local", new=embed):
+            await ops.generate_embedding("a")
+            await ops.generate_embedding("bb")
+            await ops.generate_embedding("a")  # refresh "a"
+            await ops.generate_embedding("ccc")  # evicts "bb"
+            await ops.generate_embedding("a")
+
+        assert ops._cache_key("a") in ops._cache
+        assert ops._cache_key("bb") not in ops._cache
+        assert embed.await_count == 3
+        assert ops.cache_info()["memory_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """A new instance reads embeddings stored by a previous one."""
+        from cyntra.memory.vector_ops import VectorOps
+
+        first = VectorOps(model_name="test-model", cache_dir=tmp_path)
+        with patch.object(first, "_embed_local", new=AsyncMock(return_value=[0.5, 0.25])):
+            await first.generate_embedding("observation")
+
+        second = VectorOps(model_name="test-model", cache_dir=tmp_path)
+        with patch.object(second, "_embed_local", new=AsyncMock()) as embed:
+            result = await second.generate_embedding("observation")
+
+        assert result == [0.5, 0.25]
+        embed.assert_not_awaited()
+        info = second.cache_info()
+        assert (info["memory_hits"], info["disk_hits"], info["misses"]) == (0, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_batch_goes_through_both_tiers(self, tmp_path):
+        """Only texts missing from both tiers are embedded."""
+        from cyntra.memory.vector_ops import VectorOps
+
+        warm = VectorOps(model_name="test-model", cache_dir=tmp_path)
+        with patch.object(warm, "_batch_embed_local", new=AsyncMock(return_value=[[1.0, 0.0]])):
+            await warm.batch_embeddings(["on disk"])
+
+        ops = VectorOps(model_name="test-model", cache_dir=tmp_path)
+        ops._cache[ops._cache_key("in memory")] = [0.0, 1.0]
+        batch = AsyncMock(return_value=[[0.5, 0.5]])
+        with patch.object(ops, "_batch_embed_local", new=batch):
+            result = await ops.batch_embeddings(["in memory", "on disk", "new"])
+
+        assert result == [[0.0, 1.0], [1.0, 0.0], [0.5, 0.5]]
+        batch.assert_awaited_once_with(["new"], 32)
+        info = ops.cache_info()
+        assert (info["memory_hits"], info["disk_hits"], info["misses"]) == (1, 1, 1)
+        assert info["disk_size"] == 2
+
+
 class TestCosineSimilarity:
     """Tests for cosine similarity calculation."""
 
@@ -208,6 +271,49 @@ class TestEuclideanDistance:
         assert distance == pytest.approx(1.732, rel=0.01)
 
 
+class TestSimilarityKernels:
+    """Tests for the batched NumPy similarity kernels."""
+
+    def test_similarity_matrix_matches_pairwise(self):
+        """Test all-pairs matrix agrees with pairwise cosine similarity."""
+        import numpy as np
+
+        from cyntra.memory.vector_ops import VectorOps, normalize_rows, similarity_matrix
+
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(20, 16)).tolist()
+
+        sims = similarity_matrix(normalize_rows(vectors))
+
+        assert sims.shape == (20, 20)
+        assert sims.dtype == np.float32
+        for i in range(20):
+            for j in range(20):
+                expected = VectorOps.cosine_similarity(vectors[i], vectors[j])
+                assert sims[i, j] == pytest.approx(expected, abs=1e-5)
+
+    def test_zero_rows_have_zero_similarity(self):
+        """Test zero vectors stay zero after normalisation."""
+        from cyntra.memory.vector_ops import normalize_rows, similarity_matrix
+
+        matrix = normalize_rows([[0.0, 0.0], [1.0, 1.0]])
+
+        assert similarity_matrix(matrix)[0].tolist() == [0.0, 0.0]
+
+    def test_top_k(self):
+        """Test top-k returns best matches first and honours the threshold."""
+        from cyntra.memory.vector_ops import normalize_rows, top_k
+
+        matrix = normalize_rows([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [-1.0, 0.0]])
+
+        ranked = top_k([2.0, 0.0], matrix, k=3)
+        assert [i for i, _ in ranked] == [0, 2, 1]
+        assert ranked[0][1] == pytest.approx(1.0)
+
+        assert [i for i, _ in top_k([1.0, 0.0], matrix, k=10, threshold=0.5)] == [0, 2]
+        assert top_k([1.0, 0.0], matrix, k=0) == []
+
+
 class TestGetVectorOps:
     """Tests for get_vector_ops singleton."""
 
@@ -222,6 +328,8 @@ class TestGetVectorOps:
         ops2 = vo_module.get_vector_ops()
 
         assert ops1 is ops2
+        # No persistent store unless a directory is passed.
+        assert ops1._cache_dir is None
 
     def test_singleton_with_params(self):
         """Test singleton with custom parameters."""
@@ -5,7 +5,11 @@ Test telemetry collection.
 import tempfile
 from pathlib import Path
 
-from cyntra.adapters.telemetry import TelemetryWriter, read_telemetry_events
+from cyntra.adapters.telemetry import (
+    TelemetryWriter,
+    iter_telemetry_events,
+    read_telemetry_events,
+)
 
 
 def test_telemetry_writer_basic():
@@ -146,3 +150,49 @@ def test_read_empty_telemetry():
         telemetry_path = Path(tmpdir) / "nonexistent.jsonl"
         events = read_telemetry_events(telemetry_path)
         assert len(events) == 0
+
+
+def test_iter_telemetry_events_streams_and_skips_bad_lines():
+    """Streaming reader yields parsed events lazily and skips malformed lines."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        telemetry_path = Path(tmpdir) / "telemetry.jsonl"
+        telemetry_path.write_text('{"type": "a"}\nnot json\n{"type": "b"}\n')
+
+        events = iter_telemetry_events(telemetry_path)
+        assert next(events) == {"type": "a"}
+        assert [e["type"] for e in events] == ["b"]
+        assert list(iter_telemetry_events(Path(tmpdir) / "missing.jsonl")) == []
+
+
+def test_kernel_memory_bridge_ingests_in_chunks(monkeypatch):
+    """Telemetry ingest writes observations in bulk chunks, not per event."""
+    from cyntra.kernel import memory_integration
+    from cyntra.kernel.memory_integration import KernelMemoryBridge
+    from cyntra.memory.database import MemoryDB
+
+    monkeypatch.setattr(memory_integration, "TELEMETRY_CHUNK_SIZE", 4)
+    batch_sizes: list[int] = []
+    add_observations = MemoryDB.add_observations
+
+    def record(self, observations, skip_duplicates=False):
+        observations = list(observations)
+        batch_sizes.append(len(observations))
+        return add_observations(self, observations, skip_duplicates)
+
+    monkeypatch.setattr(MemoryDB, "add_observations", record)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workcell = Path(tmpdir) / "wc"
+        workcell.mkdir()
+        with TelemetryWriter(workcell / "telemetry.jsonl") as writer:
+            for i in range(10):
+                writer.bash_command(command=f"make {i}", output=f"built target_{i}")
+            writer.thinking(content="not an observation")
+
+        bridge = KernelMemoryBridge(db_path=Path(tmpdir) / "mem.db")
+        bridge.hooks.workcell_start(workcell_id="wc-1")
+        bridge._ingest_telemetry(workcell / "telemetry.jsonl")
+
+        assert batch_sizes == [4, 4, 2]
+        assert len(bridge.hooks.db.get_observations(limit=100)) == 10
+        bridge.close()
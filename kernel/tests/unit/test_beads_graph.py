@@ -0,0 +1,76 @@
+"""Tests for BeadsGraph lookup indexes."""
+
+from datetime import UTC, datetime
+
+from cyntra.state.models import BeadsGraph, Dep, Issue
+
+
+def make_issue(id: str, status: str = "open") -> Issue:
+    """Helper to create test issues."""
+    now = datetime.now(UTC)
+    return Issue(id=id, title=f"Issue {id}", status=status, created=now, updated=now)
+
+
+def make_dep(from_id: str, to_id: str, dep_type: str = "blocks") -> Dep:
+    """Helper to create test deps."""
+    return Dep(from_id=from_id, to_id=to_id, dep_type=dep_type, created=datetime.now(UTC))
+
+
+class TestIndexedLookups:
+    """Indexed accessors match the original linear-scan semantics."""
+
+    def test_get_issue_returns_first_match(self) -> None:
+        first = make_issue("1")
+        graph = BeadsGraph(issues=[first, make_issue("2"), make_issue("1")], deps=[])
+
+        assert graph.get_issue("1") is first
+        assert graph.get_issue("missing") is None
+
+    def test_blocking_and_blocked_by(self) -> None:
+        graph = BeadsGraph(
+            issues=[make_issue("1"), make_issue("2"), make_issue("3")],
+            deps=[
+                make_dep("1", "3"),
+                make_dep("2", "3"),
+                make_dep("3", "1", "discovered"),
+                make_dep("9", "3"),  # Unknown blocker is skipped
+            ],
+        )
+
+        assert [i.id for i in graph.get_blocking_deps("3")] == ["1", "2"]
+        assert [i.id for i in graph.get_blocked_by("1")] == ["3"]
+        assert graph.get_blocked_by("3") == []
+
+    def test_get_deps_preserves_order_and_filters_type(self) -> None:
+        deps = [make_dep("1", "2"), make_dep("3", "1", "discovered"), make_dep("1", "1")]
+        graph = BeadsGraph(issues=[make_issue("1")], deps=deps)
+
+        assert graph.get_deps("1") == deps
+        assert graph.get_deps("1", "discovered") == [deps[1]]
+
+    def test_filter_to_issue_preserves_order(self) -> None:
+        graph = BeadsGraph(
+            issues=[make_issue(str(n)) for n in range(5)],
+            deps=[make_dep("0", "2"), make_dep("2", "4"), make_dep("1", "3"), make_dep("0", "4")],
+        )
+
+        filtered = graph.filter_to_issue("2")
+
+        assert [i.id for i in filtered.issues] == ["0", "2", "4"]
+        assert [(d.from_id, d.to_id) for d in filtered.deps] == [
+            ("0", "2"),
+            ("2", "4"),
+            ("0", "4"),
+        ]
+
+    def test_index_tracks_appends_and_replacement(self) -> None:
+        graph = BeadsGraph(issues=[make_issue("1")], deps=[])
+        assert graph.get_issue("2") is None
+
+        graph.issues.append(make_issue("2"))
+        graph.deps.append(make_dep("1", "2"))
+        assert graph.get_issue("2") is not None
+        assert [i.id for i in graph.get_blocked_by("1")] == ["2"]
+
+        graph.deps = []
+        assert graph.get_blocked_by("1") == []
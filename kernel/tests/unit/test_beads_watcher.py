@@ -0,0 +1,314 @@
+"""Tests for the Beads change watcher and graph delta application."""
+
+import asyncio
+import json
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cyntra.state.manager import StateManager
+from cyntra.state.models import BeadsGraph, Dep, GraphDelta, Issue
+from cyntra.state.watch import BeadsWatcher
+
+
+def make_issue(id: str, status: str = "open") -> Issue:
+    """Helper to create test issues."""
+    now = datetime.now(UTC)
+    return Issue(id=id, title=f"Issue {id}", status=status, created=now, updated=now)
+
+
+def make_dep(from_id: str, to_id: str, dep_type: str = "blocks") -> Dep:
+    """Helper to create test deps."""
+    return Dep(from_id=from_id, to_id=to_id, dep_type=dep_type, created=datetime.now(UTC))
+
+
+def append_line(path: Path, record: dict) -> None:
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+@pytest.fixture
+def beads_dir(tmp_path: Path) -> Path:
+    beads = tmp_path / ".beads"
+    beads.mkdir()
+    (beads / "issues.jsonl").write_text(json.dumps(make_issue("1").to_dict()) + "\n")
+    (beads / "deps.jsonl").write_text("")
+    return beads
+
+
+def polling_watcher(beads_dir: Path) -> BeadsWatcher:
+    watcher = BeadsWatcher(beads_dir, debounce_seconds=0.05, poll_interval=0.02, use_inotify=False)
+    watcher.mark_synced()
+    return watcher
+
+
+class TestBeadsWatcherPoll:
+    """Change classification from file state."""
+
+    def test_appended_records_become_a_delta(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        append_line(beads_dir / "issues.jsonl", make_issue("2").to_dict())
+        append_line(beads_dir / "deps.jsonl", make_dep("1", "2").to_dict())
+
+        change = watcher.poll()
+        assert change is not None and not change.requires_reload
+        assert [i.id for i in change.delta.upserted_issues] == ["2"]
+        assert [(d.from_id, d.to_id) for d in change.delta.added_deps] == [("1", "2")]
+        assert watcher.poll() is None
+
+    def test_unparseable_appended_record_is_skipped(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        append_line(beads_dir / "issues.jsonl", {"id": "3", "dk_attempts": "x"})
+        append_line(beads_dir / "issues.jsonl", make_issue("2").to_dict())
+
+        change = watcher.poll()
+        assert change is not None and not change.requires_reload
+        assert [i.id for i in change.delta.upserted_issues] == ["2"]
+
+    def test_appended_duplicate_matches_full_load(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+        manager = StateManager(repo_root=beads_dir.parent)
+        manager._bd_available = False
+        graph = manager.load_graph()
+
+        append_line(beads_dir / "issues.jsonl", make_issue("2").to_dict())
+        append_line(beads_dir / "issues.jsonl", make_issue("1", status="done").to_dict())
+        graph.apply(watcher.poll().delta)
+
+        full = manager.load_graph()
+        assert [(i.id, i.status) for i in graph.issues] == [("1", "done"), ("2", "open")]
+        assert [(i.id, i.status) for i in full.issues] == [("1", "done"), ("2", "open")]
+
+    def test_journaled_writes_become_a_delta(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+        manager = StateManager(repo_root=beads_dir.parent)
+        manager._bd_available = False
+
+        assert manager.update_issue("1", status="running") is True
+        new_id = manager.create_issue(title="Follow-up")
+
+        change = watcher.poll()
+        assert change is not None and not change.requires_reload
+        assert [(i.id, i.status) for i in change.delta.upserted_issues] == [
+            ("1", "running"),
+            (new_id, "open"),
+        ]
+        assert watcher.poll() is None
+
+        # A rewrite the journal does not account for still reloads.
+        path = beads_dir / "issues.jsonl"
+        path.write_text(path.read_text().replace('"running"', '"done"'))
+        manager.update_issue(new_id, status="running")
+        change = watcher.poll()
+        assert change is not None and change.requires_reload
+
+    def test_compaction_is_not_a_change(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+        manager = StateManager(repo_root=beads_dir.parent)
+        manager._bd_available = False
+        manager.update_issue("1", status="running")
+
+        manager.compact()
+
+        change = watcher.poll()
+        assert change is not None and not change.requires_reload
+        assert [(i.id, i.status) for i in change.delta.upserted_issues] == [("1", "running")]
+        assert watcher.poll() is None
+
+    def test_partial_line_waits_for_newline(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+        line = json.dumps(make_issue("2").to_dict())
+
+        with open(beads_dir / "issues.jsonl", "a") as f:
+            f.write(line[:10])
+        assert watcher.poll() is None
+
+        with open(beads_dir / "issues.jsonl", "a") as f:
+            f.write(line[10:] + "\n")
+        change = watcher.poll()
+        assert change is not None
+        assert [i.id for i in change.delta.upserted_issues] == ["2"]
+
+    def test_rewrite_requires_reload(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        tmp = beads_dir / "issues.jsonl.tmp"
+        tmp.write_text(json.dumps(make_issue("1", "done").to_dict()) + "\n")
+        tmp.rename(beads_dir / "issues.jsonl")
+
+        change = watcher.poll()
+        assert change is not None and change.requires_reload
+        assert watcher.poll() is None
+
+    def test_in_place_rewrite_that_grows_requires_reload(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        issues = [make_issue("1", "running").to_dict(), make_issue("2").to_dict()]
+        (beads_dir / "issues.jsonl").write_text("".join(json.dumps(r) + "\n" for r in issues))
+
+        change = watcher.poll()
+        assert change is not None and change.requires_reload
+
+    def test_touch_is_ignored(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+        path = beads_dir / "issues.jsonl"
+
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        assert watcher.poll() is None
+
+    def test_other_beads_files_require_reload(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        (beads_dir / "issues.yaml").write_text("issues: []\n")
+
+        change = watcher.poll()
+        assert change is not None and change.requires_reload
+
+
+class TestBeadsWatcherWait:
+    """Blocking waits wake on changes and respect timeouts."""
+
+    async def test_poll_mode_wakes_on_append(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        async def writer() -> None:
+            await asyncio.sleep(0.05)
+            append_line(beads_dir / "issues.jsonl", make_issue("2").to_dict())
+
+        task = asyncio.create_task(writer())
+        change = await watcher.wait(timeout=2.0)
+        await task
+
+        assert change is not None
+        assert [i.id for i in change.delta.upserted_issues] == ["2"]
+
+    async def test_timeout_returns_none(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+        assert await watcher.wait(timeout=0.1) is None
+
+    async def test_debounce_coalesces_burst(self, beads_dir: Path) -> None:
+        watcher = polling_watcher(beads_dir)
+
+        async def writer() -> None:
+            for n in range(2, 6):
+                await asyncio.sleep(0.01)
+                append_line(beads_dir / "issues.jsonl", make_issue(str(n)).to_dict())
+
+        task = asyncio.create_task(writer())
+        change = await watcher.wait(timeout=2.0)
+        await task
+
+        assert change is not None
+        assert [i.id for i in change.delta.upserted_issues] == ["2", "3", "4", "5"]
+
+    async def test_inotify_wakes_on_write(self, beads_dir: Path) -> None:
+        watcher = BeadsWatcher(beads_dir, debounce_seconds=0.05, poll_interval=10.0)
+        watcher.mark_synced()
+
+        async def writer() -> None:
+            await asyncio.sleep(0.05)
+            append_line(beads_dir / "issues.jsonl", make_issue("2").to_dict())
+
+        try:
+            task = asyncio.create_task(writer())
+            change = await watcher.wait(timeout=2.0)
+            await task
+            if watcher.mode != "inotify":
+                pytest.skip("inotify unavailable")
+        finally:
+            watcher.close()
+
+        assert change is not None
+        assert [i.id for i in change.delta.upserted_issues] == ["2"]
+
+
+class TestBeadsGraphApply:
+    """BeadsGraph.apply keeps the graph equal to a reload."""
+
+    def test_upsert_remove_and_deps(self) -> None:
+        graph = BeadsGraph(
+            issues=[make_issue("1"), make_issue("2"), make_issue("3")],
+            deps=[make_dep("1", "2"), make_dep("2", "3")],
+        )
+
+        graph.apply(
+            GraphDelta(
+                upserted_issues=[make_issue("2", "done"), make_issue("4")],
+                removed_issue_ids=["3"],
+                added_deps=[make_dep("2", "4")],
+                removed_deps=[make_dep("2", "3")],
+            )
+        )
+
+        assert [(i.id, i.status) for i in graph.issues] == [
+            ("1", "open"),
+            ("2", "done"),
+            ("4", "open"),
+        ]
+        assert [(d.from_id, d.to_id) for d in graph.deps] == [("1", "2"), ("2", "4")]
+        assert [i.id for i in graph.get_blocked_by("2")] == ["4"]
+
+    def test_upserts_and_added_deps_update_indexes_in_place(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        graph = BeadsGraph(issues=[make_issue("1"), make_issue("2")], deps=[make_dep("1", "2")])
+        graph.get_issue("1")
+        monkeypatch.setattr(graph, "reindex", lambda: pytest.fail("full reindex"))
+
+        graph.apply(
+            GraphDelta(
+                upserted_issues=[make_issue("2", "done"), make_issue("3")],
+                added_deps=[make_dep("2", "3")],
+            )
+        )
+
+        assert [(i.id, i.status) for i in graph.issues] == [
+            ("1", "open"),
+            ("2", "done"),
+            ("3", "open"),
+        ]
+        assert graph.get_issue("3").id == "3"
+        assert [i.id for i in graph.get_blocking_deps("3")] == ["2"]
+        assert [i.id for i in graph.get_blocked_by("1")] == ["2"]
+        assert [(d.from_id, d.to_id) for d in graph.get_deps("2")] == [("1", "2"), ("2", "3")]
+
+
+class TestRunnerWatchMode:
+    """The runner applies appended records without reloading the graph."""
+
+    def test_pending_delta_skips_full_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from cyntra.kernel.config import KernelConfig
+        from cyntra.kernel.runner import KernelRunner
+
+        runner = KernelRunner(config=KernelConfig(repo_root=tmp_path), watch_mode=True)
+        runner.state_manager._bd_available = False
+        beads = runner.config.beads_path
+        beads.mkdir(parents=True, exist_ok=True)
+        (beads / "issues.jsonl").write_text(json.dumps(make_issue("1").to_dict()) + "\n")
+
+        _, schedule = runner._load_and_schedule()
+        assert [i.id for i in schedule.ready_issues] == ["1"]
+
+        append_line(beads / "issues.jsonl", make_issue("2").to_dict())
+        append_line(beads / "deps.jsonl", make_dep("1", "2").to_dict())
+        change = runner.beads_watcher.poll()
+        assert change is not None and not change.requires_reload
+        runner._pending_delta = change.delta
+
+        def fail_load() -> BeadsGraph:
+            raise AssertionError("graph should be updated from the delta")
+
+        monkeypatch.setattr(runner.state_manager, "load_beads_graph", fail_load)
+        graph, schedule = runner._load_and_schedule()
+
+        assert [i.id for i in graph.issues] == ["1", "2"]
+        assert [i.id for i in schedule.ready_issues] == ["1"]
+        assert [i.id for i in schedule.critical_path] == ["1", "2"]
@@ -0,0 +1,157 @@
+"""Tests for continuous slot-based dispatch."""
+
+import asyncio
+import json
+from dataclasses import replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from cyntra.kernel.config import KernelConfig
+from cyntra.kernel.dispatch_pool import SlotMetrics
+from cyntra.kernel.runner import KernelRunner
+from cyntra.state.models import BeadsGraph, Dep, Issue
+
+
+def make_issue(id: str, status: str = "open") -> Issue:
+    """Helper to create test issues."""
+    now = datetime.now(UTC)
+    return Issue(id=id, title=f"Issue {id}", status=status, created=now, updated=now)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlotMetrics:
+    """Tests for SlotMetrics accounting."""
+
+    def test_utilisation_and_queue_wait(self) -> None:
+        clock = FakeClock()
+        metrics = SlotMetrics(capacity=2, clock=clock)
+
+        metrics.mark_ready("a")
+        metrics.mark_ready("b")
+        assert metrics.acquire("a") == 0.0
+
+        clock.now = 5.0
+        assert metrics.acquire("b") == 5.0
+        assert metrics.free == 0
+
+        clock.now = 10.0
+        metrics.release()
+        metrics.release()
+
+        summary = metrics.summary()
+        # Busy: 1 slot for 5s + 2 slots for 5s = 15 of 20 slot-seconds.
+        assert summary["slot_utilisation"] == 0.75
+        assert summary["dispatched"] == 2
+        assert summary["peak_busy_slots"] == 2
+        assert summary["queue_wait_ms_max"] == 5000
+
+    def test_mark_ready_keeps_first_sighting(self) -> None:
+        clock = FakeClock()
+        metrics = SlotMetrics(capacity=1, clock=clock)
+
+        metrics.mark_ready("a")
+        clock.now = 3.0
+        metrics.mark_ready("a")
+        clock.now = 4.0
+
+        assert metrics.acquire("a") == 4.0
+
+
+class TestContinuousDispatch:
+    """The runner refills free slots as soon as a dispatch finishes."""
+
+    @pytest.fixture
+    def runner(self, tmp_path: Path) -> KernelRunner:
+        config = KernelConfig(repo_root=tmp_path, max_concurrent_workcells=2)
+        return KernelRunner(config=config)
+
+    async def test_unblocked_dependent_starts_before_slow_lane_finishes(
+        self, runner: KernelRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        now = datetime.now(UTC)
+        graph = BeadsGraph(
+            issues=[make_issue("slow"), make_issue("fast"), make_issue("next")],
+            deps=[Dep(from_id="fast", to_id="next", dep_type="blocks", created=now)],
+        )
+        timeline: list[str] = []
+
+        def load_graph() -> BeadsGraph:
+            return BeadsGraph(issues=list(graph.issues), deps=list(graph.deps))
+
+        async def fake_dispatch(issue: Issue, *, history_candidates: list) -> None:
+            runner._running_tasks.add(issue.id)
+            timeline.append(f"start:{issue.id}")
+            await asyncio.sleep(0.2 if issue.id == "slow" else 0.01)
+            pos = next(i for i, x in enumerate(graph.issues) if x.id == issue.id)
+            graph.issues[pos] = replace(graph.issues[pos], status="done")
+            runner._running_tasks.discard(issue.id)
+            timeline.append(f"end:{issue.id}")
+
+        monkeypatch.setattr(runner.state_manager, "load_beads_graph", load_graph)
+        monkeypatch.setattr(runner, "_dispatch_single_async", fake_dispatch)
+        monkeypatch.setattr("cyntra.planner.artifacts.collect_history_candidates", lambda **_: [])
+        runner._running = True
+
+        _, schedule = runner._load_and_schedule()
+        await runner._dispatch_parallel(schedule)
+
+        assert timeline.index("start:next") < timeline.index("end:slow")
+        assert all(i.status == "done" for i in graph.issues)
+
+        events = [
+            json.loads(line)
+            for line in (runner.config.logs_dir / "events.jsonl").read_text().splitlines()
+        ]
+        metrics = [e for e in events if e["type"] == "dispatch.metrics"]
+        assert len(metrics) == 1
+        assert metrics[0]["data"]["dispatched"] == 3
+        assert metrics[0]["data"]["capacity"] == 2
+
+    async def test_refill_respects_tokens_held_by_running_lanes(
+        self, runner: KernelRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        runner.config.max_concurrent_tokens = 100_000
+        now = datetime.now(UTC)
+        graph = BeadsGraph(
+            issues=[
+                replace(make_issue("slow"), dk_estimated_tokens=60_000),
+                replace(make_issue("fast"), dk_estimated_tokens=40_000),
+                replace(make_issue("next"), dk_estimated_tokens=50_000),
+            ],
+            deps=[Dep(from_id="fast", to_id="next", dep_type="blocks", created=now)],
+        )
+        timeline: list[str] = []
+
+        def load_graph() -> BeadsGraph:
+            return BeadsGraph(issues=list(graph.issues), deps=list(graph.deps))
+
+        async def fake_dispatch(issue: Issue, *, history_candidates: list) -> None:
+            runner._running_tasks.add(issue.id)
+            timeline.append(f"start:{issue.id}")
+            await asyncio.sleep(0.1 if issue.id == "slow" else 0.01)
+            pos = next(i for i, x in enumerate(graph.issues) if x.id == issue.id)
+            graph.issues[pos] = replace(graph.issues[pos], status="done")
+            runner._running_tasks.discard(issue.id)
+            timeline.append(f"end:{issue.id}")
+
+        monkeypatch.setattr(runner.state_manager, "load_beads_graph", load_graph)
+        monkeypatch.setattr(runner, "_dispatch_single_async", fake_dispatch)
+        monkeypatch.setattr("cyntra.planner.artifacts.collect_history_candidates", lambda **_: [])
+        runner._running = True
+
+        _, schedule = runner._load_and_schedule()
+        await runner._dispatch_parallel(schedule)
+
+        # A slot frees up when "fast" ends, but "slow" still holds 60k of the
+        # 100k budget, so "next" (50k) has to wait for it.
+        assert timeline.index("start:next") > timeline.index("end:slow")
+        assert all(i.status == "done" for i in graph.issues)
@@ -77,3 +77,20 @@ def test_transition_db_roundtrip(tmp_path: Path) -> None:
     assert probs and probs[0]["probability"] == 1.0
 
     db.close()
+
+
+def test_single_insert_is_committed_for_other_handles(tmp_path: Path) -> None:
+    db_path = tmp_path / "dynamics.sqlite"
+    writer = TransitionDB(db_path)
+    reader = TransitionDB(db_path)
+
+    state = build_state_t1(domain="code", job_type="code", features={}, policy_key={})
+    writer.insert_transition({"transition_id": "tr_1", "from_state": state, "to_state": state})
+
+    assert not writer.pool.writer.in_transaction
+    assert reader.transition_counts() == [
+        {"from_state": state["state_id"], "to_state": state["state_id"], "count": 1}
+    ]
+
+    writer.close()
+    reader.close()
@@ -0,0 +1,230 @@
+"""Tests for the event rollups behind `cyntra stats`."""
+
+import io
+import json
+import random
+from collections import Counter
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from cyntra.kernel.config import KernelConfig
+from cyntra.observability import stats
+from cyntra.observability.event_log import SegmentedEventLog, SegmentManifest
+from cyntra.observability.events import EventReader
+
+TOOLCHAINS = ["codex", "claude", None]
+TYPES = ["cycle_start", "task_complete", "task_failed", "issue.started"]
+BASE = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def random_events(rng: random.Random, n: int) -> list[dict]:
+    events = []
+    for _ in range(n):
+        data: dict = {}
+        toolchain = rng.choice(TOOLCHAINS)
+        if toolchain:
+            data["toolchain"] = toolchain
+        if rng.random() < 0.5:
+            data["tokens_used"] = rng.randrange(1, 1000)
+        if rng.random() < 0.5:
+            data["duration_ms"] = rng.randrange(1, 10_000)
+            data["size"] = rng.choice(["XS", "S", "M", "L", "XL"])
+        ts = BASE + timedelta(hours=rng.randrange(72))
+        events.append(
+            {
+                "type": rng.choice(TYPES),
+                "timestamp": ts.isoformat().replace("+00:00", "Z"),
+                "issue_id": str(rng.randrange(5)),
+                "data": data,
+            }
+        )
+    return events
+
+
+def expected(events: list[dict], *keys: str) -> dict[tuple, tuple[int, int]]:
+    """(count, token sum) per group, computed the slow way."""
+    out: dict[tuple, list[int]] = {}
+    for event in events:
+        data = event["data"]
+        values = {
+            "type": event["type"],
+            "toolchain": data.get("toolchain", ""),
+            "day": event["timestamp"][:10],
+        }
+        agg = out.setdefault(tuple(values[k] for k in keys), [0, 0])
+        agg[0] += 1
+        agg[1] += data.get("tokens_used", 0)
+    return {k: (v[0], v[1]) for k, v in out.items()}
+
+
+def actual(reader: EventReader, *keys: str, **kwargs) -> dict[tuple, tuple[int, int]]:
+    return {
+        tuple(row[k] for k in keys): (row["n"], row["tokens"])
+        for row in reader.group_by(*keys, **kwargs)
+    }
+
+
+@pytest.fixture
+def logs_dir(tmp_path: Path) -> Path:
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    return logs
+
+
+def write(log: SegmentedEventLog, events: list[dict]) -> None:
+    for event in events:
+        log.append(json.dumps(event))
+    log.flush()
+
+
+class TestGroupBy:
+    """Rollups from the segment manifest and the event index."""
+
+    def test_group_by_matches_full_scan(self, logs_dir: Path) -> None:
+        events = random_events(random.Random(0), 500)
+        write(SegmentedEventLog(logs_dir, roll_daily=False), events)
+
+        reader = EventReader(logs_dir)
+        assert actual(reader, "toolchain", "type") == expected(events, "toolchain", "type")
+        assert actual(reader, "day") == expected(events, "day")
+        assert reader.index.refresh() == 0
+        assert actual(EventReader(logs_dir, use_index=False), "day") == expected(events, "day")
+
+    def test_rolled_segments_are_served_from_the_manifest(
+        self, logs_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        rng = random.Random(1)
+        log = SegmentedEventLog(logs_dir, roll_daily=False)
+        reader = EventReader(logs_dir)
+        events: list[dict] = []
+
+        for step in range(4):
+            batch = random_events(rng, 100)
+            events += batch
+            write(log, batch)
+            assert actual(reader, "toolchain") == expected(events, "toolchain")
+            if step % 2:
+                log.roll()
+                log.seal(force=True)
+
+        monkeypatch.setattr(reader.manifest, "open", lambda info: pytest.fail("opened segment"))
+        assert actual(reader, "toolchain") == expected(events, "toolchain")
+        # The index only holds the head; rolled events are counted once.
+        head = reader.index.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        assert head == 0
+
+    def test_late_appends_to_rolled_segment_are_counted(self, logs_dir: Path) -> None:
+        rng = random.Random(2)
+        log = SegmentedEventLog(logs_dir, roll_daily=False)
+        first, late = random_events(rng, 50), random_events(rng, 5)
+
+        write(log, first)
+        log.roll()
+        segment = next((logs_dir / "segments").glob("*.jsonl"))
+        with open(segment, "a") as f:
+            f.writelines(json.dumps(e) + "\n" for e in late)
+        log.seal(force=True)
+
+        assert actual(EventReader(logs_dir), "type") == expected(first + late, "type")
+
+    def test_retention_removes_rows(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, roll_daily=False, retention_days=30)
+        write(log, random_events(random.Random(3), 20))
+        log.roll()
+        log.seal(force=True)
+
+        assert EventReader(logs_dir).group_by() == []
+
+    def test_since_filters_by_timestamp(self, logs_dir: Path) -> None:
+        events = random_events(random.Random(4), 300)
+        events.sort(key=lambda e: e["timestamp"])
+        log = SegmentedEventLog(logs_dir, roll_daily=False)
+        write(log, events[:100])
+        log.roll()
+        write(log, events[100:200])
+        log.roll()
+        write(log, events[200:])
+
+        since = BASE + timedelta(days=1, hours=6)
+        recent = [e for e in events if e["timestamp"] >= "2025-01-02T06"]
+        for reader in (EventReader(logs_dir), EventReader(logs_dir, use_index=False)):
+            assert actual(reader, "type", since=since) == expected(recent, "type")
+
+    def test_segments_without_a_recorded_rollup_are_scanned(self, logs_dir: Path) -> None:
+        events = random_events(random.Random(6), 100)
+        log = SegmentedEventLog(logs_dir, roll_daily=False)
+        write(log, events)
+        log.roll()
+        manifest = SegmentManifest(logs_dir)
+        segments = manifest.load()
+        for info in segments:
+            info.rollup = None
+        manifest.save(segments)
+
+        assert actual(EventReader(logs_dir), "toolchain") == expected(events, "toolchain")
+
+    def test_unknown_group_key_is_rejected(self, logs_dir: Path) -> None:
+        with pytest.raises(ValueError):
+            EventReader(logs_dir).group_by("issue_id")
+
+
+class TestShowStats:
+    """`cyntra stats` output from the rollups."""
+
+    def test_reports(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        config = KernelConfig(repo_root=tmp_path)
+        config.logs_dir.mkdir(parents=True)
+        events = random_events(random.Random(5), 400)
+        write(SegmentedEventLog(config.logs_dir, roll_daily=False), events)
+
+        out = io.StringIO()
+        monkeypatch.setattr(stats, "console", Console(file=out, width=200))
+        monkeypatch.setattr(stats.KernelConfig, "load", classmethod(lambda cls, p: config))
+
+        stats.show_stats(
+            tmp_path / "config.yaml", show_cost=True, show_success_rate=True, show_timing=True
+        )
+        text = out.getvalue()
+
+        counts = Counter(e["type"] for e in events)
+        tokens = sum(e["data"].get("tokens_used", 0) for e in events)
+        assert f"Tasks Completed: {counts['task_complete']}" in text
+        assert f"Tasks Failed: {counts['task_failed']}" in text
+        assert f"Total Tokens: {tokens:,}" in text
+        assert "unknown" in text
+        assert "Average Duration" in text
+
+    def test_unsized_tasks_are_summed_into_m(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        config = KernelConfig(repo_root=tmp_path)
+        config.logs_dir.mkdir(parents=True)
+        ts = BASE.isoformat().replace("+00:00", "Z")
+        events = [
+            {"type": "task_complete", "timestamp": ts, "data": {"duration_ms": 1000, "size": "M"}},
+            {"type": "task_complete", "timestamp": ts, "data": {"duration_ms": 3000}},
+        ]
+        write(SegmentedEventLog(config.logs_dir, roll_daily=False), events)
+
+        out = io.StringIO()
+        monkeypatch.setattr(stats, "console", Console(file=out, width=200))
+        monkeypatch.setattr(stats.KernelConfig, "load", classmethod(lambda cls, p: config))
+
+        stats.show_stats(tmp_path / "config.yaml", show_timing=True)
+
+        row = next(line for line in out.getvalue().splitlines() if " M " in line)
+        assert [cell.strip() for cell in row.split("│")[1:4]] == ["M", "2.0s", "2"]
+
+    def test_no_events(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        config = KernelConfig(repo_root=tmp_path)
+        config.logs_dir.mkdir(parents=True)
+
+        out = io.StringIO()
+        monkeypatch.setattr(stats, "console", Console(file=out))
+        monkeypatch.setattr(stats.KernelConfig, "load", classmethod(lambda cls, p: config))
+
+        stats.show_stats(tmp_path / "config.yaml")
+        assert "No statistics available yet" in out.getvalue()
@@ -0,0 +1,209 @@
+"""Tests for the rolling segmented event log."""
+
+import gzip
+import json
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from cyntra.kernel.config import KernelConfig
+from cyntra.observability.event_log import SegmentedEventLog, SegmentManifest
+from cyntra.observability.events import Event, EventEmitter, EventReader, EventType
+from cyntra.observability.history import _load_events
+
+
+def event_line(ts: datetime, event_type: str = "issue.started", **extra: object) -> str:
+    event = {"type": event_type, "timestamp": ts.isoformat().replace("+00:00", "Z"), **extra}
+    return json.dumps(event)
+
+
+def day(n: int) -> datetime:
+    return datetime(2025, 1, n, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+def logs_dir(tmp_path: Path) -> Path:
+    return tmp_path / "logs"
+
+
+def write_days(log: SegmentedEventLog, days: list[int]) -> None:
+    """Write two events per day, rolling after each day, and seal everything."""
+    for n in days:
+        log.append(event_line(day(n), issue_id=f"i{n}", tokens_used=10))
+        log.append(event_line(day(n), "issue.completed", issue_id=f"i{n}", duration_ms=100))
+        log.roll()
+    log.seal(force=True)
+
+
+class TestSegmentedEventLog:
+    """Buffering, rolling and sealing."""
+
+    def test_buffers_until_flush_interval(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, flush_interval=3600)
+        log.append(event_line(day(1)))
+        log.append(event_line(day(1)))
+
+        assert not (logs_dir / "events.jsonl").exists()
+
+        log.flush()
+        assert len((logs_dir / "events.jsonl").read_text().splitlines()) == 2
+        log.close()
+
+    def test_rolls_by_size(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, max_segment_bytes=300, roll_daily=False)
+        for _ in range(10):
+            log.append(event_line(datetime.now(UTC)))
+        log.close()
+
+        segments = SegmentManifest(logs_dir).load()
+        assert segments
+        rolled = sum(s.events for s in segments)
+        head = len((logs_dir / "events.jsonl").read_text().splitlines())
+        assert rolled + head == 10
+        assert all(s.bytes <= 300 for s in segments)
+
+    def test_rolls_on_day_boundary(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir)
+        log.append(event_line(datetime.now(UTC) - timedelta(days=1)))
+        log.append(event_line(datetime.now(UTC)))
+        log.close()
+
+        segments = SegmentManifest(logs_dir).load()
+        assert [s.events for s in segments] == [1]
+        assert len((logs_dir / "events.jsonl").read_text().splitlines()) == 1
+
+    def test_seal_compresses_and_records_summary(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, roll_daily=False, compression="gzip")
+        write_days(log, [1, 2])
+
+        segments = SegmentManifest(logs_dir).load()
+        assert [s.codec for s in segments] == ["gzip", "gzip"]
+        first = segments[0]
+        assert first.file.endswith(".jsonl.gz")
+        assert (first.start, first.end) == ("2025-01-01T12:00:00Z", "2025-01-01T12:00:00Z")
+        assert first.types == {"issue.started": 1, "issue.completed": 1}
+        assert first.issues == ["i1"]
+        assert first.totals["total_tokens"] == 10
+
+        with gzip.open(logs_dir / "segments" / first.file, "rt") as f:
+            assert len(f.readlines()) == 2
+
+    def test_seal_waits_for_grace_period(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, seal_grace_seconds=3600)
+        log.append(event_line(day(1)))
+        log.roll()
+
+        assert log.seal() == 0
+        assert SegmentManifest(logs_dir).load()[0].codec is None
+
+    def test_retention_drops_old_segments(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, retention_days=30)
+        log.append(event_line(datetime.now(UTC) - timedelta(days=60)))
+        log.roll()
+        log.append(event_line(datetime.now(UTC)))
+        log.roll()
+
+        segments = SegmentManifest(logs_dir).load()
+        assert len(segments) == 1
+        assert sorted(p.name for p in (logs_dir / "segments").iterdir()) == sorted(
+            ["manifest.json", segments[0].file]
+        )
+
+    def test_writer_reopens_head_rolled_elsewhere(self, logs_dir: Path) -> None:
+        ours = SegmentedEventLog(logs_dir, roll_daily=False)
+        other = SegmentedEventLog(logs_dir, roll_daily=False)
+        ours.append(event_line(day(1)))
+        other.roll()
+        ours.append(event_line(day(2)))
+        ours.close()
+
+        assert [s.events for s in SegmentManifest(logs_dir).load()] == [1]
+        assert len((logs_dir / "events.jsonl").read_text().splitlines()) == 1
+
+
+class TestSegmentedReads:
+    """Readers span segments and the live head."""
+
+    def test_reader_spans_segments_and_head(self, logs_dir: Path) -> None:
+        log = SegmentedEventLog(logs_dir, roll_daily=False)
+        write_days(log, [1, 2, 3])
+        log.append(event_line(day(4), issue_id="i4"))
+        log.close()
+
+        reader = EventReader(logs_dir)
+        assert len(reader.read_all()) == 7
+        assert [e["issue_id"] for e in reader.read_recent(3)] == ["i3", "i3", "i4"]
+        assert [e["issue_id"] for e in reader.read_by_type("issue.completed")] == [
+            "i1",
+            "i2",
+            "i3",
+        ]
+        assert len(reader.read_by_issue("i2")) == 2
+
+        stats = reader.get_stats()
+        assert stats == EventReader(logs_dir, use_index=False).get_stats()
+        assert stats["total_events"] == 7
+        assert stats["issues_completed"] == 3
+
+    def test_time_window_skips_segments(
+        self, logs_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log = SegmentedEventLog(logs_dir, roll_daily=False)
+        write_days(log, [1, 2, 3])
+
+        reader = EventReader(logs_dir)
+        opened: list[str] = []
+        original = reader.manifest.open
+
+        def tracking_open(info):  # type: ignore[no-untyped-def]
+            opened.append(info.file)
+            return original(info)
+
+        monkeypatch.setattr(reader.manifest, "open", tracking_open)
+
+        events = reader.read_all(since=day(2), until=day(2))
+        assert {e["issue_id"] for e in events} == {"i2"}
+        assert len(opened) == 1
+
+        opened.clear()
+        assert len(reader.read_by_issue("i3")) == 2
+        assert len(opened) == 1
+
+    def test_stats_and_history_read_segments(self, tmp_path: Path) -> None:
+        config = KernelConfig(repo_root=tmp_path)
+        log = SegmentedEventLog(config.logs_dir, roll_daily=False)
+        write_days(log, [1, 2])
+        log.append(event_line(day(3), issue_id="i3"))
+        log.close()
+
+        reader = EventReader(config.logs_dir)
+        assert [row["n"] for row in reader.group_by()] == [5]
+        assert [row["n"] for row in reader.group_by(since=day(2))] == [3]
+        # Naive datetimes (as parsed by the CLI) are treated as UTC.
+        assert len(_load_events(config, since=datetime(2025, 1, 3))) == 1
+        assert [e["issue_id"] for e in _load_events(config, issue_id="i1")] == ["i1", "i1"]
+
+
+class TestEventEmitter:
+    """EventEmitter keeps one handle open across emits."""
+
+    def test_emit_reuses_handle(self, logs_dir: Path) -> None:
+        emitter = EventEmitter(logs_dir)
+        emitter.emit(Event(type=EventType.KERNEL_STARTED))
+        handle = emitter.log._handle
+        emitter.emit(Event(type=EventType.KERNEL_STOPPED))
+
+        assert emitter.log._handle is handle
+        assert len(EventReader(logs_dir).read_all()) == 2
+        emitter.close()
+        assert emitter.log._handle is None
+
+    def test_buffered_emitter_flushes_on_close(self, logs_dir: Path) -> None:
+        emitter = EventEmitter(logs_dir, flush_interval=3600)
+        emitter.emit(Event(type=EventType.KERNEL_STARTED))
+        assert not os.path.exists(logs_dir / "events.jsonl")
+
+        emitter.close()
+        assert len(EventReader(logs_dir).read_all()) == 1
@@ -0,0 +1,152 @@
+"""Tests for the indexed EventReader."""
+
+import json
+import os
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from cyntra.observability.event_index import EventIndex
+from cyntra.observability.events import EventReader
+
+TYPES = ["issue.started", "issue.completed", "issue.failed", "workcell.created", "error"]
+
+
+def random_events(rng: random.Random, n: int) -> list[dict]:
+    events = []
+    for _ in range(n):
+        event: dict = {"type": rng.choice(TYPES), "timestamp": "2025-01-01T00:00:00Z"}
+        if rng.random() < 0.8:
+            event["issue_id"] = str(rng.randrange(10))
+        if rng.random() < 0.5:
+            event["tokens_used"] = rng.randrange(1000)
+            event["cost_usd"] = rng.random()
+        if rng.random() < 0.5:
+            event["duration_ms"] = rng.randrange(1, 10_000)
+        events.append(event)
+    return events
+
+
+def append_events(path: Path, events: list[dict]) -> None:
+    with open(path, "a") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def logs_dir(tmp_path: Path) -> Path:
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    return logs
+
+
+class TestIndexedQueries:
+    """Indexed answers match a full scan."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_full_scan_across_appends(self, logs_dir: Path, seed: int) -> None:
+        rng = random.Random(seed)
+        events_file = logs_dir / "events.jsonl"
+        indexed = EventReader(logs_dir)
+        scanned = EventReader(logs_dir, use_index=False)
+
+        for _ in range(4):
+            append_events(events_file, random_events(rng, rng.randrange(1, 200)))
+            with open(events_file, "a") as f:
+                f.write("not json\n\n")
+
+            assert indexed.get_stats() == pytest.approx(scanned.get_stats())
+            for event_type in TYPES:
+                assert indexed.read_by_type(event_type) == scanned.read_by_type(event_type)
+            for issue_id in map(str, range(10)):
+                assert indexed.read_by_issue(issue_id) == scanned.read_by_issue(issue_id)
+
+    def test_refresh_only_parses_new_lines(self, logs_dir: Path) -> None:
+        events_file = logs_dir / "events.jsonl"
+        append_events(events_file, random_events(random.Random(0), 50))
+
+        index = EventIndex(events_file)
+        assert index.refresh() == 50
+        assert index.refresh() == 0
+
+        append_events(events_file, random_events(random.Random(1), 5))
+        assert index.refresh() == 5
+
+    def test_concurrent_refreshes_index_each_line_once(self, logs_dir: Path) -> None:
+        events_file = logs_dir / "events.jsonl"
+        append_events(events_file, random_events(random.Random(0), 5))
+        EventIndex(events_file).close()
+        barrier = threading.Barrier(8)
+
+        def refresh(_: int) -> int:
+            index = EventIndex(events_file)
+            try:
+                barrier.wait()
+                return index.refresh()
+            finally:
+                index.close()
+
+        with ThreadPoolExecutor(8) as pool:
+            added = list(pool.map(refresh, range(8)))
+
+        assert sum(added) == 5
+        assert EventIndex(events_file).aggregates()["total_events"] == 5
+
+    def test_index_persists_across_readers(self, logs_dir: Path) -> None:
+        events_file = logs_dir / "events.jsonl"
+        append_events(events_file, random_events(random.Random(0), 20))
+        EventReader(logs_dir).get_stats()
+
+        assert EventIndex(events_file).refresh() == 0
+
+    def test_partial_line_is_indexed_once_complete(self, logs_dir: Path) -> None:
+        events_file = logs_dir / "events.jsonl"
+        line = json.dumps({"type": "error", "issue_id": "7"})
+        with open(events_file, "w") as f:
+            f.write(line[:5])
+
+        reader = EventReader(logs_dir)
+        assert reader.read_by_issue("7") == []
+
+        with open(events_file, "a") as f:
+            f.write(line[5:] + "\n")
+        assert reader.read_by_issue("7") == [{"type": "error", "issue_id": "7"}]
+
+    def test_rewritten_log_is_reindexed(self, logs_dir: Path) -> None:
+        events_file = logs_dir / "events.jsonl"
+        append_events(events_file, [{"type": "issue.completed", "issue_id": "1"}])
+        reader = EventReader(logs_dir)
+        assert reader.get_stats()["issues_completed"] == 1
+
+        tmp = logs_dir / "events.tmp"
+        append_events(tmp, [{"type": "issue.failed", "issue_id": "1"}] * 3)
+        os.replace(tmp, events_file)
+
+        stats = reader.get_stats()
+        assert stats["issues_completed"] == 0
+        assert stats["issues_failed"] == 3
+        assert [e["type"] for e in reader.read_by_issue("1")] == ["issue.failed"] * 3
+
+
+class TestReadRecent:
+    """read_recent scans backwards from the end."""
+
+    def test_matches_tail_of_full_scan(self, logs_dir: Path) -> None:
+        events_file = logs_dir / "events.jsonl"
+        append_events(events_file, random_events(random.Random(0), 300))
+        with open(events_file, "a") as f:
+            f.write("garbage\n")
+
+        reader = EventReader(logs_dir)
+        reader._TAIL_BLOCK = 100  # Force lines to straddle block boundaries.
+        full = reader.read_all()
+
+        for limit in (1, 7, 299, 300, 1000):
+            assert reader.read_recent(limit) == full[-limit:]
+
+    def test_missing_file(self, logs_dir: Path) -> None:
+        assert EventReader(logs_dir).read_recent() == []
+        assert EventReader(logs_dir).get_stats()["total_events"] == 0
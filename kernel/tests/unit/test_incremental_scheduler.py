@@ -0,0 +1,193 @@
+"""Tests for the incremental scheduler."""
+
+import random
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+
+from cyntra.kernel.config import KernelConfig
+from cyntra.kernel.incremental import IncrementalScheduler, IncrementalScheduleState
+from cyntra.kernel.scheduler import SIZE_TO_HOURS, Scheduler
+from cyntra.state.models import BeadsGraph, Dep, GraphDelta, Issue
+
+STATUSES = ["open", "ready", "running", "done", "blocked"]
+SIZES = ["XS", "S", "M", "L", "XL"]
+
+
+def make_issue(id: str, status: str = "open", size: str = "M", **kwargs) -> Issue:
+    """Helper to create test issues."""
+    now = datetime.now(UTC)
+    return Issue(
+        id=id, title=f"Issue {id}", status=status, created=now, updated=now, dk_size=size, **kwargs
+    )
+
+
+def make_dep(from_id: str, to_id: str, dep_type: str = "blocks") -> Dep:
+    """Helper to create test deps."""
+    return Dep(from_id=from_id, to_id=to_id, dep_type=dep_type, created=datetime.now(UTC))
+
+
+def path_hours(path: list[Issue]) -> int:
+    return sum(SIZE_TO_HOURS.get(i.dk_size, 4) for i in path)
+
+
+def rebuilt(graph: BeadsGraph) -> IncrementalScheduleState:
+    state = IncrementalScheduleState()
+    state.sync(graph)
+    return state
+
+
+def assert_matches_full_recompute(state: IncrementalScheduleState, graph: BeadsGraph) -> None:
+    fresh = rebuilt(graph)
+    assert state.dist == fresh.dist
+    assert state.level == fresh.level
+    assert state.tail == fresh.tail
+    assert [i.id for i in state.ready_issues()] == [i.id for i in fresh.ready_issues()]
+    assert [i.id for i in state.critical_path()] == [i.id for i in fresh.critical_path()]
+    assert [i.id for i in state.topological_order()] == [i.id for i in fresh.topological_order()]
+
+
+def mutate(rng: random.Random, graph: BeadsGraph, next_id: int, acyclic: bool) -> int:
+    """Apply one random edit to `graph` in place; returns the next unused issue id."""
+    op = rng.choice(["status", "status", "size", "add_issue", "drop_issue", "add_dep", "drop_dep"])
+    if op in ("status", "size") and graph.issues:
+        pos = rng.randrange(len(graph.issues))
+        issue = graph.issues[pos]
+        if op == "status":
+            graph.issues[pos] = replace(issue, status=rng.choice(STATUSES))
+        else:
+            graph.issues[pos] = replace(issue, dk_size=rng.choice(SIZES))
+    elif op == "add_issue":
+        graph.issues.append(make_issue(str(next_id), rng.choice(STATUSES), rng.choice(SIZES)))
+        next_id += 1
+    elif op == "drop_issue" and graph.issues:
+        graph.issues.pop(rng.randrange(len(graph.issues)))
+    elif op == "add_dep" and len(graph.issues) >= 2:
+        a, b = rng.sample(range(len(graph.issues)), 2)
+        if acyclic:
+            # Ids grow monotonically, so low→high edges can never form a cycle.
+            a, b = sorted((a, b), key=lambda p: int(graph.issues[p].id))
+        graph.deps.append(make_dep(graph.issues[a].id, graph.issues[b].id))
+    elif op == "drop_dep" and graph.deps:
+        graph.deps.pop(rng.randrange(len(graph.deps)))
+    return next_id
+
+
+class TestIncrementalMatchesFullRecompute:
+    """Property tests: random edit sequences versus a from-scratch rebuild."""
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_random_edit_sequences(self, seed: int) -> None:
+        rng = random.Random(seed)
+        graph = BeadsGraph(
+            issues=[make_issue(str(n), rng.choice(STATUSES), rng.choice(SIZES)) for n in range(12)],
+            deps=[],
+        )
+        next_id = 12
+        state = IncrementalScheduleState()
+        scheduler = Scheduler(KernelConfig())
+
+        for _ in range(40):
+            for _ in range(rng.randint(1, 3)):
+                next_id = mutate(rng, graph, next_id, acyclic=True)
+            snapshot = BeadsGraph(issues=list(graph.issues), deps=list(graph.deps))
+            state.sync(snapshot)
+
+            assert_matches_full_recompute(state, snapshot)
+            assert [i.id for i in state.ready_issues()] == [
+                i.id for i in scheduler.compute_ready_set(snapshot)
+            ]
+            analysis = scheduler.analyze_critical_path(snapshot)
+            assert path_hours(state.critical_path()) == path_hours(analysis.path)
+            assert state.slack(state.issues) == analysis.slack
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_random_edits_with_cycles(self, seed: int) -> None:
+        rng = random.Random(1000 + seed)
+        graph = BeadsGraph(issues=[make_issue(str(n)) for n in range(8)], deps=[])
+        next_id = 8
+        state = IncrementalScheduleState()
+
+        for _ in range(40):
+            next_id = mutate(rng, graph, next_id, acyclic=False)
+            snapshot = BeadsGraph(issues=list(graph.issues), deps=list(graph.deps))
+            state.sync(snapshot)
+            assert_matches_full_recompute(state, snapshot)
+
+
+class TestIncrementalScheduleState:
+    """Targeted behavior of the incremental state."""
+
+    def test_status_flip_only_touches_direct_dependents(self) -> None:
+        issues = [make_issue("a", "running")] + [make_issue(str(n)) for n in range(50)]
+        deps = [make_dep("a", "0")] + [make_dep(str(n), str(n + 1)) for n in range(49)]
+        state = rebuilt(BeadsGraph(issues=issues, deps=deps))
+        dist_before = dict(state.dist)
+
+        evaluated: list[str] = []
+        original = state._evaluate
+        state._evaluate = lambda iid: (evaluated.append(iid), original(iid))  # type: ignore[method-assign]
+
+        state.apply(GraphDelta(upserted_issues=[make_issue("a", "done")]))
+
+        assert evaluated == []
+        assert state.dist == dist_before
+        assert [i.id for i in state.ready_issues()] == ["0"]
+
+    def test_delta_application(self) -> None:
+        state = rebuilt(BeadsGraph(issues=[make_issue("1", "done"), make_issue("2")], deps=[]))
+
+        state.apply(GraphDelta(upserted_issues=[make_issue("3", size="XL")]))
+        state.apply(GraphDelta(added_deps=[make_dep("2", "3")]))
+
+        assert [i.id for i in state.ready_issues()] == ["2"]
+        assert [i.id for i in state.critical_path()] == ["2", "3"]
+
+        state.apply(GraphDelta(removed_issue_ids=["2"]))
+        assert [i.id for i in state.ready_issues()] == ["3"]
+        assert state.dist["3"] == SIZE_TO_HOURS["XL"]
+
+    def test_dangling_edge_activates_when_issue_appears(self) -> None:
+        state = rebuilt(BeadsGraph(issues=[make_issue("2")], deps=[make_dep("1", "2")]))
+        assert [i.id for i in state.ready_issues()] == ["2"]
+
+        state.apply(GraphDelta(upserted_issues=[make_issue("1")]))
+        assert [i.id for i in state.ready_issues()] == ["1"]
+
+
+class TestIncrementalScheduler:
+    """IncrementalScheduler produces the same schedule as the full scheduler."""
+
+    def test_schedule_matches_full_scheduler(self) -> None:
+        config = KernelConfig(max_concurrent_workcells=2)
+        graph = BeadsGraph(
+            issues=[
+                make_issue("1", size="L"),
+                make_issue("2"),
+                make_issue("3", "done"),
+                make_issue("4", size="S"),
+            ],
+            deps=[make_dep("1", "2"), make_dep("3", "4")],
+        )
+        incremental = IncrementalScheduler(config)
+        full = Scheduler(config)
+
+        for status in ("open", "done"):
+            graph.issues[0] = replace(graph.issues[0], status=status)
+            inc_result = incremental.schedule(graph)
+            full_result = full.schedule(graph)
+            assert [i.id for i in inc_result.ready_issues] == [
+                i.id for i in full_result.ready_issues
+            ]
+            assert [i.id for i in inc_result.critical_path] == [
+                i.id for i in full_result.critical_path
+            ]
+            assert [i.id for i in inc_result.scheduled_lanes] == [
+                i.id for i in full_result.scheduled_lanes
+            ]
+
+    def test_excludes_running_tasks(self) -> None:
+        scheduler = IncrementalScheduler(KernelConfig(), running_tasks={"1"})
+        result = scheduler.schedule(BeadsGraph(issues=[make_issue("1"), make_issue("2")], deps=[]))
+        assert [i.id for i in result.ready_issues] == ["2"]
@@ -0,0 +1,258 @@
+"""Tests for the append-only issue mutation log."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cyntra.state.mutation_log import (
+    IssueMutationLog,
+    committed_since,
+    create_record,
+    replay,
+    snapshot_key,
+    update_record,
+)
+
+TS = "2025-01-01T00:00:00Z"
+LATER = "2025-01-02T00:00:00Z"
+
+
+def write_snapshot(beads_dir: Path, issues: list[dict]) -> None:
+    beads_dir.mkdir(parents=True, exist_ok=True)
+    (beads_dir / "issues.jsonl").write_text("".join(json.dumps(i) + "\n" for i in issues))
+
+
+def read_snapshot(log: IssueMutationLog) -> list[dict]:
+    return [json.loads(line) for line in log.snapshot_path.read_text().splitlines()]
+
+
+def current(log: IssueMutationLog) -> list[dict]:
+    """Issues as a reader sees them: issues.jsonl with the log replayed."""
+    entries, _ = log.read()
+    return replay(read_snapshot(log), entries, snapshot_key(log.snapshot_path))
+
+
+@pytest.fixture
+def log(tmp_path: Path) -> IssueMutationLog:
+    beads = tmp_path / ".beads"
+    write_snapshot(beads, [{"id": "1", "status": "open", "tags": ["a"]}, {"id": "2"}])
+    return IssueMutationLog(beads)
+
+
+class TestReplay:
+    """Replay semantics."""
+
+    KEY = (1, 2, 3)
+
+    def test_ops_update_or_create(self) -> None:
+        snapshot = [{"id": "1", "status": "open"}, {"id": "2", "status": "open"}]
+        entry = {
+            "base": list(self.KEY),
+            "ops": [
+                update_record("2", "done", None, {}, TS),
+                create_record({"id": "3", "status": "open"}),
+            ],
+        }
+
+        out = replay(snapshot, [entry], self.KEY)
+
+        assert [(i["id"], i["status"]) for i in out] == [
+            ("1", "open"),
+            ("2", "done"),
+            ("3", "open"),
+        ]
+        assert snapshot[1] == {"id": "2", "status": "open"}
+
+    def test_replay_is_idempotent(self) -> None:
+        entry = {
+            "base": list(self.KEY),
+            "ops": [
+                update_record("1", "running", ["b"], {"dk_attempts": "1"}, TS),
+                create_record({"id": "2", "status": "open"}),
+            ],
+        }
+
+        once = replay([{"id": "1", "status": "open"}], [entry], self.KEY)
+
+        assert replay(once, [entry], self.KEY) == once
+
+    def test_create_never_replaces_an_existing_issue(self) -> None:
+        entry = {"base": list(self.KEY), "ops": [create_record({"id": "1", "title": "ours"})]}
+
+        out = replay([{"id": "1", "title": "theirs"}], [entry], self.KEY)
+
+        assert out == [{"id": "1", "title": "theirs"}]
+
+    def test_rebased_update_older_than_snapshot_edit_is_skipped(self) -> None:
+        snapshot = [{"id": "1", "status": "done", "updated": LATER}]
+        entry = {"base": list(self.KEY), "ops": [update_record("1", "running", None, {}, TS)]}
+
+        # Written against this issues.jsonl: applied as is.
+        assert replay(snapshot, [entry], self.KEY)[0]["status"] == "running"
+        # issues.jsonl was rewritten since, with a newer edit of the issue.
+        assert replay(snapshot, [entry], (4, 5, 6))[0]["status"] == "done"
+
+
+class TestIssueMutationLog:
+    """Appends, compaction and the change feed."""
+
+    def test_commit_appends_without_rewriting_issues_jsonl(self, log: IssueMutationLog) -> None:
+        before = log.snapshot_path.read_bytes()
+
+        result = log.commit(
+            [
+                update_record("1", "running", ["b"], {"dk_attempts": "1"}, TS),
+                update_record("missing", "done", None, {}, TS),
+            ]
+        )
+
+        assert log.snapshot_path.read_bytes() == before
+        assert result.snapshot == snapshot_key(log.snapshot_path)
+        assert result.missing == ["missing"]
+        assert [i["id"] for i in result.issues] == ["1"]
+
+        issues = current(log)
+        assert issues[0]["status"] == "running"
+        assert sorted(issues[0]["tags"]) == ["a", "b"]
+        assert issues[0]["dk_attempts"] == "1"
+
+        entries, _ = log.read()
+        assert len(entries) == 1
+        assert entries[0]["ops"] == [
+            update_record("1", "running", ["b"], {"dk_attempts": "1"}, TS),
+        ]
+
+    def test_commit_reads_only_the_log_tail(
+        self, log: IssueMutationLog, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log.commit([update_record("1", "running", None, {}, TS)])
+        other = IssueMutationLog(log.beads_dir)
+        other.commit([update_record("2", "done", None, {}, TS)])
+
+        def unexpected_read() -> list[dict]:
+            raise AssertionError("issues.jsonl re-read")
+
+        monkeypatch.setattr(log, "_read_snapshot", unexpected_read)
+        result = log.commit([update_record("1", "done", None, {}, TS)])
+
+        assert result.missing == []
+        assert [(i["id"], i.get("status")) for i in current(other)] == [
+            ("1", "done"),
+            ("2", "done"),
+        ]
+
+    def test_create_never_overwrites_and_compacts(self, log: IssueMutationLog) -> None:
+        # Another tool created "3" after we picked it as the next free id.
+        write_snapshot(log.beads_dir, [*read_snapshot(log), {"id": "3", "title": "theirs"}])
+
+        result = log.commit(
+            [
+                create_record({"id": "3", "title": "ours", "status": "open"}),
+                update_record("3", "running", None, {}, TS),
+            ]
+        )
+
+        assert result.created == ["4"]
+        # Compacted right away, so tools reading issues.jsonl see the new id.
+        by_id = {i["id"]: i for i in read_snapshot(log)}
+        assert by_id["3"] == {"id": "3", "title": "theirs"}
+        assert by_id["4"]["title"] == "ours" and by_id["4"]["status"] == "running"
+        assert result.snapshot == snapshot_key(log.snapshot_path)
+
+    def test_cursor_follows_compaction(self, log: IssueMutationLog) -> None:
+        log.commit([update_record("1", "running", None, {}, TS)])
+        _, cursor = log.read()
+        known = snapshot_key(log.snapshot_path)
+
+        # Folded before the reader saw it; the link repeats it.
+        log.commit([update_record("1", "done", None, {}, TS)])
+        assert log.compact()
+        assert not log.compact()
+        log.commit([update_record("2", "done", None, {}, TS)])
+
+        entries, cursor = log.read(cursor)
+        known_now = snapshot_key(log.snapshot_path)
+        assert known_now != known
+        written = committed_since(entries, known, known_now)
+        assert [(i["id"], i["status"]) for i in written] == [("1", "done"), ("2", "done")]
+
+        # An external rewrite breaks the chain.
+        write_snapshot(log.beads_dir, read_snapshot(log))
+        log.commit([update_record("1", "done", None, {}, TS)])
+        entries, _ = log.read(cursor)
+        assert committed_since(entries, known_now, snapshot_key(log.snapshot_path)) is None
+
+    def test_two_compactions_require_a_reload(self, log: IssueMutationLog) -> None:
+        _, no_log = log.read()
+        known = snapshot_key(log.snapshot_path)
+        log.commit([update_record("1", "running", None, {}, TS)])
+        _, cursor = log.read()
+        log.compact()
+        log.commit([update_record("1", "done", None, {}, TS)])
+        log.compact()
+
+        with pytest.raises(ValueError):
+            log.read(cursor)
+        entries, _ = log.read(no_log)
+        assert committed_since(entries, known, snapshot_key(log.snapshot_path)) is None
+
+    def test_external_rewrite_keeps_logged_changes(self, log: IssueMutationLog) -> None:
+        log.commit([update_record("1", "running", None, {}, TS)])
+
+        # A tool that only reads issues.jsonl edits issue 2.
+        write_snapshot(log.beads_dir, [{"id": "1", "status": "open"}, {"id": "2", "title": "x"}])
+        assert [(i["id"], i.get("status"), i.get("title")) for i in current(log)] == [
+            ("1", "running", None),
+            ("2", None, "x"),
+        ]
+
+        # A newer edit of the same issue wins over the logged one.
+        write_snapshot(log.beads_dir, [{"id": "1", "status": "done", "updated": LATER}])
+        assert current(log)[0]["status"] == "done"
+        log.compact()
+        assert read_snapshot(log)[0]["status"] == "done"
+
+    def test_crash_between_compaction_renames_is_harmless(self, log: IssueMutationLog) -> None:
+        log.commit([update_record("1", "running", ["b"], {}, TS)])
+        expected = current(log)
+
+        # issues.jsonl was replaced but the old log is still in place.
+        write_snapshot(log.beads_dir, expected)
+
+        assert current(log) == expected
+        log.commit([update_record("2", "done", None, {}, TS)])
+        assert current(log) == [expected[0], {**expected[1], "status": "done", "updated": TS}]
+
+    def test_torn_tail_is_ignored_and_terminated(self, log: IssueMutationLog) -> None:
+        log.commit([update_record("1", "running", None, {}, TS)])
+        with open(log.path, "a") as f:
+            f.write('{"base": [1, 2')
+
+        entries, cursor = log.read()
+        assert len(entries) == 1
+
+        log.commit([update_record("2", "done", None, {}, TS)])
+        entries, _ = log.read(cursor)
+        # The torn line is skipped; the entry after it survives.
+        assert [i["id"] for e in entries for i in e["issues"]] == ["2"]
+
+    def test_log_is_compacted_past_threshold(self, log: IssueMutationLog) -> None:
+        log.commit([update_record("1", "running", None, {}, TS)])
+        assert read_snapshot(log)[0]["status"] == "open"
+
+        log.max_log_bytes = log.path.stat().st_size + 1
+        log.commit([update_record("2", "done", None, {}, TS)])
+
+        assert [(i["id"], i.get("status")) for i in read_snapshot(log)] == [
+            ("1", "running"),
+            ("2", "done"),
+        ]
+        entries, cursor = log.read()
+        assert [e.get("ops") for e in entries] == [None]
+
+        # A log replaced without a link cannot be followed.
+        log.path.unlink()
+        log.path.write_text("")
+        with pytest.raises(ValueError):
+            log.read(cursor)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from cyntra.planner.training import compiled as compiled_mod
+from cyntra.planner.training.compiled import load_compiled_dataset
+from cyntra.planner.training.data import (
+    build_vocab,
+    dataset_action_space,
+    encode_dataset,
+    load_dataset,
+)
+
+SEQ_LEN = 24
+
+
+def _row(i: int) -> dict[str, Any]:
+    swarm = "speculate_vote" if i % 3 else "serial_handoff"
+    return {
+        "split": ["train", "train", "train", "val", "test"][i % 5],
+        "planner_input": {
+            "schema_version": "cyntra.planner_input.v1",
+            "job_type": "code",
+            "universe_id": "medica",
+            "universe_defaults": {"swarm_id": "speculate_vote"},
+            "issue": {
+                "issue_id": str(i),
+                "dk_risk": ["low", "high"][i % 2],
+                "tags": [f"t{i % 4}"],
+                "keywords": [f"kw{i}"],
+            },
+            "history": {"last_n_similar_runs": []},
+            "action_space": {
+                "swarm_ids": ["serial_handoff", "speculate_vote"],
+                "max_candidates_bins": [1, 2, 3, "NA"],
+                "max_minutes_bins": [15, 30, "NA"],
+                "max_iterations_bins": ["NA"],
+            },
+            "system_state": None,
+        },
+        "label_action": {
+            "swarm_id": swarm,
+            "budgets": {
+                "max_candidates_bin": 1 if swarm == "serial_handoff" else 2,
+                "max_minutes_bin": [15, 30, "NA"][i % 3],
+                "max_iterations_bin": "NA",
+            },
+        },
+    }
+
+
+def _write_dataset(path: Path, rows: list[dict[str, Any]]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    rows = [_row(i) for i in range(30)]
+    rows.append({"split": "train", "planner_input": "not-a-dict"})
+    bad_label = _row(99)
+    bad_label["label_action"]["swarm_id"] = "unknown_swarm"
+    rows.append(bad_label)
+    return _write_dataset(tmp_path / "ds" / "dataset.jsonl", rows)
+
+
+def test_compiled_arrays_match_encode_dataset(dataset_path: Path) -> None:
+    rows = load_dataset(dataset_path)
+    vocab = build_vocab(rows)
+    head_vocab = dataset_action_space(rows)
+    examples = encode_dataset(rows, vocab=vocab, head_vocab=head_vocab, seq_len=SEQ_LEN)
+
+    data = load_compiled_dataset(dataset_path, seq_len=SEQ_LEN)
+
+    assert data.vocab.tokens == vocab.tokens
+    assert data.head_vocab == head_vocab
+    assert len(data) == len(examples) == 30
+    assert data.input_ids.dtype == np.int32 and isinstance(data.input_ids, np.memmap)
+    assert data.input_ids.tolist() == [ex.input_ids for ex in examples]
+    assert data.attention_mask.tolist() == [ex.attention_mask for ex in examples]
+    assert data.labels.tolist() == [
+        [ex.label_swarm, ex.label_max_candidates, ex.label_max_minutes, ex.label_max_iterations]
+        for ex in examples
+    ]
+    for split in ("train", "val", "test"):
+        expected = [i for i, ex in enumerate(examples) if ex.split == split]
+        assert data.splits[split].tolist() == expected
+        assert data.count(split) == len(expected)
+    assert data.count("missing") == 0
+
+
+def test_iter_batches_covers_split_once_per_epoch(dataset_path: Path) -> None:
+    data = load_compiled_dataset(dataset_path, seq_len=SEQ_LEN)
+    # Tag each row with its own index so gathered batches can be traced back.
+    data = replace(data, input_ids=np.repeat(np.arange(len(data))[:, None], SEQ_LEN, axis=1))
+    rng = np.random.default_rng(0)
+
+    epochs = []
+    for _ in range(2):
+        seen: list[int] = []
+        for ids, mask, labels in data.iter_batches("train", 4, rng=rng):
+            assert ids.shape[1] == SEQ_LEN and len(ids) == len(mask) == len(labels) <= 4
+            assert (labels == data.labels[ids[:, 0]]).all()
+            seen.extend(ids[:, 0].tolist())
+        epochs.append(seen)
+
+    expected = sorted(data.splits["train"].tolist())
+    assert sorted(epochs[0]) == sorted(epochs[1]) == expected
+    assert epochs[0] != epochs[1]
+
+
+def test_compiled_dataset_is_reused_until_the_file_changes(
+    dataset_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = load_compiled_dataset(dataset_path, seq_len=SEQ_LEN)
+
+    def _fail(*_: Any, **__: Any) -> None:
+        raise AssertionError("recompiled")
+
+    monkeypatch.setattr(compiled_mod, "compile_dataset", _fail)
+    again = load_compiled_dataset(dataset_path, seq_len=SEQ_LEN)
+    assert again.root == first.root
+    monkeypatch.undo()
+
+    other_len = load_compiled_dataset(dataset_path, seq_len=SEQ_LEN * 2)
+    assert other_len.root != first.root
+    assert other_len.input_ids.shape == (30, SEQ_LEN * 2)
+
+    _write_dataset(dataset_path, [_row(i) for i in range(5)])
+    rebuilt = load_compiled_dataset(dataset_path, seq_len=SEQ_LEN)
+    assert rebuilt.root != first.root
+    assert len(rebuilt) == 5
+    assert not list(dataset_path.parent.glob("compiled/*.tmp-*"))
+
+
+def test_empty_dataset_compiles(tmp_path: Path) -> None:
+    path = _write_dataset(tmp_path / "dataset.jsonl", [])
+
+    data = load_compiled_dataset(path, seq_len=SEQ_LEN)
+
+    assert len(data) == 0
+    assert data.input_ids.shape == (0, SEQ_LEN)
+    assert list(data.iter_batches("train", 8)) == []
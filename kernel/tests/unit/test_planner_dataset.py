@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import json
+import pickle
+import random
 from pathlib import Path
 
-from cyntra.planner.dataset import build_and_write_dataset
+from cyntra.planner import dataset as dataset_mod
+from cyntra.planner.dataset import build_and_write_dataset, build_dataset_examples, dataset_hash
 
 
 def _write_json(path: Path, data: dict) -> None:
@@ -121,3 +124,98 @@ def test_build_and_write_dataset_is_deterministic(tmp_path: Path) -> None:
     assert len(history) == 1
     assert isinstance(second.get("tokens"), list)
     assert all(isinstance(t, str) for t in second["tokens"])
+
+
+def _synthetic_summaries(n: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    started_ms = 1_766_000_000_000
+    summaries = []
+    for i in range(n):
+        # Repeated timestamps exercise the strict "earlier runs only" cutoff.
+        started_ms += rng.choice([0, 60_000, 3_600_000])
+        job_type = rng.choice(["code", "code", "fab-world"])
+        summary = {
+            "run_id": f"wc-{i:05d}",
+            "issue_id": str(i % 7),
+            "started_ms": started_ms,
+            "job_type": job_type,
+            "tags": rng.sample(["gate:test", "asset:world", "ui", "perf", "docs"], 2),
+            "action_executed": {
+                "swarm_id": rng.choice(["serial_handoff", "speculate_vote"]),
+                "max_candidates": rng.choice([1, 2, 3]),
+                "max_minutes": rng.choice([15, 30, 60]),
+            },
+            "outcome": {"status": rng.choice(["success", "failed"]), "fail_codes": []},
+        }
+        if job_type == "fab-world":
+            summary["world_id"] = f"world-{rng.randrange(2)}"
+        summaries.append(summary)
+    return summaries
+
+
+def test_sharded_build_matches_serial_build(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(dataset_mod, "MIN_SHARD_SIZE", 16)
+    summaries = _synthetic_summaries(200)
+
+    def _build(workers: int, include_world: bool) -> list[dict]:
+        return build_dataset_examples(
+            repo_root=tmp_path,
+            run_summaries=summaries,
+            issues={},
+            universe_id="",
+            include_world=include_world,
+            n_similar=4,
+            workers=workers,
+        )
+
+    for include_world in (True, False):
+        serial = _build(1, include_world)
+        sharded = _build(3, include_world)
+        assert sharded == serial
+        assert dataset_hash(sharded) == dataset_hash(serial)
+        assert any(ex["planner_input"]["history"]["last_n_similar_runs"] for ex in serial)
+
+
+def test_sharded_build_only_used_for_time_ordered_snapshots(monkeypatch) -> None:
+    monkeypatch.setattr(dataset_mod, "MIN_SHARD_SIZE", 16)
+    summaries = _synthetic_summaries(100)
+
+    assert dataset_mod._is_time_ordered(summaries)
+    shuffled = list(reversed(summaries))
+    assert not dataset_mod._is_time_ordered(shuffled)
+
+    bounds = dataset_mod._shard_bounds(len(summaries), workers=2)
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(summaries)
+    assert all(a[1] == b[0] for a, b in zip(bounds, bounds[1:], strict=False))
+    assert len(bounds) == 6  # min(2 workers * 4, 100 // 16)
+
+
+def test_shard_job_pickles_with_its_index(tmp_path: Path) -> None:
+    summaries = _synthetic_summaries(60)
+    ctx = dataset_mod._ExampleContext(
+        issues={},
+        action_space=dataset_mod.action_space_for_swarms(["serial_handoff", "speculate_vote"]),
+        universe_id="unknown",
+        universe_defaults={"swarm_id": None, "objective_id": None},
+        include_world=True,
+        n_similar=4,
+    )
+    job = dataset_mod._ShardJob(run_summaries=summaries, ctx=ctx)
+    job.index()
+
+    # What a spawn/forkserver worker receives through `initargs`
+    dataset_mod._init_shard_worker(pickle.loads(pickle.dumps(job)))
+    try:
+        pickled = dataset_mod._build_shard((0, len(summaries)))
+    finally:
+        dataset_mod._shard_job = None
+
+    serial = build_dataset_examples(
+        repo_root=tmp_path,
+        run_summaries=summaries,
+        issues={},
+        universe_id="",
+        include_world=True,
+        n_similar=4,
+    )
+    assert pickled == serial
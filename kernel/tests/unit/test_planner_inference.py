@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from cyntra.planner import inference
+from cyntra.planner.action_space import valid_actions
+from cyntra.planner.tokenizer import tokenize_planner_input
+from cyntra.planner.vocab import build_vocab_from_token_streams
+
+SWARM_IDS = ["serial_handoff", "speculate_vote", "parallel_compete"]
+CANDIDATES_BINS = [1, 2, 3, "NA"]
+MINUTES_BINS = [15, 30, 60, "NA"]
+ITERATIONS_BINS = [1, 2, "NA"]
+SEQ_LEN = 32
+
+
+class _Input:
+    def __init__(self, name: str, shape: list[Any]) -> None:
+        self.name = name
+        self.shape = shape
+
+
+class FakeSession:
+    """Deterministic linear heads over the token ids; records batch sizes."""
+
+    def __init__(self, batch_dim: Any = "batch") -> None:
+        rng = np.random.default_rng(7)
+        self.weights = [
+            rng.normal(size=(SEQ_LEN, n)).astype(np.float32)
+            for n in (
+                len(SWARM_IDS),
+                len(CANDIDATES_BINS),
+                len(MINUTES_BINS),
+                len(ITERATIONS_BINS),
+            )
+        ]
+        self.batch_dim = batch_dim
+        self.batch_sizes: list[int] = []
+
+    def get_inputs(self) -> list[_Input]:
+        return [
+            _Input("input_ids", [self.batch_dim, SEQ_LEN]),
+            _Input("attention_mask", [self.batch_dim, SEQ_LEN]),
+        ]
+
+    def run(self, _: Any, feeds: dict[str, np.ndarray]) -> list[np.ndarray]:
+        ids = feeds["input_ids"]
+        assert ids.dtype == np.int64 and ids.shape[1] == SEQ_LEN
+        self.batch_sizes.append(ids.shape[0])
+        x = (ids % 17).astype(np.float32) * feeds["attention_mask"] / 17.0
+        return [x @ w for w in self.weights]
+
+
+def _planner_input(i: int, job_type: str = "code") -> dict[str, Any]:
+    return {
+        "schema_version": "cyntra.planner_input.v1",
+        "created_at": "2025-12-20T00:00:00Z",
+        "universe_id": "medica",
+        "job_type": job_type,
+        "universe_defaults": {"swarm_id": "speculate_vote"},
+        "issue": {
+            "issue_id": str(i),
+            "dk_priority": f"P{i % 4}",
+            "dk_risk": ["low", "medium", "high"][i % 3],
+            "dk_size": "M",
+            "dk_attempts": i % 5,
+            "tags": [f"tag{i % 7}", f"tag{i % 3}"],
+            "keywords": [f"kw{i}"],
+        },
+        "history": {"last_n_similar_runs": []},
+        "action_space": {"swarm_ids": SWARM_IDS},
+        "system_state": None,
+    }
+
+
+def _write_bundle(bundle_dir: Path) -> None:
+    bundle_dir.mkdir()
+    streams = [tokenize_planner_input(_planner_input(i)) for i in range(20)]
+    vocab = build_vocab_from_token_streams(streams)
+    (bundle_dir / "vocab.json").write_text(json.dumps({"tokens": list(vocab.tokens)}))
+    (bundle_dir / "action_space.json").write_text(
+        json.dumps(
+            {
+                "swarm_ids": SWARM_IDS,
+                "max_candidates_bins": CANDIDATES_BINS,
+                "max_minutes_bins": MINUTES_BINS,
+                "max_iterations_bins": ITERATIONS_BINS,
+            }
+        )
+    )
+    (bundle_dir / "calibration.json").write_text(
+        json.dumps({"temperatures": {"swarm_id": 1.5, "max_minutes_bin": 0.8}})
+    )
+    (bundle_dir / "planner.onnx").write_bytes(b"")
+
+
+@pytest.fixture
+def make_planner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    _write_bundle(tmp_path / "bundle")
+
+    def _make(session: FakeSession | None = None, **kwargs: Any) -> inference.OnnxPlanner:
+        fake = session or FakeSession()
+        monkeypatch.setattr(inference.ort, "InferenceSession", lambda *_a, **_k: fake)
+        return inference.OnnxPlanner(tmp_path / "bundle", **kwargs)
+
+    return _make
+
+
+def _reference_decode(planner: inference.OnnxPlanner, job_type: str, probs: Any) -> tuple:
+    """Scalar per-action decoder the vectorised path must agree with."""
+    cfg = planner.cfg
+    lookups = [
+        {v: i for i, v in enumerate(bins)}
+        for bins in (
+            cfg.swarm_ids,
+            cfg.max_candidates_bins,
+            cfg.max_minutes_bins,
+            cfg.max_iterations_bins,
+        )
+    ]
+    best_score = -math.inf
+    best = None
+    for action in valid_actions(job_type, cfg.action_space):
+        ids = [lookup[value] for lookup, value in zip(lookups, action, strict=True)]
+        score = sum(math.log(max(1e-12, float(p[i]))) for p, i in zip(probs, ids, strict=True))
+        if score > best_score or (score == best_score and json.dumps(action) < json.dumps(best)):
+            best_score, best = score, action
+    return best
+
+
+def test_predict_actions_matches_scalar_decoding(make_planner) -> None:
+    planner = make_planner(cache_size=0)
+    inputs = [_planner_input(i, "fab-world" if i % 4 == 0 else "code") for i in range(40)]
+
+    preds = planner.predict_actions(inputs)
+
+    assert len(preds) == len(inputs)
+    for planner_input, pred in zip(inputs, preds, strict=True):
+        probs = planner._run_session([planner_input])[0]
+        expected = _reference_decode(planner, planner_input["job_type"], probs)
+        budgets = pred["budgets"]
+        got = (
+            pred["swarm_id"],
+            budgets["max_candidates_bin"],
+            budgets["max_minutes_bin"],
+            budgets["max_iterations_bin"],
+        )
+        assert got == expected
+        assert pred["input_hash"] == inference.hash_planner_input(planner_input)
+        assert 0.0 < pred["confidence"] <= 1.0
+
+        single = planner.predict_action(planner_input)
+        assert single["budgets"] == budgets and single["swarm_id"] == pred["swarm_id"]
+        # Batched matmuls may round differently from a batch of one.
+        assert single["confidence"] == pytest.approx(pred["confidence"], rel=1e-5)
+
+
+def test_predict_actions_runs_one_session_call_per_chunk(make_planner) -> None:
+    session = FakeSession()
+    planner = make_planner(session, cache_size=0, max_batch_size=16)
+
+    planner.predict_actions([_planner_input(i) for i in range(40)])
+
+    assert session.batch_sizes == [16, 16, 8]
+
+
+def test_fixed_batch_bundles_are_chunked_to_their_batch_size(make_planner) -> None:
+    session = FakeSession(batch_dim=1)
+    planner = make_planner(session, cache_size=0)
+
+    planner.predict_actions([_planner_input(i) for i in range(3)])
+
+    assert session.batch_sizes == [1, 1, 1]
+
+
+def test_cache_skips_repeated_inputs_and_evicts_lru(make_planner) -> None:
+    session = FakeSession()
+    planner = make_planner(session, cache_size=2)
+    a, b, c = (_planner_input(i) for i in range(3))
+
+    first = planner.predict_actions([a, b, a])
+    assert session.batch_sizes == [2]
+    assert first[0]["swarm_id"] == first[2]["swarm_id"]
+
+    # created_at is excluded from the hash, so a re-stamped input still hits.
+    planner.predict_action({**a, "created_at": "2026-01-01T00:00:00Z"})
+    assert session.batch_sizes == [2]
+
+    planner.predict_actions([c])  # evicts b, the least recently used
+    planner.predict_actions([a, b])
+    assert session.batch_sizes == [2, 1, 1]
+
+
+def test_session_thread_counts_are_configurable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_bundle(tmp_path / "bundle")
+    seen: dict[str, Any] = {}
+
+    def _session(_path: str, *, sess_options: Any, providers: list[str]) -> FakeSession:
+        seen["intra"] = sess_options.intra_op_num_threads
+        seen["inter"] = sess_options.inter_op_num_threads
+        return FakeSession()
+
+    monkeypatch.setattr(inference.ort, "InferenceSession", _session)
+    inference.OnnxPlanner(tmp_path / "bundle", intra_op_threads=2, inter_op_threads=1)
+
+    assert seen == {"intra": 2, "inter": 1}
+
+
+def test_select_best_action_restricts_to_candidates(make_planner) -> None:
+    planner = make_planner()
+    planner_input = _planner_input(3)
+    candidates = random.Random(0).sample(valid_actions("code", planner.cfg.action_space), 5)
+
+    best = planner.select_best_action(planner_input, candidates)
+
+    assert best in candidates
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from cyntra.planner import run_catalog
+from cyntra.planner.artifacts import collect_history_candidates
+from cyntra.planner.run_catalog import RunCatalog
+from cyntra.planner.run_summaries import iter_archive_run_summaries
+
+
+def _make_archive(
+    archives_dir: Path, name: str, *, started_at: str, status: str = "success"
+) -> Path:
+    workcell_dir = archives_dir / name
+    workcell_dir.mkdir(parents=True, exist_ok=True)
+    (workcell_dir / "manifest.json").write_text(
+        json.dumps({"workcell_id": name, "job_type": "code", "issue": {"id": "1", "tags": []}})
+    )
+    (workcell_dir / "proof.json").write_text(
+        json.dumps(
+            {
+                "workcell_id": name,
+                "status": status,
+                "verification": {"gates": {}, "all_passed": True},
+                "metadata": {"started_at": started_at, "duration_ms": 10},
+            }
+        )
+    )
+    return workcell_dir
+
+
+def test_catalog_matches_scan_and_is_sorted(tmp_path: Path) -> None:
+    archives = tmp_path / ".cyntra" / "archives"
+    _make_archive(archives, "wc-b", started_at="2025-01-02T00:00:00Z")
+    _make_archive(archives, "wc-a", started_at="2025-01-01T00:00:00Z")
+    (archives / "wc-empty").mkdir()
+
+    candidates = collect_history_candidates(repo_root=tmp_path, include_world=False)
+
+    expected = sorted(iter_archive_run_summaries(archives), key=lambda r: r["started_ms"])
+    assert candidates == expected
+    assert [c["run_id"] for c in candidates] == ["wc-a", "wc-b"]
+    assert (tmp_path / run_catalog.CATALOG_RELPATH).exists()
+
+
+def test_refresh_only_rebuilds_changed_runs(tmp_path: Path, monkeypatch) -> None:
+    archives = tmp_path / "archives"
+    _make_archive(archives, "wc-a", started_at="2025-01-01T00:00:00Z")
+    changed = _make_archive(archives, "wc-b", started_at="2025-01-02T00:00:00Z")
+    removed = _make_archive(archives, "wc-c", started_at="2025-01-03T00:00:00Z")
+
+    built: list[str] = []
+    build = run_catalog.build_archive_run_summary
+
+    def recording_build(run_dir: Path):
+        built.append(run_dir.name)
+        return build(run_dir)
+
+    monkeypatch.setattr(run_catalog, "build_archive_run_summary", recording_build)
+    catalog = RunCatalog(tmp_path / "catalog.db", repo_root=tmp_path, archives_dir=archives)
+
+    assert catalog.refresh() == 3
+    assert catalog.refresh() == 0
+    assert sorted(built) == ["wc-a", "wc-b", "wc-c"]
+
+    built.clear()
+    _make_archive(archives, "wc-b", started_at="2025-01-02T00:00:00Z", status="failed")
+    proof = changed / "proof.json"
+    stat = proof.stat()
+    os.utime(proof, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    for path in removed.iterdir():
+        path.unlink()
+    removed.rmdir()
+
+    assert catalog.refresh() == 2
+    assert built == ["wc-b"]
+    summaries = catalog.summaries()
+    assert [s["run_id"] for s in summaries] == ["wc-a", "wc-b"]
+    assert summaries[1]["outcome"]["status"] == "failed"
+    catalog.close()
+
+
+def test_history_ingester_discovers_runs_from_catalog(tmp_path: Path) -> None:
+    from cyntra.skills.sleeptime.history_ingester import HistoryIngester
+
+    runs = tmp_path / ".cyntra" / "runs"
+    for name, started in [("old", "2025-01-01T00:00:00Z"), ("new", "2025-01-03T00:00:00Z")]:
+        (runs / name).mkdir(parents=True)
+        (runs / name / "manifest.json").write_text(json.dumps({"started_at": started}))
+    (runs / "no-manifest").mkdir()
+
+    ingester = HistoryIngester(runs_dir=runs, watermark_path=tmp_path / "wm.json")
+
+    assert [p.name for p in ingester.discover_runs()] == ["new", "old"]
+    assert [p.name for p in ingester.discover_runs("2025-01-02T00:00:00+00:00")] == ["new"]
+    assert (tmp_path / ".cyntra" / "planner" / "run_catalog.db").exists()
+
+
+def test_history_ingester_watermark_uses_manifest_started_at(tmp_path: Path) -> None:
+    from cyntra.skills.sleeptime.history_ingester import HistoryIngester
+
+    runs = tmp_path / ".cyntra" / "runs"
+    # The world summary orders by created_at; the ingester's watermark is started_at.
+    for name, created, started in [
+        ("early", "2025-01-05T00:00:00Z", "2025-01-01T00:00:00Z"),
+        ("late", "2025-01-01T00:00:00Z", "2025-01-05T00:00:00Z"),
+    ]:
+        (runs / name).mkdir(parents=True)
+        (runs / name / "manifest.json").write_text(
+            json.dumps({"created_at": created, "started_at": started})
+        )
+        (runs / name / "context.json").write_text(json.dumps({"universe_id": "u"}))
+
+    ingester = HistoryIngester(runs_dir=runs, watermark_path=tmp_path / "wm.json")
+
+    assert [p.name for p in ingester.discover_runs()] == ["late", "early"]
+    assert [p.name for p in ingester.discover_runs("2025-01-03T00:00:00+00:00")] == ["late"]
+
+
+def test_summaries_break_ties_by_directory(tmp_path: Path) -> None:
+    archives = tmp_path / "archives"
+    for name, status in [("wc-b", "success"), ("wc-c", "failed"), ("wc-a", "failed")]:
+        run_dir = _make_archive(archives, name, started_at="2025-01-01T00:00:00Z", status=status)
+        # Same started_ms and run_id in every directory
+        proof = json.loads((run_dir / "proof.json").read_text())
+        proof["workcell_id"] = "wc"
+        (run_dir / "proof.json").write_text(json.dumps(proof))
+
+    catalog = RunCatalog(tmp_path / "catalog.db", repo_root=tmp_path, archives_dir=archives)
+    catalog.refresh()
+
+    summaries = catalog.summaries()
+    assert {s["run_id"] for s in summaries} == {"wc"}
+    assert [s["outcome"]["status"] for s in summaries] == ["failed", "success", "failed"]
+    catalog.close()
+
+
+def test_catalog_with_older_layout_is_rebuilt(tmp_path: Path) -> None:
+    import sqlite3
+
+    db_path = tmp_path / "catalog.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE runs (root TEXT, name TEXT, signature INTEGER)")
+    conn.execute("INSERT INTO runs VALUES ('r', 'n', 1)")
+    conn.commit()
+    conn.close()
+    archives = tmp_path / "archives"
+    _make_archive(archives, "wc-a", started_at="2025-01-01T00:00:00Z")
+
+    catalog = RunCatalog(db_path, repo_root=tmp_path, archives_dir=archives)
+
+    assert catalog.refresh() == 1
+    assert [s["run_id"] for s in catalog.summaries()] == ["wc-a"]
+    catalog.close()
+
+
+def test_world_runs_rebuild_when_universe_config_changes(tmp_path: Path, monkeypatch) -> None:
+    runs = tmp_path / ".cyntra" / "runs"
+    (runs / "run-1").mkdir(parents=True)
+    (runs / "run-1" / "manifest.json").write_text(json.dumps({"run_id": "run-1"}))
+    swarms = tmp_path / "universes" / "u" / "swarms.yaml"
+    swarms.parent.mkdir(parents=True)
+    swarms.write_text("swarms: {}\n")
+
+    built: list[str] = []
+
+    def recording_build(run_dir: Path, *, repo_root: Path):
+        built.append(run_dir.name)
+        return {"run_id": run_dir.name, "started_ms": 1}
+
+    monkeypatch.setattr(run_catalog, "build_world_run_summary", recording_build)
+    catalog = RunCatalog(tmp_path / "catalog.db", repo_root=tmp_path, runs_dir=runs)
+
+    assert catalog.refresh() == 1
+    assert catalog.refresh() == 0
+
+    # A swarm population change alters cached max_candidates
+    stat = swarms.stat()
+    os.utime(swarms, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**12))
+    assert catalog.refresh() == 1
+    assert built == ["run-1", "run-1"]
+    catalog.close()
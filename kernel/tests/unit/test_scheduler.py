@@ -237,6 +237,52 @@ class TestComputeCriticalPath:
         assert [p.id for p in path] == ["1", "2"]
 
 
+class TestAnalyzeCriticalPath:
+    """Tests for the CPM analysis (earliest/latest start and slack)."""
+
+    def test_slack_for_parallel_branches(self, config: KernelConfig) -> None:
+        """Issues off the critical path get slack equal to their float."""
+        scheduler = Scheduler(config)
+        # 1 (M=4) -> 2 (L=8) -> 4 (S=2)   = 14 (critical)
+        # 1 (M=4) -> 3 (S=2) -> 4 (S=2)   = 8, so 3 can slip by 6 hours
+        # 5 (XS=1) stands alone, so it can slip by 13 hours
+        graph = BeadsGraph(
+            issues=[
+                make_issue("1"),
+                make_issue("2", size="L"),
+                make_issue("3", size="S"),
+                make_issue("4", size="S"),
+                make_issue("5", size="XS"),
+            ],
+            deps=[
+                make_dep("1", "2"),
+                make_dep("1", "3"),
+                make_dep("2", "4"),
+                make_dep("3", "4"),
+            ],
+        )
+
+        analysis = scheduler.analyze_critical_path(graph)
+
+        assert [i.id for i in analysis.path] == ["1", "2", "4"]
+        assert analysis.duration == 14
+        assert analysis.earliest_start == {"1": 0, "2": 4, "3": 4, "4": 12, "5": 0}
+        assert analysis.slack == {"1": 0, "2": 0, "3": 6, "4": 0, "5": 13}
+
+    def test_ignores_non_blocking_deps(self, config: KernelConfig) -> None:
+        """Only 'blocks' edges constrain the schedule."""
+        scheduler = Scheduler(config)
+        graph = BeadsGraph(
+            issues=[make_issue("1"), make_issue("2")],
+            deps=[make_dep("1", "2", "discovered")],
+        )
+
+        analysis = scheduler.analyze_critical_path(graph)
+
+        assert analysis.duration == 4
+        assert analysis.slack == {"1": 0, "2": 0}
+
+
 class TestPackLanes:
     """Tests for pack_lanes."""
 
@@ -267,6 +313,20 @@ class TestPackLanes:
         assert len(scheduled) == 2  # 2 * 40k = 80k < 100k
         assert len(skipped) == 3
 
+    def test_reserved_tokens_count_against_limit(self, config: KernelConfig) -> None:
+        """Tokens held by running lanes are not handed out again."""
+        config.max_concurrent_tokens = 100_000
+        scheduler = Scheduler(config)
+
+        issues = [make_issue(str(i)) for i in range(3)]
+        for issue in issues:
+            issue.dk_estimated_tokens = 40_000
+
+        scheduled, skipped, reasons = scheduler.pack_lanes(issues, [], reserved_tokens=60_000)
+
+        assert len(scheduled) == 1
+        assert all(reasons[i.id] == "token_limit" for i in skipped)
+
     def test_prioritizes_critical_path(self, config: KernelConfig) -> None:
         """Critical path items are scheduled first."""
         scheduler = Scheduler(config)
@@ -284,6 +344,17 @@ class TestPackLanes:
 
         assert scheduled[0].id == "3"  # Critical path first
 
+    def test_prefers_less_slack_at_equal_priority(self, config: KernelConfig) -> None:
+        """Among equal-priority issues, the one with less float goes first."""
+        scheduler = Scheduler(config)
+        config.max_concurrent_workcells = 1
+
+        issues = [make_issue("1"), make_issue("2")]
+
+        scheduled, _, _ = scheduler.pack_lanes(issues, [], slack={"1": 8, "2": 2})
+
+        assert scheduled[0].id == "2"
+
 
 class TestShouldSpeculate:
     """Tests for should_speculate."""
@@ -310,6 +381,14 @@ class TestShouldSpeculate:
 
         assert scheduler.should_speculate(issue, [issue]) is True
 
+    def test_high_risk_with_zero_slack(self, config: KernelConfig) -> None:
+        """Zero-slack items count as critical even off the chosen path."""
+        scheduler = Scheduler(config)
+        issue = make_issue("1", risk="high")
+
+        assert scheduler.should_speculate(issue, [], slack={"1": 0}) is True
+        assert scheduler.should_speculate(issue, [], slack={"1": 3}) is False
+
     def test_low_risk_not_speculate(self, config: KernelConfig) -> None:
         """Returns False for low-risk items."""
         scheduler = Scheduler(config)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pickle
+import random
+
+from cyntra.planner.similar_runs import SimilarRunsIndex, SimilarRunsQuery, select_similar_runs
+
+DAY_MS = 24 * 60 * 60 * 1000
+TAGS = ["gate:test", "gate:lint", "asset:mesh", "bug", "docs", "perf"]
+
+
+def _random_runs(rng: random.Random, count: int) -> list[dict]:
+    runs = []
+    started_ms = 0
+    for i in range(count):
+        # Frequent equal timestamps and repeated run ids exercise the tie-breaks.
+        started_ms += rng.choice([0, 0, 1, DAY_MS // 3, 2 * DAY_MS, 10 * DAY_MS])
+        job_type = rng.choice(["code", "code", "fab-world"])
+        run = {
+            "run_id": f"wc-{rng.randrange(count // 2)}",
+            "started_ms": started_ms,
+            "job_type": job_type,
+            "tags": rng.sample(TAGS, rng.randrange(4)),
+            "outcome": {"status": "failed", "fail_codes": ["gate:test"], "gates": []},
+        }
+        if job_type == "fab-world":
+            run["world_id"] = rng.choice(["w1", "w2", None])
+            run["objective_id"] = rng.choice(["o1", "o2"])
+        if i % 50 == 0:
+            run["started_ms"] = None
+        runs.append(run)
+    return runs
+
+
+def _random_query(rng: random.Random, started_ms: int) -> SimilarRunsQuery:
+    job_type = rng.choice(["code", "fab-world", "unknown"])
+    return SimilarRunsQuery(
+        job_type=job_type,
+        started_ms=started_ms,
+        tags=rng.sample(TAGS, rng.randrange(4)),
+        world_id=rng.choice([None, "w1", "w2"]) if job_type == "fab-world" else None,
+        objective_id=rng.choice([None, "o1"]) if job_type == "fab-world" else None,
+    )
+
+
+def test_index_matches_linear_scan() -> None:
+    rng = random.Random(0)
+    runs = _random_runs(rng, 600)
+    index = SimilarRunsIndex()
+    history: list[dict] = []
+
+    for run in runs:
+        started_ms = run["started_ms"] if run["started_ms"] is not None else 0
+        for _ in range(3):
+            query = _random_query(rng, started_ms + rng.choice([0, 1, 5 * DAY_MS]))
+            n = rng.choice([0, 1, 3, 8])
+            expected = select_similar_runs(query, history, n=n)
+            actual = select_similar_runs(query, index, n=n)
+            assert [id(r) for r in actual] == [id(r) for r in expected]
+        index.add(run)
+        history.append(run)
+
+    assert len(index) == sum(isinstance(r["started_ms"], int) for r in runs)
+
+
+def test_out_of_order_inserts() -> None:
+    rng = random.Random(1)
+    runs = [r for r in _random_runs(rng, 300) if r["started_ms"] is not None]
+    shuffled = runs[:]
+    rng.shuffle(shuffled)
+    index = SimilarRunsIndex(shuffled)
+
+    for _ in range(100):
+        query = _random_query(rng, rng.randrange(runs[-1]["started_ms"] + DAY_MS))
+        expected = select_similar_runs(query, shuffled, n=8)
+        assert [id(r) for r in index.select(query, n=8)] == [id(r) for r in expected]
+
+
+def test_index_survives_pickling() -> None:
+    rng = random.Random(2)
+    runs = [r for r in _random_runs(rng, 300) if r["started_ms"] is not None]
+    index = SimilarRunsIndex(runs)
+
+    restored = pickle.loads(pickle.dumps(index))
+
+    for _ in range(100):
+        query = _random_query(rng, rng.randrange(runs[-1]["started_ms"] + DAY_MS))
+        expected = [r["run_id"] for r in index.select(query, n=8)]
+        assert [r["run_id"] for r in restored.select(query, n=8)] == expected
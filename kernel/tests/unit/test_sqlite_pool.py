@@ -0,0 +1,99 @@
+"""Tests for the shared SQLite connection pool."""
+
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from cyntra.dynamics.state_t1 import build_state_t1
+from cyntra.dynamics.transition_db import TransitionDB
+from cyntra.kernel.dynamics_router import DynamicsRouter
+from cyntra.state.sqlite_pool import open_pool
+
+SCHEMA = "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT);"
+
+
+def test_pool_shared_per_path_and_refcounted(tmp_path: Path) -> None:
+    first = open_pool(tmp_path / "a.db", schema=SCHEMA)
+    second = open_pool(tmp_path / "." / "a.db", schema="CREATE TABLE never_run (x);")
+    assert first is second
+
+    with second.read() as conn:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert tables == {"items"}
+
+    first.close()
+    assert not second.closed
+    second.close()
+    assert second.closed
+    assert open_pool(tmp_path / "a.db") is not first
+
+
+def test_readers_are_read_only_and_see_commits(tmp_path: Path) -> None:
+    pool = open_pool(tmp_path / "a.db", schema=SCHEMA)
+    with pool.write() as conn, conn:
+        conn.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)])
+
+    with pool.read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 2
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO items (name) VALUES ('c')")
+    pool.close()
+
+
+def test_readers_from_executor_threads(tmp_path: Path) -> None:
+    pool = open_pool(tmp_path / "a.db", schema=SCHEMA, max_readers=2)
+    with pool.write() as conn, conn:
+        conn.executemany("INSERT INTO items (name) VALUES (?)", [(str(i),) for i in range(100)])
+
+    def count(_: int) -> int:
+        with pool.read() as conn:
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(count, range(32))) == [100] * 32
+    assert pool._reader_count <= 2
+    pool.close()
+
+
+def test_dynamics_router_reuses_transition_db(tmp_path: Path, monkeypatch) -> None:
+    db_path = tmp_path / "dynamics.sqlite"
+    from_state = build_state_t1(
+        domain="code", job_type="code", features={"phase": "plan"}, policy_key={}
+    )
+    to_state = build_state_t1(
+        domain="code", job_type="code", features={"phase": "done"}, policy_key={}
+    )
+    db = TransitionDB(db_path)
+    db.insert_transitions(
+        [
+            {
+                "transition_id": "tr_1",
+                "from_state": from_state,
+                "to_state": to_state,
+                "context": {"toolchain": "codex"},
+            }
+        ]
+    )
+    db.close()
+
+    opened: list[Path] = []
+    monkeypatch.setattr(TransitionDB, "__init__", _recording_init(TransitionDB.__init__, opened))
+    router = DynamicsRouter(db_path=db_path, cache_ttl=0)
+    for _ in range(3):
+        probabilities = router.get_toolchain_probabilities("code", "code", {"phase": "plan"})
+        assert probabilities == {"codex": 1.0}
+    assert router.get_toolchain_stats()["total_transitions"] == 1
+    assert opened == [db_path]
+    router.close()
+
+
+def _recording_init(init, opened: list[Path]):
+    def wrapper(self, db_path):
+        opened.append(db_path)
+        init(self, db_path)
+
+    return wrapper
@@ -1,5 +1,6 @@
 """Tests for StateManager."""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -189,3 +190,186 @@ class TestFilterToIssue:
         assert "2" in issue_ids
         assert "10" in issue_ids
         assert "1" not in issue_ids  # Not directly related
+
+
+class TestCachedMode:
+    """Tests for the write-through cache."""
+
+    @pytest.fixture
+    def cached_manager(self, state_manager: StateManager) -> StateManager:
+        manager = StateManager(repo_root=state_manager.repo_root, cached=True)
+        manager._bd_available = False
+        return manager
+
+    def test_reads_are_served_from_cache(
+        self, cached_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should parse the files once while they are unchanged."""
+        reads: list[int] = []
+        original = cached_manager._read_graph
+        monkeypatch.setattr(cached_manager, "_read_graph", lambda: (reads.append(1), original())[1])
+
+        first = cached_manager.load_graph()
+        second = cached_manager.load_graph()
+
+        assert len(reads) == 1
+        assert [i.id for i in first.issues] == [i.id for i in second.issues]
+        assert first.issues is not second.issues
+
+    def test_updates_are_batched_until_flush(self, cached_manager: StateManager) -> None:
+        """Should apply updates in memory and write them in one rewrite."""
+        issues_file = cached_manager.beads_dir / "issues.jsonl"
+        before = issues_file.read_text()
+
+        assert cached_manager.update_issue("2", status="running") is True
+        assert cached_manager.update_issue("3", status="running") is True
+        assert cached_manager.update_issue("3", dk_attempts="1") is True
+        issue_id = cached_manager.create_issue(title="Follow-up", tags=["fix"])
+        assert cached_manager.add_dep("3", issue_id) is True
+
+        graph = cached_manager.load_graph()
+        assert graph.get_issue("2").status == "running"
+        assert graph.get_issue("3").dk_attempts == 1
+        assert [b.id for b in graph.get_blocking_deps(issue_id)] == ["3"]
+        assert issues_file.read_text() == before
+
+        assert cached_manager.flush() is True
+
+        reloaded = StateManager(repo_root=cached_manager.repo_root).load_graph()
+        assert reloaded.get_issue("2").status == "running"
+        assert reloaded.get_issue("3").status == "running"
+        assert reloaded.get_issue("3").dk_attempts == 1
+        assert reloaded.get_issue(issue_id).title == "Follow-up"
+        assert [b.id for b in reloaded.get_blocking_deps(issue_id)] == ["3"]
+
+    def test_unknown_issue_is_rejected(self, cached_manager: StateManager) -> None:
+        assert cached_manager.update_issue("missing", status="done") is False
+        assert cached_manager.flush() is True
+
+    def test_external_edit_invalidates_cache(self, cached_manager: StateManager) -> None:
+        """Should reload when another process rewrites the files."""
+        cached_manager.load_graph()
+        cached_manager.update_issue("4", status="running")
+
+        other = StateManager(repo_root=cached_manager.repo_root)
+        other._bd_available = False
+        assert other.update_issue("6", status="done") is True
+
+        graph = cached_manager.load_graph()
+        assert graph.get_issue("6").status == "done"
+        # Our queued write was re-applied on top of the external edit.
+        assert graph.get_issue("4").status == "running"
+
+    def test_flush_reloads_after_unjournaled_edit(self, cached_manager: StateManager) -> None:
+        """An edit made between load and flush must not be masked by our write."""
+        cached_manager.load_graph()
+        cached_manager.update_issue("4", status="running")
+
+        issues_file = cached_manager.beads_dir / "issues.jsonl"
+        rows = [json.loads(line) for line in issues_file.read_text().splitlines() if line.strip()]
+        for row in rows:
+            if row["id"] == "6":
+                row["status"] = "done"
+        issues_file.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+        assert cached_manager.flush() is True
+
+        graph = cached_manager.load_graph()
+        assert graph.get_issue("6").status == "done"
+        assert graph.get_issue("4").status == "running"
+
+    def test_own_flush_keeps_cache(
+        self, cached_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cached_manager.load_graph()
+        cached_manager.update_issue("4", status="running")
+        cached_manager.flush()
+
+        monkeypatch.setattr(cached_manager, "_read_graph", lambda: pytest.fail("cache dropped"))
+        assert cached_manager.load_graph().get_issue("4").status == "running"
+
+    def test_cli_flush_groups_identical_updates(
+        self, cached_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Twenty status updates should cost one bd spawn."""
+        import subprocess
+
+        graph = StateManager(repo_root=cached_manager.repo_root).load_graph()
+        calls: list[list[str]] = []
+
+        def fake_run(cmd: list[str], **_: object) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            stdout = json.dumps([i.to_dict() for i in graph.issues]) if cmd[1] == "list" else "{}"
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr("cyntra.state.manager.subprocess.run", fake_run)
+        cached_manager._bd_available = True
+        cached_manager.load_graph()
+        calls.clear()
+
+        for _ in range(20):
+            for issue in graph.issues:
+                cached_manager.update_issue_status(issue.id, "running")
+
+        assert calls == []
+        assert cached_manager.flush() is True
+        assert len(calls) == 1
+        assert calls[0][:2] == ["bd", "update"]
+        assert set(calls[0][2 : 2 + len(graph.issues)]) == {i.id for i in graph.issues}
+
+
+class TestMutationLogBackend:
+    """File mode writes are logged and compacted into issues.jsonl."""
+
+    def test_update_is_logged_then_compacted(self, state_manager: StateManager) -> None:
+        state_manager._bd_available = False
+        issues_file = state_manager.beads_dir / "issues.jsonl"
+        before = issues_file.read_bytes()
+
+        assert state_manager.update_issue("2", status="running") is True
+        assert state_manager.update_issue("missing", status="done") is False
+
+        assert issues_file.read_bytes() == before
+        assert state_manager.mutation_log.path.exists()
+        assert state_manager.load_graph().get_issue("2").status == "running"
+
+        state_manager.compact()
+        written = {
+            json.loads(line)["id"]: json.loads(line) for line in issues_file.open() if line.strip()
+        }
+        assert written["2"]["status"] == "running"
+
+    def test_create_skips_ids_taken_by_other_writers(self, state_manager: StateManager) -> None:
+        """A queued create must not overwrite an issue another tool added meanwhile."""
+        cached = StateManager(repo_root=state_manager.repo_root, cached=True)
+        cached._bd_available = False
+        queued = cached.create_issue(title="Queued")
+        cached.add_dep(queued, "2")
+
+        issues_file = cached.beads_dir / "issues.jsonl"
+        with issues_file.open("a") as f:
+            f.write(json.dumps({"id": queued, "title": "From the desktop app"}) + "\n")
+        assert cached.flush() is True
+
+        graph = StateManager(repo_root=state_manager.repo_root).load_graph()
+        assert graph.get_issue(queued).title == "From the desktop app"
+        ours = next(i for i in graph.issues if i.title == "Queued")
+        assert ours.id != queued
+        assert [d.to_id for d in graph.get_deps(ours.id)] == ["2"]
+
+    def test_cached_reader_applies_log_tail(
+        self, state_manager: StateManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should pick up another writer's records without a full reload."""
+        cached = StateManager(repo_root=state_manager.repo_root, cached=True)
+        cached._bd_available = False
+        cached.load_graph()
+        monkeypatch.setattr(cached, "_read_graph", lambda: pytest.fail("full reload"))
+
+        state_manager._bd_available = False
+        state_manager.update_issue("6", status="done")
+        new_id = state_manager.create_issue(title="From another kernel")
+
+        graph = cached.load_graph()
+        assert graph.get_issue("6").status == "done"
+        assert graph.get_issue(new_id).title == "From another kernel"